@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+"""Compares the time it takes to serve many concurrent calls to a method that
+waits on a slow backend via AsgiApplication, where the method is a coroutine
+function, and via WsgiApplication served by a pool of worker threads, where
+the method blocks its thread.
+
+    $ python asgi.py -n 1000 -d 50 -w 16
+"""
+
+from __future__ import print_function
+
+import time
+import asyncio
+import argparse
+
+from concurrent.futures import ThreadPoolExecutor
+
+from spyne import Application, Service, srpc
+from spyne.model import Integer, Unicode
+from spyne.protocol.http import HttpRpc
+from spyne.server.asgi import AsgiApplication
+from spyne.server.wsgi import WsgiApplication
+
+
+class AsyncService(Service):
+    @srpc(Integer, _returns=Unicode)
+    async def slow_call(delay):
+        await asyncio.sleep(delay / 1000.)
+        return u'done'
+
+
+class SyncService(Service):
+    @srpc(Integer, _returns=Unicode)
+    def slow_call(delay):
+        time.sleep(delay / 1000.)
+        return u'done'
+
+
+def get_app(service):
+    return Application([service], 'tns', name=service.__name__,
+                                                      in_protocol=HttpRpc(),
+                                                      out_protocol=HttpRpc())
+
+
+def run_asgi(number, delay):
+    asgi_app = AsgiApplication(get_app(AsyncService))
+    scope = {
+        'type': 'http', 'method': 'GET', 'path': '/slow_call',
+        'query_string': b'delay=%d' % delay, 'headers': [],
+        'server': ('localhost', 80),
+    }
+
+    async def call():
+        async def receive():
+            return {'type': 'http.request', 'body': b''}
+
+        async def send(message):
+            pass
+
+        await asgi_app(scope, receive, send)
+
+    async def run():
+        await asyncio.gather(*[call() for _ in range(number)])
+
+    asyncio.run(run())
+
+
+def run_wsgi(number, delay, workers):
+    wsgi_app = WsgiApplication(get_app(SyncService))
+    environ = {
+        'REQUEST_METHOD': 'GET', 'PATH_INFO': '/slow_call',
+        'QUERY_STRING': 'delay=%d' % delay, 'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80', 'wsgi.url_scheme': 'http',
+    }
+
+    def call():
+        return b''.join(wsgi_app(dict(environ), lambda *args: None))
+
+    with ThreadPoolExecutor(workers) as executor:
+        for f in [executor.submit(call) for _ in range(number)]:
+            f.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=1000,
+                                        help="Number of concurrent requests.")
+    parser.add_argument('-d', '--delay', type=int, default=50,
+                              help="Backend delay of each call, in ms.")
+    parser.add_argument('-w', '--workers', type=int, default=16,
+                                        help="Number of wsgi worker threads.")
+    args = parser.parse_args()
+
+    print("%d requests, %d ms backend delay each" % (args.number, args.delay))
+
+    start = time.time()
+    run_wsgi(args.number, args.delay, args.workers)
+    wsgi_elapsed = time.time() - start
+    print("%-24s %9.3f s" % ("wsgi, %d threads" % args.workers, wsgi_elapsed))
+
+    start = time.time()
+    run_asgi(args.number, args.delay)
+    asgi_elapsed = time.time() - start
+    print("%-24s %9.3f s x%.2f" % ("asgi, async def", asgi_elapsed,
+                                                 wsgi_elapsed / asgi_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+"""Measures how fast ``PGObjectJson`` columns convert rows to and from
+objects. The "fresh" numbers construct a new protocol instance for every row,
+the way the column types used to. The "list" numbers load the rows and
+serialize them back to json, like a listing endpoint would, with and without
+``lazy=True``.
+
+    $ python document_columns.py -n 20000
+"""
+
+from __future__ import print_function
+
+import json
+import timeit
+import argparse
+
+from datetime import datetime
+
+from spyne.model import ComplexModel, Integer, Unicode, DateTime, Array
+from spyne.protocol.json import JsonDocument
+from spyne.store.relational.document import PGObjectJson
+from spyne.util.dictdoc import get_dict_as_object, get_object_as_json
+
+
+class SomeComplexModel(ComplexModel):
+    i = Integer
+    s = Unicode
+    dt = DateTime
+
+
+class Row(ComplexModel):
+    id = Integer
+    doc = SomeComplexModel
+
+
+def get_rows(number):
+    dt = datetime(2026, 1, 1, 12, 30).isoformat()
+    return [json.dumps(dict(i=i, s='string %d' % i, dt=dt))
+                                                        for i in range(number)]
+
+
+def load_fresh(column, rows):
+    return [get_dict_as_object(json.loads(row), column.cls, complex_as=dict,
+                               protocol_inst=JsonDocument(complex_as=dict))
+                                                                for row in rows]
+
+
+def list_rows(column, rows):
+    objects = column.process_result_values(rows)
+    rows = [Row(id=i, doc=o) for i, o in enumerate(objects)]
+    return get_object_as_json(rows, Array(Row), complex_as=dict)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=20000,
+                                                  help="Number of rows.")
+    args = parser.parse_args()
+
+    column = PGObjectJson(SomeComplexModel, complex_as=dict)
+    rows = get_rows(args.number)
+    objects = column.process_result_values(rows)
+
+    fresh = timeit.timeit(lambda: load_fresh(column, rows), number=1)
+    cached = timeit.timeit(lambda: column.process_result_values(rows),
+                                                                       number=1)
+    bind = timeit.timeit(lambda: column.process_bind_values(objects),
+                                                                       number=1)
+
+    lazy_column = PGObjectJson(SomeComplexModel, complex_as=dict, lazy=True)
+    assert list_rows(column, rows) == list_rows(lazy_column, rows)
+
+    eager_list = timeit.timeit(lambda: list_rows(column, rows), number=1)
+    lazy_list = timeit.timeit(lambda: list_rows(lazy_column, rows), number=1)
+
+    print("%d rows" % args.number)
+    print("%-14s %9.2f us/row" % ("load fresh", fresh * 1e6 / args.number))
+    print("%-14s %9.2f us/row x%.2f" % ("load cached",
+                               cached * 1e6 / args.number, fresh / cached))
+    print("%-14s %9.2f us/row" % ("dump cached", bind * 1e6 / args.number))
+    print("%-14s %9.2f us/row" % ("list eager",
+                                           eager_list * 1e6 / args.number))
+    print("%-14s %9.2f us/row x%.2f" % ("list lazy",
+                    lazy_list * 1e6 / args.number, eager_list / lazy_list))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""Measures the cost of looking up the method that handles an HTTP request
+against the number of ``HttpPattern`` instances in the application, both with
+the route index that ``HttpBase`` uses and with a plain scan over the
+patterns.
+
+    $ python http_routing.py -n 2000
+"""
+
+from __future__ import print_function
+
+import logging
+import timeit
+import argparse
+
+from spyne import Application, Service, Integer, srpc
+from spyne.protocol.http import HttpRpc, HttpPattern
+from spyne.server.wsgi import WsgiApplication, WsgiMethodContext
+
+
+ROUTE_COUNTS = (10, 100, 500, 1000)
+
+
+def get_server(route_count):
+    methods = {}
+    for i in range(route_count):
+        def f(id):
+            pass
+        f.__name__ = 'f%d' % i
+
+        # one third of the routes are static, the rest have a placeholder
+        if i % 3 == 0:
+            patt = HttpPattern('/resource%d/list' % i, verb='GET')
+        else:
+            patt = HttpPattern('/resource%d/<id>' % i, verb='GET')
+
+        methods[f.__name__] = srpc(Integer, _patterns=[patt])(f)
+
+    SomeService = type('SomeService', (Service,), methods)
+
+    app = Application([SomeService], 'tns', in_protocol=HttpRpc(),
+                                                        out_protocol=HttpRpc())
+    return WsgiApplication(app)
+
+
+def lookup_indexed(server, path):
+    ctx = WsgiMethodContext(server, {}, 'text/plain')
+    server.match_pattern(ctx, 'GET', path, 'localhost')
+    return ctx.method_request_string
+
+
+def lookup_linear(server, path):
+    ctx = WsgiMethodContext(server, {}, 'text/plain')
+    for patt in server._http_patterns:
+        if server._match_one_pattern(patt, 'GET', path, 'localhost') \
+                                                                  is not None:
+            ctx.method_request_string = patt.endpoint.name
+            break
+    return ctx.method_request_string
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=2000,
+                                    help="Number of lookups per measurement.")
+    args = parser.parse_args()
+
+    # every server instance registers the same application again
+    logging.getLogger('spyne.util.appreg').setLevel(logging.ERROR)
+
+    print("%8s %14s %14s" % ("routes", "indexed", "linear"))
+    for route_count in ROUTE_COUNTS:
+        server = get_server(route_count)
+
+        # the route that the linear scan finds last and a dynamic one
+        paths = ('/resource0/list', '/resource%d/42' % (route_count - 1))
+        for path in paths:
+            assert lookup_indexed(server, path) == lookup_linear(server, path)
+
+        results = []
+        for lookup in (lookup_indexed, lookup_linear):
+            elapsed = timeit.timeit(
+                         lambda: [lookup(server, path) for path in paths],
+                                                         number=args.number)
+            results.append(elapsed * 1e6 / args.number / len(paths))
+
+        print("%8d %11.2f us %11.2f us" % ((route_count,) + tuple(results)))
+
+
+if __name__ == '__main__':
+    main()
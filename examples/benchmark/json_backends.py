@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""Compares the json backends that JsonDocument supports by running complete
+request/response cycles through a JsonDocument application and by just
+parsing and re-serializing the request document. Backends that are not
+installed are skipped.
+
+    $ python json_backends.py -n 200 -s 100
+"""
+
+from __future__ import print_function
+
+import json
+import timeit
+import argparse
+
+from datetime import datetime
+
+from spyne import Application, Service, MethodContext, srpc
+from spyne.model import ComplexModel, Integer, Unicode, DateTime, Double, \
+    Array
+from spyne.protocol.json import JsonDocument, get_json_backend
+from spyne.server import ServerBase
+
+
+BACKENDS = ('json', 'simplejson', 'orjson', 'ujson', 'rapidjson')
+
+
+class SomeComplexModel(ComplexModel):
+    i = Integer
+    s = Unicode
+    d = Double
+    dt = DateTime
+
+
+class SomeService(Service):
+    @srpc(Array(SomeComplexModel), _returns=Array(SomeComplexModel))
+    def echo(values):
+        return values
+
+
+def get_request(size):
+    now = datetime(2026, 1, 1, 12, 30).isoformat()
+    values = [dict(i=i, s='string %d' % i, d=i / 3., dt=now)
+                                                        for i in range(size)]
+    return json.dumps({"echo": {"values": values}}).encode('utf8')
+
+
+def get_server(backend):
+    app = Application([SomeService], 'tns',
+                                  in_protocol=JsonDocument(backend=backend),
+                                  out_protocol=JsonDocument(backend=backend))
+    return ServerBase(app)
+
+
+def run_once(server, request):
+    initial_ctx = MethodContext(server, MethodContext.SERVER)
+    initial_ctx.in_string = [request]
+
+    ctx, = server.generate_contexts(initial_ctx, in_string_charset='utf8')
+    server.get_in_object(ctx)
+    server.get_out_object(ctx)
+    server.get_out_string(ctx)
+    retval = b''.join(ctx.out_string)
+    ctx.close()
+
+    return retval
+
+
+def codec_once(backend, request):
+    return backend.dumpb(backend.loads(request), 'utf8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=200,
+                                 help="Number of requests per backend.")
+    parser.add_argument('-s', '--size', type=int, default=100,
+                                 help="Number of array items per request.")
+    args = parser.parse_args()
+
+    request = get_request(args.size)
+    print("%d requests with %d items each (%d bytes)" %
+                                      (args.number, args.size, len(request)))
+
+    print("%-12s %18s %18s" % ("backend", "request", "codec only"))
+
+    baseline = None
+    for backend in BACKENDS:
+        try:
+            server = get_server(backend)
+        except ImportError:
+            print("%-12s not installed" % backend)
+            continue
+
+        codec = get_json_backend(backend)
+
+        run_once(server, request)  # warm up
+        elapsed = timeit.timeit(lambda: run_once(server, request),
+                                                         number=args.number)
+        codec_elapsed = timeit.timeit(lambda: codec_once(codec, request),
+                                                         number=args.number)
+        if baseline is None:
+            baseline = elapsed, codec_elapsed
+
+        print("%-12s %9.3f ms x%.2f %9.3f ms x%.2f" % (backend,
+                elapsed * 1000. / args.number, baseline[0] / elapsed,
+                codec_elapsed * 1000. / args.number,
+                                             baseline[1] / codec_elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""Measures the time and the memory allocations it takes to set up the
+MethodContext instances for a small JsonDocument request, which consists of
+creating the initial context, parsing the request and generating the method
+contexts.
+
+    $ python method_context.py -n 20000
+"""
+
+from __future__ import print_function
+
+import timeit
+import argparse
+import tracemalloc
+
+from spyne import Application, Service, MethodContext, Integer, srpc
+from spyne.protocol.json import JsonDocument
+from spyne.server import ServerBase
+
+
+class SomeService(Service):
+    @srpc(Integer, _returns=Integer)
+    def echo(i):
+        return i
+
+
+REQUEST = b'{"echo": {"i": 42}}'
+
+
+def get_server():
+    app = Application([SomeService], 'tns', in_protocol=JsonDocument(),
+                                                  out_protocol=JsonDocument())
+    return ServerBase(app)
+
+
+def create_context(server):
+    return MethodContext(server, MethodContext.SERVER)
+
+
+def generate_contexts(server):
+    initial_ctx = MethodContext(server, MethodContext.SERVER)
+    initial_ctx.in_string = [REQUEST]
+    contexts = server.generate_contexts(initial_ctx, in_string_charset='utf8')
+    return contexts
+
+
+def full_request(server):
+    ctx, = generate_contexts(server)
+    server.get_in_object(ctx)
+    server.get_out_object(ctx)
+    server.get_out_string(ctx)
+    b''.join(ctx.out_string)
+    ctx.close()
+
+
+def get_allocations(func, server, number):
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        retval = [func(server) for _ in range(number)]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(s.count_diff for s in stats)
+    size = sum(s.size_diff for s in stats)
+    del retval
+
+    return float(blocks) / number, float(size) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=20000,
+                                         help="Number of iterations per step.")
+    args = parser.parse_args()
+
+    server = get_server()
+    full_request(server)  # warm up
+
+    print("%-20s %12s %12s %12s" % ("step", "us/request", "blocks", "bytes"))
+    for func in (create_context, generate_contexts, full_request):
+        elapsed = timeit.timeit(lambda: func(server), number=args.number)
+
+        # allocations are measured on contexts kept alive, except for full
+        # requests which close theirs.
+        blocks, size = get_allocations(func, server, min(args.number, 1000))
+
+        print("%-20s %12.2f %12.1f %12.1f" % (func.__name__,
+                          elapsed * 1e6 / args.number, blocks, size))
+
+
+if __name__ == '__main__':
+    main()
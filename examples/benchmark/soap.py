@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+"""Measures the cost of SOAP 1.1 request processing by running complete
+request/response cycles through a Soap11 application and by just parsing
+and decomposing the request envelope.
+
+    $ python soap.py -n 1000 -s 10
+"""
+
+from __future__ import print_function
+
+import timeit
+import argparse
+
+from spyne import Application, Service, MethodContext, srpc
+from spyne.model import ComplexModel, Integer, Unicode, Double, Array
+from spyne.protocol.soap import Soap11
+from spyne.server import ServerBase
+
+
+class SomeComplexModel(ComplexModel):
+    i = Integer
+    s = Unicode
+    d = Double
+
+
+class SomeService(Service):
+    @srpc(Array(SomeComplexModel), _returns=Array(SomeComplexModel))
+    def echo(values):
+        return values
+
+
+ENVELOPE = u"""<?xml version="1.0" encoding="UTF-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/"
+               xmlns:tns="tns">
+  <soap:Header/>
+  <soap:Body>
+    <tns:echo><tns:values>%s</tns:values></tns:echo>
+  </soap:Body>
+</soap:Envelope>"""
+
+ITEM = u"""<tns:SomeComplexModel><tns:i>%d</tns:i><tns:s>string %d</tns:s>
+<tns:d>%f</tns:d></tns:SomeComplexModel>"""
+
+
+def get_request(size):
+    items = u''.join([ITEM % (i, i, i / 3.) for i in range(size)])
+    return (ENVELOPE % items).encode('utf8')
+
+
+def get_server():
+    app = Application([SomeService], 'tns', in_protocol=Soap11(),
+                                                       out_protocol=Soap11())
+    return ServerBase(app)
+
+
+def run_once(server, request):
+    initial_ctx = MethodContext(server, MethodContext.SERVER)
+    initial_ctx.in_string = [request]
+
+    ctx, = server.generate_contexts(initial_ctx, in_string_charset='utf8')
+    server.get_in_object(ctx)
+    server.get_out_object(ctx)
+    server.get_out_string(ctx)
+    retval = b''.join(ctx.out_string)
+    ctx.close()
+
+    return retval
+
+
+def parse_once(server, request):
+    ctx = MethodContext(server, MethodContext.SERVER)
+    ctx.in_string = [request]
+
+    prot = server.app.in_protocol
+    prot.create_in_document(ctx)
+    prot.decompose_incoming_envelope(ctx, prot.REQUEST)
+    ctx.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=1000,
+                                 help="Number of requests.")
+    parser.add_argument('-s', '--size', type=int, default=10,
+                                 help="Number of array items per request.")
+    args = parser.parse_args()
+
+    request = get_request(args.size)
+    print("%d requests with %d items each (%d bytes)" %
+                                      (args.number, args.size, len(request)))
+
+    server = get_server()
+    run_once(server, request)  # warm up
+
+    for name, func in (('request', run_once), ('envelope', parse_once)):
+        elapsed = timeit.timeit(lambda: func(server, request),
+                                                         number=args.number)
+        print("%-10s %9.3f ms" % (name, elapsed * 1000. / args.number))
+
+
+if __name__ == '__main__':
+    main()
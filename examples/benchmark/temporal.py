@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""Measures the cost of converting DateTime, Date, Time and Duration values
+from and to their string representations, both through the protocol and by
+calling the bare datetime parsers.
+
+    $ python temporal.py -n 20000
+"""
+
+from __future__ import print_function
+
+import timeit
+import argparse
+
+from datetime import datetime, timedelta
+
+import pytz
+
+from spyne.model import DateTime, Date, Time, Duration
+from spyne.protocol import ProtocolBase
+from spyne.protocol._inbase import _parse_datetime_iso, \
+    _parse_datetime_iso_fast
+
+
+CASES = (
+    (DateTime, u'2026-01-01T12:30:45.123456'),
+    (DateTime, u'2026-01-01T12:30:45Z'),
+    (DateTime, u'2026-01-01T12:30:45+03:00'),
+    (Date, u'2026-01-01'),
+    (Time, u'12:30:45.5'),
+    (Duration, u'P1DT2H3M4S'),
+)
+
+VALUES = (
+    (DateTime, datetime(2026, 1, 1, 12, 30, 45, 123456, pytz.utc)),
+    (DateTime(timezone=False), datetime(2026, 1, 1, 12, 30, 45)),
+    (Duration, timedelta(days=1, hours=2, minutes=3, seconds=4)),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=20000,
+                                 help="Number of conversions per case.")
+    args = parser.parse_args()
+    n = args.number
+
+    prot = ProtocolBase()
+
+    print("%-10s %-30s %12s" % ("type", "from_unicode", "us/call"))
+    for cls, s in CASES:
+        elapsed = timeit.timeit(lambda: prot.from_unicode(cls, s), number=n)
+        print("%-10s %-30s %12.3f" % (cls.get_type_name(), s,
+                                                          elapsed * 1e6 / n))
+
+    print()
+    print("%-10s %-30s %12s" % ("type", "to_unicode", "us/call"))
+    for cls, v in VALUES:
+        elapsed = timeit.timeit(lambda: prot.to_unicode(cls, v), number=n)
+        print("%-10s %-30s %12.3f" % (cls.get_type_name(), v,
+                                                          elapsed * 1e6 / n))
+
+    print()
+    print("%-30s %12s %12s" % ("bare datetime parser", "regex", "fast"))
+    for cls, s in CASES:
+        if cls is not DateTime:
+            continue
+        slow = timeit.timeit(lambda: _parse_datetime_iso(cls, s), number=n)
+        fast = timeit.timeit(lambda: _parse_datetime_iso_fast(s), number=n)
+        print("%-30s %12.3f %12.3f" % (s, slow * 1e6 / n, fast * 1e6 / n))
+
+
+if __name__ == '__main__':
+    main()
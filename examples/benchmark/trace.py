@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# encoding: utf8
+#
+# Copyright © Burak Arslan <burak at arskom dot com dot tr>,
+#             Arskom Ltd. http://www.arskom.com.tr
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+#    1. Redistributions of source code must retain the above copyright notice,
+#       this list of conditions and the following disclaimer.
+#    2. Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the following disclaimer in the
+#       documentation and/or other materials provided with the distribution.
+#    3. Neither the name of the owner nor the names of its contributors may be
+#       used to endorse or promote products derived from this software without
+#       specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER BE LIABLE FOR ANY DIRECT,
+# INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY
+# OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE,
+# EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+"""Measures what the per-field debug log statements cost when serializing
+instances of a wide model, by flipping ``spyne.const.TRACE`` in every
+loaded Spyne module. Debug output itself is never emitted; the point is the
+cost of log calls that produce nothing.
+
+    $ python trace.py -n 200 -f 100
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+import logging
+import argparse
+
+from spyne.model import ComplexModel, Integer, Unicode
+from spyne.protocol.json import JsonDocument
+
+
+def get_class(num_fields):
+    fields = {}
+    for i in range(num_fields):
+        fields['i%d' % i] = Integer
+        fields['s%d' % i] = Unicode
+
+    return ComplexModel.produce('tns', 'WideModel', fields)
+
+
+def set_trace(value):
+    for name, module in list(sys.modules.items()):
+        if name.startswith('spyne.') and hasattr(module, 'TRACE'):
+            module.TRACE = value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('-n', '--number', type=int, default=200,
+                                 help="Number of serializations per run.")
+    parser.add_argument('-f', '--fields', type=int, default=100,
+                                 help="Number of fields of each type.")
+    parser.add_argument('-l', '--level', default='INFO',
+                                 help="Log level of the spyne logger.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('spyne').setLevel(getattr(logging, args.level))
+
+    cls = get_class(args.fields)
+    inst = cls(**dict([(k, 1 if k[0] == 'i' else u'x')
+                                            for k in cls._type_info.keys()]))
+
+    prot = JsonDocument()
+    prot._object_to_doc(cls, inst)  # warm up
+
+    print("%d fields, log level %s" % (len(cls._type_info), args.level))
+
+    results = {}
+    for trace in (True, False):
+        set_trace(trace)
+        results[trace] = min(timeit.repeat(
+                               lambda: prot._object_to_doc(cls, inst),
+                                               number=args.number, repeat=5))
+
+        print("TRACE=%-5s %9.3f ms" % (trace,
+                                         results[trace] * 1000. / args.number))
+
+    print("speedup: x%.2f" % (results[True] / results[False]))
+
+
+if __name__ == '__main__':
+    main()
@@ -213,8 +213,12 @@ class RunTests(ExtendedTestCommand):
             'interop/test_pyramid.py',
             'interop/test_soap_client_http_twisted.py',
 
-            'transport/test_msgpack.py'
+            'transport/test_asgi.py',
+            'transport/test_msgpack.py',
+            'transport/test_twisted_http.py',
 
+            'test_auxproc.py',
+            'test_context.py',
             'test_null_server.py',
             'test_service.py',
             'test_soft_validation.py',
@@ -30,6 +30,14 @@ from spyne.error import Fault, Redirect, RespawnError, InvalidRequestError
 from spyne.interface import Interface, InterfaceDocuments
 from spyne.util import six
 from spyne.util.appreg import register_application
+from spyne.util.gcpolicy import IntervalGcPolicy
+
+
+try:
+    from inspect import iscoroutine as _iscoroutine
+except ImportError:  # Python 2
+    def _iscoroutine(_):
+        return False
 
 
 class MethodAlreadyExistsError(Exception):
@@ -78,6 +86,10 @@ class Application(object):
     :param documents_container:
                          A class that implements the InterfaceDocuments
                          interface
+    :param gc_policy:    A :class:`spyne.util.gcpolicy.GcPolicyBase` instance
+                         that decides when the garbage collector is run
+                         explicitly. Defaults to
+                         :class:`spyne.util.gcpolicy.IntervalGcPolicy`.
 
     Supported events:
         * ``method_call``:
@@ -98,6 +110,11 @@ class Application(object):
             which in turn is called by the transport when the response is fully
             sent to the client (or in the client case, the response is fully
             received from server).
+
+        * ``gc_collect``:
+            Called after the gc policy runs the garbage collector, with the
+            policy, the collected generation, the time it took in seconds and
+            the number of unreachable objects found.
     """
 
     transport = None
@@ -105,7 +122,7 @@ class Application(object):
     def __init__(self, services, tns, name=None,
                  in_protocol=None, out_protocol=None,
                  config=None, classes=(),
-                 documents_container=InterfaceDocuments):
+                 documents_container=InterfaceDocuments, gc_policy=None):
         self.services = tuple(services)
         self.tns = tns
         self.name = name
@@ -120,6 +137,10 @@ class Application(object):
         self.event_manager = EventManager(self)
         self.error_handler = None
 
+        if gc_policy is None:
+            gc_policy = IntervalGcPolicy()
+        self.gc_policy = gc_policy
+
         self.in_protocol = in_protocol
         self.out_protocol = out_protocol
 
@@ -148,13 +169,30 @@ class Application(object):
         # separate for backwards compatibility reasons.
         self.out_protocol.message = self.out_protocol.RESPONSE
 
+        # resolve class attributes and conversion handlers of the whole
+        # interface upfront so that the request path never has to.
+        classes = list(self.interface.classes.values())
+        self.in_protocol.warm_attrcache(classes)
+        self.in_protocol.warm_codeccache(classes)
+        if self.out_protocol is not self.in_protocol:
+            self.out_protocol.warm_attrcache(classes)
+            self.out_protocol.warm_codeccache(classes)
+
         register_application(self)
 
+        self.gc_policy.initialize(self)
+
     def process_request(self, ctx):
         """Takes a MethodContext instance. Returns the response to the request
         as a native python object. If the function throws an exception, it
         returns None and sets the exception object to ctx.out_error.
 
+        If the user code is a coroutine function (ie. an ``async def``), the
+        coroutine object it returns is put to ``ctx.out_object`` as is. The
+        transport is then expected to run it and pass its result to
+        :func:`complete_request` or the exception it raises to
+        :func:`process_exception`. See :mod:`spyne.server.asgi`.
+
         Overriding this method would break event management. So this is not
         meant to be overridden unless you know what you're doing.
         """
@@ -170,23 +208,50 @@ class Application(object):
                 ctx.in_object = []
 
             # call user method
-            ctx.out_object = self.call_wrapper(ctx)
+            retval = self.call_wrapper(ctx)
+            if _iscoroutine(retval):
+                ctx.out_object = retval
+                return
+
+            self.complete_request(ctx, retval)
+
+        # we don't catch BaseException because we actually don't want to catch
+        # "system-exiting" exceptions. See:
+        # https://docs.python.org/2/library/exceptions.html#exceptions.Exception
+        except Exception as e:
+            self.process_exception(ctx, e)
+
+    def complete_request(self, ctx, retval):
+        """Sets ``ctx.out_object`` using the given return value of the user
+        code and fires the ``method_return_object`` event.
+
+        Exceptions are meant to be passed to :func:`process_exception` by the
+        caller.
+        """
+
+        ctx.out_object = retval
+
+        # out object is always a sequence of return values. see
+        # MethodContext docstrings for more info
+        if ctx.descriptor.body_style is not BODY_STYLE_WRAPPED or \
+                            len(ctx.descriptor.out_message._type_info) <= 1:
+            # if it's not a wrapped method, OR there's just one return type
+            # we wrap it ourselves
+            ctx.out_object = [ctx.out_object]
 
-            # out object is always a sequence of return values. see
-            # MethodContext docstrings for more info
-            if ctx.descriptor.body_style is not BODY_STYLE_WRAPPED or \
-                                len(ctx.descriptor.out_message._type_info) <= 1:
-                # if it's not a wrapped method, OR there's just one return type
-                # we wrap it ourselves
-                ctx.out_object = [ctx.out_object]
+        # Now that the processing is switched to the outgoing message,
+        # point ctx.protocol to ctx.out_protocol
+        ctx.protocol = ctx.outprot_ctx
 
-            # Now that the processing is switched to the outgoing message,
-            # point ctx.protocol to ctx.out_protocol
-            ctx.protocol = ctx.outprot_ctx
+        ctx.fire_event('method_return_object')
 
-            ctx.fire_event('method_return_object')
+    def process_exception(self, ctx, e):
+        """Handles the exception raised by the user code by either doing the
+        requested redirect or setting ``ctx.out_error``. Must be called from
+        inside the ``except`` block that caught ``e``.
+        """
 
-        except Redirect as e:
+        if isinstance(e, Redirect):
             try:
                 e.do_redirect()
 
@@ -205,7 +270,7 @@ class Application(object):
 
                 ctx.fire_event('method_redirect_exception')
 
-        except Fault as e:
+        elif isinstance(e, Fault):
             if e.faultcode == 'Client' or e.faultcode.startswith('Client.'):
                 logger_client.exception(e)
             else:
@@ -215,10 +280,7 @@ class Application(object):
 
             ctx.fire_event('method_exception_object')
 
-        # we don't catch BaseException because we actually don't want to catch
-        # "system-exiting" exceptions. See:
-        # https://docs.python.org/2/library/exceptions.html#exceptions.Exception
-        except Exception as e:
+        else:
             logger_server.critical(e, **{'exc_info': 1})
 
             ctx.out_error = Fault('Server', get_fault_string_from_exception(e))
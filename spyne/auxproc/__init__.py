@@ -40,3 +40,5 @@ This package is DEPRECATED. Get rid of this ASAP.
 
 from spyne.auxproc._base import process_contexts
 from spyne.auxproc._base import AuxProcBase
+from spyne.auxproc._base import AuxMethodStats
+from spyne.auxproc._base import PooledAuxProcBase
@@ -26,7 +26,17 @@ executed.
 import logging
 logger = logging.getLogger(__name__)
 
+from time import time
+from threading import Condition
+from collections import deque, defaultdict
+
 from spyne import AuxMethodContext
+from spyne.util.stats import QueueStats
+
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP = 'drop'
+OVERFLOW_COALESCE = 'coalesce'
 
 
 def process_contexts(server, contexts, p_ctx, error=None):
@@ -86,3 +96,181 @@ class AuxProcBase(object):
         """
 
         ctx.aux = AuxMethodContext(p_ctx, error)
+
+
+def _run_job(func, args):
+    """Runs the given job in a pool worker. Never raises, so that the job
+    always gets its completion callback."""
+
+    try:
+        return True, func(*args)
+
+    except Exception as e:
+        logger.exception(e)
+        return False, repr(e)
+
+
+class AuxMethodStats(QueueStats):
+    """Queue depth and latency counters of a single auxiliary method. See
+    :class:`spyne.util.stats.QueueStats` for the common counters."""
+
+    __slots__ = ('dropped', 'coalesced')
+
+
+class _AuxJob(object):
+    __slots__ = ('key', 'func', 'args', 'queued_at')
+
+    def __init__(self, key, func, args, queued_at):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.queued_at = queued_at
+
+
+class PooledAuxProcBase(AuxProcBase):
+    """Base class for AuxProcs that run auxiliary methods in a worker pool.
+
+    Contexts wait in a queue of their own until a worker is free, so that the
+    queue can be bounded and so that its depth and the latency of every
+    auxiliary method can be tracked in :attr:`stats`.
+
+    :param pool_size: Max. number of auxiliary methods that can be processed
+        in parallel.
+    :param max_queued: Max. number of contexts that can wait for a free worker.
+        ``None`` means unbounded.
+    :param overflow: What to do with a new context when the queue is full.
+        ``'block'`` makes the caller wait until there is room in the queue,
+        ``'drop'`` discards the new context and ``'coalesce'`` puts the new
+        context in place of the oldest waiting context of the same method,
+        discarding the new context when there isn't one.
+    :param process_exceptions: If false, does not execute auxiliary methods
+        when the main method throws an exception.
+    """
+
+    def __init__(self, pool_size=1, max_queued=None, overflow=OVERFLOW_BLOCK,
+                                                      process_exceptions=False):
+        super(PooledAuxProcBase, self).__init__(
+                                         process_exceptions=process_exceptions)
+
+        assert overflow in (OVERFLOW_BLOCK, OVERFLOW_DROP, OVERFLOW_COALESCE), \
+                                        "Invalid overflow policy %r" % overflow
+
+        self.pool = None
+        self.max_queued = max_queued
+        self.overflow = overflow
+
+        self.stats = defaultdict(AuxMethodStats)
+        """Maps the internal keys of auxiliary methods to their
+        :class:`AuxMethodStats` instances."""
+
+        self._pool_size = pool_size
+        self._queue = deque()
+        self._running = 0
+        self._cond = Condition()
+
+    @property
+    def pool_size(self):
+        return self._pool_size
+
+    def create_pool(self, server):
+        """Override this to return the pool that will run the jobs. It must
+        implement the ``apply_async()`` and ``close()`` methods of
+        ``multiprocessing.pool.Pool``."""
+
+        raise NotImplementedError()
+
+    def create_job(self, server, ctx, *args, **kwargs):
+        """Override this to return a ``(func, args)`` tuple that processes the
+        given context when called in a pool worker. It's called from the
+        thread that runs :func:`process_contexts`."""
+
+        raise NotImplementedError()
+
+    def initialize(self, server):
+        with self._cond:
+            old_pool, self.pool = self.pool, self.create_pool(server)
+
+        if old_pool is not None:
+            old_pool.close()
+
+    def close(self):
+        """Waits for the queued contexts to be processed and stops the pool."""
+
+        with self._cond:
+            while len(self._queue) > 0 or self._running > 0:
+                self._cond.wait()
+
+            pool, self.pool = self.pool, None
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    def process_context(self, server, ctx, *args, **kwargs):
+        key = ctx.descriptor.internal_key
+
+        try:
+            func, fargs = self.create_job(server, ctx, *args, **kwargs)
+
+        except Exception as e:
+            logger.exception(e)
+            with self._cond:
+                stats = self.stats[key]
+                stats.submitted += 1
+                stats.failed += 1
+            return
+
+        job = _AuxJob(key, func, fargs, time())
+
+        with self._cond:
+            stats = self.stats[key]
+            stats.submitted += 1
+
+            max_queued = self.max_queued
+            while max_queued is not None and len(self._queue) >= max_queued:
+                if self.overflow == OVERFLOW_BLOCK:
+                    self._cond.wait()
+                    continue
+
+                if self.overflow == OVERFLOW_COALESCE:
+                    for i, old_job in enumerate(self._queue):
+                        if old_job.key == key:
+                            self._queue[i] = job
+                            stats.coalesced += 1
+                            return
+
+                logger.warning("Queue full, dropping context for aux method %s",
+                                                                            key)
+                stats.dropped += 1
+                return
+
+            self._queue.append(job)
+            stats.job_queued()
+
+            self._dispatch()
+
+    def _dispatch(self):
+        # must be called with self._cond acquired
+        queue = self._queue
+        while self._running < self._pool_size and len(queue) > 0:
+            job = queue.popleft()
+
+            self.stats[job.key].job_started()
+            self._running += 1
+
+            self.pool.apply_async(_run_job, (job.func, job.args),
+                   callback=lambda result, job=job: self._job_done(job, result))
+
+        self._cond.notify_all()
+
+    def _job_done(self, job, result):
+        ok, retval = result
+        latency = time() - job.queued_at
+
+        with self._cond:
+            self._running -= 1
+
+            failed = not (ok and retval is None)
+            self.stats[job.key].job_done(failed, latency)
+
+            self._dispatch()
@@ -0,0 +1,153 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""The ``spyne.auxproc.process`` module contains an AuxProc that processes
+auxiliary methods in a pool of worker processes."""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import pickle
+import multiprocessing
+
+from spyne import MethodContext, AuxMethodContext
+from spyne.auxproc import PooledAuxProcBase
+from spyne.auxproc._base import OVERFLOW_BLOCK
+from spyne.model.complex import ComplexModelBase
+
+
+_worker_server = None
+
+
+def _init_worker(server, server_factory):
+    global _worker_server
+
+    if server_factory is not None:
+        server = server_factory()
+
+    _worker_server = server
+
+
+def _process_in_worker(payload):
+    method_request_string, index, in_header, in_object, error = \
+                                                           pickle.loads(payload)
+
+    server = _worker_server
+    ctx = MethodContext(server, MethodContext.SERVER)
+    ctx.method_request_string = method_request_string
+    smm = server.app.interface.service_method_map
+    ctx.descriptor = smm[method_request_string][index]
+    ctx.aux = AuxMethodContext(None, error)
+    ctx.in_header = in_header
+
+    in_message = ctx.descriptor.in_message
+    if in_object is not None and issubclass(in_message, ComplexModelBase):
+        in_object = in_message.get_serialization_instance(in_object)
+    ctx.in_object = in_object
+
+    server.get_out_object(ctx)
+    if ctx.out_error is not None:
+        logger.exception(ctx.out_error)
+        return repr(ctx.out_error)
+
+    server.get_out_string(ctx)
+    for s in ctx.out_string:
+        pass
+
+    ctx.close()
+
+
+class ProcessAuxProc(PooledAuxProcBase):
+    """ProcessAuxProc processes auxiliary methods in a pool of worker
+    processes, so that cpu-bound auxiliary methods don't compete with request
+    handling for the GIL.
+
+    The incoming document is deserialized in the calling thread. Only the
+    method identifier, the deserialized header and arguments and the error from
+    the primary method are sent to the worker, so they must be picklable. An
+    error that can't be pickled is replaced by its ``repr()``. The primary
+    context is not available to the worker so ``ctx.aux.parent`` is ``None``
+    there.
+
+    Workers need a server instance of their own. By default, they are forked
+    from the process that initializes the server and inherit its server
+    instance, which needs the ``'fork'`` start method. Pass a picklable
+    ``server_factory`` to use other start methods.
+
+    See :class:`spyne.auxproc.PooledAuxProcBase` for queueing options.
+
+    :param pool_size: Number of worker processes. Defaults to the number of
+        cpus.
+    :param server_factory: A picklable callable that returns the server
+        instance that the workers use to process auxiliary methods.
+    :param mp_context: The ``multiprocessing`` start method name. Defaults to
+        ``'fork'`` when ``server_factory`` is ``None`` and to the platform
+        default otherwise.
+    """
+
+    def __init__(self, pool_size=None, max_queued=None, overflow=OVERFLOW_BLOCK,
+                                         server_factory=None, mp_context=None):
+        if pool_size is None:
+            pool_size = multiprocessing.cpu_count()
+
+        super(ProcessAuxProc, self).__init__(pool_size=pool_size,
+                                      max_queued=max_queued, overflow=overflow)
+
+        if mp_context is None and server_factory is None:
+            mp_context = 'fork'
+
+        self.server_factory = server_factory
+        self.mp_context = mp_context
+
+    def create_pool(self, server):
+        if self.server_factory is None:
+            initargs = (server, None)
+        else:
+            initargs = (None, self.server_factory)
+
+        mp_context = multiprocessing.get_context(self.mp_context)
+        return mp_context.Pool(self.pool_size, initializer=_init_worker,
+                                                              initargs=initargs)
+
+    def create_job(self, server, ctx, *args, **kwargs):
+        server.get_in_object(ctx)
+        if ctx.in_error is not None:
+            raise ctx.in_error
+
+        in_object = ctx.in_object
+        if in_object is not None:
+            in_object = list(in_object)
+
+        error = ctx.aux.error
+        if error is not None:
+            try:
+                pickle.dumps(error, pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                error = repr(error)
+
+        index = server.app.interface \
+                .service_method_map[ctx.method_request_string] \
+                                                         .index(ctx.descriptor)
+
+        payload = pickle.dumps((ctx.method_request_string, index,
+                     ctx.in_header, in_object, error), pickle.HIGHEST_PROTOCOL)
+
+        ctx.close()
+
+        return _process_in_worker, (payload,)
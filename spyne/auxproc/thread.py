@@ -20,33 +20,34 @@
 import logging
 logger = logging.getLogger(__name__)
 
+from functools import partial
 from multiprocessing.pool import ThreadPool
 
-from spyne.auxproc import AuxProcBase
+from spyne.auxproc import PooledAuxProcBase
+from spyne.auxproc._base import OVERFLOW_BLOCK
 
 
-class ThreadAuxProc(AuxProcBase):
+class ThreadAuxProc(PooledAuxProcBase):
     """ThreadAuxProc processes auxiliary methods asynchronously in another
     thread using the undocumented ``multiprocessing.pool.ThreadPool`` class.
     This is available in Python 2.7. It's possibly there since 2.6 as well but
     it's hard to tell since it's not documented.
 
+    See :class:`spyne.auxproc.PooledAuxProcBase` for queueing options.
+
     :param pool_size: Max. number of threads that can be used to process
         methods in auxiliary queue in parallel.
     """
 
-    def __init__(self, pool_size=1):
-        super(ThreadAuxProc, self).__init__()
-
-        self.pool = None
-        self.__pool_size = pool_size
+    def __init__(self, pool_size=1, max_queued=None, overflow=OVERFLOW_BLOCK):
+        super(ThreadAuxProc, self).__init__(pool_size=pool_size,
+                                     max_queued=max_queued, overflow=overflow)
 
-    @property
-    def pool_size(self):
-        return self.__pool_size
+    def create_pool(self, server):
+        return ThreadPool(self.pool_size)
 
-    def process_context(self, server, ctx, *args, **kwargs):
-        self.pool.apply_async(self.process, (server, ctx) + args, kwargs)
+    def create_job(self, server, ctx, *args, **kwargs):
+        if len(kwargs) > 0:
+            return partial(self.process, **kwargs), (server, ctx) + args
 
-    def initialize(self, server):
-        self.pool = ThreadPool(self.__pool_size)
+        return self.process, (server, ctx) + args
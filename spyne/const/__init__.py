@@ -21,6 +21,8 @@
 """The ``spyne.const`` package contains miscellanous constant values needed
 in various parts of Spyne."""
 
+import os
+
 
 MAX_STRING_FIELD_LENGTH = 64
 """Maximum length of a string field for :func:`spyne.util.log_repr`"""
@@ -72,6 +74,17 @@ DEFAULT_LOCALE = 'en_US'
 """Locale code to use for the translation subsystem when locale information is
 missing in an incoming request."""
 
+VALIDATION_SCHEMA_CACHE_SIZE = 16
+"""Maximum number of compiled xml validation schemas that are kept in memory
+to be shared between protocol instances with identical interfaces."""
+
+TRACE = os.environ.get('SPYNE_TRACE', '') not in ('', '0')
+"""When ``False``, the per-field and per-object debug log statements in
+(de)serialization loops are skipped entirely, even when the ``DEBUG`` log
+level is enabled. Set the ``SPYNE_TRACE`` environment variable to ``1`` to
+turn them back on. This is read when Spyne modules are imported, so changing
+it later has no effect."""
+
 WARN_ON_DUPLICATE_FAULTCODE = True
 """Warn about duplicate faultcodes in all Fault subclasses globally. Only works
 when CODE class attribute is set for every Fault subclass."""
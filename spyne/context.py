@@ -17,17 +17,17 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
-import gc, logging
+import logging
 logger = logging.getLogger('spyne')
 
 from time import time
-from copy import copy
 from collections import deque, defaultdict
 
-from spyne import const
+from spyne.util.six import add_metaclass
 
 
-_LAST_GC_RUN = 0.0
+_LAZY = type("LAZY", (object,), {})
+"""Marks sub-contexts of a :class:`MethodContext` that are not created yet."""
 
 
 class AuxMethodContext(object):
@@ -98,28 +98,88 @@ class EventContext(object):
         self.event_id = event_id
 
 
+def _frozen_setattr(self, k, v):
+    if not getattr(self, 'frozen', False) or k in self.__dict__ \
+                                               or hasattr(self.__class__, k):
+        object.__setattr__(self, k, v)
+    else:
+        raise ValueError("use the udc member for storing arbitrary data "
+                         "in the method context")
+
+
+class MethodContextMeta(type):
+    """Collects the slot names of :class:`MethodContext` subclasses and makes
+    sure subclasses that don't define ``__slots__`` (and thus get an instance
+    ``__dict__``) don't accept new attributes once the context is frozen."""
+
+    def __new__(cls, cls_name, cls_bases, cls_dict):
+        if not ('__slots__' in cls_dict or '__setattr__' in cls_dict):
+            cls_dict['__setattr__'] = _frozen_setattr
+
+        retval = super(MethodContextMeta, cls).__new__(cls, cls_name,
+                                                           cls_bases, cls_dict)
+
+        slot_names = []
+        for c in reversed(retval.__mro__):
+            for k in c.__dict__.get('__slots__', ()):
+                if not (k in ('__dict__', '__weakref__') or k in slot_names):
+                    slot_names.append(k)
+        retval._slot_names = tuple(slot_names)
+
+        return retval
+
+
+@add_metaclass(MethodContextMeta)
 class MethodContext(object):
     """The base class for all RPC Contexts. Holds all information about the
     current state of execution of a remote procedure call.
+
+    Transport, protocol and event contexts are created on first access.
+    Subclasses should define ``__slots__`` for the attributes they add.
     """
 
+    __slots__ = (
+        'call_start', 'call_end', 'is_closed', 'app', 'udc', 'aux',
+        'method_request_string', 'files', 'active', 'in_string',
+        'in_document', 'in_header_doc', 'in_body_doc', 'in_error',
+        'in_header', 'in_object', 'out_object', 'out_header', 'out_error',
+        'out_body_doc', 'out_header_doc', 'out_document', 'out_string',
+        'out_stream', 'function', 'locale', 'pusher_stack', 'frozen',
+        '_descriptor', '_in_protocol', '_out_protocol', '_server', '_way',
+        '_transport', '_inprot_ctx', '_outprot_ctx', '_protocol', '_event',
+        '__weakref__',
+    )
+
     SERVER = type("SERVER", (object,), {})
     CLIENT = type("CLIENT", (object,), {})
     TransportContext = TransportContext
 
-    frozen = False
-
     def copy(self):
-        retval = copy(self)
-
-        if retval.transport is not None:
-            retval.transport.parent = retval
-        if retval.inprot_ctx is not None:
-            retval.inprot_ctx.parent = retval
-        if retval.outprot_ctx is not None:
-            retval.outprot_ctx.parent = retval
-        if retval.event is not None:
-            retval.event.parent = retval
+        """Returns a shallow copy of this context. Sub-contexts that were
+        already created are shared with the copy and point to it as their
+        parent. The ones that were not are created separately for each
+        context when needed."""
+
+        cls = self.__class__
+        retval = cls.__new__(cls)
+
+        getter = object.__getattribute__
+        setter = object.__setattr__
+        for k in cls._slot_names:
+            try:
+                setter(retval, k, getter(self, k))
+            except AttributeError:
+                pass
+
+        d = getattr(self, '__dict__', None)
+        if d is not None:
+            retval.__dict__.update(d)
+
+        for k in ('_transport', '_inprot_ctx', '_outprot_ctx', '_event'):
+            subctx = getter(retval, k)
+            if not (subctx is None or subctx is _LAZY):
+                subctx.parent = retval
+
         if retval.aux is not None:
             retval.aux.parent = retval
 
@@ -128,7 +188,7 @@ class MethodContext(object):
     def fire_event(self, event, *args, **kwargs):
         self.app.event_manager.fire_event(event, self, *args, **kwargs)
 
-        desc = self.descriptor
+        desc = self._descriptor
         if desc is not None:
             for evmgr in desc.event_managers:
                 evmgr.fire_event(event, self, *args, **kwargs)
@@ -145,6 +205,11 @@ class MethodContext(object):
             return self.descriptor.name
 
     def __init__(self, transport, way):
+        if not (way is MethodContext.SERVER or way is MethodContext.CLIENT):
+            raise ValueError(way)
+
+        self.frozen = False
+
         # metadata
         self.call_start = time()
         """The time the rpc operation was initiated in seconds-since-epoch
@@ -167,43 +232,14 @@ class MethodContext(object):
         self.udc = None
         """The user defined context. Use it to your liking."""
 
-        self.transport = None
-        """The transport-specific context. Transport implementors can use this
-        to their liking."""
-
-        if self.TransportContext is not None:
-            self.transport = self.TransportContext(self, transport)
-
-        self.outprot_ctx = None
-        """The output-protocol-specific context. Protocol implementors can use
-        this to their liking."""
-
-        if self.app.out_protocol is not None:
-            self.outprot_ctx = self.app.out_protocol.get_context(self, transport)
-
-        self.inprot_ctx = None
-        """The input-protocol-specific context. Protocol implementors can use
-        this to their liking."""
-
-        if self.app.in_protocol is not None:
-            self.inprot_ctx = self.app.in_protocol.get_context(self, transport)
-
-        self.protocol = None
-        """The protocol-specific context. This points to the in_protocol when an
-        incoming message is being processed and out_protocol when an outgoing
-        message is being processed."""
-
-        if way is MethodContext.SERVER:
-            self.protocol = self.inprot_ctx
-        elif way is MethodContext.CLIENT:
-            self.protocol = self.outprot_ctx
-        else:
-            raise ValueError(way)
+        self._server = transport
+        self._way = way
 
-        self.event = EventContext(self)
-        """Event-specific context. Use this as you want, preferably only in
-        events, as you'd probably want to separate the event data from the
-        method data."""
+        self._transport = _LAZY
+        self._outprot_ctx = _LAZY
+        self._inprot_ctx = _LAZY
+        self._protocol = _LAZY
+        self._event = _LAZY
 
         self.aux = None
         """Auxiliary-method specific context. You can use this to share data
@@ -222,8 +258,7 @@ class MethodContext(object):
         """Transports may choose to delay incoming requests. When a context
         is queued but waiting, this is False."""
 
-        self.__descriptor = None
-
+        self._descriptor = None
         #
         # Input
         #
@@ -336,11 +371,101 @@ class MethodContext(object):
 
         self.fire_event("method_context_created")
 
+    @property
+    def transport(self):
+        """The transport-specific context. Transport implementors can use this
+        to their liking."""
+
+        retval = self._transport
+        if retval is _LAZY:
+            retval = None
+            if self.TransportContext is not None:
+                retval = self.TransportContext(self, self._server)
+            self._transport = retval
+
+        return retval
+
+    @transport.setter
+    def transport(self, what):
+        self._transport = what
+
+    @property
+    def outprot_ctx(self):
+        """The output-protocol-specific context. Protocol implementors can use
+        this to their liking."""
+
+        retval = self._outprot_ctx
+        if retval is _LAZY:
+            retval = None
+            if self.app.out_protocol is not None:
+                retval = self.app.out_protocol.get_context(self, self._server)
+            self._outprot_ctx = retval
+
+        return retval
+
+    @outprot_ctx.setter
+    def outprot_ctx(self, what):
+        self._outprot_ctx = what
+
+    @property
+    def inprot_ctx(self):
+        """The input-protocol-specific context. Protocol implementors can use
+        this to their liking."""
+
+        retval = self._inprot_ctx
+        if retval is _LAZY:
+            retval = None
+            if self.app.in_protocol is not None:
+                retval = self.app.in_protocol.get_context(self, self._server)
+            self._inprot_ctx = retval
+
+        return retval
+
+    @inprot_ctx.setter
+    def inprot_ctx(self, what):
+        self._inprot_ctx = what
+
+    @property
+    def protocol(self):
+        """The protocol-specific context. This points to the in_protocol when an
+        incoming message is being processed and out_protocol when an outgoing
+        message is being processed."""
+
+        retval = self._protocol
+        if retval is _LAZY:
+            if self._way is MethodContext.SERVER:
+                retval = self.inprot_ctx
+            else:
+                retval = self.outprot_ctx
+            self._protocol = retval
+
+        return retval
+
+    @protocol.setter
+    def protocol(self, what):
+        self._protocol = what
+
+    @property
+    def event(self):
+        """Event-specific context. Use this as you want, preferably only in
+        events, as you'd probably want to separate the event data from the
+        method data."""
+
+        retval = self._event
+        if retval is _LAZY:
+            retval = self._event = EventContext(self)
+
+        return retval
+
+    @event.setter
+    def event(self, what):
+        self._event = what
+
     def get_descriptor(self):
-        return self.__descriptor
+        return self._descriptor
 
     def set_descriptor(self, descriptor):
-        self.__descriptor = descriptor
+        self._descriptor = descriptor
         self.function = descriptor.function
 
     descriptor = property(get_descriptor, set_descriptor)
@@ -356,18 +481,19 @@ class MethodContext(object):
         if self.descriptor is not None:
             return self.descriptor.service_class
 
-    def __setattr__(self, k, v):
-        if not self.frozen or k in self.__dict__ or k in \
-                                                 ('descriptor', 'out_protocol'):
-            object.__setattr__(self, k, v)
-        else:
-            raise ValueError("use the udc member for storing arbitrary data "
-                             "in the method context")
-
     def __repr__(self):
         retval = deque()
 
-        for k, v in self.__dict__.items():
+        items = []
+        for k in self._slot_names:
+            try:
+                items.append((k, object.__getattribute__(self, k)))
+            except AttributeError:
+                pass
+
+        items.extend(getattr(self, '__dict__', {}).items())
+
+        for k, v in items:
             if isinstance(v, dict):
                 ret = deque(['{'])
 
@@ -386,8 +512,6 @@ class MethodContext(object):
         return ''.join((self.__class__.__name__, '(', ', '.join(retval), ')'))
 
     def close(self):
-        global _LAST_GC_RUN
-
         self.call_end = time()
         self.app.event_manager.fire_event("method_context_closed", self)
         for f in self.files:
@@ -395,15 +519,9 @@ class MethodContext(object):
 
         self.is_closed = True
 
-        # this is important to have file descriptors returned in a timely manner
-        t = time()
-        if (t - _LAST_GC_RUN) > const.MIN_GC_INTERVAL:
-            gc.collect()
-
-            dt = (time() - t)
-            _LAST_GC_RUN = t
-
-            logger.debug("gc.collect() took around %dms.", round(dt, 2) * 1000)
+        # this is important to have file descriptors returned in a timely
+        # manner. see spyne.util.gcpolicy.
+        self.app.gc_policy.context_closed(self)
 
     def set_out_protocol(self, what):
         self._out_protocol = what
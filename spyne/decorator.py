@@ -363,6 +363,9 @@ def rpc(*params, **kparams):
     :param _event_manager: An instance of :class:`spyne.EventManager` class.
     :param _logged: May be the string '...' to denote that the rpc arguments
         will not be logged.
+    :param _executor: Where the transport runs this method, eg. a
+        :class:`spyne.server.twisted.executor.ThreadPoolExecutor` instance.
+        Overrides the ``__executor__`` attribute of the service class.
     :param _evmgrs: Same as ``_event_managers``.
     :param _evmgr: Same as ``_event_manager``.
     :param _service_class: A :class:`Service` subclass. It's generally not a
@@ -405,6 +408,7 @@ def rpc(*params, **kparams):
             _static_when = kparams.pop("_static_when", None)
             _href = kparams.pop("_href", None)
             _logged = kparams.pop("_logged", True)
+            _executor = kparams.pop("_executor", None)
             _internal_key_suffix = kparams.pop('_internal_key_suffix', '')
             if '_service' in kparams and '_service_class' in kparams:
                 raise LogicError("Please pass only one of '_service' and "
@@ -535,6 +539,7 @@ def rpc(*params, **kparams):
                 default_on_null=_default_on_null,
                 event_managers=_event_managers,
                 logged=_logged,
+                executor=_executor,
             )
 
             if _patterns is not None and _no_self:
@@ -44,7 +44,7 @@ class MethodDescriptor(object):
                  parent_class, port_type, no_ctx, udd, class_key, aux, patterns,
                  body_style, args, operation_name, no_self, translations,
                  when, static_when, service_class, href, internal_key_suffix,
-                 default_on_null, event_managers, logged):
+                 default_on_null, event_managers, logged, executor=None):
 
         self.__real_function = function
         """The original callable for the user code."""
@@ -183,6 +183,11 @@ class MethodDescriptor(object):
         self.logged = logged
         """Denotes the logging style for this method."""
 
+        self.executor = executor
+        """Where the transport runs this method. None means the transport
+        default. See :mod:`spyne.server.twisted.executor` for the executors
+        that the Twisted http transport supports."""
+
         if self.service_class is not None:
             self.event_managers.append(self.service_class.event_manager)
 
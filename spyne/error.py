@@ -137,6 +137,15 @@ class ResourceAlreadyExistsError(Fault):
                                .__init__(self.CODE, fault_string % fault_object)
 
 
+class ServiceUnavailableError(Fault):
+    """Raised when the server is too busy to process the request."""
+
+    CODE = 'Server.ServiceUnavailable'
+
+    def __init__(self, faultstring="Service unavailable"):
+        super(ServiceUnavailableError, self).__init__(self.CODE, faultstring)
+
+
 class Redirect(Fault):
     """Raised when client needs to make another request for the same
     resource."""
@@ -78,6 +78,6 @@ class EventManager(object):
                         stored in ctx.event attribute.
         """
 
-        handlers = self.handlers.get(event_name, oset())
+        handlers = self.handlers.get(event_name, ())
         for handler in handlers:
             handler(ctx, *args, **kwargs)
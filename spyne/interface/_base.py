@@ -341,6 +341,9 @@ class Interface(object):
                 if method.aux is None:
                     method.aux = s.__aux__
 
+                if method.executor is None:
+                    method.executor = s.__executor__
+
                 if method.aux is not None:
                     method.aux.methods.append(method.gen_interface_key(s))
 
@@ -383,6 +386,9 @@ class Interface(object):
                     if method.out_header is None:
                         method.out_header = s.__out_header__
 
+                    if method.executor is None:
+                        method.executor = s.__executor__
+
                     # FIXME: There's no need to process aux info here as it's
                     # not currently known how to write aux member methods in the
                     # first place.
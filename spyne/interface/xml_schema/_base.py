@@ -20,14 +20,16 @@
 import logging
 logger = logging.getLogger('.'.join(__name__.split(".")[:-1]))
 
-import os
-import shutil
-import tempfile
+import threading
 
 import spyne.const.xml as ns
 
 from lxml import etree
+from hashlib import sha1
 from itertools import chain
+from collections import OrderedDict
+
+from spyne import const
 
 from spyne.util.cdict import cdict
 from spyne.util.odict import odict
@@ -75,6 +77,46 @@ _ns_soap = ns.NS_WSDL11_SOAP
 _pref_wsa = ns.PREFMAP[_ns_wsa]
 
 
+_VALIDATION_BASE_URL = 'spyne-xsd://validation/'
+
+_validation_schemas = OrderedDict()
+_validation_schemas_lock = threading.Lock()
+
+
+class _SchemaResolver(etree.Resolver):
+    """Serves the schema documents of an interface from memory."""
+
+    def __init__(self, documents):
+        super(_SchemaResolver, self).__init__()
+
+        self.documents = documents
+
+    def resolve(self, url, pubid, context):
+        if url.startswith(_VALIDATION_BASE_URL):
+            data = self.documents.get(url[len(_VALIDATION_BASE_URL):], None)
+            if data is not None:
+                return self.resolve_string(data, context, base_url=url)
+
+
+def _compile_validation_schema(documents, root_file_name):
+    parser = etree.XMLParser()
+    parser.resolvers.add(_SchemaResolver(documents))
+
+    try:
+        root = etree.fromstring(documents[root_file_name], parser,
+                                base_url=_VALIDATION_BASE_URL + root_file_name)
+        return etree.XMLSchema(root)
+
+    except Exception:
+        logger.error("This could be a Spyne error. Unless you're "
+                     "sure the reason for this error is outside "
+                     "Spyne, please open a new issue with a "
+                     "minimal test case that reproduces it.")
+        for k, v in sorted(documents.items()):
+            logger.error("Schema document %r:\n%s", k, v.decode('utf8'))
+        raise
+
+
 class SchemaInfo(object):
     def __init__(self):
         self.elements = odict()
@@ -202,44 +244,50 @@ class XmlSchema(InterfaceDocumentBase):
                     schema_root.append(element)
 
     def build_validation_schema(self):
-        """Build application schema specifically for xml validation purposes."""
+        """Build application schema specifically for xml validation purposes.
+
+        Schema documents are compiled in memory. Compiled schemas are cached
+        in the process, keyed by the hash of the schema documents, so
+        protocol instances and applications with identical interfaces share
+        the same ``etree.XMLSchema`` instance. Build your applications before
+        forking to also share it with pre-forked worker processes.
+        """
 
         self.build_schema_nodes(with_schema_location=True)
 
         pref_tns = self.interface.get_namespace_prefix(self.interface.tns)
-        tmp_dir_name = tempfile.mkdtemp(prefix='spyne')
-        logger.debug("generating schema for targetNamespace=%r, prefix: "
-                  "%r in dir %r" % (self.interface.tns, pref_tns, tmp_dir_name))
-
-        try:
-            # serialize nodes to files
-            for k, v in self.schema_dict.items():
-                file_name = os.path.join(tmp_dir_name, "%s.xsd" % k)
-                with open(file_name, 'wb') as f:
-                    etree.ElementTree(v).write(f, pretty_print=True)
-
-                logger.debug("writing %r for ns %s" %
-                             (file_name, self.interface.nsmap[k]))
-
-            with open(os.path.join(tmp_dir_name, "%s.xsd" % pref_tns), 'r') as f:
-                try:
-                    self.validation_schema = etree.XMLSchema(etree.parse(f))
-
-                except Exception:
-                    f.seek(0)
-                    logger.error("This could be a Spyne error. Unless you're "
-                                 "sure the reason for this error is outside "
-                                 "Spyne, please open a new issue with a "
-                                 "minimal test case that reproduces it.")
-                    raise
-
-            shutil.rmtree(tmp_dir_name)
-            logger.debug("Schema built. Removed %r" % tmp_dir_name)
-
-        except Exception as e:
-            logger.exception(e)
-            logger.error("The schema files are left at: %r" % tmp_dir_name)
-            raise
+        logger.debug("generating schema for targetNamespace=%r, prefix: %r",
+                                                  self.interface.tns, pref_tns)
+
+        documents = {}
+        key = sha1()
+        for k, v in sorted(self.schema_dict.items()):
+            file_name = "%s.xsd" % k
+            documents[file_name] = data = etree.tostring(v)
+
+            key.update(file_name.encode('utf8'))
+            key.update(data)
+
+        root_file_name = "%s.xsd" % pref_tns
+        key.update(root_file_name.encode('utf8'))
+        key = key.hexdigest()
+
+        with _validation_schemas_lock:
+            schema = _validation_schemas.get(key, None)
+            if schema is None:
+                schema = _compile_validation_schema(documents, root_file_name)
+                _validation_schemas[key] = schema
+
+                while len(_validation_schemas) > \
+                                           const.VALIDATION_SCHEMA_CACHE_SIZE:
+                    _validation_schemas.popitem(last=False)
+
+                logger.debug("Validation schema %s built.", key)
+
+            else:
+                logger.debug("Validation schema %s reused.", key)
+
+        self.validation_schema = schema
 
     def get_schema_node(self, pref):
         """Return schema node for the given namespace prefix."""
@@ -33,6 +33,7 @@ import threading
 import spyne.const.xml
 
 from copy import deepcopy
+from weakref import WeakValueDictionary
 from collections import OrderedDict
 
 from spyne import const
@@ -856,6 +857,38 @@ class SimpleModelAttributesMeta(AttributesMeta):
     upattern = property(get_unicode_pattern, set_unicode_pattern)
 
 
+def _freeze(value):
+    """Returns a hashable representation of the given customization argument.
+    Raises ``TypeError`` when the argument can't be represented that way."""
+
+    if isinstance(value, dict):
+        return dict, tuple([(k, _freeze(v)) for k, v in value.items()])
+
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple([_freeze(v) for v in value])
+
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset([_freeze(v) for v in value])
+
+    hash(value)
+
+    # the type is part of the key so that e.g. 1 and True are kept apart
+    return type(value), value
+
+
+def _get_intern_key(cls, kwargs):
+    if len(kwargs) == 0 or 'type_name' in kwargs:
+        return None
+
+    try:
+        return cls, tuple(sorted([(k, _freeze(v)) for k, v in kwargs.items()]))
+    except TypeError:
+        return None
+
+
+_interned = WeakValueDictionary()
+
+
 class SimpleModel(ModelBase):
     """The base class for primitives."""
 
@@ -888,7 +921,20 @@ class SimpleModel(ModelBase):
     @classmethod
     def customize(cls, **kwargs):
         """Duplicates cls and overwrites the values in ``cls.Attributes`` with
-        ``**kwargs`` and returns the new class."""
+        ``**kwargs`` and returns the new class.
+
+        Customizations that don't end up as a separate type in the schema (e.g.
+        ``Unicode(min_occurs=1)``, as opposed to ``Unicode(64)``) are interned:
+        customizing the same class with equal arguments again returns the same
+        class. So the returned class must not be modified. Call ``customize()``
+        without arguments to get a private copy.
+        """
+
+        key = _get_intern_key(cls, kwargs)
+        if key is not None:
+            retval = _interned.get(key, None)
+            if retval is not None:
+                return retval
 
         cls_name, cls_bases, cls_dict = cls._s_customize(**kwargs)
 
@@ -903,6 +949,11 @@ class SimpleModel(ModelBase):
 
         retval.resolve_namespace(retval, kwargs.get('__namespace__'))
 
+        # anonymous types get named after the field they are assigned to, see
+        # ComplexModelBase.resolve_namespace, so they can't be shared.
+        if key is not None and retval.get_type_name() is not ModelBase.Empty:
+            _interned[key] = retval
+
         return retval
 
     @staticmethod
@@ -982,12 +1033,16 @@ class xml:
     :param root_tag: Root tag of the xml element that contains the field values.
     :param no_ns: When true, the xml document is stripped from namespace
         information. This is generally a stupid thing to do. Use with caution.
+    :param lazy: When true, the xml document is parsed on first access. See
+        :class:`spyne.util.lazydoc.LazyDocument`.
     """
 
-    def __init__(self, root_tag=None, no_ns=False, pretty_print=False):
+    def __init__(self, root_tag=None, no_ns=False, pretty_print=False,
+                                                                   lazy=False):
         self.root_tag = root_tag
         self.no_ns = no_ns
         self.pretty_print = pretty_print
+        self.lazy = lazy
 
 
 class table:
@@ -1043,25 +1098,33 @@ class json:
     :func:`ComplexModelBase.Attributes.store_as`.
 
     Make sure you don't mix this with the json package when importing.
+
+    :param lazy: When true, the json document is parsed on first access. See
+        :class:`spyne.util.lazydoc.LazyDocument`.
     """
 
-    def __init__(self, ignore_wrappers=True, complex_as=dict):
+    def __init__(self, ignore_wrappers=True, complex_as=dict, lazy=False):
         if ignore_wrappers != True:
             raise NotImplementedError("ignore_wrappers != True")
         self.ignore_wrappers = ignore_wrappers
         self.complex_as = complex_as
+        self.lazy = lazy
 
 
 class jsonb:
     """Compound option object for jsonb serialization. It's meant to be passed
     to :func:`ComplexModelBase.Attributes.store_as`.
+
+    :param lazy: When true, the json document is parsed on first access. See
+        :class:`spyne.util.lazydoc.LazyDocument`.
     """
 
-    def __init__(self, ignore_wrappers=True, complex_as=dict):
+    def __init__(self, ignore_wrappers=True, complex_as=dict, lazy=False):
         if ignore_wrappers != True:
             raise NotImplementedError("ignore_wrappers != True")
         self.ignore_wrappers = ignore_wrappers
         self.complex_as = complex_as
+        self.lazy = lazy
 
 
 class msgpack:
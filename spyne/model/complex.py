@@ -45,8 +45,8 @@ from spyne.model._base import PSSM_VALUES, apply_pssm
 from spyne.model.primitive import NATIVE_MAP
 from spyne.model.primitive._base import AnyXml
 
-from spyne.util import six, memoize, memoize_id, sanitize_args, \
-    memoize_ignore_none
+from spyne.util import six, memoize_id, sanitize_args, memoize_ignore_none
+from spyne.util.memo import memoize_bounded
 from spyne.util.color import YEL
 from spyne.util.meta import Prepareable
 from spyne.util.odict import odict
@@ -69,6 +69,84 @@ def _get_flat_type_info(cls, retval):
     return retval
 
 
+def _iter_referenced_classes(cls):
+    yield getattr(cls, '__extends__', None)
+    yield getattr(cls, '__orig__', None)
+
+    # XmlAttribute, XmlData and friends wrap the actual type
+    sub = getattr(cls, 'type', None)
+    if isclass(sub):
+        yield sub
+
+    for v in getattr(cls, '_type_info', {}).values():
+        yield v
+
+
+def _get_dependent_classes(classes, roots):
+    """Returns the classes among the ones reachable from ``roots`` that extend,
+    customize or contain (directly or not) any of the given classes. The given
+    classes are also part of the return value."""
+
+    parents = {}
+    seen = set()
+    queue = deque(roots)
+    while len(queue) > 0:
+        cls = queue.popleft()
+        if cls in seen:
+            continue
+        seen.add(cls)
+
+        for sub in _iter_referenced_classes(cls):
+            if isclass(sub):
+                parents.setdefault(sub, []).append(cls)
+                queue.append(sub)
+
+    retval = set()
+    queue = deque(classes)
+    while len(queue) > 0:
+        cls = queue.popleft()
+        if cls in retval:
+            continue
+        retval.add(cls)
+        queue.extend(parents.get(cls, ()))
+
+    return retval
+
+
+def _forget_type_info(*classes):
+    """Drops the memoized type information of the given classes whose fields
+    were changed, along with that of the classes that depend on them."""
+
+    memos = (ComplexModelBase.get_flat_type_info,
+             ComplexModelBase.get_simple_type_info_with_prot)
+
+    roots = set()
+    for memo in memos:
+        roots.update([a for a in memo.get_arguments() if isclass(a)])
+
+    if len(roots) == 0:
+        return
+
+    stale = _get_dependent_classes(classes, roots)
+    for memo in memos:
+        memo.forget(stale)
+
+
+def _forget_subclasses(cls):
+    """Drops the memoized subclass lists that are affected by a new subclass
+    of ``cls``. Those are the lists of ``cls``, its base classes and their
+    variants, which share the list of subclasses with the original class."""
+
+    memo = ComplexModelBase.get_subclasses
+    while cls is not None:
+        memo.discard(cls)
+        variants = cls.Attributes._variants
+        if variants is not None:
+            for v in list(variants):
+                memo.discard(v)
+        cls = cls.__extends__
+
+
 class TypeInfo(odict):
     def __init__(self, *args, **kwargs):
         super(TypeInfo, self).__init__(*args, **kwargs)
@@ -318,7 +396,7 @@ def _get_type_info(cls, cls_name, cls_bases, cls_dict, attrs):
                     "customized class. You should first get your class " \
                     "hierarchy right, then start customizing classes."
 
-                b.get_subclasses.memo.clear()
+                _forget_subclasses(b)
                 logger.debug("Registering %r as base of '%s'", b, cls_name)
 
     if not ('_type_info' in cls_dict):
@@ -685,6 +763,9 @@ class ComplexModelMeta(with_metaclass(Prepareable, type(ModelBase))):
             if self.Attributes._subclasses is eattr._subclasses:
                 self.Attributes._subclasses = None
 
+        # get_subclasses is keyed by id(), see ComplexModelBase.customize
+        self.get_subclasses.discard(self)
+
         # sanitize fields
         for k, v in type_info.items():
             # replace bare SelfRerefence
@@ -1045,8 +1126,11 @@ class ComplexModelBase(ModelBase):
                 retval.extend(subc.get_subclasses())
         return retval
 
+    # Not weak: this is one of the hottest memoizers and weak keys would cost a
+    # weakref per lookup. Classes are long-lived anyway and maxsize caps the
+    # damage.
     @staticmethod
-    @memoize_ignore_none
+    @memoize_bounded(weak=False, base=memoize_ignore_none)
     def get_flat_type_info(cls):
         """Returns a _type_info dict that includes members from all base
         classes.
@@ -1081,7 +1165,7 @@ class ComplexModelBase(ModelBase):
                                                      cls, hier_delim=hier_delim)
 
     @staticmethod
-    @memoize
+    @memoize_bounded(weak=False)
     def get_simple_type_info_with_prot(cls, prot=None, hier_delim="."):
         """See :func:ComplexModelBase.get_simple_type_info"""
         fti = cls.get_flat_type_info(cls)
@@ -1264,11 +1348,10 @@ class ComplexModelBase(ModelBase):
 
         _process_child_attrs(cls, retval, kwargs)
 
-        # we could be smarter, but customize is supposed to be called only
-        # during daemon initialization, so it's not really necessary.
-        ComplexModelBase.get_subclasses.memo.clear()
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info_with_prot.memo.clear()
+        # Nothing that's memoized can refer to the new class yet. get_subclasses
+        # is keyed by id() though, so we make sure that the new class does not
+        # pick up the entry of a garbage-collected class with the same id.
+        ComplexModelBase.get_subclasses.discard(retval)
 
         return retval
 
@@ -1298,8 +1381,7 @@ class ComplexModelBase(ModelBase):
 
         cls._type_info[field_name] = field_type
 
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info_with_prot.memo.clear()
+        _forget_type_info(cls)
 
     @classmethod
     def _append_to_variants(cls, field_name, field_type):
@@ -1335,8 +1417,7 @@ class ComplexModelBase(ModelBase):
 
         cls._type_info.insert(index, (field_name, field_type))
 
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info_with_prot.memo.clear()
+        _forget_type_info(cls)
 
     @classmethod
     def insert_field(cls, index, field_name, field_type):
@@ -1355,8 +1436,7 @@ class ComplexModelBase(ModelBase):
 
         cls._type_info[field_name] = field_type
 
-        ComplexModelBase.get_flat_type_info.memo.clear()
-        ComplexModelBase.get_simple_type_info_with_prot.memo.clear()
+        _forget_type_info(cls)
 
     @classmethod
     def _replace_field(cls, field_name, field_type):
@@ -0,0 +1,113 @@
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""The ``spyne.protocol._attrs`` module contains the machinery that resolves
+the effective class attributes of Spyne types for a given protocol instance.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+from collections import deque
+
+
+META_ATTR = ['nullable', 'default_factory']
+
+
+class ClassAttrs(object):
+    """A read-only snapshot of ``cls.Attributes`` merged with protocol-specific
+    overrides from ``cls.Attributes.prot_attrs``.
+
+    Values live in the instance ``__dict__`` so that reading an existing
+    attribute is a plain attribute lookup. Reading a missing attribute returns
+    ``None``, just like :class:`spyne.util.attrdict.DefaultAttrDict`.
+    """
+
+    def __init__(self, data):
+        self.__dict__.update(data)
+
+    def __getattr__(self, key):
+        # only called when key is not in __dict__
+        if key.startswith('__'):
+            raise AttributeError(key)
+        return None
+
+    def __setattr__(self, key, value):
+        raise AttributeError("%r is read-only" % self.__class__.__name__)
+
+    def __delattr__(self, key):
+        raise AttributeError("%r is read-only" % self.__class__.__name__)
+
+    def __getitem__(self, key):
+        return self.__dict__.get(key, None)
+
+    def __iter__(self):
+        return iter(self.__dict__)
+
+    def get(self, key, *args):
+        return self.__dict__.get(key, *args)
+
+    def items(self):
+        return self.__dict__.items()
+
+    def __repr__(self):
+        return "ClassAttrs(%s)" % ', '.join(['%s=%r' % (k, v)
+                    for k, v in sorted(self.__dict__.items(), key=lambda x:x[0])])
+
+
+def build_cls_attrs(prot, cls):
+    """Returns a :class:`ClassAttrs` instance for the given protocol instance
+    and class."""
+
+    attrs = cls.Attributes
+
+    data = dict([(k, getattr(attrs, k)) for k in dir(attrs) + META_ATTR
+                                                     if not k.startswith('__')])
+
+    if attrs.prot_attrs:
+        data.update(attrs.prot_attrs.get(prot.__class__, {}))
+        data.update(attrs.prot_attrs.get(prot, {}))
+
+    return ClassAttrs(data)
+
+
+def get_reachable_classes(classes):
+    """Yields every class in the given iterable along with all the classes
+    that are reachable from them via member, array item, xml modifier and
+    parent class relationships. Every class is yielded only once."""
+
+    seen = set()
+    queue = deque(classes)
+
+    while len(queue) > 0:
+        cls = queue.popleft()
+        if cls is None or cls in seen or not hasattr(cls, 'Attributes'):
+            continue
+
+        seen.add(cls)
+        yield cls
+
+        queue.extend(getattr(cls, '_type_info', {}).values())
+
+        # XmlAttribute, XmlData and friends wrap the actual type
+        sub = getattr(cls, 'type', None)
+        if isinstance(sub, type):
+            queue.append(sub)
+
+        queue.append(getattr(cls, '__extends__', None))
+        queue.append(getattr(cls, '__orig__', None))
@@ -23,14 +23,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 from datetime import datetime
-from weakref import WeakKeyDictionary
+from weakref import WeakKeyDictionary, ref as weakref_ref
 
 from spyne import ProtocolContext, EventManager
-from spyne.const import DEFAULT_LOCALE
+from spyne.const import DEFAULT_LOCALE, TRACE
 from spyne.model import Array
 from spyne.error import ResourceNotFoundError
-from spyne.util import DefaultAttrDict
 from spyne.util.six import string_types
+from spyne.protocol._attrs import build_cls_attrs, get_reachable_classes
+from spyne.protocol._codec import Codec, HANDLER_TABLES
 
 
 _MISSING = type("_MISSING", (object,), {})()
@@ -74,7 +75,16 @@ class ProtocolMixin(object):
             self.mime_type = mime_type
 
         self._attrcache = WeakKeyDictionary()
+        self._attrcache_hits = 0
+        self._attrcache_misses = 0
         self._sortcache = WeakKeyDictionary()
+        self._tablecache = WeakKeyDictionary()
+        self._dtincache = WeakKeyDictionary()
+        self._dtoutcache = WeakKeyDictionary()
+        # keyed by id(cls) as this is looked up for every primitive value. The
+        # entries are removed by weakref callbacks, see _build_codec.
+        self._codeccache = {}
+        self._watching_handler_tables = False
 
     def _cast(self, cls_attrs, inst):
         if cls_attrs.parser is not None:
@@ -185,26 +195,126 @@ class ProtocolMixin(object):
                           cls if clsorig is None else clsorig)
 
     def get_cls_attrs(self, cls):
-        logger.debug("%r attrcache size: %d", self, len(self._attrcache))
+        """Returns the effective class attributes of ``cls`` for this protocol
+        instance as a read-only :class:`spyne.protocol._attrs.ClassAttrs`
+        instance. Missing attributes read as ``None``.
+
+        This is called several times per field during (de)serialization so
+        it must stay cheap -- please don't add logging here.
+        """
+
         attr = self._attrcache.get(cls, None)
         if attr is not None:
+            self._attrcache_hits += 1
             return attr
 
-        self._attrcache[cls] = attr = DefaultAttrDict([
-                (k, getattr(cls.Attributes, k))
-                        for k in dir(cls.Attributes) + META_ATTR
-                                                     if not k.startswith('__')])
+        self._attrcache_misses += 1
+        self._attrcache[cls] = attr = build_cls_attrs(self, cls)
 
-        if cls.Attributes.prot_attrs:
-            cls_attrs = cls.Attributes.prot_attrs.get(self.__class__, {})
-            # logger.debug("%r cls attr %r", cls, cls_attrs)
-            attr.update(cls_attrs)
+        return attr
 
-            inst_attrs = cls.Attributes.prot_attrs.get(self, {})
-            # logger.debug("%r inst attr %r", cls, cls_attrs)
-            attr.update(inst_attrs)
+    def warm_attrcache(self, classes):
+        """Resolves the class attributes of every class reachable from the
+        given iterable of classes in one pass, so that no cache misses happen
+        in the request path.
 
-        return attr
+        :param classes: An iterable of Spyne classes. Normally, it's
+            ``app.interface.classes.values()``.
+        :returns: The number of classes whose attributes were resolved.
+        """
+
+        retval = 0
+        for cls in get_reachable_classes(classes):
+            if not (cls in self._attrcache):
+                self._attrcache_misses += 1
+                self._attrcache[cls] = build_cls_attrs(self, cls)
+                retval += 1
+
+        logger.debug("%r attrcache warmed with %d new classes, size: %d",
+                                           self, retval, len(self._attrcache))
+
+        return retval
+
+    def get_codec(self, cls):
+        """Returns the :class:`spyne.protocol._codec.Codec` instance that
+        holds the conversion handlers and class attributes of ``cls`` for
+        this protocol instance.
+
+        Codecs are built once per class. When two threads race to build the
+        codec for the same class, both get the one that made it to the
+        cache first.
+        """
+
+        codec = self._codeccache.get(id(cls), None)
+        if codec is None:
+            codec = self._build_codec(cls)
+
+        return codec
+
+    def _build_codec(self, cls):
+        if not self._watching_handler_tables:
+            self._watch_handler_tables()
+
+        key = id(cls)
+        cache = self._codeccache
+
+        codec = Codec(self, cls)
+        # the callback runs while cls is being destroyed, so the entry is
+        # gone before its id can be reused by another object.
+        codec.ref = weakref_ref(cls, lambda _: cache.pop(key, None))
+
+        return cache.setdefault(key, codec)
+
+    def _watch_handler_tables(self):
+        # codecs hold the handlers they resolved, so any change to a handler
+        # table discards them.
+        for _, table_name in HANDLER_TABLES:
+            table = getattr(self, table_name, None)
+            if table is not None:
+                table.add_listener(self.reset_codeccache)
+
+        self._watching_handler_tables = True
+
+    def reset_codeccache(self):
+        """Discards every codec. This is called when a handler table of this
+        protocol instance is modified."""
+
+        self._codeccache.clear()
+
+    def warm_codeccache(self, classes):
+        """Builds codecs for every class reachable from the given iterable of
+        classes, so that no primitive conversion in the request path has to
+        resolve handlers.
+
+        Modifying a handler table afterwards discards the codecs, which are
+        then rebuilt on demand.
+
+        :param classes: An iterable of Spyne classes. Normally, it's
+            ``app.interface.classes.values()``.
+        :returns: The number of codecs built.
+        """
+
+        retval = 0
+        for cls in get_reachable_classes(classes):
+            if not (id(cls) in self._codeccache):
+                self._build_codec(cls)
+                retval += 1
+
+        logger.debug("%r codec cache warmed with %d new classes, size: %d",
+                                           self, retval, len(self._codeccache))
+
+        return retval
+
+    def get_attrcache_stats(self):
+        """Returns a dict with the ``size``, ``hits`` and ``misses`` counts of
+        the class attribute cache. Counters are not synchronized, so they
+        are approximate under concurrent access."""
+
+        return dict(
+            size=len(self._attrcache),
+            hits=self._attrcache_hits,
+            misses=self._attrcache_misses,
+        )
 
     def get_context(self, parent, transport):
         return ProtocolContext(parent, transport)
@@ -221,8 +331,10 @@ class ProtocolMixin(object):
         if len(call_handles) == 0:
             raise ResourceNotFoundError(ctx.method_request_string)
 
-        retval = []
-        for d in call_handles:
+        # the given context is used as the primary context, only auxiliary
+        # contexts need copies.
+        retval = [ctx]
+        for d in call_handles[1:]:
             assert d is not None
 
             c = ctx.copy()
@@ -230,6 +342,10 @@ class ProtocolMixin(object):
 
             retval.append(c)
 
+        primary = call_handles[0]
+        assert primary is not None
+        ctx.descriptor = primary
+
         return retval
 
     def get_call_handles(self, ctx):
@@ -253,31 +369,37 @@ class ProtocolMixin(object):
         """
 
         if not self.polymorphic:
-            logger.debug("PMORPH Skipped: %r is NOT polymorphic", self)
+            if TRACE:
+                logger.debug("PMORPH Skipped: %r is NOT polymorphic", self)
             return cls, False
 
         orig_cls = cls.__orig__ or cls
 
         if inst.__class__ is orig_cls:
-            logger.debug("PMORPH Skipped: Instance class %r is the same as "
-                                        "designated base class", inst.__class__)
+            if TRACE:
+                logger.debug("PMORPH Skipped: Instance class %r is the same "
+                                 "as designated base class", inst.__class__)
             return cls, False
 
         if not isinstance(inst, orig_cls):
-            logger.debug("PMORPH Skipped: Instance class %r is not a subclass "
-                        "of designated base class %r", inst.__class__, orig_cls)
+            if TRACE:
+                logger.debug("PMORPH Skipped: Instance class %r is not a "
+                              "subclass of designated base class %r",
+                                                     inst.__class__, orig_cls)
             return cls, False
 
         cls_attr = self.get_cls_attrs(cls)
         polymap_cls = cls_attr.polymap.get(inst.__class__, None)
 
         if polymap_cls is not None:
-            logger.debug("PMORPH OK: cls switch with polymap: %r => %r",
+            if TRACE:
+                logger.debug("PMORPH OK: cls switch with polymap: %r => %r",
                                                                cls, polymap_cls)
             return polymap_cls, True
 
         else:
-            logger.debug("PMORPH OK: cls switch without polymap: %r => %r",
+            if TRACE:
+                logger.debug("PMORPH OK: cls switch without polymap: %r => %r",
                                                             cls, inst.__class__)
             return inst.__class__, True
 
@@ -414,5 +536,3 @@ class ProtocolMixin(object):
 
         return items
 
-
-META_ATTR = ['nullable', 'default_factory']
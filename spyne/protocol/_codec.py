@@ -0,0 +1,69 @@
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""The ``spyne.protocol._codec`` module contains the per-class conversion
+records that protocols use to dispatch primitive conversions."""
+
+import logging
+logger = logging.getLogger(__name__)
+
+
+HANDLER_TABLES = (
+    ('to_bytes', '_to_bytes_handlers'),
+    ('to_unicode', '_to_unicode_handlers'),
+    ('from_bytes', '_from_bytes_handlers'),
+    ('from_unicode', '_from_unicode_handlers'),
+    ('to_bytes_iterable', '_to_bytes_iterable_handlers'),
+)
+
+
+def _missing_handler(cls, *_, **__):
+    raise KeyError(cls)
+
+
+class Codec(object):
+    """Bundles the conversion handlers resolved from a protocol instance's
+    handler tables for a single class, along with the effective attributes of
+    that class.
+
+    Instances are immutable once built. Handlers that the protocol does not
+    define raise ``KeyError``, just like a failed handler table lookup.
+    """
+
+    __slots__ = ('ref', 'attrs') + tuple(k for k, _ in HANDLER_TABLES)
+
+    def __init__(self, prot, cls):
+        # codecs must not keep their class alive, see
+        # ProtocolMixin._build_codec
+        self.ref = None
+
+        self.attrs = None
+        if hasattr(cls, 'Attributes'):
+            self.attrs = prot.get_cls_attrs(cls)
+
+        for key, table_name in HANDLER_TABLES:
+            table = getattr(prot, table_name, None)
+            handler = None
+            if table is not None:
+                handler = table.resolve(cls)
+            if handler is None:
+                handler = _missing_handler
+            setattr(self, key, handler)
+
+    def __repr__(self):
+        return "Codec(%r)" % (self.ref,)
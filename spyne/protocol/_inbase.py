@@ -70,6 +70,101 @@ _duration_re = re.compile(
     )
 
 
+_date_fromisoformat = getattr(date, 'fromisoformat', None)
+_time_fromisoformat = getattr(time, 'fromisoformat', None)
+_datetime_fromisoformat = getattr(datetime, 'fromisoformat', None)
+
+_offset_tzinfos = {}
+
+
+def _get_offset_tzinfo(minutes):
+    """Returns a cached ``pytz.FixedOffset`` instance for the given offset."""
+
+    retval = _offset_tzinfos.get(minutes, None)
+    if retval is None:
+        retval = _offset_tzinfos[minutes] = FixedOffset(minutes, {})
+    return retval
+
+
+def _is_fraction(s):
+    """Returns whether ``s`` is either empty or a dot followed by at most six
+    digits, which is what datetime can represent without rounding."""
+
+    return len(s) == 0 or (s[0] == '.' and 2 <= len(s) <= 7 and
+                                                              s[1:].isdigit())
+
+
+def _parse_time_iso_fast(string):
+    """Parses "HH:MM:SS[.ffffff]" with time.fromisoformat(). Returns None for
+    anything else so that the caller can fall back to the regex-based
+    parser."""
+
+    if _time_fromisoformat is None or len(string) < 8 or string[2] != ':' \
+                        or string[5] != ':' or not _is_fraction(string[8:]):
+        return None
+
+    try:
+        return _time_fromisoformat(string)
+    except ValueError:
+        return None
+
+
+def _parse_date_iso_fast(string):
+    """Parses "YYYY-MM-DD" with date.fromisoformat(). Returns None for
+    anything else so that the caller can fall back to the slow path."""
+
+    if _date_fromisoformat is None or len(string) != 10 or string[4] != '-' \
+                                or string[7] != '-' or not string[5].isdigit():
+        return None
+
+    try:
+        return _date_fromisoformat(string)
+    except ValueError:
+        return None
+
+
+def _parse_datetime_iso_fast(string):
+    """Parses "YYYY-MM-DDTHH:MM:SS[.ffffff][Z|+HH:MM]" with
+    datetime.fromisoformat(). Returns None for anything else so that the
+    caller can fall back to the regex-based parser, whose results this
+    function replicates for the strings it accepts."""
+
+    if _datetime_fromisoformat is None or len(string) < 19 \
+            or string[4] != '-' or string[7] != '-' or string[10] not in 'T ' \
+            or string[13] != ':' or string[16] != ':':
+        return None
+
+    tail = string[19:]
+    tz = None
+    if tail[-1:] == 'Z':
+        tz = pytz.utc
+        tail = tail[:-1]
+
+    elif len(tail) >= 6 and tail[-6] in '+-' and tail[-3] == ':':
+        tz_hr, tz_min = tail[-5:-3], tail[-2:]
+        if not (tz_hr.isdigit() and tz_min.isdigit()):
+            return None
+
+        offset = int(tz_hr) * 60 + int(tz_min)
+        if tail[-6] == '-':
+            offset = -offset
+        tz = _get_offset_tzinfo(offset)
+        tail = tail[:-6]
+
+    if not _is_fraction(tail):
+        return None
+
+    try:
+        retval = _datetime_fromisoformat(string[:19 + len(tail)])
+    except ValueError:
+        return None
+
+    if tz is not None:
+        retval = retval.replace(tzinfo=tz)
+
+    return retval
+
+
 class InProtocolBase(ProtocolMixin):
     """This is the abstract base class for all input protocol implementations.
     Child classes can implement only the required subset of the public methods.
@@ -227,12 +322,13 @@ class InProtocolBase(ProtocolMixin):
         if string is None:
             return None
 
+        codec = self.get_codec(class_)
+
         if isinstance(string, six.string_types) and \
-                           len(string) == 0 and class_.Attributes.empty_is_none:
+                             len(string) == 0 and codec.attrs.empty_is_none:
             return None
 
-        handler = self._from_bytes_handlers[class_]
-        return handler(class_, string, *args, **kwargs)
+        return codec.from_bytes(class_, string, *args, **kwargs)
 
     def from_unicode(self, class_, string, *args, **kwargs):
         if string is None:
@@ -243,14 +339,13 @@ class InProtocolBase(ProtocolMixin):
         #        "Invalid type passed to `from_unicode`: {}".format(
         #                                         (class_, type(string), string))
 
-        cls_attrs = self.get_cls_attrs(class_)
+        codec = self.get_codec(class_)
 
         if isinstance(string, six.string_types) and len(string) == 0 and \
-                                                        cls_attrs.empty_is_none:
+                                                     codec.attrs.empty_is_none:
             return None
 
-        handler = self._from_unicode_handlers[class_]
-        return handler(class_, string, *args, **kwargs)
+        return codec.from_unicode(class_, string, *args, **kwargs)
 
     def null_from_bytes(self, cls, value):
         return None
@@ -386,6 +481,10 @@ class InProtocolBase(ProtocolMixin):
     def time_from_unicode(self, cls, string):
         """Expects ISO formatted times."""
 
+        retval = _parse_time_iso_fast(string)
+        if retval is not None:
+            return retval
+
         match = _time_re.match(string)
         if match is None:
             raise ValidationError(string, "%%r does not match regex %r " %
@@ -412,6 +511,10 @@ class InProtocolBase(ProtocolMixin):
         no matter what.
         """
 
+        retval = _parse_date_iso_fast(string)
+        if retval is not None:
+            return retval
+
         try:
             return date(*(strptime(string, u'%Y-%m-%d')[0:3]))
 
@@ -439,34 +542,17 @@ class InProtocolBase(ProtocolMixin):
     def datetime_from_unicode_iso(self, cls, string):
         astz = self.get_cls_attrs(cls).as_timezone
 
-        match = cls._utc_re.match(string)
-        if match:
-            tz = pytz.utc
-            retval = _parse_datetime_iso_match(match, tz=tz)
-            if astz is not None:
-                retval = retval.astimezone(astz)
-            return retval
+        retval = _parse_datetime_iso_fast(string)
+        if retval is None:
+            retval = _parse_datetime_iso(cls, string)
 
-        if match is None:
-            match = cls._offset_re.match(string)
-            if match:
-                tz_hr, tz_min = [int(match.group(x))
-                                                   for x in ("tz_hr", "tz_min")]
-                tz = FixedOffset(tz_hr * 60 + tz_min, {})
-                retval = _parse_datetime_iso_match(match, tz=tz)
-                if astz is not None:
-                    retval = retval.astimezone(astz)
-                return retval
-
-        if match is None:
-            match = cls._local_re.match(string)
-            if match:
-                retval = _parse_datetime_iso_match(match)
-                if astz:
-                    retval = retval.replace(tzinfo=astz)
-                return retval
+        if astz is not None:
+            if retval.tzinfo is None:
+                retval = retval.replace(tzinfo=astz)
+            else:
+                retval = retval.astimezone(astz)
 
-        raise ValidationError(string)
+        return retval
 
     def datetime_from_unicode(self, cls, string):
         serialize_as = self.get_cls_attrs(cls).serialize_as
@@ -519,21 +605,27 @@ class InProtocolBase(ProtocolMixin):
                 raise ValidationError(e.message, "%s")
 
     def duration_from_unicode(self, cls, string):
-        duration = _duration_re.match(string).groupdict(0)
-        if duration is None:
+        match = _duration_re.match(string)
+        if match is None:
             raise ValidationError(string,
                 "Time data '%%s' does not match regex '%s'" %
                                                         (_duration_re.pattern,))
 
+        duration = match.groupdict(0)
+
         days = int(duration['days'])
         days += int(duration['months']) * 30
         days += int(duration['years']) * 365
         hours = int(duration['hours'])
         minutes = int(duration['minutes'])
-        seconds = float(duration['seconds'])
-        f, i = modf(seconds)
-        seconds = i
-        microseconds = int(1e6 * f)
+        seconds = duration['seconds']
+        if seconds == 0 or not ('.' in seconds):
+            # no float round trip for the common case of integral seconds
+            seconds = int(seconds)
+            microseconds = 0
+        else:
+            f, seconds = modf(float(seconds))
+            microseconds = int(1e6 * f)
 
         delta = timedelta(days=days, hours=hours, minutes=minutes,
             seconds=seconds, microseconds=microseconds)
@@ -583,13 +675,17 @@ class InProtocolBase(ProtocolMixin):
     def xmlattribute_from_bytes(self, cls, value):
         return self.from_bytes(cls.type, value)
 
-    def _datetime_from_unicode(self, cls, string):
-        cls_attrs = self.get_cls_attrs(cls)
+    def _get_datetime_in_plan(self, cls):
+        """Returns a ``(parser, dt_format, as_timezone)`` tuple for the given
+        DateTime subclass. Plans are built once per class and cached in the
+        protocol instance."""
 
-        # get parser
-        parser = cls_attrs.parser
+        retval = self._dtincache.get(cls, None)
+        if retval is not None:
+            return retval
+
+        cls_attrs = self.get_cls_attrs(cls)
 
-        # get date_format
         dt_format = cls_attrs.dt_format
         if dt_format is None:
             dt_format = cls_attrs.date_format
@@ -598,24 +694,31 @@ class InProtocolBase(ProtocolMixin):
         if dt_format is None:
             dt_format = cls_attrs.format
 
+        if six.PY2 and isinstance(dt_format, six.text_type):
+            # FIXME: perhaps it should encode to string's encoding instead
+            # of utf8 all the time
+            dt_format = dt_format.encode('utf8')
+
+        retval = (cls_attrs.parser, dt_format, cls_attrs.as_timezone)
+        self._dtincache[cls] = retval
+
+        return retval
+
+    def _datetime_from_unicode(self, cls, string):
+        parser, dt_format, astz = self._get_datetime_in_plan(cls)
+
         # parse the string
         if parser is not None:
             retval = parser(self, cls, string)
 
         elif dt_format is not None:
-            if six.PY2:
-                # FIXME: perhaps it should encode to string's encoding instead
-                # of utf8 all the time
-                if isinstance(dt_format, six.text_type):
-                    dt_format = dt_format.encode('utf8')
-                if isinstance(string, six.text_type):
-                    string = string.encode('utf8')
+            if six.PY2 and isinstance(string, six.text_type):
+                string = string.encode('utf8')
 
             retval = datetime.strptime(string, dt_format)
 
-            astz = cls_attrs.as_timezone
             if astz:
-                retval = retval.astimezone(cls_attrs.as_time_zone)
+                retval = retval.astimezone(astz)
 
         else:
             retval = self.datetime_from_unicode_iso(cls, string)
@@ -660,6 +763,31 @@ def _parse_datetime_iso_match(date_match, tz=None):
     return datetime(year, month, day, hour, minute, second, usecond, tz)
 
 
+def _parse_datetime_iso(cls, string):
+    """The regex-based parser for the strings :func:`_parse_datetime_iso_fast`
+    does not accept."""
+
+    match = cls._utc_re.match(string)
+    if match:
+        return _parse_datetime_iso_match(match, tz=pytz.utc)
+
+    match = cls._offset_re.match(string)
+    if match:
+        offset = int(match.group('tz_hr')[1:]) * 60 + \
+                                                   int(match.group('tz_min'))
+        if match.group('tz_hr')[0] == '-':
+            offset = -offset
+
+        return _parse_datetime_iso_match(match,
+                                              tz=_get_offset_tzinfo(offset))
+
+    match = cls._local_re.match(string)
+    if match:
+        return _parse_datetime_iso_match(match)
+
+    raise ValidationError(string)
+
+
 _dt_sec = lambda cls, val: \
         int(mktime(val.timetuple()))
 _dt_sec_float = lambda cls, val: \
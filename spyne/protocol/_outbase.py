@@ -41,6 +41,7 @@ except ImportError:
     html = None
 
 from spyne.protocol._base import ProtocolMixin
+from spyne.const import TRACE
 from spyne.model import ModelBase, XmlAttribute, SimpleModel, Null, \
     ByteArray, File, ComplexModelBase, AnyXml, AnyHtml, Unicode, Decimal, \
     Double, Integer, Time, DateTime, Uuid, Duration, Boolean, AnyDict, \
@@ -48,9 +49,10 @@ from spyne.model import ModelBase, XmlAttribute, SimpleModel, Null, \
 from spyne.model.relational import FileData
 
 from spyne.const.http import HTTP_400, HTTP_401, HTTP_404, HTTP_405, HTTP_413, \
-    HTTP_500
+    HTTP_500, HTTP_503
 from spyne.error import Fault, InternalError, ResourceNotFoundError, \
-    RequestTooLongError, RequestNotAllowed, InvalidCredentialsError
+    RequestTooLongError, RequestNotAllowed, InvalidCredentialsError, \
+    ServiceUnavailableError
 from spyne.model.binary import binary_encoding_handlers, \
     BINARY_ENCODING_USE_DEFAULT
 
@@ -181,6 +183,9 @@ class OutProtocolBase(ProtocolMixin):
         if isinstance(fault, InvalidCredentialsError):
             return HTTP_401
 
+        if isinstance(fault, ServiceUnavailableError):
+            return HTTP_503
+
         if isinstance(fault, Fault) and (fault.faultcode.startswith('Client.')
                                                 or fault.faultcode == 'Client'):
             return HTTP_400
@@ -199,8 +204,7 @@ class OutProtocolBase(ProtocolMixin):
         if value is None:
             return None
 
-        handler = self._to_bytes_handlers[cls]
-        retval = handler(cls, value, *args, **kwargs)
+        retval = self.get_codec(cls).to_bytes(cls, value, *args, **kwargs)
 
         # enable this only for testing. we're not as strict for performance
         # reasons
@@ -213,8 +217,7 @@ class OutProtocolBase(ProtocolMixin):
         if value is None:
             return None
 
-        handler = self._to_unicode_handlers[cls]
-        retval = handler(cls, value, *args, **kwargs)
+        retval = self.get_codec(cls).to_unicode(cls, value, *args, **kwargs)
 
         # enable this only for testing. we're not as strict for performance
         # reasons as well as not to take the joy of dealing with duck typing
@@ -232,8 +235,7 @@ class OutProtocolBase(ProtocolMixin):
         if isinstance(value, PushBase):
             return value
 
-        handler = self._to_bytes_iterable_handlers[cls]
-        return handler(cls, value)
+        return self.get_codec(cls).to_bytes_iterable(cls, value)
 
     def null_to_bytes(self, cls, value, **_):
         return b""
@@ -475,7 +477,8 @@ class OutProtocolBase(ProtocolMixin):
             return value[0]
 
         encoder = binary_encoding_handlers[encoding]
-        logger.debug("Using binary encoder %r for encoding %r",
+        if TRACE:
+            logger.debug("Using binary encoder %r for encoding %r",
                                                               encoder, encoding)
         retval = encoder(value)
         if encoding is not None and isinstance(retval, six.text_type):
@@ -646,42 +649,58 @@ class OutProtocolBase(ProtocolMixin):
     def model_base_to_unicode(self, cls, value, **kwargs):
         return cls.to_unicode(value, **kwargs)
 
-    def _datetime_to_unicode(self, cls, value, **_):
-        """Returns ISO formatted datetimes."""
-
-        cls_attrs = self.get_cls_attrs(cls)
+    def _get_datetime_out_plan(self, cls):
+        """Returns a ``(as_timezone, timezone, dt_format, str_format)`` tuple
+        for the given DateTime subclass. Plans are built once per class and
+        cached in the protocol instance."""
 
-        if cls_attrs.as_timezone is not None and value.tzinfo is not None:
-            value = value.astimezone(cls_attrs.as_timezone)
+        retval = self._dtoutcache.get(cls, None)
+        if retval is not None:
+            return retval
 
-        if not cls_attrs.timezone:
-            value = value.replace(tzinfo=None)
+        cls_attrs = self.get_cls_attrs(cls)
 
         dt_format = self._get_datetime_format(cls_attrs)
 
-        if dt_format is None:
-            retval = value.isoformat()
-
-        elif six.PY2 and isinstance(dt_format, unicode):
-            retval = self.strftime(value, dt_format.encode('utf8')).decode('utf8')
-
-        else:
-            retval = self.strftime(value, dt_format)
-
         # FIXME: must deprecate string_format, this should have been str_format
         str_format = cls_attrs.string_format
         if str_format is None:
             str_format = cls_attrs.str_format
-        if str_format is not None:
-            return str_format.format(value)
 
         # FIXME: must deprecate interp_format, this should have been just format
-        interp_format = cls_attrs.interp_format
-        if interp_format is not None:
-            return interp_format.format(value)
+        if str_format is None:
+            str_format = cls_attrs.interp_format
+
+        retval = (cls_attrs.as_timezone, cls_attrs.timezone, dt_format,
+                                                                    str_format)
+        self._dtoutcache[cls] = retval
 
         return retval
 
+    def _datetime_to_unicode(self, cls, value, **_):
+        """Returns ISO formatted datetimes."""
+
+        astz, timezone, dt_format, str_format = \
+                                             self._get_datetime_out_plan(cls)
+
+        if value.tzinfo is not None:
+            if astz is not None:
+                value = value.astimezone(astz)
+
+            if not timezone:
+                value = value.replace(tzinfo=None)
+
+        if str_format is not None:
+            return str_format.format(value)
+
+        if dt_format is None:
+            return value.isoformat()
+
+        if six.PY2 and isinstance(dt_format, unicode):
+            return self.strftime(value, dt_format.encode('utf8')).decode('utf8')
+
+        return self.strftime(value, dt_format)
+
     def _date_to_bytes(self, cls, value, **_):
         cls_attrs = self.get_cls_attrs(cls)
 
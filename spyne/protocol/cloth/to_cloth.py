@@ -32,6 +32,7 @@ from spyne.util import Break, coroutine
 from spyne.util.oset import oset
 from spyne.util.six import string_types
 from spyne.util.color import R, B
+from spyne.const import TRACE
 from spyne.model import Array, AnyXml, AnyHtml, ModelBase, ComplexModelBase, \
     PushBase, XmlAttribute, AnyUri, XmlData, Any
 
@@ -314,8 +315,10 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
             (eg. arrays).
         """
 
-        logger_c.debug("entering %s %r nsmap=%r attrib=%r skip=%s method=%s",
-                     cloth.tag, cloth.attrib, cloth.nsmap, attrib, skip, method)
+        if TRACE:
+            logger_c.debug("entering %s %r nsmap=%r attrib=%r skip=%s "
+                        "method=%s", cloth.tag, cloth.attrib, cloth.nsmap,
+                                                          attrib, skip, method)
 
         if not ctx.outprot_ctx.doctype_written:
             self.write_doctype(ctx, parent, cloth)
@@ -360,7 +363,8 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
             if elt_ctx is not None:
                 self.event_manager.fire_event(("before_exit", elt), ctx, parent)
                 elt_ctx.__exit__(None, None, None)
-                logger_c.debug("\texit norm %s %s", elt.tag, elt.attrib)
+                if TRACE:
+                    logger_c.debug("\texit norm %s %s", elt.tag, elt.attrib)
                 if elt.tail is not None:
                     parent.write(elt.tail)
 
@@ -369,7 +373,8 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
             if ancestors[:len(cureltstack)] != cureltstack:
                 # write following siblings before closing parent node
                 for sibl in elt.itersiblings(preceding=False):
-                    logger_c.debug("\twrite exit sibl %s %r %d",
+                    if TRACE:
+                        logger_c.debug("\twrite exit sibl %s %r %d",
                                                 sibl.tag, sibl.attrib, id(sibl))
                     parent.write(sibl)
 
@@ -379,11 +384,13 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
             prevsibls = _prevsibls(anc, self.strip_comments, since=last_elt)
             for elt in prevsibls:
                 if id(elt) in tags:
-                    logger_c.debug("\tskip  anc prevsibl %s %r",
+                    if TRACE:
+                        logger_c.debug("\tskip  anc prevsibl %s %r",
                                                             elt.tag, elt.attrib)
                     continue
 
-                logger_c.debug("\twrite anc prevsibl %s %r 0x%x",
+                if TRACE:
+                    logger_c.debug("\twrite anc prevsibl %s %r 0x%x",
                                                    elt.tag, elt.attrib, id(elt))
                 parent.write(elt)
 
@@ -395,7 +402,8 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
 
             anc_ctx = parent.element(anc.tag, anc.attrib, **kwargs)
             anc_ctx.__enter__()
-            logger_c.debug("\tenter norm %s %r 0x%x method: %r", anc.tag,
+            if TRACE:
+                logger_c.debug("\tenter norm %s %r 0x%x method: %r", anc.tag,
                                                     anc.attrib, id(anc), method)
             if anc.text is not None:
                 parent.write(anc.text)
@@ -414,11 +422,14 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
                 continue
 
             if id(elt) in tags:
-                logger_c.debug("\tskip  cloth prevsibl %s %r",
+                if TRACE:
+                    logger_c.debug("\tskip  cloth prevsibl %s %r",
                                                             elt.tag, elt.attrib)
                 continue
 
-            logger_c.debug("\twrite cloth prevsibl %s %r", elt.tag, elt.attrib)
+            if TRACE:
+                logger_c.debug("\twrite cloth prevsibl %s %r",
+                                                            elt.tag, elt.attrib)
             parent.write(elt)
 
         skip = skip or (cloth.tag == self.DATA_TAG_NAME)
@@ -459,7 +470,8 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
         cureltstack.append(cloth)
         curctxstack.append(curtag)
 
-        logger_c.debug("")
+        if TRACE:
+            logger_c.debug("")
 
     def _close_cloth(self, ctx, parent):
         rootstack = ctx.protocol.rootstack
@@ -471,18 +483,21 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
             if elt_ctx is not None:
                 self.event_manager.fire_event(("before_exit", elt), ctx, parent)
                 elt_ctx.__exit__(None, None, None)
-                logger_c.debug("exit %s close", elt.tag)
+                if TRACE:
+                    logger_c.debug("exit %s close", elt.tag)
                 if elt.tail is not None:
                     parent.write(elt.tail)
 
             for sibl in elt.itersiblings(preceding=False):
-                logger_c.debug("write %s nextsibl", sibl.tag)
+                if TRACE:
+                    logger_c.debug("write %s nextsibl", sibl.tag)
                 parent.write(sibl)
                 if sibl.tail is not None:
                     parent.write(sibl.tail)
 
             if elt is close_until:
-                logger_c.debug("closed until %r, breaking out", close_until)
+                if TRACE:
+                    logger_c.debug("closed until %r, breaking out", close_until)
                 break
 
         del ctx.protocol.eltstack[close_until]
@@ -597,14 +612,16 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
 
                         self._enter_cloth(ctx, cloth, parent, attrib=attrs,
                                                         method=cls_attrs.method)
-                        identifier = "%s.%s" % (prot_name, "null_to_cloth")
-                        logger_s.debug("Writing '%s' using %s type: %s.", name,
-                                                identifier, cls.get_type_name())
+                        if TRACE:
+                            identifier = "%s.%s" % (prot_name, "null_to_cloth")
+                            logger_s.debug("Writing '%s' using %s type: %s.",
+                                          name, identifier, cls.get_type_name())
                         parent.write(cloth)
 
                     else:
-                        logger_s.debug("Skipping '%s' type: %s because empty.",
-                                                      name, cls.get_type_name())
+                        if TRACE:
+                            logger_s.debug("Skipping '%s' type: %s because "
+                                         "empty.", name, cls.get_type_name())
                         self._enter_cloth(ctx, cloth, parent, skip=True,
                                                         method=cls_attrs.method)
 
@@ -629,7 +646,9 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
                     # easier for protocols to make decisions based on parents of
                     # instances at hand.
                     pushed = True
-                    logger_c.debug("%s %r pushed %r %r", R("#"), self, cls, inst)
+                    if TRACE:
+                        logger_c.debug("%s %r pushed %r %r", R("#"), self,
+                                                                      cls, inst)
                     ctx.outprot_ctx.inst_stack.append((cls, inst, from_arr))
 
                     # try rendering the array value
@@ -662,13 +681,16 @@ class ToClothMixin(OutProtocolBase, ClothParserMixin):
                     pass
                 finally:
                     if pushed:
-                        logger_c.debug("%s %r popped %r %r", B("#"),
+                        if TRACE:
+                            logger_c.debug("%s %r popped %r %r", B("#"),
                                                                 self, cls, inst)
                         ctx.outprot_ctx.inst_stack.pop()
 
         else:
             if pushed:
-                logger_c.debug("%s %r popped %r %r", B("#"), self, cls, inst)
+                if TRACE:
+                    logger_c.debug("%s %r popped %r %r", B("#"), self,
+                                                                      cls, inst)
                 ctx.outprot_ctx.inst_stack.pop()
 
     def model_base_to_cloth(self, ctx, cls, inst, cloth, parent, name,
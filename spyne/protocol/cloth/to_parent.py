@@ -28,6 +28,7 @@ from spyne.util.six.moves.collections_abc import Iterable
 from lxml import etree, html
 from lxml.builder import E
 
+from spyne.const import TRACE
 from spyne.const.xml import NS_XSI, NS_SOAP11_ENV, SOAP11_ENV
 from spyne.model import PushBase, ComplexModelBase, AnyXml, Fault, AnyDict, \
     AnyHtml, ModelBase, ByteArray, XmlData, Any, AnyUri, ImageUri, XmlAttribute
@@ -131,8 +132,9 @@ class ToParentMixin(OutProtocolBase):
                 # if instance is still None, use the global null handler to
                 # serialize it
                 if inst is None and self.use_global_null_handler:
-                    identifier = prot_name + '.null_to_parent'
-                    logger.debug("Writing %s using %s for %s.", name,
+                    if TRACE:
+                        identifier = prot_name + '.null_to_parent'
+                        logger.debug("Writing %s using %s for %s.", name,
                                                 identifier, cls.get_type_name())
                     self.null_to_parent(ctx, cls, inst, parent, name, **kwargs)
 
@@ -171,7 +173,8 @@ class ToParentMixin(OutProtocolBase):
                     # of instances at hand.
                     ctx.outprot_ctx.inst_stack.append( (cls, inst, from_arr) )
                     pushed = True
-                    logger.debug("%s %r pushed %r using %r",
+                    if TRACE:
+                        logger.debug("%s %r pushed %r using %r",
                                                      R("$"), self, cls, handler)
 
                     # disabled for performance reasons
@@ -203,8 +206,9 @@ class ToParentMixin(OutProtocolBase):
                         self._close_cloth(ctx, parent)
 
                     if pushed:
-                        logger.debug("%s %r popped %r %r", B("$"), self, cls,
-                                                                           inst)
+                        if TRACE:
+                            logger.debug("%s %r popped %r %r", B("$"),
+                                                                self, cls, inst)
                         ctx.outprot_ctx.inst_stack.pop()
 
         else:
@@ -212,7 +216,8 @@ class ToParentMixin(OutProtocolBase):
                 self._close_cloth(ctx, parent)
 
             if pushed:
-                logger.debug("%s %r popped %r %r", B("$"), self, cls, inst)
+                if TRACE:
+                    logger.debug("%s %r popped %r %r", B("$"), self, cls, inst)
                 ctx.outprot_ctx.inst_stack.pop()
 
     @coroutine
@@ -405,8 +410,9 @@ class ToParentMixin(OutProtocolBase):
         for k, v in self.sort_fields(cls):
             attr = self.get_cls_attrs(v)
             if attr.exc:
-                prot_name = self.__class__.__name__
-                logger.debug("%s: excluded for %s.", k, prot_name)
+                if TRACE:
+                    logger.debug("%s: excluded for %s.", k,
+                                                       self.__class__.__name__)
                 continue
 
             if issubclass(v, XmlAttribute):
@@ -31,6 +31,8 @@ from collections import defaultdict
 from spyne.util import six
 from spyne.util.six.moves.collections_abc import Iterable as AbcIterable
 
+from spyne.const import TRACE
+
 from spyne.error import ValidationError
 from spyne.error import ResourceNotFoundError
 
@@ -38,6 +40,48 @@ from spyne.model import ByteArray, File, Fault, ComplexModelBase, Array, Any, \
     AnyDict, Uuid, Unicode
 
 from spyne.protocol.dictdoc import DictDocument
+from spyne.util.lazydoc import LazyDocument, has_document, get_document, \
+    get_object
+
+
+_NO_DOC = object()
+"""Returned by :meth:`HierDictDocument._filter_doc` when a stored document
+can't be output without deserializing it first."""
+
+
+class _DictDeserializationTable(object):
+    """Precompiled member lookup tables for deserializing instances of a
+    ComplexModel subclass from dicts or sequences.
+
+    ``members`` maps incoming dict keys to ``(member, key, member_attrs,
+    is_array)`` tuples. ``keys`` is the sequence of non-excluded member names
+    that incoming sequences are paired with.
+    """
+
+    __slots__ = ['members', 'keys']
+
+    def __init__(self, members, keys):
+        self.members = members
+        self.keys = keys
+
+
+class StreamedArray(object):
+    """Stands for an array in a document produced by
+    :class:`HierDictDocument` whose items are converted only as they are
+    iterated over. Only emitted when the protocol has ``stream_iterables``
+    set and the array instance is not a ``list`` or a ``tuple``.
+    """
+
+    __slots__ = ['items']
+
+    def __init__(self, items):
+        self.items = items
+
+    def __iter__(self):
+        return self.items
+
+    def __repr__(self):
+        return "StreamedArray(%r)" % (self.items,)
 
 
 class HierDictDocument(DictDocument):
@@ -53,6 +97,13 @@ class HierDictDocument(DictDocument):
     from_serstr = DictDocument.from_unicode
     to_serstr = DictDocument.to_unicode
 
+    stream_iterables = False
+    """When ``True``, arrays whose instances are arbitrary iterables (e.g.
+    generators or database cursors) are not materialized in the outgoing
+    document but are represented by :class:`StreamedArray` instances. Only set
+    this for protocols whose ``create_out_string`` knows how to consume them.
+    """
+
     def get_class_name(self, cls):
         class_name = cls.get_type_name()
         if not six.PY2:
@@ -241,6 +292,43 @@ class HierDictDocument(DictDocument):
 
         return retval
 
+    def get_deserialization_table(self, cls):
+        """Returns the member lookup tables for deserializing instances of the
+        given ``ComplexModel`` subclass as a ``_DictDeserializationTable``
+        instance. Excluded members are omitted.
+
+        Tables are built once per class and cached in the protocol instance.
+        """
+
+        retval = self._tablecache.get(cls, None)
+        if retval is not None:
+            return retval
+
+        flat_type_info = cls.get_flat_type_info(cls)
+
+        candidates = {}
+        for k, (member, key) in flat_type_info.alt.items():
+            candidates[k] = (member, key)
+        for k, member in flat_type_info.items():
+            candidates[k] = (member, k)
+
+        members = {}
+        for k, (member, key) in candidates.items():
+            member_attrs = self.get_cls_attrs(member)
+            if member_attrs.exc:
+                continue
+
+            is_array = member_attrs.max_occurs > 1
+            members[k] = (member, key, member_attrs, is_array)
+
+        keys = tuple([k for k, v in flat_type_info.items()
+                                              if not self.get_cls_attrs(v).exc])
+
+        retval = self._tablecache[cls] = \
+                                     _DictDeserializationTable(members, keys)
+
+        return retval
+
     def _doc_to_object(self, ctx, cls, doc, validator=None):
         if doc is None:
             return []
@@ -305,6 +393,9 @@ class HierDictDocument(DictDocument):
             logger.critical("No flat_type_info found for type %r", cls)
             raise TypeError(cls)
 
+        table = self.get_deserialization_table(cls)
+        members = table.members
+
         # this is for validating cls.Attributes.{min,max}_occurs
         frequencies = defaultdict(int)
 
@@ -313,10 +404,8 @@ class HierDictDocument(DictDocument):
         except AttributeError:
             # Input is not a dict, so we assume it's a sequence that we can pair
             # with the incoming sequence with field names.
-            # TODO: cache this
             try:
-                items = zip([k for k, v in flat_type_info.items()
-                                         if not self.get_cls_attrs(v).exc], doc)
+                items = zip(table.keys, doc)
             except TypeError as e:
                 logger.error("Invalid document %r for %r", doc, cls)
                 raise ValidationError(doc)
@@ -329,19 +418,13 @@ class HierDictDocument(DictDocument):
                 except UnicodeDecodeError:
                     raise ValidationError(k)
 
-            member = flat_type_info.get(k, None)
-            if member is None:
-                member, k = flat_type_info.alt.get(k, (None, k))
-                if member is None:
-                    continue
-
-            member_attrs = self.get_cls_attrs(member)
-
-            if member_attrs.exc:
+            entry = members.get(k, None)
+            if entry is None:
                 continue
 
-            mo = member_attrs.max_occurs
-            if mo > 1:
+            member, k, member_attrs, is_array = entry
+
+            if is_array:
                 subinst = getattr(inst, k, None)
                 if subinst is None:
                     subinst = []
@@ -363,10 +446,25 @@ class HierDictDocument(DictDocument):
 
         return inst
 
+    def get_doc_key(self, cls):
+        """Returns a hashable that is equal for protocol instances that
+        produce the same document for instances of the given class. See
+        :class:`spyne.util.lazydoc.LazyDocument`."""
+
+        return (self.__class__, cls, self.ignore_wrappers, self.complex_as,
+                      self.polymorphic, self.key_encoding, self.binary_encoding)
+
     def _object_to_doc(self, cls, inst, tags=None):
         if inst is None:
             return None
 
+        if type(inst) is LazyDocument:
+            if has_document(inst, self.get_doc_key(cls)):
+                retval = self._filter_doc(cls, get_document(inst))
+                if retval is not _NO_DOC:
+                    return retval
+            inst = get_object(inst)
+
         if tags is None:
             tags = set()
 
@@ -413,6 +511,11 @@ class HierDictDocument(DictDocument):
 
         # transform the results into a dict:
         if cls.Attributes.max_occurs > 1:
+            if inst is not None and self.stream_iterables and \
+                                           not isinstance(inst, (list, tuple)):
+                return StreamedArray(self._iter_array_items(cls, inst, tags,
+                                                      cls_orig=cls_orig or cls))
+
             if inst is not None:
                 retval = []
 
@@ -420,8 +523,9 @@ class HierDictDocument(DictDocument):
                     if id(subinst) in tags:
                         # even when there is ONE already-serialized instance,
                         # we throw the whole thing away.
-                        logger.debug("Throwing the whole array away because "
-                                                        "found %d", id(subinst))
+                        if TRACE:
+                            logger.debug("Throwing the whole array away "
+                                                "because found %d", id(subinst))
 
                         # this is DANGEROUS
                         #logger.debug("Said array: %r", inst)
@@ -437,6 +541,106 @@ class HierDictDocument(DictDocument):
 
         return retval
 
+    def _filter_doc(self, cls, doc):
+        """Drops the keys that ``cls`` does not declare or excludes from a
+        stored document so that passing it through does not leak fields that
+        were removed from the model or hidden with ``exc=True``. Returns
+        ``_NO_DOC`` when the document can't be checked without deserializing
+        it."""
+
+        if self.polymorphic or not self.ignore_wrappers or \
+                                                  self.key_encoding is not None:
+            return _NO_DOC
+
+        if doc is None:
+            return None
+
+        cls_attrs = self.get_cls_attrs(cls)
+        if cls_attrs.exc:
+            return None
+
+        if cls_attrs.out_type is not None or cls_attrs.type is not None:
+            return _NO_DOC
+
+        if cls.Attributes.max_occurs > 1:
+            if not isinstance(doc, list):
+                return _NO_DOC
+
+            retval = []
+            for subdoc in doc:
+                subdoc = self._filter_doc_value(cls, subdoc)
+                if subdoc is _NO_DOC:
+                    return _NO_DOC
+                retval.append(subdoc)
+
+            return retval
+
+        return self._filter_doc_value(cls, doc)
+
+    def _filter_doc_value(self, cls, doc):
+        if doc is None:
+            return None
+
+        if issubclass(cls, (Any, AnyDict)):
+            return doc
+
+        if issubclass(cls, Array):
+            st, = cls._type_info.values()
+            return self._filter_doc(st, doc)
+
+        if issubclass(cls, File) or cls.Attributes._wrapper:
+            return _NO_DOC
+
+        if not issubclass(cls, ComplexModelBase):
+            if isinstance(doc, (dict, list)):
+                return _NO_DOC
+            return doc
+
+        cls_attrs = self.get_cls_attrs(cls)
+        if not isinstance(doc, dict) or cls_attrs.simple_field is not None \
+                or bool(cls_attrs.wrapper) \
+                or self.get_complex_as(cls_attrs) is not dict \
+                or getattr(cls.Attributes, 'serialize_as', False) is list:
+            return _NO_DOC
+
+        retval = {}
+        for k, v in self.sort_fields(cls):
+            subattr = self.get_cls_attrs(v)
+            if subattr.exc:
+                continue
+
+            sub_name = subattr.sub_name
+            if sub_name is None:
+                sub_name = k
+
+            val = doc.get(sub_name, None)
+            if val is None and (subattr.default is not None or
+                                   subattr.min_occurs > 0 or
+                                   self.get_complex_as(subattr) is list):
+                # let the serializer fill these in
+                return _NO_DOC
+
+            val = self._filter_doc(v, val)
+            if val is _NO_DOC:
+                return _NO_DOC
+
+            if val is not None:
+                retval[sub_name] = val
+
+        return retval
+
+    def _iter_array_items(self, cls, inst, tags, cls_orig):
+        for subinst in inst:
+            if id(subinst) in tags:
+                # the items before this one are already gone, so we can only
+                # skip it.
+                if TRACE:
+                    logger.debug("Skipping array item because found %d",
+                                                                   id(subinst))
+                continue
+
+            yield self._to_dict_value(cls, subinst, tags, cls_orig=cls_orig)
+
     def _get_member_pairs(self, cls, inst, tags):
         old_len = len(tags)
         tags = tags | {id(inst)}
@@ -462,7 +666,8 @@ class HierDictDocument(DictDocument):
                 if id(subinst) in tags:
                     continue
 
-            logger.debug("%s%r type is %r", "  " * len(tags), k, v)
+            if TRACE:
+                logger.debug("%s%r type is %r", "  " * len(tags), k, v)
 
             val = self._object_to_doc(v, subinst, tags)
             min_o = subattr.min_occurs
@@ -520,8 +725,9 @@ class HierDictDocument(DictDocument):
 
             subinst = getattr(inst, sf, None)
 
-            logger.debug("Render complex object %s to the value %r of its "
-                         "field '%s'", cls.get_type_name(), subinst, sf)
+            if TRACE:
+                logger.debug("Render complex object %s to the value %r of its "
+                             "field '%s'", cls.get_type_name(), subinst, sf)
 
             return self.to_unicode(subcls, subinst)
 
@@ -22,10 +22,13 @@ logger = logging.getLogger(__name__)
 
 import re
 
+from weakref import WeakKeyDictionary
+from operator import itemgetter
 from collections import deque
 from collections import defaultdict
 
 from spyne.util import six
+from spyne.const import TRACE
 from spyne.error import ValidationError
 
 from spyne.model import ByteArray, String, File, ComplexModelBase, Array, \
@@ -91,6 +94,50 @@ class SimpleDictDocument(DictDocument):
 
         self.hier_delim = hier_delim
         self.strict_arrays = strict_arrays
+        self._bindercache = WeakKeyDictionary()
+
+    def get_flat_binder(self, cls):
+        """Returns the flat dict binder of the given ``ComplexModel``
+        subclass for this protocol instance and its current ``hier_delim``.
+
+        The binder is a ``(simple_type_info, cls_attrs, plans)`` tuple where
+        ``plans`` maps every flat key without array indexes (e.g.
+        ``"a.b.c"`` for ``"a[3].b.c"``) to a ``(member, steps, leaf_attrs)``
+        tuple. ``steps`` contains a ``(key, member_class, member_attrs,
+        is_array)`` tuple for every intermediate class in the member path,
+        so that no type info or class attribute lookups are done per field.
+
+        Binders are cached in the protocol instance and rebuilt when the
+        simple type info of the class changes.
+        """
+
+        simple_type_info = cls.get_simple_type_info_with_prot(cls, self,
+                                                     hier_delim=self.hier_delim)
+
+        retval = self._bindercache.get(cls, None)
+        if retval is not None and retval[0] is simple_type_info:
+            return retval
+
+        plans = {}
+        for k, member in simple_type_info.items():
+            steps = []
+            ctype_info = cls.get_flat_type_info(cls)
+            for pkey in member.path[:-1]:
+                ncls = ctype_info[pkey]
+                nattrs = self.get_cls_attrs(ncls)
+                if issubclass(ncls, Array):
+                    ncls, = ncls._type_info.values()
+
+                is_array = self.get_cls_attrs(ncls).max_occurs > 1
+                steps.append((pkey, ncls, nattrs, is_array))
+                ctype_info = ncls.get_flat_type_info(ncls)
+
+            plans[k] = (member, tuple(steps), self.get_cls_attrs(member.type))
+
+        retval = (simple_type_info, self.get_cls_attrs(cls), plans)
+        self._bindercache[cls] = retval
+
+        return retval
 
     def _to_native_values(self, cls, member, orig_k, k, v, req_enc, validator):
         value = []
@@ -174,20 +221,33 @@ class SimpleDictDocument(DictDocument):
         else:
             retval = cls.get_deserialization_instance(ctx)
 
-        simple_type_info = cls.get_simple_type_info_with_prot(cls, self,
-                                                     hier_delim=self.hier_delim)
+        simple_type_info, ccls_attr, plans = self.get_flat_binder(cls)
 
-        logger.debug("Simple type info key: %r", simple_type_info.keys())
+        # the logging calls below are in the per-field loop, so don't even
+        # call them when they won't be emitted.
+        debug = TRACE and logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Simple type info key: %r", simple_type_info.keys())
 
         idxmap = defaultdict(dict)
-        for orig_k, v in sorted(doc.items(), key=lambda _k: _k[0]):
-            k = RE_HTTP_ARRAY_INDEX.sub("", orig_k)
 
-            member = simple_type_info.get(k, None)
-            if member is None:
-                logger.debug("\tdiscarding field %r" % k)
+        # timsort makes a single pass when the keys are already in canonical
+        # order.
+        for orig_k, v in sorted(doc.items(), key=itemgetter(0)):
+            has_index = '[' in orig_k
+            if has_index:
+                k = RE_HTTP_ARRAY_INDEX.sub("", orig_k)
+            else:
+                k = orig_k
+
+            plan = plans.get(k, None)
+            if plan is None:
+                if debug:
+                    logger.debug("\tdiscarding field %r", k)
                 continue
 
+            member, steps, member_attrs = plan
+
             if member.can_be_empty:
                 if v != ['empty']:  # maybe raise a ValidationError instead?
                     # 'empty' is the only valid value at this point after all
@@ -198,7 +258,7 @@ class SimpleDictDocument(DictDocument):
                 if issubclass(member.type, Array):
                     value = []
 
-                elif self.get_cls_attrs(member.type).max_occurs > 1:
+                elif member_attrs.max_occurs > 1:
                     value = []
 
                 else:
@@ -215,29 +275,22 @@ class SimpleDictDocument(DictDocument):
             # assign the native value to the relevant class in the nested object
             # structure.
             cinst = retval
-            ctype_info = cls.get_flat_type_info(cls)
-            ccls_attr = self.get_cls_attrs(cls)
             value = self._cast(ccls_attr, value)
 
             idx, nidx = 0, 0
             pkey = member.path[0]
             cfreq_key = cls, idx
 
-            indexes = deque(RE_HTTP_ARRAY_INDEX.findall(orig_k))
+            if has_index:
+                indexes = deque(RE_HTTP_ARRAY_INDEX.findall(orig_k))
+            else:
+                indexes = None
 
-            for pkey in member.path[:-1]:
+            for pkey, ncls, nattrs, is_array in steps:
                 nidx = 0
-                ncls, ninst = ctype_info[pkey], getattr(cinst, pkey, None)
-                nattrs = self.get_cls_attrs(ncls)
-                if issubclass(ncls, Array):
-                    ncls, = ncls._type_info.values()
-
-                ncls_attrs = self.get_cls_attrs(ncls)
-                mo = ncls_attrs.max_occurs
-                if mo > 1:
-                    if len(indexes) == 0:
-                        nidx = 0
-                    else:
+                ninst = getattr(cinst, pkey, None)
+                if is_array:
+                    if indexes:
                         nidx = int(indexes.popleft())
 
                     if ninst is None:
@@ -281,11 +334,9 @@ class SimpleDictDocument(DictDocument):
 
                 cfreq_key = cfreq_key + (ncls, nidx)
                 idx = nidx
-                ctype_info = ncls.get_flat_type_info(ncls)
 
             frequencies[cfreq_key][member.path[-1]] += len(value)
 
-            member_attrs = self.get_cls_attrs(member.type)
             if member_attrs.max_occurs > 1:
                 _v = getattr(cinst, member.path[-1], None)
                 is_set = True
@@ -295,29 +346,36 @@ class SimpleDictDocument(DictDocument):
                 else:
                     _v.extend(value)
 
-                set_skip = 'set ' if is_set else 'SKIP'
-                logger.debug("\t%s arr %r(%r) = %r" %
-                                           (set_skip, member.path, pkey, value))
+                if debug:
+                    logger.debug("\t%s arr %r(%r) = %r",
+                                     'set ' if is_set else 'SKIP', member.path,
+                                                                   pkey, value)
 
             else:
                 is_set = cinst._safe_set(member.path[-1], value[0],
                                                       member.type, member_attrs)
 
-                set_skip = 'set ' if is_set else 'SKIP'
-                logger.debug("\t%s val %r(%r) = %r" %
-                                        (set_skip, member.path, pkey, value[0]))
+                if debug:
+                    logger.debug("\t%s val %r(%r) = %r",
+                                     'set ' if is_set else 'SKIP', member.path,
+                                                                pkey, value[0])
 
         if validator is self.SOFT_VALIDATION:
-            logger.debug("\tvalidate_freq: \n%r", frequencies)
+            if debug:
+                logger.debug("\tvalidate_freq: \n%r", frequencies)
+
             for k, d in frequencies.items():
                 for i, path_cls in enumerate(k[:-1:2]):
                     attrs = self.get_cls_attrs(path_cls)
                     if not attrs.validate_freq:
-                        logger.debug("\t\tskip validate_freq: %r", k[:i*2])
+                        if debug:
+                            logger.debug("\t\tskip validate_freq: %r",
+                                                                       k[:i*2])
                         break
                 else:
                     path_cls = k[-2]
-                    logger.debug("\t\tdo validate_freq: %r", k)
+                    if debug:
+                        logger.debug("\t\tdo validate_freq: %r", k)
                     self._check_freq_dict(path_cls, d)
 
         if issubclass(cls, Array):
@@ -29,6 +29,7 @@ from lxml.html.builder import E
 from spyne import ModelBase, ComplexModelBase, Array
 from spyne.util import coroutine, Break, urlencode
 from spyne.util.oset import oset
+from spyne.const import TRACE
 from spyne.protocol.html.table import HtmlTableBase
 
 
@@ -116,7 +117,8 @@ class HtmlColumnTable(HtmlTableBase, HtmlColumnTableRowProtocol):
         if inst is None:
             return
 
-        logger.debug("Generate row for %r", cls)
+        if TRACE:
+            logger.debug("Generate row for %r", cls)
 
         mrpc_delim_elt = ''
         if self.mrpc_delim_text is not None:
@@ -128,7 +130,8 @@ class HtmlColumnTable(HtmlTableBase, HtmlColumnTableRowProtocol):
             for k, v in self.sort_fields(cls):
                 cls_attr = self.get_cls_attrs(v)
                 if cls_attr.exc:
-                    logger.debug("\tExclude table cell %r type %r for %r",
+                    if TRACE:
+                        logger.debug("\tExclude table cell %r type %r for %r",
                                                                       k, v, cls)
                     continue
 
@@ -148,7 +151,8 @@ class HtmlColumnTable(HtmlTableBase, HtmlColumnTableRowProtocol):
                         sub_name = "%s[%d]%s%s" % (name, array_index,
                                                      self.hier_delim, sub_name)
 
-                logger.debug("\tGenerate table cell %r type %r for %r",
+                if TRACE:
+                    logger.debug("\tGenerate table cell %r type %r for %r",
                                                                sub_name, v, cls)
 
                 td_attrs = {}
@@ -207,7 +211,8 @@ class HtmlColumnTable(HtmlTableBase, HtmlColumnTableRowProtocol):
                             **{'class': 'mrpc-operation'}
                         ))
 
-            logger.debug("Generate row for %r done.", cls)
+            if TRACE:
+                logger.debug("Generate row for %r done.", cls)
             self.extend_data_row(ctx, cls, inst, parent, name,
                                               array_index=array_index, **kwargs)
 
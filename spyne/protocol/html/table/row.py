@@ -30,6 +30,7 @@ from spyne import ModelBase, ByteArray, ComplexModelBase, Array, AnyUri, \
     ImageUri
 from spyne.util import coroutine, Break
 from spyne.util.cdict import cdict
+from spyne.const import TRACE
 from spyne.protocol.html.table import HtmlTableBase
 
 
@@ -97,8 +98,9 @@ class HtmlRowTable(HtmlTableBase):
                 for k, v in self.sort_fields(cls):
                     sub_attrs = self.get_cls_attrs(v)
                     if sub_attrs.exc:
-                        logger.debug("\tExclude table cell %r type %r for %r",
-                                                                      k, v, cls)
+                        if TRACE:
+                            logger.debug("\tExclude table cell %r type %r "
+                                                          "for %r", k, v, cls)
                         continue
                     try:
                         sub_value = getattr(inst, k, None)
@@ -48,6 +48,8 @@ import logging
 logger = logging.getLogger(__name__)
 
 from itertools import chain
+from importlib import import_module
+
 from spyne.util import six
 
 
@@ -70,6 +72,7 @@ from spyne.model.primitive import Integer
 from spyne.model.primitive import Boolean
 from spyne.model.fault import Fault
 from spyne.protocol.dictdoc import HierDictDocument
+from spyne.protocol.dictdoc.hier import StreamedArray
 
 
 # TODO: use this as default
@@ -86,6 +89,224 @@ class JsonEncoder(json.JSONEncoder):
             return list(o)
 
 
+def _json_default(o):
+    """Fallback for objects that json backends can't serialize natively. Just
+    like :class:`JsonEncoder`, it assumes such objects are generators or other
+    iterables, like :class:`spyne.protocol.dictdoc.hier.StreamedArray`."""
+
+    try:
+        return list(o)
+    except TypeError:
+        raise TypeError("%r is not JSON serializable" % (o,))
+
+
+class JsonBackend(object):
+    """Base class for the json encoders/decoders that :class:`JsonDocument`
+    can use. The keyword arguments passed to :class:`JsonDocument` that it
+    doesn't consume itself are passed to ``loads()`` and ``dumps()``.
+    """
+
+    name = None
+    """The name of the backend."""
+
+    decode_error = ValueError
+    """The exception class that ``loads()`` raises for invalid documents."""
+
+    def loads(self, s, **kwargs):
+        """Parses the given ``str`` or ``bytes`` instance."""
+        raise NotImplementedError()
+
+    def dumps(self, o, **kwargs):
+        """Serializes the given document to a ``str`` instance."""
+        raise NotImplementedError()
+
+    def dumpb(self, o, encoding, **kwargs):
+        """Serializes the given document to a ``bytes`` instance in the given
+        encoding."""
+        return self.dumps(o, **kwargs).encode(encoding)
+
+    def get_separators(self, kwargs):
+        """Returns the item and key separators ``dumps()`` uses."""
+        return ',', ':'
+
+
+class StdlibJsonBackend(JsonBackend):
+    """Uses a module that has the same interface as the ``json`` module from
+    the standard library, like ``json`` itself or ``simplejson``.
+
+    :param module_name: Name of the module to use. Defaults to ``simplejson``
+        when it's available, ``json`` otherwise.
+    """
+
+    def __init__(self, module_name=None):
+        if module_name is None:
+            self.module = json
+        else:
+            self.module = import_module(module_name)
+
+        self.name = self.module.__name__
+        if self.name == 'simplejson':
+            self.decode_error = self.module.JSONDecodeError
+
+    def loads(self, s, **kwargs):
+        return self.module.loads(s, **kwargs)
+
+    def dumps(self, o, **kwargs):
+        if not ('cls' in kwargs or 'default' in kwargs):
+            kwargs['default'] = _json_default
+        return self.module.dumps(o, **kwargs)
+
+    def get_separators(self, kwargs):
+        separators = kwargs.get('separators', None)
+        if separators is not None:
+            return separators
+
+        if kwargs.get('indent', None) is not None:
+            return ',', ': '
+
+        return ', ', ': '
+
+
+class OrjsonBackend(JsonBackend):
+    """Uses ``orjson``, which serializes ``datetime``, ``date``, ``time`` and
+    ``uuid.UUID`` instances natively. The ``sort_keys`` and ``indent``
+    (only with a width of 2) arguments are converted to their ``orjson``
+    counterparts, other arguments are rejected. ``loads()`` ignores its
+    arguments. Integers must fit in 64 bits.
+    """
+
+    name = 'orjson'
+
+    def __init__(self):
+        self.module = import_module('orjson')
+        self.decode_error = self.module.JSONDecodeError
+
+    def _get_option(self, kwargs):
+        orjson = self.module
+        retval = orjson.OPT_NON_STR_KEYS
+
+        for k, v in kwargs.items():
+            if k == 'sort_keys':
+                if v:
+                    retval |= orjson.OPT_SORT_KEYS
+
+            elif k == 'indent':
+                if v == 2:
+                    retval |= orjson.OPT_INDENT_2
+                elif v is not None:
+                    raise ValueError("orjson only supports indent=2")
+
+            else:
+                raise TypeError("orjson does not support the %r argument" % k)
+
+        return retval
+
+    def loads(self, s, **kwargs):
+        return self.module.loads(s)
+
+    def dumps(self, o, **kwargs):
+        return self.module.dumps(o, default=_json_default,
+                                 option=self._get_option(kwargs)).decode('utf8')
+
+    def dumpb(self, o, encoding, **kwargs):
+        retval = self.module.dumps(o, default=_json_default,
+                                                option=self._get_option(kwargs))
+        if encoding.lower().replace('-', '') == 'utf8':
+            return retval
+        return retval.decode('utf8').encode(encoding)
+
+    def get_separators(self, kwargs):
+        if kwargs.get('indent', None) is not None:
+            return ',', ': '
+        return ',', ':'
+
+
+class UjsonBackend(JsonBackend):
+    """Uses ``ujson``. Forward slashes are not escaped unless the
+    ``escape_forward_slashes`` argument says otherwise, to match the output of
+    the ``json`` module."""
+
+    name = 'ujson'
+
+    def __init__(self):
+        self.module = import_module('ujson')
+        self.decode_error = getattr(self.module, 'JSONDecodeError', ValueError)
+
+    def loads(self, s, **kwargs):
+        return self.module.loads(s, **kwargs)
+
+    def dumps(self, o, **kwargs):
+        kwargs.setdefault('escape_forward_slashes', False)
+        return self.module.dumps(o, default=_json_default, **kwargs)
+
+    def get_separators(self, kwargs):
+        if kwargs.get('indent', None):
+            return ',', ': '
+        return ',', ':'
+
+
+class RapidjsonBackend(JsonBackend):
+    """Uses ``python-rapidjson``. Unless told otherwise via the
+    ``datetime_mode``, ``uuid_mode`` and ``number_mode`` arguments, it
+    serializes ``datetime``, ``date`` and ``time`` instances in ISO 8601
+    format, ``uuid.UUID`` instances in their canonical form and
+    ``decimal.Decimal`` instances as numbers."""
+
+    name = 'rapidjson'
+
+    def __init__(self):
+        self.module = rapidjson = import_module('rapidjson')
+        self.decode_error = rapidjson.JSONDecodeError
+        self.dumps_defaults = dict(
+            datetime_mode=rapidjson.DM_ISO8601,
+            uuid_mode=rapidjson.UM_CANONICAL,
+            number_mode=rapidjson.NM_DECIMAL,
+        )
+
+    def loads(self, s, **kwargs):
+        return self.module.loads(s, **kwargs)
+
+    def dumps(self, o, **kwargs):
+        for k, v in self.dumps_defaults.items():
+            kwargs.setdefault(k, v)
+        return self.module.dumps(o, default=_json_default, **kwargs)
+
+    def get_separators(self, kwargs):
+        if kwargs.get('indent', None) is not None:
+            return ',', ': '
+        return ',', ':'
+
+
+_json_backends = {
+    'json': lambda: StdlibJsonBackend('json'),
+    'simplejson': lambda: StdlibJsonBackend('simplejson'),
+    'orjson': OrjsonBackend,
+    'ujson': UjsonBackend,
+    'rapidjson': RapidjsonBackend,
+}
+
+
+def get_json_backend(backend=None):
+    """Returns a :class:`JsonBackend` instance for the given backend name. When
+    ``backend`` is ``None``, returns the default backend, which uses
+    ``simplejson`` when it's available, ``json`` otherwise. When ``backend``
+    is already a :class:`JsonBackend` instance, it's returned as is.
+
+    Raises ``ImportError`` when the requested package is not installed.
+    """
+
+    if backend is None:
+        return StdlibJsonBackend()
+
+    if isinstance(backend, JsonBackend):
+        return backend
+
+    assert backend in _json_backends, "Unknown json backend %r. " \
+                      "Accepted ones are: %r" % (backend, tuple(_json_backends))
+
+    return _json_backends[backend]()
+
+
 NON_NUMBER_TYPES = tuple({list, dict, six.text_type, six.binary_type})
 
 
@@ -96,6 +317,17 @@ class JsonDocument(HierDictDocument):
     :param ignore_wrappers: Does not serialize wrapper objects.
     :param complex_as: One of (list, dict). When list, the complex objects are
         serialized to a list of values instead of a dict of key/value pairs.
+    :param backend: The json implementation to use. One of ``'json'``,
+        ``'simplejson'``, ``'orjson'``, ``'ujson'``, ``'rapidjson'`` or a
+        :class:`JsonBackend` instance. Defaults to ``simplejson`` when it's
+        available, ``json`` otherwise. See :func:`get_json_backend`.
+    :param stream_iterables: When ``True``, arrays that are not passed as
+        ``list`` or ``tuple`` instances, like generators returned from functions
+        with an ``Iterable`` return type, are serialized item by item while
+        the outgoing string is being consumed by the transport, so that they
+        are never held in memory in their entirety. The ``indent`` and
+        ``sort_keys`` arguments to ``json.dumps`` are not honoured for
+        documents that contain such arrays.
     """
 
     mime_type = 'application/json'
@@ -114,7 +346,7 @@ class JsonDocument(HierDictDocument):
                         # DictDocument specific
                         ignore_wrappers=True, complex_as=dict, ordered=False,
                         default_string_encoding=None, polymorphic=False,
-                        **kwargs):
+                        stream_iterables=False, backend=None, **kwargs):
 
         super(JsonDocument, self).__init__(app, validator, mime_type, ignore_uncap,
                                ignore_wrappers, complex_as, ordered, polymorphic)
@@ -132,6 +364,8 @@ class JsonDocument(HierDictDocument):
         self._to_unicode_handlers[Integer] = self._ret
 
         self.default_string_encoding = default_string_encoding
+        self.stream_iterables = stream_iterables
+        self.backend = get_json_backend(backend)
         self.kwargs = kwargs
 
     def _ret(self, cls, value):
@@ -163,7 +397,8 @@ class JsonDocument(HierDictDocument):
 
     @message.setter
     def message(self, val):
-        if val is self.RESPONSE and not ('cls' in self.kwargs):
+        if val is self.RESPONSE and not ('cls' in self.kwargs) and \
+                                   isinstance(self.backend, StdlibJsonBackend):
             self.kwargs['cls'] = JsonEncoder
         self.__message = val
 
@@ -177,21 +412,111 @@ class JsonDocument(HierDictDocument):
                     in_string_encoding = self.default_string_encoding
                 if in_string_encoding is not None:
                     in_string = in_string.decode(in_string_encoding)
-            ctx.in_document = json.loads(in_string, **self.kwargs)
+            ctx.in_document = self.backend.loads(in_string, **self.kwargs)
 
-        except JSONDecodeError as e:
+        except self.backend.decode_error as e:
             raise Fault('Client.JsonDecodeError', repr(e))
 
     def create_out_string(self, ctx, out_string_encoding='utf8'):
         """Sets ``ctx.out_string`` using ``ctx.out_document``."""
+
+        if self.stream_iterables:
+            ctx.out_string = chain.from_iterable(self._iter_json(o)
+                                                      for o in ctx.out_document)
+            if out_string_encoding is not None:
+                ctx.out_string = (s.encode(out_string_encoding)
+                                                        for s in ctx.out_string)
+            return
+
+        backend = self.backend
         if out_string_encoding is None:
-            ctx.out_string = (json.dumps(o, **self.kwargs)
+            ctx.out_string = (backend.dumps(o, **self.kwargs)
                                                       for o in ctx.out_document)
         else:
             ctx.out_string = (
-                json.dumps(o, **self.kwargs).encode(out_string_encoding)
+                backend.dumpb(o, out_string_encoding, **self.kwargs)
                                                       for o in ctx.out_document)
 
+    def _iter_json(self, doc):
+        """Yields the json representation of the given document in fragments.
+        Every item of a :class:`StreamedArray` is serialized and yielded as
+        soon as it's produced."""
+
+        backend = self.backend
+        item_sep, key_sep = backend.get_separators(self.kwargs)
+
+        if isinstance(doc, StreamedArray):
+            sep = '['
+            for item in doc:
+                yield sep + backend.dumps(item, **self.kwargs)
+                sep = item_sep
+
+            if sep == '[':
+                yield '[]'
+            else:
+                yield ']'
+
+        elif isinstance(doc, dict):
+            sep = '{'
+            for k, v in doc.items():
+                yield sep + backend.dumps(_get_json_key(k), **self.kwargs) \
+                                                                      + key_sep
+                for s in self._iter_json(v):
+                    yield s
+                sep = item_sep
+
+            if sep == '{':
+                yield '{}'
+            else:
+                yield '}'
+
+        elif isinstance(doc, (list, tuple)):
+            sep = '['
+            for v in doc:
+                yield sep
+                for s in self._iter_json(v):
+                    yield s
+                sep = item_sep
+
+            if sep == '[':
+                yield '[]'
+            else:
+                yield ']'
+
+        else:
+            yield backend.dumps(doc, **self.kwargs)
+
+
+def _get_json_key(key):
+    """Converts the given dict key to a string the way the ``json`` module
+    does."""
+
+    if isinstance(key, six.string_types):
+        return key
+
+    # bool is a subclass of int, so these need to come first
+    if key is True:
+        return 'true'
+    if key is False:
+        return 'false'
+    if key is None:
+        return 'null'
+
+    if isinstance(key, six.integer_types):
+        return int.__repr__(key)
+
+    if isinstance(key, float):
+        if key != key:
+            return 'NaN'
+        if key == float('inf'):
+            return 'Infinity'
+        if key == float('-inf'):
+            return '-Infinity'
+        return float.__repr__(key)
+
+    raise TypeError("keys must be str, int, float, bool or None, not %s" %
+                                                          type(key).__name__)
+
 
 # Continuation of http://stackoverflow.com/a/24184379/1520211
 class HybridHttpJsonDocument(JsonDocument):
@@ -151,6 +151,11 @@ class MessagePackDocument(HierDictDocument):
             argument is ignored.
         """
 
+        # inline framing: the transport already decoded the document along
+        # with the message shell.
+        if ctx.in_string is None and ctx.in_document is not None:
+            return
+
         # handle mmap objects from in ctx.in_string as returned by
         # TwistedWebResource.handle_rpc.
         if isinstance(ctx.in_string, (list, tuple)) \
@@ -31,21 +31,17 @@ from __future__ import print_function, unicode_literals
 import logging
 logger = logging.getLogger(__name__)
 
-import re
+import quopri
 
-from base64 import b64encode
-from itertools import chain
-
-from lxml import etree
-
-from email import generator
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
-from email.encoders import encode_7or8bit
+from os.path import basename
+from mmap import mmap, ACCESS_READ
+from uuid import uuid4
+from base64 import b64decode
+from tempfile import TemporaryFile
 
 from spyne import ValidationError
 from spyne.util import six
-from spyne.model.binary import ByteArray, File
+from spyne.util.six import BytesIO
 from spyne.const.xml import NS_XOP
 
 if six.PY2:
@@ -56,57 +52,239 @@ else:
 
 XPATH_NSDICT = dict(xop=NS_XOP)
 
+MTOM_SPOOL_SIZE = 1024 * 1024
+"""Attachments larger than this many bytes are spooled to a temporary file
+instead of being kept in memory."""
+
+MAX_PART_HEADER_SIZE = 64 * 1024
+"""Max. size of the header block of a single mime part."""
+
+MTOM_START_ID = 'spyneEnvelope'
+
 
-def _join_attachment(ns_soap_env, href_id, envelope, payload, prefix=True):
-    """Places the data from an attachment back into a SOAP message, replacing
-    its xop:Include element or href.
+class MimeAttachment(object):
+    """A part of an incoming multipart/related message.
 
-    Returns a tuple of length 2 with the new message and the number of
-    replacements made
+    The body of the part is kept in memory until it grows past ``spool_size``
+    bytes, after which it's spooled to an anonymous temporary file.
 
-    :param  id:       content-id or content-location of attachment
-    :param  prefix:   Set this to true if id is content-id or false if it is
-                      content-location.  It prefixes a "cid:" to the href value.
-    :param  envelope: soap envelope string to be operated on
-    :param  payload:  attachment data
+    :param headers: The part headers as an ``email.message.Message`` instance.
+    :param spool_size: Max. size of an in-memory part.
     """
 
-    # grab the XML element of the message in the SOAP body
-    soaptree = etree.fromstring(envelope)
-    soapbody = soaptree.find("{%s}Body" % ns_soap_env)
+    __slots__ = ('headers', 'size', 'spool_size', '_chunks', '_file', '_map')
+
+    def __init__(self, headers, spool_size=MTOM_SPOOL_SIZE):
+        self.headers = headers
+        self.size = 0
+        self.spool_size = spool_size
+
+        self._chunks = []
+        self._file = None
+        self._map = None
+
+    @property
+    def content_id(self):
+        retval = self.headers.get('Content-ID', None)
+        if retval is not None:
+            retval = retval.strip().strip('<>')
+        return retval
+
+    @property
+    def content_location(self):
+        return self.headers.get('Content-Location', None)
+
+    @property
+    def content_type(self):
+        return self.headers.get_content_type()
+
+    @property
+    def file_name(self):
+        retval = self.headers.get_filename()
+        if retval is not None:
+            retval = basename(retval)
+        return retval
+
+    @property
+    def spooled(self):
+        return self._file is not None
+
+    def write(self, data):
+        self.size += len(data)
+
+        if self._file is not None:
+            self._file.write(data)
+            return
+
+        self._chunks.append(bytes(data))
+        if self.size > self.spool_size:
+            self._file = TemporaryFile()
+            for chunk in self._chunks:
+                self._file.write(chunk)
+            self._chunks = None
+
+    def finish(self):
+        """Called once the whole body is written. Undoes the
+        Content-Transfer-Encoding, if any."""
+
+        cte = self.headers.get('Content-Transfer-Encoding', '')
+        cte = cte.strip().lower()
+
+        if cte == 'base64':
+            decoder = b64decode
+        elif cte == 'quoted-printable':
+            decoder = quopri.decodestring
+        else:
+            decoder = None
 
-    if soapbody is None:
-        raise ValidationError(None, "SOAP Body tag not found")
+        if decoder is not None:
+            data = decoder(bytes(self.get_data()))
+            self.close()
 
-    message = None
-    for child in list(soapbody):
-        if child.tag != "{%s}Fault" % ns_soap_env:
-            message = child
-            break
+            self.size = 0
+            self._chunks = []
+            self._file = None
+            self.write(data)
+
+        if self._file is not None:
+            self._file.flush()
+
+    def get_data(self):
+        """Returns the body as a bytes-like object. It's a ``bytes`` instance
+        when the part is in memory and a read-only ``mmap`` instance when it
+        was spooled to a file."""
 
-    idprefix = ''
+        if self._file is None:
+            if len(self._chunks) != 1:
+                self._chunks = [b''.join(self._chunks)]
+            return self._chunks[0]
 
-    if prefix:
-        idprefix = "cid:"
-    href_id = "%s%s" % (idprefix, href_id,)
+        if self.size == 0:
+            return b''
 
-    num = 0
-    xpath = ".//xop:Include[@href=\"{}\"]".format(href_id)
+        if self._map is None:
+            self._map = mmap(self._file.fileno(), 0, access=ACCESS_READ)
 
-    for num, node in enumerate(message.xpath(xpath, namespaces=XPATH_NSDICT)):
-        parent = node.getparent()
-        parent.remove(node)
-        parent.text = payload
+        return self._map
 
-    return etree.tostring(soaptree), num
+    def get_handle(self):
+        """Returns a file object positioned at the beginning of the body."""
 
+        if self._file is None:
+            return BytesIO(self.get_data())
 
-def collapse_swa(ctx, content_type, ns_soap_env):
+        self._file.seek(0)
+        return self._file
+
+    def close(self):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # there are still memoryviews of it around. it's unmapped
+                # once they're gone.
+                pass
+            self._map = None
+
+        if self._file is not None:
+            self._file.close()
+
+
+def split_multipart(chunks, boundary, spool_size=MTOM_SPOOL_SIZE):
+    """Splits the multipart body in the given iterable of byte chunks into
+    :class:`MimeAttachment` instances without joining the body first.
+
+    Returns the list of parts in order of appearance.
     """
-    Translates an SwA multipart/related message into an application/soap+xml
-    message.
 
-    Returns the 'appication/soap+xml' version of the given HTTP body.
+    if not isinstance(boundary, bytes):
+        boundary = boundary.encode('ascii')
+
+    delim = b'\r\n--' + boundary
+    keep = len(delim) - 1
+
+    parts = []
+    part = None
+    in_headers = False
+    closed = False
+
+    # so that a delimiter at the very beginning of the body is found too.
+    data = b'\r\n'
+
+    for chunk in chunks:
+        if closed:
+            break  # ignore the epilogue
+
+        if len(data) == 0:
+            data = chunk
+        elif len(chunk) > 0:
+            data = data + chunk
+
+        while True:
+            if in_headers:
+                # the rest of the delimiter line is either '--' or optional
+                # whitespace, followed by CRLF.
+                if data.startswith(b'--'):
+                    closed = True
+                    break
+
+                hs = data.find(b'\r\n')
+                if hs < 0:
+                    break
+                hs += 2
+
+                if data.startswith(b'\r\n', hs):
+                    header_block, bs = b'', hs + 2
+
+                else:
+                    he = data.find(b'\r\n\r\n', hs)
+                    if he < 0:
+                        if len(data) > MAX_PART_HEADER_SIZE:
+                            raise ValidationError(None,
+                                                   "Mime part headers too long")
+                        break
+
+                    header_block, bs = data[hs:he], he + 4
+
+                headers = message_from_bytes(header_block + b'\r\n\r\n')
+                part = MimeAttachment(headers, spool_size)
+                data = data[bs:]
+                in_headers = False
+
+            i = data.find(delim)
+            if i < 0:
+                if len(data) > keep:
+                    if part is not None:
+                        part.write(memoryview(data)[:len(data) - keep])
+                    data = data[len(data) - keep:]
+                break
+
+            if part is not None:
+                part.write(memoryview(data)[:i])
+                part.finish()
+                parts.append(part)
+                part = None
+
+            data = data[i + len(delim):]
+            in_headers = True
+
+    if not closed:
+        raise ValidationError(None, "Truncated multipart message")
+
+    return parts
+
+
+def collapse_swa(ctx, content_type, ns_soap_env, spool_size=MTOM_SPOOL_SIZE):
+    """
+    Splits an SwA multipart/related message into the SOAP envelope and its
+    attachments.
+
+    Returns the SOAP part of the given HTTP body. Other parts are put in
+    ``ctx.inprot_ctx.in_attachments`` keyed by their 'cid:'-prefixed
+    Content-ID and their Content-Location. The protocol resolves the
+    xop:Include elements in the envelope against that dict, so attachment
+    data is passed to ``ByteArray`` and ``File`` fields as-is, without any
+    base64 round-tripping.
 
     References:
     SwA     http://www.w3.org/TR/SOAP-attachments
@@ -115,8 +293,9 @@ def collapse_swa(ctx, content_type, ns_soap_env):
             http://www.w3.org/Submission/soap11mtom10/
 
     :param  content_type: value of the Content-Type header field, parsed by
-                          cgi.parse_header() function
+                          spyne.server.http.parse_header()
     :param  ctx:          request context
+    :param  spool_size:   Attachments larger than this are spooled to disk.
     """
 
     envelope = ctx.in_string
@@ -128,78 +307,60 @@ def collapse_swa(ctx, content_type, ns_soap_env):
     if u'multipart/related' not in mime_type:
         return envelope
 
-    charset = content_data.get('charset', None)
-    if charset is None:
-        charset = 'ascii'
-
     boundary = content_data.get('boundary', None)
     if boundary is None:
         raise ValidationError(None, u"Missing 'boundary' value from "
                                                          u"Content-Type header")
 
-    envelope = list(envelope)
-
-    # What an ugly hack...
-    request = MIMEMultipart('related', boundary=boundary)
-    msg_string = re.sub(r"\n\n.*", '', request.as_string())
-    msg_string = chain(
-        (msg_string.encode(charset), generator.NL.encode('ascii')),
-        (e for e in envelope),
-    )
+    parts = split_multipart(envelope, boundary, spool_size)
+    if len(parts) == 0:
+        raise ValidationError(None, "Invalid MtoM request")
 
-    msg_string = b''.join(msg_string)
-    msg = message_from_bytes(msg_string)  # our message
+    root = content_data.get('start', None)
+    if root is not None:
+        root = root.strip().strip('<>')
 
     soapmsg = None
-    root = msg.get_param('start')
-
-    # walk through sections, reconstructing pure SOAP
-    for part in msg.walk():
-        # skip the multipart container section
-        if part.get_content_maintype() == 'multipart':
-            continue
+    attachments = {}
+    for i, part in enumerate(parts):
+        cid = part.content_id
 
         # detect main soap section
-        if (part.get('Content-ID') and part.get('Content-ID') == root) or \
-                (root is None and part == msg.get_payload()[0]):
-            soapmsg = part.get_payload()
+        if soapmsg is None and (cid == root or (root is None and i == 0)):
+            soapmsg = bytes(part.get_data())
             continue
 
-        # binary packages
-        cte = part.get("Content-Transfer-Encoding")
-
-        if cte != 'base64':
-            payload = b64encode(part.get_payload(decode=True))
-        else:
-            payload = part.get_payload()
-
-        cid = part.get("Content-ID").strip("<>")
-        cloc = part.get("Content-Location")
-        numreplaces = None
-
-        # Check for Content-ID and make replacement
         if cid:
-            soapmsg, numreplaces = _join_attachment(
-                                             ns_soap_env, cid, soapmsg, payload)
+            attachments['cid:' + cid] = part
 
-        # Check for Content-Location and make replacement
-        if cloc and not cid and not numreplaces:
-            soapmsg, numreplaces = _join_attachment(
-                                            ns_soap_env, cloc, soapmsg, payload,
-                                                                          False)
+        cloc = part.content_location
+        if cloc:
+            attachments[cloc] = part
+
+    # the temporary files and the mmaps of the parts are released when the
+    # context is closed.
+    ctx.files.extend(parts)
 
     if soapmsg is None:
         raise ValidationError(None, "Invalid MtoM request")
 
+    if ctx.inprot_ctx is not None and \
+                              hasattr(ctx.inprot_ctx, 'in_attachments'):
+        ctx.inprot_ctx.in_attachments = attachments
+
     return (soapmsg,)
 
 
-def apply_mtom(headers, envelope, params, paramvals):
-    """Apply MTOM to a SOAP envelope, separating attachments into a
-    MIME multipart message.
+def apply_mtom(headers, envelope, attachments):
+    """Wraps the SOAP envelope and its attachments in a MIME multipart/related
+    message. Attachment data is streamed as-is, without being encoded or
+    copied into an intermediate buffer.
 
-    Returns a tuple of length 2 with dictionary of headers and string of body
-    that can be sent with HTTPConnection
+    Returns a tuple of length 2 with the dictionary of headers and the
+    iterable of body chunks. Both are returned untouched when ``attachments``
+    is None. Otherwise a multipart message is returned even when
+    ``attachments`` is empty, as the envelope may be serialized lazily, in
+    which case the attachments are collected while the body is being sent.
 
     References:
     XOP     http://www.w3.org/TR/xop10/
@@ -210,106 +371,61 @@ def apply_mtom(headers, envelope, params, paramvals):
                      originally be sent.
     :param envelope  Iterable containing SOAP envelope string that would have
                      originally been sent.
-    :param params    params attribute from the Message object used for the SOAP
-    :param paramvals values of the params, passed to Message.to_parent
+    :param attachments A sequence of ``(content_id, content_type, chunks)``
+                     tuples, as collected in
+                     ``XmlProtocolContext.out_attachments``.
     """
 
-    # grab the XML element of the message in the SOAP body
-    envelope = ''.join(envelope)
-
-    soaptree = etree.fromstring(envelope)
-    soapbody = soaptree.find("{%s}Body" % _ns_soap_env)
-
-    message = None
-    for child in list(soapbody):
-        if child.tag == ("{%s}Fault" % _ns_soap_env):
-            return headers, envelope
-        else:
-            message = child
-            break
+    if attachments is None:
+        return headers, envelope
 
-    # Get additional parameters from original Content-Type
-    ctarray = []
+    root_type = 'text/xml'
+    charset = 'utf-8'
     for n, v in headers.items():
         if n.lower() == 'content-type':
             ctarray = v.split(';')
-            break
-
-    roottype = ctarray[0].strip()
-    rootparams = {}
-    for ctparam in ctarray[1:]:
-        n, v = ctparam.strip().split('=')
-        rootparams[n] = v.strip("\"'")
-
-    # Set up initial MIME parts.
-    mtompkg = MIMEMultipart('related', boundary='?//<><>spyne_MIME_boundary<>')
-    rootpkg = MIMEApplication(envelope, 'xop+xml', encode_7or8bit)
-
-    # Set up multipart headers.
-    del mtompkg['mime-version']
-    mtompkg.set_param('start-info', roottype)
-    mtompkg.set_param('start', '<spyneEnvelope>')
-    if 'SOAPAction' in headers:
-        mtompkg.add_header('SOAPAction', headers.get('SOAPAction'))
-
-    # Set up root SOAP part headers.
-    del rootpkg['mime-version']
-
-    rootpkg.add_header('Content-ID', '<spyneEnvelope>')
-
-    for n, v in rootparams.items():
-        rootpkg.set_param(n, v)
+            root_type = ctarray[0].strip()
+            for ctparam in ctarray[1:]:
+                k, _, pv = ctparam.strip().partition('=')
+                if k.lower() == 'charset':
+                    charset = pv.strip("\"'")
 
-    rootpkg.set_param('type', roottype)
-
-    mtompkg.attach(rootpkg)
-
-    # Extract attachments from SOAP envelope.
-    for i in range(len(params)):
-        name, typ = params[i]
-
-        if issubclass(typ, (ByteArray, File)):
-            id = "SpyneAttachment_%s" % (len(mtompkg.get_payload()), )
-
-            param = message[i]
-            param.text = ""
-
-            incl = etree.SubElement(param, "{%s}Include" % _ns_xop)
-            incl.attrib["href"] = "cid:%s" % id
-
-            if paramvals[i].fileName and not paramvals[i].data:
-                paramvals[i].load_from_file()
+            del headers[n]
+            break
 
-            if issubclass(type, File):
-                data = paramvals[i].data
-            else:
-                data = ''.join(paramvals[i])
+    boundary = 'spyne-mime-%s' % uuid4().hex
 
-            attachment = MIMEApplication(data, _encoder=encode_7or8bit)
+    headers['Content-Type'] = 'multipart/related; ' \
+               'type="application/xop+xml"; start="<%s>"; start-info="%s"; ' \
+                'boundary="%s"' % (MTOM_START_ID, root_type, boundary)
 
-            del attachment['mime-version']
+    for n in list(headers):
+        if n.lower() == 'content-length':
+            del headers[n]
 
-            attachment.add_header('Content-ID', '<%s>' % (id, ))
-            mtompkg.attach(attachment)
+    return headers, _gen_mtom_body(boundary, root_type, charset, envelope,
+                                                                   attachments)
 
-    # Update SOAP envelope.
-    rootpkg.set_payload(etree.tostring(soaptree))
 
-    # extract body string from MIMEMultipart message
-    bound = '--%s' % (mtompkg.get_boundary(), )
-    marray = mtompkg.as_string().split(bound)
-    mtombody = bound
-    mtombody += bound.join(marray[1:])
+def _gen_mtom_body(boundary, root_type, charset, envelope, attachments):
+    yield ('--%s\r\n'
+           'Content-Type: application/xop+xml; charset=%s; type="%s"\r\n'
+           'Content-Transfer-Encoding: binary\r\n'
+           'Content-ID: <%s>\r\n'
+           '\r\n' % (boundary, charset, root_type, MTOM_START_ID)) \
+                                                               .encode('ascii')
 
-    # set Content-Length
-    mtompkg.add_header("Content-Length", str(len(mtombody)))
+    for chunk in envelope:
+        yield chunk
 
-    # extract dictionary of headers from MIMEMultipart message
-    mtomheaders = {}
-    for name, value in mtompkg.items():
-        mtomheaders[name] = value
+    for content_id, content_type, chunks in attachments:
+        yield ('\r\n--%s\r\n'
+               'Content-Type: %s\r\n'
+               'Content-Transfer-Encoding: binary\r\n'
+               'Content-ID: <%s>\r\n'
+               '\r\n' % (boundary, content_type, content_id)).encode('ascii')
 
-    if len(mtompkg.get_payload()) <= 1:
-        return headers, envelope
+        for chunk in chunks:
+            yield chunk
 
-    return mtomheaders, [mtombody]
+    yield ('\r\n--%s--\r\n' % boundary).encode('ascii')
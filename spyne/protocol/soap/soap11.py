@@ -38,15 +38,12 @@ import logging
 logger = logging.getLogger(__name__)
 logger_invalid = logging.getLogger(__name__ + ".invalid")
 
-import cgi
-
 from itertools import chain
 
 import spyne.const.xml as ns
 
 from lxml import etree
 from lxml.etree import XMLSyntaxError
-from lxml.etree import XMLParser
 
 from spyne import BODY_STYLE_WRAPPED
 from spyne.util import six
@@ -56,8 +53,25 @@ from spyne.error import RequestNotAllowed
 from spyne.model.fault import Fault
 from spyne.model.primitive import Date, Time, DateTime
 from spyne.protocol.xml import XmlDocument
-from spyne.protocol.soap.mime import collapse_swa
-from spyne.server.http import HttpTransportContext
+from spyne.protocol.soap.mime import collapse_swa, MTOM_SPOOL_SIZE
+from spyne.server.http import HttpTransportContext, parse_header
+
+
+_SOAP_ENV_TAGS = {}
+
+def _has_href(elt):
+    # a plain walk instead of a shared etree.XPath object, which would not be
+    # thread-safe.
+    return any(e.get('href') is not None
+                                    for e in elt.iterdescendants(etree.Element))
+
+
+def _get_soap_env_tags(ns_soap):
+    retval = _SOAP_ENV_TAGS.get(ns_soap, None)
+    if retval is None:
+        retval = _SOAP_ENV_TAGS[ns_soap] = ('{%s}Envelope' % ns_soap,
+                                '{%s}Header' % ns_soap, '{%s}Body' % ns_soap)
+    return retval
 
 
 def _from_soap(in_envelope_xml, xmlids=None, **kwargs):
@@ -65,17 +79,21 @@ def _from_soap(in_envelope_xml, xmlids=None, **kwargs):
     """
     ns_soap = kwargs.pop('ns', ns.NS_SOAP11_ENV)
 
-    if xmlids:
+    # XMLID() returns every element with an id attribute. the python-level
+    # walk is only needed when something actually refers to one of them.
+    if xmlids and _has_href(in_envelope_xml):
         resolve_hrefs(in_envelope_xml, xmlids)
 
-    if in_envelope_xml.tag != '{%s}Envelope' % ns_soap:
+    envelope_tag, header_tag, body_tag = _get_soap_env_tags(ns_soap)
+    if in_envelope_xml.tag != envelope_tag:
         raise Fault('Client.SoapError', 'No {%s}Envelope element was found!' %
                                                                         ns_soap)
 
-    header_envelope = in_envelope_xml.xpath('e:Header',
-                                          namespaces={'e': ns_soap})
-    body_envelope = in_envelope_xml.xpath('e:Body',
-                                          namespaces={'e': ns_soap})
+    # a tag filter over the direct children is equivalent to the
+    # 'e:Header' and 'e:Body' xpath queries, but avoids both compiling the
+    # queries and the per-evaluator lock of precompiled etree.XPath objects.
+    header_envelope = list(in_envelope_xml.iterchildren(header_tag))
+    body_envelope = list(in_envelope_xml.iterchildren(body_tag))
 
     if len(header_envelope) == 0 and len(body_envelope) == 0:
         raise Fault('Client.SoapError', 'Soap envelope is empty!')
@@ -163,6 +181,8 @@ class Soap11(XmlDocument):
         documents. The transport can override this.
     :param pretty_print: When ``True``, returns the document in a pretty-printed
         format.
+    :param mtom_spool_size: Incoming MTOM/SwA attachments larger than this many
+        bytes are spooled to a temporary file instead of being kept in memory.
     """
 
     mime_type = 'text/xml; charset=utf-8'
@@ -174,6 +194,8 @@ class Soap11(XmlDocument):
     ns_soap_enc = ns.NS_SOAP11_ENC
 
     def __init__(self, *args, **kwargs):
+        self.mtom_spool_size = kwargs.pop('mtom_spool_size', MTOM_SPOOL_SIZE)
+
         super(Soap11, self).__init__(*args, **kwargs)
 
         # SOAP requires DateTime strings to be in iso format. The following
@@ -197,11 +219,11 @@ class Soap11(XmlDocument):
                         "You must issue a POST request with the Content-Type "
                         "header properly set.")
 
-            content_type = cgi.parse_header(content_type)
-            ctx.in_string = collapse_swa(ctx, content_type, self.ns_soap_env)
+            content_type = parse_header(content_type)
+            ctx.in_string = collapse_swa(ctx, content_type, self.ns_soap_env,
+                                                          self.mtom_spool_size)
 
-        ctx.in_document = _parse_xml_string(ctx.in_string,
-                                            XMLParser(**self.parser_kwargs),
+        ctx.in_document = _parse_xml_string(ctx.in_string, self.get_parser(),
                                                                         charset)
 
     def decompose_incoming_envelope(self, ctx, message=XmlDocument.REQUEST):
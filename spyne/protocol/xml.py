@@ -34,7 +34,12 @@ import logging
 logger = logging.getLogger('spyne.protocol.xml')
 logger_invalid = logging.getLogger('spyne.protocol.xml.invalid')
 
+import threading
+
+from random import random
 from inspect import isgenerator
+from itertools import chain
+from weakref import WeakKeyDictionary
 from collections import defaultdict
 
 from lxml import etree
@@ -42,14 +47,17 @@ from lxml import html
 from lxml.builder import E
 from lxml.etree import XMLSyntaxError
 from lxml.etree import XMLParser
+from lxml.etree import XMLPullParser
 
-from spyne import BODY_STYLE_WRAPPED
+from spyne import BODY_STYLE_WRAPPED, ProtocolContext
 
 from spyne.util import Break, coroutine
 from spyne.util.six import text_type, string_types
+from spyne.util.six.moves.urllib.parse import unquote
 from spyne.util.cdict import cdict
 from spyne.util.etreeconv import etree_to_dict, dict_to_etree,\
     root_dict_to_etree
+from spyne.const import TRACE
 from spyne.const.xml import XSI, NS_SOAP11_ENC
 
 from spyne.error import Fault
@@ -58,6 +66,7 @@ from spyne.const.ansi_color import LIGHT_GREEN
 from spyne.const.ansi_color import LIGHT_RED
 from spyne.const.ansi_color import END_COLOR
 from spyne.const.xml import NS_SOAP11_ENV
+from spyne.const.xml import NS_XOP
 from spyne.const.xml import PREFMAP, DEFAULT_NS
 
 from spyne.model import Any, ModelBase, Array, Iterable, ComplexModelBase, \
@@ -93,6 +102,85 @@ def _gen_tagname(ns, name):
     return name
 
 
+def _free_element(elt):
+    """Frees the memory used by an element that was completely parsed by a
+    pull parser, along with its preceding siblings. This is the pattern
+    recommended by lxml for incremental parsing, as removing the element
+    itself while its parent is still being parsed is not safe."""
+
+    elt.clear()
+    while elt.getprevious() is not None:
+        del elt.getparent()[0]
+
+
+def _reset_parser(parser):
+    """Makes a feed parser that failed in the middle of a document usable
+    again."""
+
+    try:
+        parser.close()
+    except XMLSyntaxError:
+        pass
+
+
+def _iter_pull_events(parser, chunks):
+    """Feeds the given chunks to the given ``XMLPullParser`` instance one by
+    one and yields ``(event, element)`` pairs as soon as they are available.
+    """
+
+    try:
+        for chunk in chunks:
+            parser.feed(chunk)
+            for evt in parser.read_events():
+                yield evt
+
+        parser.close()
+        for evt in parser.read_events():
+            yield evt
+
+    except XMLSyntaxError as e:
+        logger_invalid.error("%r in incrementally parsed document", e)
+        raise Fault('Client.XMLSyntaxError', str(e))
+
+
+class XmlProtocolContext(ProtocolContext):
+    def __init__(self, parent, transport, type=None):
+        super(XmlProtocolContext, self).__init__(parent, transport, type)
+
+        self.in_events = None
+        """When the incoming document is being parsed incrementally, this is
+        the iterator of the remaining ``(event, element)`` pairs."""
+
+        self.in_attachments = None
+        """When the incoming document came with MTOM/SwA attachments, this
+        maps their 'cid:'-prefixed Content-IDs and their Content-Locations to
+        :class:`spyne.protocol.soap.mime.MimeAttachment` instances."""
+
+        self.out_attachments = None
+        """When not None, binary values are not serialized inline but
+        referenced with xop:Include elements and appended here as
+        ``(content_id, content_type, chunks)`` tuples, to be sent as MTOM
+        attachments."""
+
+
+class _XmlDeserializationTable(object):
+    """Precompiled member lookup tables for deserializing instances of a
+    ComplexModel subclass from xml.
+
+    ``children`` maps child tags in Clark notation (and bare tags) to
+    ``(member, key, freq_key, member_attrs, is_array)`` tuples whereas
+    ``attributes`` maps attribute names to ``(member, key, member_attrs,
+    type_attrs)`` tuples where ``type_attrs`` is ``None`` unless ``member`` is
+    an ``XmlAttribute``.
+    """
+
+    __slots__ = ['children', 'attributes']
+
+    def __init__(self, children, attributes):
+        self.children = children
+        self.attributes = attributes
+
+
 class SchemaValidationError(Fault):
     """Raised when the input stream could not be validated by the Xml Schema."""
 
@@ -159,6 +247,13 @@ class XmlDocument(SubXmlBase):
 
         Defaults to ``None``.
 
+    :param validation_sample_rate: The fraction of incoming documents that
+        are validated against the schema when schema validation is enabled.
+        e.g. ``0.1`` validates a random 10% of incoming messages. Has no
+        effect on other validators.
+
+        Defaults to ``1.0``.
+
     :param replace_null_with_default: If ``False``, does not replace incoming
         explicit null values with denoted default values. This is against Xml
         Schema standard but consistent with other Spyne protocol
@@ -207,9 +302,31 @@ class XmlDocument(SubXmlBase):
 
         Defaults to ``True``.
 
+    :param incremental_in: When ``True``, incoming documents are fed to the
+        parser chunk by chunk as they arrive from the transport and requests
+        are deserialized while they are being parsed. Elements are freed as
+        soon as they are deserialized. When the last argument of a method is
+        an ``Iterable``, its items are parsed and deserialized only as the
+        user code consumes them, which lets huge requests be processed in
+        bounded memory. Can not be used with schema validation and element
+        frequencies of the request message are not validated.
+
+        Defaults to ``False``.
+
+    :param compile_plans: When ``True``, the member list of every
+        ``ComplexModel`` subclass is compiled to a flat serialization plan the
+        first time an instance of it is serialized and the plan is reused for
+        every subsequent instance. Classes must not be modified after they are
+        first serialized when this is enabled.
+
+        Defaults to ``False``.
+
     The following are passed straight to the ``XMLParser()`` instance from
     lxml. Docs are also plagiarized from the lxml documentation. Please note
     that some of the defaults are different to make parsing safer by default.
+    Parsers are created once per thread (see :func:`get_parser`) so changing
+    ``parser_kwargs`` after the protocol has parsed its first document has no
+    effect in threads that already have a parser.
 
     :param attribute_defaults: read the DTD (if referenced by the document) and
         add the default attributes from it.
@@ -302,12 +419,19 @@ class XmlDocument(SubXmlBase):
                 binary_encoding=None,
                 parse_xsi_type=True,
                 polymorphic=False,
+                compile_plans=False,
+                incremental_in=False,
+                validation_sample_rate=1.0,
             ):
 
         super(XmlDocument, self).__init__(app, validator,
                                                 binary_encoding=binary_encoding)
 
+        if not (0.0 <= validation_sample_rate <= 1.0):
+            raise ValueError(validation_sample_rate)
+
         self.validation_schema = None
+        self.validation_sample_rate = validation_sample_rate
         self.xml_declaration = xml_declaration
         self.cleanup_namespaces = cleanup_namespaces
         self.replace_null_with_default = replace_null_with_default
@@ -320,6 +444,14 @@ class XmlDocument(SubXmlBase):
         self.polymorphic = polymorphic
         self.pretty_print = pretty_print
         self.parse_xsi_type = parse_xsi_type
+        self.compile_plans = compile_plans
+        self._plancache = WeakKeyDictionary()
+        self._parser_local = threading.local()
+
+        if incremental_in and self.validator is self.SCHEMA_VALIDATION:
+            raise ValueError("Incremental parsing can't be used with schema "
+                                                                 "validation")
+        self.incremental_in = incremental_in
 
         self.serialization_handlers = cdict({
             Any: self.any_to_parent,
@@ -330,6 +462,7 @@ class XmlDocument(SubXmlBase):
             AnyDict: self.any_dict_to_parent,
             AnyHtml: self.any_html_to_parent,
             ModelBase: self.modelbase_to_parent,
+            File: self.file_to_parent,
             ByteArray: self.byte_array_to_parent,
             ComplexModelBase: self.complex_to_parent,
             XmlAttribute: self.xmlattribute_to_parent,
@@ -347,6 +480,7 @@ class XmlDocument(SubXmlBase):
             ModelBase: self.base_from_element,
             Unicode: self.unicode_from_element,
             Iterable: self.iterable_from_element,
+            File: self.file_from_element,
             ByteArray: self.byte_array_from_element,
             ComplexModelBase: self.complex_from_element,
         })
@@ -414,30 +548,101 @@ class XmlDocument(SubXmlBase):
             self.validation_schema = xml_schema.validation_schema
 
     def __validate_lxml(self, payload):
+        if self.validation_sample_rate < 1.0 and \
+                                        random() >= self.validation_sample_rate:
+            return
+
         ret = self.validation_schema.validate(payload)
 
-        logger.debug("Validated ? %r" % ret)
+        logger.debug("Validated ? %r", ret)
         if ret == False:
             error_text = text_type(self.validation_schema.error_log.last_error)
             raise SchemaValidationError(error_text.encode('ascii',
                                                            'xmlcharrefreplace'))
 
+    def get_context(self, parent, transport):
+        return XmlProtocolContext(parent, transport)
+
+    def get_parser(self):
+        """Returns the ``XMLParser`` instance of the current thread, creating
+        it from ``parser_kwargs`` if necessary. lxml parsers can be reused but
+        not shared between threads. When threading is monkey-patched (e.g. by
+        gevent), this returns one parser per greenlet.
+        """
+
+        parser = getattr(self._parser_local, 'parser', None)
+        if parser is None:
+            parser = self._parser_local.parser = XMLParser(**self.parser_kwargs)
+        return parser
+
     def create_in_document(self, ctx, charset=None):
         """Uses the iterable of string fragments in ``ctx.in_string`` to set
-        ``ctx.in_document``."""
+        ``ctx.in_document``.
+
+        Byte fragments are fed to the parser one by one instead of being
+        joined first. When ``incremental_in`` is set, parsing stops as soon as
+        the root element is seen and the rest of the document is parsed
+        during deserialization.
+        """
 
-        string = b''.join(ctx.in_string)
+        in_string = iter(ctx.in_string)
+        try:
+            chunk = next(in_string)
+        except StopIteration:
+            chunk = b''
+
+        if not isinstance(chunk, six.binary_type):
+            # lxml refuses unicode strings with encoding declarations so
+            # text input takes the slow path.
+            ctx.in_string = chain((chunk,), in_string)
+            return self._create_in_document_from_text(ctx, charset)
+
+        if self.incremental_in:
+            parser = XMLPullParser(events=('start', 'end'),
+                                                           **self.parser_kwargs)
+            events = _iter_pull_events(parser, chain((chunk,), in_string))
+            for evt, elt in events:
+                if evt == 'start':
+                    ctx.in_document = elt
+                    ctx.inprot_ctx.in_events = events
+                    return
+
+            # no elements -- close() must have complained already
+            raise Fault('Client.XMLSyntaxError', "Document is empty")
+
+        parser = self.get_parser()
+        try:
+            parser.feed(chunk)
+            for chunk in in_string:
+                parser.feed(chunk)
+            ctx.in_document = parser.close()
+
+        except XMLSyntaxError as e:
+            _reset_parser(parser)
+            logger_invalid.error("%r in incoming document", e)
+            raise Fault('Client.XMLSyntaxError', str(e))
+
+        except Exception:
+            # e.g. the in_string generator failed. the parser is reused so it
+            # must not be left in the middle of a document.
+            _reset_parser(parser)
+            raise
+
+    def _create_in_document_from_text(self, ctx, charset=None):
+        string = ''.join(ctx.in_string)
         try:
             try:
                 ctx.in_document = etree.fromstring(string,
-                                        parser=XMLParser(**self.parser_kwargs))
+                                                       parser=self.get_parser())
 
             except ValueError:
                 logger.debug('ValueError: Deserializing from unicode strings '
                              'with encoding declaration is not supported by '
                              'lxml.')
-                ctx.in_document = etree.fromstring(string.decode(charset),
-                                                                    self.parser)
+                ctx.in_document = etree.fromstring(
+                                    string.encode(charset or self.encoding),
+                                                       parser=self.get_parser())
+
         except XMLSyntaxError as e:
             logger_invalid.error("%r in string %r", e, string)
             raise Fault('Client.XMLSyntaxError', str(e))
@@ -490,9 +695,10 @@ class XmlDocument(SubXmlBase):
                                         "is not recognized", xsi_type, classkey)
                     raise ValidationError(xsi_type)
 
-                cls = newclass
-                logger.debug("xsi:type '%s' overrides %r to %r", xsi_type,
+                if TRACE:
+                    logger.debug("xsi:type '%s' overrides %r to %r", xsi_type,
                                                                   cls, newclass)
+                cls = newclass
 
         handler = self.deserialization_handlers[cls]
         return handler(ctx, cls, element)
@@ -547,9 +753,23 @@ class XmlDocument(SubXmlBase):
             body_class = ctx.descriptor.out_message
 
         # decode method arguments
-        if ctx.in_body_doc is None:
+        events = getattr(ctx.inprot_ctx, 'in_events', None)
+        if events is not None:
+            ctx.inprot_ctx.in_events = None
+
+        if events is not None and message is self.REQUEST and \
+                                                   ctx.in_body_doc is not None:
+            ctx.in_object = self._incremental_from_element(ctx, body_class,
+                                                        ctx.in_body_doc, events)
+
+        elif events is not None:
+            for _ in events:  # parse the rest of the document
+                pass
+
+        if ctx.in_object is None and ctx.in_body_doc is None:
             ctx.in_object = [None] * len(body_class._type_info)
-        else:
+
+        elif ctx.in_object is None:
             ctx.in_object = self.from_element(ctx, body_class, ctx.in_body_doc)
 
         if logger.level == logging.DEBUG and message is self.REQUEST:
@@ -664,10 +884,68 @@ class XmlDocument(SubXmlBase):
 
         return retval
 
+    def _add_out_attachment(self, ctx, cls, inst, elt):
+        """Appends the given binary value to the outgoing MTOM attachments and
+        puts an xop:Include element that references it under ``elt``. Returns
+        False when the outgoing message has no attachments."""
+
+        if ctx is None:
+            return False
+
+        attachments = getattr(ctx.outprot_ctx, 'out_attachments', None)
+        if attachments is None:
+            return False
+
+        content_type = 'application/octet-stream'
+        if isinstance(inst, File.Value) and inst.type is not None:
+            content_type = inst.type
+
+        content_id = '%d.attachment@spyne' % (len(attachments) + 1)
+        attachments.append((content_id, content_type,
+                                           self.to_bytes_iterable(cls, inst)))
+
+        etree.SubElement(elt, '{%s}Include' % NS_XOP, nsmap={'xop': NS_XOP},
+                                                 href='cid:%s' % content_id)
+        return True
+
+    def _get_in_attachment(self, ctx, element):
+        """Returns the MTOM/SwA attachment that the given element references
+        via an xop:Include child, if any."""
+
+        if ctx is None:
+            return None
+
+        attachments = getattr(ctx.inprot_ctx, 'in_attachments', None)
+        if attachments is None:
+            return None
+
+        for child in element:
+            if child.tag != '{%s}Include' % NS_XOP:
+                continue
+
+            href = child.get('href', '')
+            if href.startswith('cid:'):
+                # cid urls are url-encoded content ids, see rfc 2392
+                href = 'cid:' + unquote(href[4:])
+
+            retval = attachments.get(href, None)
+            if retval is None:
+                raise ValidationError(href, "Attachment %r not found")
+
+            return retval
+
     def byte_array_to_parent(self, ctx, cls, inst, parent, ns, name='retval',
                                                                       **kwargs):
         elt = self._gen_tag(cls, ns, name, **kwargs)
-        elt.text = self.to_unicode(cls, inst, self.binary_encoding)
+        if not self._add_out_attachment(ctx, cls, inst, elt):
+            elt.text = self.to_unicode(cls, inst, self.binary_encoding)
+        _append(parent, elt)
+
+    def file_to_parent(self, ctx, cls, inst, parent, ns, name='retval',
+                                                                      **kwargs):
+        elt = self._gen_tag(cls, ns, name, **kwargs)
+        if not self._add_out_attachment(ctx, cls, inst, elt):
+            elt.text = self.to_unicode(cls, inst)
         _append(parent, elt)
 
     def modelbase_to_parent(self, ctx, cls, inst, parent, ns, name='retval',
@@ -736,10 +1014,15 @@ class XmlDocument(SubXmlBase):
                 # perf reasons
                 attrib[XSI_TYPE] = cls.get_type_name()
 
+        if self.compile_plans:
+            get_members = self._get_members_etree_plan
+        else:
+            get_members = self._get_members_etree
+
         if isinstance(parent, etree._Element):
             elt = etree.SubElement(parent, tag_name, attrib=attrib)
             elt.extend(subelts)
-            ret = self._get_members_etree(ctx, cls, inst, elt)
+            ret = get_members(ctx, cls, inst, elt)
 
             if isgenerator(ret):
                 try:
@@ -757,7 +1040,7 @@ class XmlDocument(SubXmlBase):
             with parent.element(tag_name, attrib=attrib):
                 for e in subelts:
                     parent.write(e)
-                ret = self._get_members_etree(ctx, cls, inst, parent)
+                ret = get_members(ctx, cls, inst, parent)
                 if isgenerator(ret):
                     try:
                         while True:
@@ -865,6 +1148,115 @@ class XmlDocument(SubXmlBase):
         except Break:
             pass
 
+    def get_serialization_plan(self, cls):
+        """Returns the serialization plan of the given ``ComplexModel``
+        subclass. The plan is a tuple of ``(key, member_class, sub_ns,
+        sub_name, is_array, is_mandatory)`` tuples that contains the members of
+        ``cls`` and of all its parent classes in serialization order. Excluded
+        members are omitted.
+
+        Plans are built once per class and cached in the protocol instance.
+        """
+
+        retval = self._plancache.get(cls, None)
+        if retval is not None:
+            return retval
+
+        retval = []
+
+        parent_cls = getattr(cls, '__extends__', None)
+        if parent_cls is not None:
+            retval.extend(self.get_serialization_plan(parent_cls))
+
+        for k, v in cls._type_info.items():
+            if self.get_cls_attrs(v).exc:
+                continue
+
+            sub_ns = v.Attributes.sub_ns
+            if sub_ns is None:
+                sub_ns = cls.get_namespace()
+
+            sub_name = v.Attributes.sub_name
+            if sub_name is None:
+                sub_name = k
+
+            retval.append((k, v, sub_ns, sub_name,
+                                                v.Attributes.max_occurs > 1,
+                                                v.Attributes.min_occurs > 0))
+
+        self._plancache[cls] = retval = tuple(retval)
+
+        return retval
+
+    @coroutine
+    def _get_members_etree_plan(self, ctx, cls, inst, parent):
+        """Same as :func:`_get_members_etree` but uses the cached plan from
+        :func:`get_serialization_plan` instead of walking the class
+        hierarchy."""
+
+        to_parent = self.to_parent
+
+        try:
+            for k, v, sub_ns, sub_name, is_array, is_mandatory in \
+                                             self.get_serialization_plan(cls):
+                try:
+                    subvalue = getattr(inst, k, None)
+                except:  # e.g. SqlAlchemy could throw NoSuchColumnError
+                    subvalue = None
+
+                if subvalue is not None and is_array:
+                    if isinstance(subvalue, PushBase):
+                        while True:
+                            sv = (yield)
+                            ret = to_parent(ctx, v, sv, parent, sub_ns,
+                                                                       sub_name)
+                            if ret is not None:
+                                try:
+                                    while True:
+                                        sv2 = (yield)  # may throw Break
+                                        ret.send(sv2)
+
+                                except Break:
+                                    try:
+                                        ret.throw(Break())
+                                    except StopIteration:
+                                        pass
+
+                    else:
+                        for sv in subvalue:
+                            ret = to_parent(ctx, v, sv, parent, sub_ns,
+                                                                       sub_name)
+
+                            if ret is not None:
+                                try:
+                                    while True:
+                                        sv2 = (yield)  # may throw Break
+                                        ret.send(sv2)
+
+                                except Break:
+                                    try:
+                                        ret.throw(Break())
+                                    except StopIteration:
+                                        pass
+
+                # Don't include empty values for
+                # non-nillable optional attributes.
+                elif subvalue is not None or is_mandatory:
+                    ret = to_parent(ctx, v, subvalue, parent, sub_ns, sub_name)
+                    if ret is not None:
+                        try:
+                            while True:
+                                sv2 = (yield)
+                                ret.send(sv2)
+                        except Break as b:
+                            try:
+                                ret.throw(b)
+                            except StopIteration:
+                                pass
+
+        except Break:
+            pass
+
     def complex_to_parent(self, ctx, cls, inst, parent, ns, name=None,
                                                            add_type=False, **_):
         cls_attrs = self.get_cls_attrs(cls)
@@ -954,13 +1346,97 @@ class XmlDocument(SubXmlBase):
 
         _append(parent, elt)
 
+    def _resolve_child(self, cls, flat_type_info, tag):
+        """Maps the given child tag to a ``(member, key, freq_key,
+        member_attrs, is_array)`` tuple the slow way. Returns ``None`` if
+        ``tag`` does not denote a member of ``cls``."""
+
+        key = freq_key = tag.split('}', 1)[-1]
+
+        member = flat_type_info.get(key, None)
+        if member is None:
+            member, key = cls._type_info_alt.get(key, (None, key))
+            if member is None:
+                member, key = cls._type_info_alt.get(tag, (None, key))
+                if member is None:
+                    return None
+
+        member_attrs = self.get_cls_attrs(member)
+        return member, key, freq_key, member_attrs, member_attrs.max_occurs > 1
+
+    def get_deserialization_table(self, cls):
+        """Returns the member lookup tables for deserializing instances of the
+        given ``ComplexModel`` subclass as an ``_XmlDeserializationTable``
+        instance.
+
+        The children table is pre-populated with the bare tags and the tags
+        qualified with the namespaces of ``cls`` and its parents, so that the
+        common case is one dict lookup per child element. Tables are built
+        once per class and cached in the protocol instance.
+        """
+
+        retval = self._tablecache.get(cls, None)
+        if retval is not None:
+            return retval
+
+        flat_type_info = cls.get_flat_type_info(cls)
+
+        namespaces = set()
+        parent_cls = cls
+        while parent_cls is not None:
+            namespaces.add(parent_cls.get_namespace())
+            parent_cls = getattr(parent_cls, '__extends__', None)
+
+        for v in flat_type_info.values():
+            namespaces.add(v.Attributes.sub_ns)
+
+        namespaces.discard(None)
+
+        tags = []
+        for k in flat_type_info:
+            tags.append(k)
+            tags.extend([_gen_tagname(ns, k) for ns in namespaces])
+
+        for k, (v, _) in cls._type_info_alt.items():
+            tags.append(k)
+            if not k.startswith('{'):
+                tags.extend([_gen_tagname(ns, k) for ns in namespaces])
+
+        children = {}
+        for tag in tags:
+            entry = self._resolve_child(cls, flat_type_info, tag)
+            if entry is not None:
+                children[tag] = entry
+
+        attributes = {}
+        for k, (v, key) in cls._type_info_alt.items():
+            attributes[k] = (v, key)
+        for k, v in flat_type_info.items():
+            attributes[k] = (v, k)
+        for k, (v, key) in attributes.items():
+            type_attrs = None
+            if issubclass(v, XmlAttribute):
+                type_attrs = self.get_cls_attrs(v.type)
+            attributes[k] = (v, key, self.get_cls_attrs(v), type_attrs)
+
+        retval = self._tablecache[cls] = \
+                                  _XmlDeserializationTable(children, attributes)
+
+        return retval
+
     def complex_from_element(self, ctx, cls, elt):
         inst = cls.get_deserialization_instance(ctx)
 
         flat_type_info = cls.get_flat_type_info(cls)
+        table = self.get_deserialization_table(cls)
+        children = table.children
+        attributes = table.attributes
 
         # this is for validating cls.Attributes.{min,max}_occurs
-        frequencies = defaultdict(int)
+        soft = self.validator is self.SOFT_VALIDATION
+        if soft:
+            frequencies = defaultdict(int)
+
         cls_attrs = self.get_cls_attrs(cls)
 
         if cls_attrs._xml_tag_body_as is not None:
@@ -979,20 +1455,17 @@ class XmlDocument(SubXmlBase):
             if isinstance(c, etree._Comment):
                 continue
 
-            key = c.tag.split('}', 1)[-1]
-            frequencies[key] += 1
+            entry = children.get(c.tag, None)
+            if entry is None:
+                entry = self._resolve_child(cls, flat_type_info, c.tag)
+                if entry is None:
+                    continue
 
-            member = flat_type_info.get(key, None)
-            if member is None:
-                member, key = cls._type_info_alt.get(key, (None, key))
-                if member is None:
-                    member, key = cls._type_info_alt.get(c.tag, (None, key))
-                    if member is None:
-                        continue
+            member, key, freq_key, member_attrs, is_array = entry
+            if soft:
+                frequencies[freq_key] += 1
 
-            member_attrs = self.get_cls_attrs(member)
-            mo = member_attrs.max_occurs
-            if mo > 1:
+            if is_array:
                 value = getattr(inst, key, None)
                 if value is None:
                     value = []
@@ -1005,14 +1478,11 @@ class XmlDocument(SubXmlBase):
             inst._safe_set(key, value, member, member_attrs)
 
             for key, value_str in c.attrib.items():
-                submember = flat_type_info.get(key, None)
-
-                if submember is None:
-                    submember, key = cls._type_info_alt.get(key, (None, key))
-                    if submember is None:
-                        continue
+                entry = attributes.get(key, None)
+                if entry is None:
+                    continue
 
-                submember_attrs = self.get_cls_attrs(submember)
+                submember, key, submember_attrs, _ = entry
                 mo = submember_attrs.max_occurs
                 if mo > 1:
                     value = getattr(inst, key, None)
@@ -1027,13 +1497,12 @@ class XmlDocument(SubXmlBase):
                 inst._safe_set(key, value, submember.type, submember_attrs)
 
         for key, value_str in elt.attrib.items():
-            member = flat_type_info.get(key, None)
-            if member is None:
-                member, key = cls._type_info_alt.get(key, (None, key))
-                if member is None:
-                    continue
+            entry = attributes.get(key, None)
+            if entry is None:
+                continue
 
-            if not issubclass(member, XmlAttribute):
+            member, key, _, member_attrs = entry
+            if member_attrs is None:  # not an XmlAttribute
                 continue
 
             if issubclass(member.type, (ByteArray, File)):
@@ -1042,10 +1511,9 @@ class XmlDocument(SubXmlBase):
             else:
                 value = self.from_unicode(member.type, value_str)
 
-            member_attrs = self.get_cls_attrs(member.type)
             inst._safe_set(key, value, member.type, member_attrs)
 
-        if self.validator is self.SOFT_VALIDATION:
+        if soft:
             for key, c in flat_type_info.items():
                 val = frequencies.get(key, 0)
                 attr = self.get_cls_attrs(c)
@@ -1055,6 +1523,155 @@ class XmlDocument(SubXmlBase):
 
         return inst
 
+    def _incremental_from_element(self, ctx, cls, elt, events):
+        """Deserializes the children of the given partially parsed element
+        while pulling the rest of it from the ``events`` iterator. Every child
+        is freed right after it's deserialized. When the last member of
+        ``cls`` is an ``Iterable``, its value is a generator that continues
+        parsing as it's consumed. Members that come after it in the document
+        can't be set anymore, so that generator raises ``ValidationError``
+        when it finds one.
+        """
+
+        if elt.get(XSI('nil')) or elt.get(XSI_TYPE) or len(elt.attrib) > 0:
+            for _ in events:
+                pass
+            return self.from_element(ctx, cls, elt)
+
+        inst = cls.get_deserialization_instance(ctx)
+        children = self.get_deserialization_table(cls).children
+        flat_type_info = cls.get_flat_type_info(cls)
+
+        last_key = None
+        if len(flat_type_info) > 0:
+            last_key, last_member = list(flat_type_info.items())[-1]
+            if not issubclass(last_member, Iterable):
+                last_key = None
+
+        depth = 0
+        for evt, child in events:
+            if evt == 'start':
+                depth += 1
+                if depth > 1:
+                    continue
+
+                entry = children.get(child.tag, None)
+                if entry is None:
+                    entry = self._resolve_child(cls, flat_type_info, child.tag)
+                if entry is None:
+                    continue
+
+                member, key, _, member_attrs, is_array = entry
+                if is_array or not issubclass(member, Array) or \
+                                          child.get(XSI('nil')) is not None:
+                    continue
+
+                # the element is an Array/Iterable wrapper: stream its items
+                depth -= 1
+                if key == last_key:
+                    items = self._iter_incremental_items(ctx, member,
+                                                           events, parent=cls)
+                    inst._safe_set(key, items, member, member_attrs)
+                    return inst
+
+                items = self._iter_incremental_items(ctx, member, events)
+                inst._safe_set(key, list(items), member, member_attrs)
+                _free_element(child)
+                continue
+
+            # evt == 'end'
+            if depth == 0:
+                break  # end of elt
+
+            depth -= 1
+            if depth > 0:
+                continue
+
+            entry = children.get(child.tag, None)
+            if entry is None:
+                entry = self._resolve_child(cls, flat_type_info, child.tag)
+
+            if entry is not None:
+                member, key, _, member_attrs, is_array = entry
+                value = self.from_element(ctx, member, child)
+                if is_array:
+                    values = getattr(inst, key, None)
+                    if values is None:
+                        values = []
+                    values.append(value)
+                    value = values
+
+                inst._safe_set(key, value, member, member_attrs)
+
+            _free_element(child)
+
+        for _ in events:  # parse the rest of the document
+            pass
+
+        return inst
+
+    def _iter_incremental_items(self, ctx, cls, events, parent=None):
+        """Yields the deserialized children of the given partially parsed
+        Array element as they are pulled from the ``events`` iterator and
+        frees them as soon as they are deserialized. When ``parent`` is given,
+        the rest of the document is parsed after the end of the element, see
+        :meth:`_drain_incremental`."""
+
+        (serializer,) = cls._type_info.values()
+
+        depth = 0
+        for evt, child in events:
+            if evt == 'start':
+                depth += 1
+                continue
+
+            if depth == 0:
+                break  # end of elt
+
+            depth -= 1
+            if depth == 0:
+                value = self.from_element(ctx, serializer, child)
+                _free_element(child)
+                yield value
+
+        if parent is not None:
+            self._drain_incremental(parent, events)
+
+    def _drain_incremental(self, cls, events):
+        """Parses the rest of the document after the trailing ``Iterable``
+        member of the partially parsed element of class ``cls``. Raises
+        ``ValidationError`` when that element has another member after the
+        ``Iterable``, as the instance it should be set on was already
+        returned."""
+
+        children = self.get_deserialization_table(cls).children
+        flat_type_info = cls.get_flat_type_info(cls)
+
+        depth = 0
+        for evt, child in events:
+            if evt == 'start':
+                depth += 1
+                if depth > 1:
+                    continue
+
+                entry = children.get(child.tag, None)
+                if entry is None:
+                    entry = self._resolve_child(cls, flat_type_info, child.tag)
+                if entry is not None:
+                    raise ValidationError(child.tag, "Element %r can't come "
+                                       "after a streamed Iterable member.")
+                continue
+
+            if depth == 0:
+                break  # end of the parent element
+
+            depth -= 1
+            if depth == 0:
+                _free_element(child)
+
+        for _ in events:  # parse the rest of the document
+            pass
+
     def array_from_element(self, ctx, cls, element):
         retval = [ ]
         (serializer,) = cls._type_info.values()
@@ -1147,6 +1764,10 @@ class XmlDocument(SubXmlBase):
         return retval
 
     def byte_array_from_element(self, ctx, cls, element):
+        attachment = self._get_in_attachment(ctx, element)
+        if attachment is not None:
+            return (attachment.get_data(),)
+
         if self.validator is self.SOFT_VALIDATION and not (
                                         cls.validate_string(cls, element.text)):
             raise ValidationError(element.text)
@@ -1158,3 +1779,13 @@ class XmlDocument(SubXmlBase):
             raise ValidationError(retval)
 
         return retval
+
+    def file_from_element(self, ctx, cls, element):
+        attachment = self._get_in_attachment(ctx, element)
+        if attachment is not None:
+            return File.Value(name=attachment.file_name,
+                              type=attachment.content_type,
+                              data=(attachment.get_data(),),
+                              handle=attachment.get_handle())
+
+        return self.base_from_element(ctx, cls, element)
@@ -29,6 +29,13 @@ from spyne.protocol import ProtocolBase
 from spyne.util import Break, coroutine
 
 
+try:
+    from inspect import iscoroutine as _iscoroutine
+except ImportError:  # Python 2
+    def _iscoroutine(_):
+        return False
+
+
 class ServerBase(object):
     """This class is the abstract base class for all server transport
     implementations. Unlike the client transports, this class does not define
@@ -117,6 +124,31 @@ class ServerBase(object):
         else:
             raise ctx.in_error
 
+        self.reject_coroutine(ctx)
+        self.fix_ignored_out_object(ctx)
+
+    def reject_coroutine(self, ctx):
+        """Turns the coroutine returned by an ``async def`` method into a
+        server error, as only asyncio-based transports know how to run it."""
+
+        if not _iscoroutine(ctx.out_object):
+            return
+
+        ctx.out_object.close()
+        ctx.out_object = None
+
+        try:
+            raise TypeError("%r is a coroutine function, which needs an "
+                            "asyncio-based transport like "
+                            "spyne.server.asgi.AsgiApplication to run." %
+                                                         ctx.descriptor.name)
+        except TypeError as e:
+            self.app.process_exception(ctx, e)
+
+    @staticmethod
+    def fix_ignored_out_object(ctx):
+        """Replaces :class:`spyne.Ignored` return values with empty ones."""
+
         if isinstance(ctx.out_object, (list, tuple)) \
                     and len(ctx.out_object) > 0 \
                     and isinstance(ctx.out_object[0], Ignored):
@@ -0,0 +1,564 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""
+A server that uses http as transport via `asgi <https://asgi.readthedocs.io>`_,
+the asynchronous successor of wsgi. The :class:`AsgiApplication` instance can
+be served by any asgi server, like uvicorn or hypercorn: ::
+
+    asgi_app = AsgiApplication(Application(...))
+
+Service methods can be coroutine functions: ::
+
+    class SomeService(Service):
+        @rpc(Unicode, _returns=Unicode)
+        async def get_name(ctx, id):
+            return await some_slow_backend.get_name(id)
+
+The coroutines returned by ``async def`` methods are awaited on the event loop,
+so one process can keep thousands of such calls in flight. Regular methods
+are run on the event loop as well, which means they block it while they run.
+Pass a :class:`concurrent.futures.ThreadPoolExecutor` instance as the
+``executor`` argument to run them in a thread pool instead.
+
+The response document is streamed to the client chunk by chunk as it's
+serialized.
+
+This module needs Python 3.
+"""
+
+
+import logging
+logger = logging.getLogger(__name__)
+
+import asyncio
+
+from io import BytesIO
+from inspect import isgenerator, iscoroutine, iscoroutinefunction
+from itertools import chain
+
+from spyne import Fault
+from spyne.application import get_fault_string_from_exception
+from spyne.auxproc import process_contexts
+from spyne.error import RequestTooLongError
+from spyne.protocol.http import HttpRpc
+from spyne.server.http import HttpBase, HttpMethodContext, CachedDocument, \
+    parse_header
+from spyne.server.wsgi import WsgiApplication, WsgiTransportContext, \
+    apply_mtom, _reconstruct_url, _gen_http_headers
+
+from spyne.const.http import HTTP_200
+from spyne.const.http import HTTP_304
+from spyne.const.http import HTTP_404
+from spyne.const.http import HTTP_500
+
+
+def _scope_to_environ(scope, body):
+    """Builds a wsgi environment from the given asgi connection scope and
+    request body, so that the request can be inspected and decomposed exactly
+    like a wsgi request."""
+
+    server = scope.get('server') or ('localhost', None)
+    client = scope.get('client') or ('', None)
+    port = server[1]
+    if port is None:
+        port = 443 if scope.get('scheme') == 'https' else 80
+
+    retval = {
+        'REQUEST_METHOD': scope['method'],
+        # PEP-3333 wants paths to be "bytes-as-unicode"
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf8')
+                                                             .decode('latin1'),
+        'PATH_INFO': scope['path'].encode('utf8').decode('latin1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin1'),
+        'SERVER_NAME': server[0],
+        'SERVER_PORT': str(port),
+        'SERVER_PROTOCOL': 'HTTP/%s' % scope.get('http_version', '1.1'),
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1] or ''),
+        'CONTENT_LENGTH': str(len(body)),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': BytesIO(body),
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+        'asgi.scope': scope,
+    }
+
+    for name, value in scope.get('headers', ()):
+        key = name.decode('latin1').upper().replace('-', '_')
+        value = value.decode('latin1')
+
+        if key == 'CONTENT_LENGTH':
+            continue  # the body is already read
+
+        if key != 'CONTENT_TYPE':
+            key = 'HTTP_' + key
+
+        if key in retval:
+            retval[key] = '%s,%s' % (retval[key], value)
+        else:
+            retval[key] = value
+
+    return retval
+
+
+def _get_content_length(scope):
+    for name, value in scope.get('headers', ()):
+        if name.lower() == b'content-length':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+
+
+def _gen_asgi_headers(headers):
+    return [(k.encode('latin1'), v.encode('latin1'))
+                                      for k, v in _gen_http_headers(headers)]
+
+
+class AsgiTransportContext(WsgiTransportContext):
+    """The class that is used in the transport attribute of the
+    :class:`AsgiMethodContext` class.
+
+    The request environment in ``req_env`` is built from the asgi connection
+    scope, which is also available as the ``scope`` attribute.
+    """
+
+    def __init__(self, parent, transport, req_env, content_type):
+        super(AsgiTransportContext, self).__init__(parent, transport,
+                                                          req_env, content_type)
+
+        self.scope = req_env['asgi.scope']
+        """The asgi connection scope"""
+
+
+class AsgiMethodContext(HttpMethodContext):
+    """The ASGI-Specific method context. ASGI-Specific information is stored in
+    the transport attribute using the :class:`AsgiTransportContext` class.
+    """
+
+    __slots__ = ()
+
+    TransportContext = None
+    HttpTransportContext = AsgiTransportContext
+
+
+class AsgiApplication(HttpBase):
+    """An `asgi 3.0 <https://asgi.readthedocs.io/en/latest/specs/main.html>`_
+    compliant application class that supports the ``http`` and ``lifespan``
+    connection scopes.
+
+    See :class:`spyne.server.wsgi.WsgiApplication` for how the wsdl document
+    is handled, this class works the same way.
+
+    :param app: The :class:`spyne.application.Application` instance.
+    :param chunked: When ``False``, the whole response is buffered and sent
+        with a Content-Length header.
+    :param max_content_length: The maximum length of the request body. Longer
+        requests are refused with a '413 Request Entity Too Large' response.
+    :param block_length: Unused, kept for signature compatibility with
+        :class:`spyne.server.wsgi.WsgiApplication`.
+    :param executor: A :class:`concurrent.futures.Executor` instance that is
+        used to run methods that are not coroutine functions. When ``None``,
+        they are run in the event loop.
+
+    Supported events:
+        * ``wsdl``
+            Called right before the wsdl data is returned to the client.
+
+        * ``wsdl_exception``
+            Called right after an exception is thrown during wsdl generation.
+            The exception object is stored in ctx.transport.wsdl_error
+            attribute.
+
+        * ``asgi_call``
+            Called first when the incoming http request is identified as a rpc
+            request.
+
+        * ``asgi_return``
+            Called right before the response starts to be sent to the client.
+
+        * ``asgi_exception``
+            Called right before returning the exception to the client.
+
+        * ``asgi_close``
+            Called after the whole data has been returned to the client. It's
+            called both from success and error cases.
+    """
+
+    def __init__(self, app, chunked=True, max_content_length=2 * 1024 * 1024,
+                                          block_length=8 * 1024, executor=None):
+        super(AsgiApplication, self).__init__(app, chunked, max_content_length,
+                                                                   block_length)
+
+        self.executor = executor
+
+        self._in_flight = 0
+
+        self._wsdl = None
+        self._wsdl_doc = None
+        if self.doc.wsdl11 is not None:
+            self._wsdl = self.doc.wsdl11.get_interface_document()
+
+    is_wsdl_request = WsgiApplication.is_wsdl_request
+
+    decompose_incoming_envelope = WsgiApplication.decompose_incoming_envelope
+
+    async def __call__(self, scope, receive, send):
+        scope_type = scope['type']
+
+        if scope_type == 'http':
+            await self.handle_http(scope, receive, send)
+
+        elif scope_type == 'lifespan':
+            await self.handle_lifespan(scope, receive, send)
+
+        else:
+            raise ValueError("Unsupported asgi scope type %r" % scope_type)
+
+    async def handle_lifespan(self, scope, receive, send):
+        while True:
+            message = await receive()
+
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+    async def handle_http(self, scope, receive, send):
+        error = None
+        try:
+            body = await self.read_body(scope, receive)
+        except RequestTooLongError as e:
+            body, error = b'', e
+
+        if body is None:
+            logger.debug("Client disconnected before sending the whole body.")
+            return
+
+        req_env = _scope_to_environ(scope, body)
+
+        if error is None and self.is_wsdl_request(req_env):
+            url = _reconstruct_url(req_env).split('?')[0].split('.wsdl')[0]
+            await self.handle_wsdl_request(req_env, send, url)
+            return
+
+        if not self.app.gc_policy.wants_idle:
+            await self.handle_rpc(req_env, send, error)
+            return
+
+        self._in_flight += 1
+        try:
+            await self.handle_rpc(req_env, send, error)
+
+        finally:
+            self._in_flight -= 1
+            if self._in_flight == 0:
+                self.app.gc_policy.idle()
+
+    async def read_body(self, scope, receive):
+        """Returns the request body as a byte string, or ``None`` if the client
+        disconnects before sending all of it. Raises
+        :class:`spyne.error.RequestTooLongError` if the body is longer than
+        ``self.max_content_length``."""
+
+        length = _get_content_length(scope)
+        if length is not None and length > self.max_content_length:
+            raise RequestTooLongError()
+
+        retval = []
+        bytes_read = 0
+
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return None
+
+            data = message.get('body', b'')
+            bytes_read += len(data)
+            if bytes_read > self.max_content_length:
+                raise RequestTooLongError()
+
+            retval.append(data)
+
+            if not message.get('more_body', False):
+                break
+
+        return b''.join(retval)
+
+    async def send_response(self, send, p_ctx):
+        """Sends the response status, headers and each chunk of
+        ``p_ctx.out_string`` to the client."""
+
+        transport = p_ctx.transport
+
+        await send({
+            'type': 'http.response.start',
+            'status': int(transport.resp_code[:3]),
+            'headers': _gen_asgi_headers(transport.resp_headers),
+        })
+
+        for chunk in p_ctx.out_string:
+            if len(chunk) == 0:
+                continue
+
+            await send({
+                'type': 'http.response.body',
+                'body': bytes(chunk),
+                'more_body': True,
+            })
+
+        await send({'type': 'http.response.body', 'body': b''})
+
+    async def handle_wsdl_request(self, req_env, send, url):
+        ctx = AsgiMethodContext(self, req_env, 'text/xml; charset=utf-8')
+        resp_headers = ctx.transport.resp_headers
+
+        ctx.transport.resp_code = HTTP_404
+        ctx.out_string = [HTTP_404.encode('latin1')]
+
+        try:
+            if self.doc.wsdl11 is None:
+                await self.send_response(send, ctx)
+                return
+
+            if self._wsdl is None:
+                self._wsdl = self.doc.wsdl11.get_interface_document()
+
+            ctx.transport.wsdl = self._wsdl
+
+            if ctx.transport.wsdl is None:
+                try:
+                    self.doc.wsdl11.build_interface_document(url)
+                    ctx.transport.wsdl = self._wsdl = \
+                                        self.doc.wsdl11.get_interface_document()
+
+                except Exception as e:
+                    logger.exception(e)
+                    ctx.transport.wsdl_error = e
+
+                    self.event_manager.fire_event('wsdl_exception', ctx)
+
+                    ctx.transport.resp_code = HTTP_500
+                    ctx.out_string = [HTTP_500.encode('latin1')]
+                    await self.send_response(send, ctx)
+                    return
+
+            self.event_manager.fire_event('wsdl', ctx)
+
+            # the compressed variants and the validators are computed only
+            # once, unless a 'wsdl' event handler changes the document.
+            doc = self._wsdl_doc
+            if doc is None or not doc.has_data(ctx.transport.wsdl):
+                doc = self._wsdl_doc = CachedDocument(ctx.transport.wsdl)
+
+            if doc.is_not_modified(req_env.get('HTTP_IF_NONE_MATCH', None),
+                                  req_env.get('HTTP_IF_MODIFIED_SINCE', None)):
+                resp_headers.update(doc.get_headers())
+                ctx.transport.resp_code = HTTP_304
+                ctx.out_string = []
+                await self.send_response(send, ctx)
+                return
+
+            encoding, retval = doc.get_encoded(
+                                      req_env.get('HTTP_ACCEPT_ENCODING', None))
+
+            resp_headers.update(doc.get_headers(encoding))
+            resp_headers['Content-Length'] = str(len(retval))
+            ctx.transport.resp_code = HTTP_200
+            ctx.out_string = [retval]
+            await self.send_response(send, ctx)
+
+        finally:
+            ctx.close()
+
+    async def get_out_object_async(self, ctx):
+        """Calls the matched user function like :func:`get_out_object` does.
+        Coroutines returned by ``async def`` methods are awaited and the other
+        methods are run in ``self.executor``, when it's set."""
+
+        if ctx.in_error is not None:
+            raise ctx.in_error
+
+        if self.executor is None or iscoroutinefunction(ctx.function):
+            # event firing is done in the spyne.application.Application
+            self.app.process_request(ctx)
+
+        else:
+            # get_running_loop() would need Python 3.7
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(self.executor, self.app.process_request,
+                                                                           ctx)
+
+        if iscoroutine(ctx.out_object):
+            coro, ctx.out_object = ctx.out_object, None
+
+            try:
+                self.app.complete_request(ctx, await coro)
+
+            except Exception as e:
+                self.app.process_exception(ctx, e)
+
+        self.fix_ignored_out_object(ctx)
+
+    async def handle_error(self, p_ctx, others, error, send):
+        """Serializes the given error and sends it to the client.
+
+        :param p_ctx: Primary (non-aux) context.
+        :param others: List if auxiliary contexts (can be empty).
+        :param error: One of ctx.{in,out}_error.
+        :param send: The asgi send callable.
+        """
+
+        if p_ctx.transport.resp_code is None:
+            p_ctx.transport.resp_code = \
+                p_ctx.out_protocol.fault_to_http_response_code(error)
+
+        self.get_out_string(p_ctx)
+
+        # consume the generator to get the length
+        p_ctx.out_string = list(p_ctx.out_string)
+
+        p_ctx.transport.resp_headers['Content-Length'] = \
+                                    str(sum((len(s) for s in p_ctx.out_string)))
+        self.event_manager.fire_event('asgi_exception', p_ctx)
+
+        try:
+            process_contexts(self, others, p_ctx, error=error)
+        except Exception as e:
+            # Report but ignore any exceptions from auxiliary methods.
+            logger.exception(e)
+
+        await self.send_response(send, p_ctx)
+
+    async def handle_rpc(self, req_env, send, error=None):
+        initial_ctx = AsgiMethodContext(self, req_env,
+                                                self.app.out_protocol.mime_type)
+
+        self.event_manager.fire_event('asgi_call', initial_ctx)
+
+        if error is None:
+            initial_ctx.in_string = [req_env['wsgi.input'].getvalue()]
+
+            charset = None
+            content_type = req_env.get('CONTENT_TYPE')
+            if content_type is not None:
+                charset = parse_header(content_type)[1].get('charset', None)
+
+            contexts = self.generate_contexts(initial_ctx, charset)
+
+        else:
+            initial_ctx.in_error = initial_ctx.out_error = error
+            contexts = [initial_ctx]
+
+        p_ctx, others = contexts[0], contexts[1:]
+
+        # TODO: rate limiting
+        p_ctx.active = True
+
+        try:
+            await self._handle_rpc(p_ctx, others, send)
+
+        finally:
+            p_ctx.close()
+            self.event_manager.fire_event('asgi_close', p_ctx)
+
+    async def _handle_rpc(self, p_ctx, others, send):
+        if p_ctx.in_error:
+            await self.handle_error(p_ctx, others, p_ctx.in_error, send)
+            return
+
+        self.get_in_object(p_ctx)
+        if p_ctx.in_error:
+            logger.error(p_ctx.in_error)
+            await self.handle_error(p_ctx, others, p_ctx.in_error, send)
+            return
+
+        await self.get_out_object_async(p_ctx)
+        if p_ctx.out_error:
+            await self.handle_error(p_ctx, others, p_ctx.out_error, send)
+            return
+
+        assert p_ctx.out_object is not None
+        g = next(iter(p_ctx.out_object))
+        is_generator = len(p_ctx.out_object) == 1 and isgenerator(g)
+
+        # same as in WsgiApplication: run generator functions until their
+        # first yield so that they can set response headers, etc.
+        if is_generator:
+            first_obj = next(g)
+            p_ctx.out_object = ( chain((first_obj,), g), )
+
+        if p_ctx.transport.resp_code is None:
+            p_ctx.transport.resp_code = HTTP_200
+
+        # binary values are collected as attachments during serialization
+        mtom = p_ctx.descriptor is not None and p_ctx.descriptor.mtom and \
+                             hasattr(p_ctx.outprot_ctx, 'out_attachments')
+        if mtom:
+            p_ctx.outprot_ctx.out_attachments = []
+
+        try:
+            self.get_out_string(p_ctx)
+
+        except Exception as e:
+            logger.exception(e)
+            p_ctx.out_error = Fault('Server',
+                                             get_fault_string_from_exception(e))
+            await self.handle_error(p_ctx, others, p_ctx.out_error, send)
+            return
+
+        if isinstance(p_ctx.out_protocol, HttpRpc) and \
+                                               p_ctx.out_header_doc is not None:
+            p_ctx.transport.resp_headers.update(p_ctx.out_header_doc)
+
+        if mtom:
+            p_ctx.transport.resp_headers, p_ctx.out_string = apply_mtom(
+                    p_ctx.transport.resp_headers, p_ctx.out_string,
+                    p_ctx.outprot_ctx.out_attachments)
+
+        self.event_manager.fire_event('asgi_return', p_ctx)
+
+        if self.chunked:
+            # the user has not set a content-length, so we delete it as the
+            # input is just an iterable.
+            if 'Content-Length' in p_ctx.transport.resp_headers:
+                del p_ctx.transport.resp_headers['Content-Length']
+        else:
+            p_ctx.out_string = [b''.join(p_ctx.out_string)]
+
+        try:
+            len(p_ctx.out_string)
+
+            p_ctx.transport.resp_headers['Content-Length'] = \
+                                    str(sum([len(a) for a in p_ctx.out_string]))
+        except TypeError:
+            pass
+
+        try:
+            process_contexts(self, others, p_ctx, error=None)
+        except Exception as e:
+            # Report but ignore any exceptions from auxiliary methods.
+            logger.exception(e)
+
+        await self.send_response(send, p_ctx)
@@ -134,6 +134,8 @@ class DjangoHttpTransportContext(HttpTransportContext):
 
 
 class DjangoHttpMethodContext(HttpMethodContext):
+    __slots__ = ()
+
     HttpTransportContext = DjangoHttpTransportContext
 
 
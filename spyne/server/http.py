@@ -17,6 +17,11 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
+import re
+import zlib
+import hashlib
+
+from time import time
 from collections import defaultdict
 
 from email import utils
@@ -29,6 +34,11 @@ from spyne.protocol.http import HttpPattern
 from spyne.const.http import gen_body_redirect, HTTP_301, HTTP_302, HTTP_303, \
     HTTP_307
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 
 class HttpRedirect(Redirect):
     def __init__(self, ctx, location, orig_exc=None, code=HTTP_302):
@@ -213,6 +223,8 @@ class HttpMethodContext(MethodContext):
     the transport attribute using the :class:`HttpTransportContext` class.
     """
 
+    __slots__ = ()
+
     # because ctor signatures differ between TransportContext and
     # HttpTransportContext, we needed a new variable
     TransportContext = None
@@ -236,6 +248,400 @@ class HttpMethodContext(MethodContext):
     """Assigning an out protocol overrides the mime type of the transport."""
 
 
+_REGEX_META = frozenset('.^$*+?{}[]\\|()')
+_REGEX_META_B = frozenset(ord(c) for c in _REGEX_META)
+_REGEX_QUANTIFIERS = frozenset('*+?{')
+_REGEX_QUANTIFIERS_B = frozenset(ord(c) for c in _REGEX_QUANTIFIERS)
+
+_named_group_re = re.compile(r'\(\?P([<=])([A-Za-z_][A-Za-z0-9_]*)([>)])')
+_named_group_b_re = re.compile(br'\(\?P([<=])([A-Za-z_][A-Za-z0-9_]*)([>)])')
+
+
+def _has_top_level_alternation(pattern):
+    """Returns ``True`` when the given regex source contains a ``|`` that's
+    not inside a group or a character class."""
+
+    if isinstance(pattern, bytes):
+        pattern = pattern.decode('latin1')
+
+    depth = 0
+    escaped = in_class = False
+    for c in pattern:
+        if escaped:
+            escaped = False
+        elif c == '\\':
+            escaped = True
+        elif in_class:
+            in_class = c != ']'
+        elif c == '[':
+            in_class = True
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == '|' and depth == 0:
+            return True
+
+    return False
+
+
+def _get_literal_prefix(pattern):
+    """Returns the part of the given regex source that every match must start
+    with, along with a flag that's ``True`` when the whole source is a
+    literal.
+
+    The prefix ends at the first regex metacharacter, or one character earlier
+    when that metacharacter is a quantifier. It's empty when the source has a
+    top-level alternation."""
+
+    if isinstance(pattern, bytes):
+        meta, quantifiers = _REGEX_META_B, _REGEX_QUANTIFIERS_B
+    else:
+        meta, quantifiers = _REGEX_META, _REGEX_QUANTIFIERS
+
+    for i, c in enumerate(pattern):
+        if c in meta:
+            if _has_top_level_alternation(pattern[i:]):
+                return pattern[:0], False
+
+            if c in quantifiers:
+                i = max(i - 1, 0)
+
+            return pattern[:i], False
+
+    return pattern, True
+
+
+class _HttpRouteBucket(object):
+    """Holds the address patterns of an :class:`HttpRouteIndex` that share
+    the same verb and host.
+
+    ``static`` maps literal addresses to the index of the first pattern with
+    that address. ``prefixed`` maps the static part of non-literal addresses,
+    cut right after their last slash, to ``(regex, indexes)`` pairs where
+    ``regex`` is an alternation of all addresses with that prefix.
+    """
+
+    __slots__ = ['static', 'prefixed', 'slash']
+
+    def __init__(self, slash):
+        self.static = {}
+        self.prefixed = {}
+        self.slash = slash
+
+    def match(self, path):
+        retval = self.static.get(path, None)
+
+        slash = self.slash
+        prefixed = self.prefixed
+        end = path.find(slash)
+        while end >= 0:
+            node = prefixed.get(path[:end + 1], None)
+            if node is not None:
+                regex, indexes = node
+                m = regex.match(path)
+                if m is not None:
+                    i = indexes[m.lastgroup]
+                    if retval is None or i < retval:
+                        retval = i
+
+            end = path.find(slash, end + 1)
+
+        return retval
+
+
+class HttpRouteIndex(object):
+    """An index over a sorted sequence of
+    :class:`spyne.protocol.http.HttpPattern` instances that finds the first
+    pattern that can match a request without trying every pattern in turn.
+
+    Patterns are bucketed by literal verb and host. Within a bucket, literal
+    addresses are looked up in a dict and the others are grouped by their
+    literal prefix, every group being tried as one combined regex. Patterns
+    with verb or host regexes or without an address are checked one by one.
+
+    :meth:`match` returns the index of a candidate which is guaranteed to be
+    the first pattern that fully matches the request. The caller still needs
+    to run the pattern's own regexes to extract its parameters.
+    """
+
+    def __init__(self, patterns, get_verb, get_host, get_address, slash):
+        self.slash = slash
+        self.buckets = {}
+        self.linear = []
+
+        groups = defaultdict(list)
+
+        for i, patt in enumerate(patterns):
+            verb_re = get_verb(patt) if patt.verb is not None else None
+            host_re = get_host(patt) if patt.host is not None else None
+            addr_re = get_address(patt) if patt.address is not None else None
+
+            verb = host = None
+            if verb_re is not None:
+                verb, is_literal = _get_literal_prefix(verb_re.pattern)
+                if not is_literal:
+                    self.linear.append(i)
+                    continue
+
+            if host_re is not None:
+                host, is_literal = _get_literal_prefix(host_re.pattern)
+                if not is_literal:
+                    self.linear.append(i)
+                    continue
+
+            if addr_re is None:
+                self.linear.append(i)
+                continue
+
+            bucket = self.buckets.get((verb, host), None)
+            if bucket is None:
+                bucket = self.buckets[verb, host] = _HttpRouteBucket(slash)
+
+            address = addr_re.pattern
+            prefix, is_literal = _get_literal_prefix(address)
+            if is_literal:
+                bucket.static.setdefault(address, i)
+                continue
+
+            prefix = prefix[:prefix.rfind(slash) + 1]
+            if len(prefix) == 0:
+                self.linear.append(i)
+                continue
+
+            groups[verb, host, prefix].append((i, address))
+
+        for (verb, host, prefix), entries in groups.items():
+            node = self._compile(entries)
+            if node is None:
+                self.linear.extend(i for i, _ in entries)
+            else:
+                self.buckets[verb, host].prefixed[prefix] = node
+
+        self.linear.sort()
+
+    @staticmethod
+    def _compile(entries):
+        """Returns a ``(regex, indexes)`` pair for the given ``(index,
+        address)`` pairs. Group names in every address are prefixed to keep
+        them unique and every alternative is followed by an empty group named
+        after the index of its pattern."""
+
+        alternatives = []
+        indexes = {}
+        for i, address in entries:
+            if isinstance(address, bytes):
+                tag = ('_%d' % i).encode('ascii')
+                alternatives.append(b''.join((b'(?:',
+                    _named_group_b_re.sub(br'(?P\1' + tag + br'_\2\3',
+                                    address), b')(?P<', tag, b'>)\\Z')))
+            else:
+                tag = '_%d' % i
+                alternatives.append(''.join(('(?:',
+                    _named_group_re.sub(r'(?P\1' + tag + r'_\2\3', address),
+                                                ')(?P<', tag, '>)\\Z')))
+            indexes['_%d' % i] = i
+
+        joiner = b'|' if isinstance(entries[0][1], bytes) else '|'
+        try:
+            return re.compile(joiner.join(alternatives)), indexes
+        except re.error:
+            return None
+
+    def match(self, method, path, host):
+        """Returns the index of the first pattern that matches the given
+        request or ``None`` if no pattern matches. Patterns in ``linear``
+        are left to ``check``."""
+
+        retval = None
+        buckets = self.buckets
+        for key in ((method, host), (method, None), (None, host),
+                                                                (None, None)):
+            bucket = buckets.get(key, None)
+            if bucket is None:
+                continue
+
+            i = bucket.match(path)
+            if i is not None and (retval is None or i < retval):
+                retval = i
+
+        return retval
+
+
+def _split_header_params(value):
+    # splits at semicolons that are not in quoted strings
+    while value[:1] == ';':
+        value = value[1:]
+        end = value.find(';')
+        while end > 0 and (value.count('"', 0, end)
+                                       - value.count('\\"', 0, end)) % 2:
+            end = value.find(';', end + 1)
+        if end < 0:
+            end = len(value)
+        yield value[:end].strip()
+        value = value[end:]
+
+
+def parse_header(value):
+    """Parses a Content-Type-like header value into a ``(value, params)``
+    tuple where ``params`` is a dict, like the ``cgi.parse_header()``
+    function, which is not available on Python 3.13 and later."""
+
+    parts = _split_header_params(';' + value)
+    key = next(parts)
+
+    params = {}
+    for part in parts:
+        name, eq, pvalue = part.partition('=')
+        if not eq:
+            continue
+
+        name = name.strip().lower()
+        pvalue = pvalue.strip()
+        if len(pvalue) >= 2 and pvalue[0] == pvalue[-1] == '"':
+            pvalue = pvalue[1:-1].replace('\\\\', '\\').replace('\\"', '"')
+
+        params[name] = pvalue
+
+    return key, params
+
+
+def _parse_accept_encoding(value):
+    """Returns a dict that maps content codings in the given Accept-Encoding
+    header value to their q-values."""
+
+    retval = {}
+    if not value:
+        return retval
+
+    for token in value.split(','):
+        coding, _, params = token.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+
+        retval[coding] = q
+
+    return retval
+
+
+class CachedDocument(object):
+    """A pre-rendered document that is served as-is to every client, like the
+    wsdl. The gzip variant (and the brotli variant, if the ``brotli`` package
+    is installed) is computed once on instantiation along with the ETag and
+    Last-Modified validators that are used to answer conditional requests.
+
+    :param data: The document as a byte string.
+    :param mtime: Modification time of the document as a unix timestamp.
+        Defaults to now.
+    :param min_compress_size: Documents shorter than this are served
+        uncompressed.
+    """
+
+    ENCODINGS = ('br', 'gzip')
+    """Supported content codings, in order of preference."""
+
+    __slots__ = ('data', 'mtime', 'etag', 'last_modified', 'variants')
+
+    def __init__(self, data, mtime=None, min_compress_size=1024):
+        if mtime is None:
+            mtime = time()
+
+        self.data = data
+        self.mtime = int(mtime)
+        self.etag = '"%s"' % hashlib.sha1(data).hexdigest()
+        self.last_modified = utils.formatdate(self.mtime, usegmt=True)
+
+        self.variants = {}
+        if len(data) >= min_compress_size:
+            # wbits=31 makes zlib emit the gzip format, with a zero mtime so
+            # that the output is deterministic.
+            comp = zlib.compressobj(9, zlib.DEFLATED, 31)
+            self.variants['gzip'] = comp.compress(data) + comp.flush()
+
+            if brotli is not None:
+                self.variants['br'] = brotli.compress(data)
+
+    def has_data(self, data):
+        """Returns True when this document was built from the given byte
+        string or from an equal one."""
+
+        return data is self.data or data == self.data
+
+    def is_not_modified(self, if_none_match=None, if_modified_since=None):
+        """Returns True when the client's copy, as described by the given
+        If-None-Match and If-Modified-Since header values, is up to date."""
+
+        if if_none_match is not None:
+            if if_none_match.strip() == '*':
+                return True
+
+            for tag in if_none_match.split(','):
+                tag = tag.strip()
+                if tag.startswith('W/'):
+                    tag = tag[2:]
+                if tag == self.etag:
+                    return True
+
+            # If-Modified-Since is ignored when If-None-Match is present.
+            return False
+
+        if if_modified_since is not None:
+            parsed = utils.parsedate_tz(if_modified_since)
+            if parsed is None:
+                return False
+
+            return utils.mktime_tz(parsed) >= self.mtime
+
+        return False
+
+    def get_encoded(self, accept_encoding=None):
+        """Returns a ``(content_encoding, data)`` tuple with the best variant
+        for the given Accept-Encoding header value. ``content_encoding`` is
+        ``None`` for the uncompressed variant."""
+
+        if len(self.variants) > 0:
+            accepted = _parse_accept_encoding(accept_encoding)
+            star = accepted.get('*', 0.0)
+
+            best, best_q = None, 0.0
+            for enc in self.ENCODINGS:
+                if enc in self.variants:
+                    q = accepted.get(enc, star)
+                    if q > best_q:
+                        best, best_q = enc, q
+
+            if best is not None:
+                return best, self.variants[best]
+
+        return None, self.data
+
+    def get_headers(self, content_encoding=None):
+        """Returns the validator headers along with the Vary and
+        Content-Encoding headers for the given variant."""
+
+        retval = {
+            'ETag': self.etag,
+            'Last-Modified': self.last_modified,
+        }
+
+        if len(self.variants) > 0:
+            retval['Vary'] = 'Accept-Encoding'
+
+        if content_encoding is not None:
+            retval['Content-Encoding'] = content_encoding
+
+        return retval
+
+
 class HttpBase(ServerBase):
     transport = 'http://schemas.xmlsoap.org/soap/http'
 
@@ -266,6 +672,10 @@ class HttpBase(ServerBase):
         self._http_patterns = list(reversed(sorted(self._http_patterns,
                                            key=lambda x: (x.address, x.host) )))
 
+        self._http_route_index = HttpRouteIndex(self._http_patterns,
+                        self.get_patt_verb, self.get_patt_host,
+                                            self.get_patt_address, self.SLASH)
+
     @classmethod
     def get_patt_verb(cls, patt):
         return patt.verb_re
@@ -279,8 +689,10 @@ class HttpBase(ServerBase):
         return patt.address_re
 
     def match_pattern(self, ctx, method='', path='', host=''):
-        """Sets ctx.method_request_string if there's a match. It's O(n) which
-        means you should keep your number of patterns as low as possible.
+        """Sets ctx.method_request_string if there's a match. Candidates are
+        found using the :class:`HttpRouteIndex` built in the constructor, so
+        the cost of a lookup depends on the number of slashes in the path
+        rather than the number of patterns.
 
         :param ctx: A MethodContext instance
         :param method: The verb in the HTTP Request (GET, POST, etc.)
@@ -292,50 +704,81 @@ class HttpBase(ServerBase):
         if not path.startswith(self.SLASH):
             path = self.SLASHPER % (path,)
 
-        params = defaultdict(list)
-        for patt in self._http_patterns:
-            assert isinstance(patt, HttpPattern)
+        patterns = self._http_patterns
+        index = self._http_route_index
 
-            if patt.verb is not None:
-                match = self.get_patt_verb(patt).match(method)
-                if match is None:
-                    continue
-                if not (match.span() == (0, len(method))):
-                    continue
+        candidate = index.match(method, path, host)
+        for i in index.linear:
+            if candidate is not None and i > candidate:
+                break
 
-                for k,v in match.groupdict().items():
-                    params[k].append(v)
+            params = self._match_one_pattern(patterns[i], method, path, host)
+            if params is not None:
+                return self._set_match(ctx, patterns[i], params)
 
-            if patt.host is not None:
-                match = self.get_patt_host(patt).match(host)
-                if match is None:
-                    continue
-                if not (match.span() == (0, len(host))):
-                    continue
+        if candidate is not None:
+            patt = patterns[candidate]
+            params = self._match_one_pattern(patt, method, path, host)
+            if params is not None:
+                return self._set_match(ctx, patt, params)
 
-                for k, v in match.groupdict().items():
-                    params[k].append(v)
+            # the pattern's regex matches the path without its match()
+            # spanning the whole of it, which the index can't tell.
+            for patt in patterns[candidate + 1:]:
+                params = self._match_one_pattern(patt, method, path, host)
+                if params is not None:
+                    return self._set_match(ctx, patt, params)
 
-            if patt.address is None:
-                if path.split(self.SLASH)[-1] != patt.endpoint.name:
-                    continue
+        return defaultdict(list)
 
-            else:
-                match = self.get_patt_address(patt).match(path)
-                if match is None:
-                    continue
+    def _set_match(self, ctx, patt, params):
+        d = patt.endpoint
+        assert isinstance(d, MethodDescriptor)
+        ctx.method_request_string = d.name
 
-                if not (match.span() == (0, len(path))):
-                    continue
+        return params
 
-                for k,v in match.groupdict().items():
-                    params[k].append(v)
+    def _match_one_pattern(self, patt, method, path, host):
+        """Returns the parameters extracted from the request when it matches
+        the given pattern, ``None`` otherwise."""
+
+        assert isinstance(patt, HttpPattern)
+
+        params = defaultdict(list)
+        if patt.verb is not None:
+            match = self.get_patt_verb(patt).match(method)
+            if match is None:
+                return None
+            if not (match.span() == (0, len(method))):
+                return None
+
+            for k,v in match.groupdict().items():
+                params[k].append(v)
+
+        if patt.host is not None:
+            match = self.get_patt_host(patt).match(host)
+            if match is None:
+                return None
+            if not (match.span() == (0, len(host))):
+                return None
+
+            for k, v in match.groupdict().items():
+                params[k].append(v)
+
+        if patt.address is None:
+            if path.split(self.SLASH)[-1] != patt.endpoint.name:
+                return None
+
+        else:
+            match = self.get_patt_address(patt).match(path)
+            if match is None:
+                return None
 
-            d = patt.endpoint
-            assert isinstance(d, MethodDescriptor)
-            ctx.method_request_string = d.name
+            if not (match.span() == (0, len(path))):
+                return None
 
-            break
+            for k,v in match.groupdict().items():
+                params[k].append(v)
 
         return params
 
@@ -23,6 +23,7 @@ import logging
 logger = logging.getLogger(__name__)
 
 import msgpack
+import threading
 
 from mmap import mmap
 from collections import OrderedDict
@@ -62,6 +63,27 @@ def _process_v1_msg(prot, msg):
     return ctx
 
 
+def _process_inline_msg(prot, msg):
+    header = None
+    body = msg[1]
+    if not isinstance(body, dict):
+        raise ValidationError(body, "Body must be a dict.")
+
+    if len(msg) > 2:
+        header = msg[2]
+        if not isinstance(header, dict):
+            raise ValidationError(header, "Header must be a dict.")
+
+    ctx = MessagePackMethodContext(prot, MessagePackMethodContext.SERVER)
+    # the document was already decoded along with the shell, there's nothing
+    # left for the protocol to parse.
+    ctx.in_document = body
+    ctx.transport.in_header = header
+    ctx.transport.inline = True
+
+    return ctx
+
+
 class MessagePackTransportContext(TransportContext):
     def __init__(self, parent, transport):
         super(MessagePackTransportContext, self).__init__(parent, transport)
@@ -70,6 +92,10 @@ class MessagePackTransportContext(TransportContext):
         self.protocol = None
         self.inreq_queue = OrderedDict()
         self.request_len = None
+        self.inline = False
+        """When True, the request came in with inline framing, so the response
+        document is packed inside the response shell instead of being packed
+        separately as a bytestream."""
 
     def get_peer(self):
         if self.protocol is not None:
@@ -92,6 +118,8 @@ class MessagePackOobMethodContext(object):
 
 
 class MessagePackMethodContext(MethodContext):
+    __slots__ = ('oob_ctx',)
+
     TransportContext = MessagePackTransportContext
 
     def __init__(self, transport, way):
@@ -110,12 +138,28 @@ class MessagePackMethodContext(MethodContext):
 
 
 class MessagePackTransportBase(ServerBase):
+    """Base class for MessagePack transports.
+
+    Two request framings are supported:
+
+        * ``[IN_REQUEST, body, header]``: ``body`` is the request document
+          packed as a separate bytestream and header values are packed
+          bytestreams as well. The response is packed the same way:
+          ``[OUT_RESPONSE_*, body]``.
+        * ``[IN_REQUEST_INLINE, body, header]``: ``body`` is the request
+          document itself and header values are plain objects. The response
+          shell and document are encoded in one pass:
+          ``[OUT_RESPONSE_*, document]``. This saves one encode and one
+          decode of every message.
+    """
+
     # These are all placeholders that need to be overridden in subclasses
     OUT_RESPONSE_NO_ERROR = None
     OUT_RESPONSE_CLIENT_ERROR = None
     OUT_RESPONSE_SERVER_ERROR = None
 
     IN_REQUEST = None
+    IN_REQUEST_INLINE = None
 
     def __init__(self, app):
         super(MessagePackTransportBase, self).__init__(app)
@@ -124,10 +168,42 @@ class MessagePackTransportBase(ServerBase):
             self.IN_REQUEST: _process_v1_msg
         }
 
-    def produce_contexts(self, msg):
+        if self.IN_REQUEST_INLINE is not None:
+            self._version_map[self.IN_REQUEST_INLINE] = _process_inline_msg
+
+        self._local = threading.local()
+
+    def get_packer(self):
+        """Returns a ``msgpack.Packer`` instance to be reused by the current
+        thread."""
+
+        packer = getattr(self._local, 'packer', None)
+        if packer is None:
+            packer = self._local.packer = msgpack.Packer()
+        return packer
+
+    def pack_inline(self, code, out_document, *args):
+        """Packs the response shell along with the given response document in
+        one pass.
+
+        :param code: Response code, one of ``OUT_RESPONSE_*``.
+        :param out_document: The ``ctx.out_document`` list. When it contains
+            exactly one document, it's packed without the enclosing list.
+        :param args: Additional shell elements, e.g. a debug tag.
+        """
+
+        if len(out_document) == 1:
+            out_document = out_document[0]
+
+        return self.get_packer().pack((code, out_document) + args)
+
+    def produce_contexts(self, msg, msglen=None):
         """Produce contexts based on incoming message.
 
         :param msg: Parsed request in this format: `[IN_REQUEST, body, header]`
+            or `[IN_REQUEST_INLINE, body, header]`.
+        :param msglen: Length of the encoded request, when known. An estimate
+            is computed from the body length otherwise.
         """
 
         if not isinstance(msg, (list, tuple)):
@@ -149,12 +225,14 @@ class MessagePackTransportBase(ServerBase):
             logger.debug("Invalid incoming request: %r", msg)
             raise ValidationError(msg[0], "Unknown request type %r")
 
-        msglen = len(msg[1])
-        # shellen = len(msgpack.packb(msg))
-        # logger.debug("Shell size: %d, message size: %d, diff: %d",
-        #                                     shellen, msglen, shellen - msglen)
-        # some approx. msgpack overhead based on observations of what's above.
-        msglen += MSGPACK_SHELL_OVERHEAD
+        if msglen is None and not isinstance(msg[1], dict):
+            msglen = len(msg[1])
+            # shellen = len(msgpack.packb(msg))
+            # logger.debug("Shell size: %d, message size: %d, diff: %d",
+            #                                 shellen, msglen, shellen - msglen)
+            # some approx. msgpack overhead based on observations of what's
+            # above.
+            msglen += MSGPACK_SHELL_OVERHEAD
 
         initial_ctx = processor(self, msg)
         contexts = self.generate_contexts(initial_ctx)
@@ -200,7 +278,13 @@ class MessagePackTransportBase(ServerBase):
         return msgpack.dumps(str(error))
 
     def pack(self, ctx):
-        ctx.out_string = msgpack.packb([self.OUT_RESPONSE_NO_ERROR,
+        if ctx.transport.inline:
+            # ctx.out_string is a generator that was never consumed, so the
+            # document is encoded only once, right here.
+            ctx.out_string = self.pack_inline(self.OUT_RESPONSE_NO_ERROR,
+                                                             ctx.out_document),
+        else:
+            ctx.out_string = msgpack.packb([self.OUT_RESPONSE_NO_ERROR,
                                                      b''.join(ctx.out_string)]),
 
 
@@ -215,3 +299,4 @@ class MessagePackServerBase(MessagePackTransportBase):
     OUT_RESPONSE_SERVER_ERROR = 2
 
     IN_REQUEST = 1
+    IN_REQUEST_INLINE = 2
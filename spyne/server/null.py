@@ -160,6 +160,7 @@ class _FunctionCall(object):
                                                        ctx.descriptor.function))
             try:
                 self.app.process_request(ctx)
+                self._server.reject_coroutine(ctx)
             finally:
                 logger.warning("%s  end context  %s" % (_small_header,
                                                                  _small_footer))
@@ -0,0 +1,223 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""The ``spyne.server.twisted.executor`` module contains the executors that
+decide where :class:`spyne.server.twisted.TwistedWebResource` runs service
+methods.
+
+By default, everything runs in the reactor thread, so a slow synchronous
+method stalls every other connection in the process. Methods that block can be
+moved to a thread pool, either per method: ::
+
+    heavy_pool = ThreadPoolExecutor(pool_size=4, max_queued=100)
+
+    class SomeService(Service):
+        @rpc(Unicode, _returns=Unicode, _executor=heavy_pool)
+        def heavy(ctx, s):
+            ...
+
+or per service, via the ``__executor__`` class attribute: ::
+
+    class SomeService(Service):
+        __executor__ = SharedThreadPoolExecutor()
+
+The ``_executor`` flag of the @rpc decorator overrides ``__executor__``, so
+``_executor=ReactorExecutor()`` moves a method back to the reactor thread.
+The default executor of the transport can be set with the ``executor``
+argument to :class:`spyne.server.twisted.http.TwistedHttpTransport`.
+
+Methods that run in a thread pool must not return ``Deferred`` instances, as
+Deferreds are not thread-safe.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+from time import time
+from threading import Lock
+
+from twisted.internet import reactor
+from twisted.internet.defer import fail
+from twisted.internet.threads import deferToThreadPool
+from twisted.python.threadpool import ThreadPool
+
+from spyne.error import ServiceUnavailableError
+from spyne.util.stats import QueueStats
+
+
+class ExecutorStats(QueueStats):
+    """Queue depth and latency counters of an executor. See
+    :class:`spyne.util.stats.QueueStats` for the common counters."""
+
+    __slots__ = ('rejected',)
+
+
+class ExecutorBase(object):
+    """Base class for executors.
+
+    :param offload_serialization: When ``True``, the deserialization of the
+        incoming document and the serialization of the outgoing one are run in
+        the executor as well, not just the user code. The incoming document is
+        still parsed in the reactor thread as it's needed to find the method.
+    """
+
+    in_reactor = False
+    """When ``True``, the transport calls the methods inline instead of
+    submitting them."""
+
+    def __init__(self, offload_serialization=False):
+        self.offload_serialization = offload_serialization
+
+    def submit(self, func, *args, **kwargs):
+        """Runs the given callable and returns a Deferred that fires with its
+        return value."""
+
+        raise NotImplementedError()
+
+    def submit_followup(self, func, *args, **kwargs):
+        """Like :meth:`submit`, but for work that continues a call that was
+        already accepted, like serializing its response. The user code has
+        run by then, so the callable is never refused."""
+
+        return self.submit(func, *args, **kwargs)
+
+
+class ReactorExecutor(ExecutorBase):
+    """Runs methods in the reactor thread. This is the default."""
+
+    in_reactor = True
+
+    def __init__(self):
+        super(ReactorExecutor, self).__init__(offload_serialization=False)
+
+
+class ThreadPoolExecutorBase(ExecutorBase):
+    """Base class for executors that run methods in a Twisted thread pool.
+
+    :param max_queued: Max. number of calls that can wait for a free thread.
+        When the queue is full, new requests are refused with
+        :class:`spyne.error.ServiceUnavailableError`, which means a
+        '503 Service Unavailable' response for http. ``None`` means unbounded.
+    :param offload_serialization: See :class:`ExecutorBase`.
+    """
+
+    def __init__(self, max_queued=None, offload_serialization=False):
+        super(ThreadPoolExecutorBase, self).__init__(
+                                   offload_serialization=offload_serialization)
+
+        self.max_queued = max_queued
+
+        self.stats = ExecutorStats()
+        """The :class:`ExecutorStats` instance of this executor."""
+
+        self._lock = Lock()
+
+    def get_pool(self):
+        """Returns the :class:`twisted.python.threadpool.ThreadPool` instance
+        to run the calls in."""
+
+        raise NotImplementedError()
+
+    def submit(self, func, *args, **kwargs):
+        stats = self.stats
+
+        with self._lock:
+            if self.max_queued is not None and stats.queued >= self.max_queued:
+                stats.rejected += 1
+                return fail(ServiceUnavailableError())
+
+            stats.submitted += 1
+            stats.job_queued()
+
+        return deferToThreadPool(reactor, self.get_pool(), self._run,
+                                                   func, args, kwargs, time())
+
+    def submit_followup(self, func, *args, **kwargs):
+        # neither limited nor counted, the call was accounted for in submit()
+        return deferToThreadPool(reactor, self.get_pool(), func, *args,
+                                                                      **kwargs)
+
+    def _run(self, func, args, kwargs, queued_at):
+        stats = self.stats
+
+        with self._lock:
+            stats.job_started()
+
+        failed = True
+        try:
+            retval = func(*args, **kwargs)
+            failed = False
+
+        finally:
+            latency = time() - queued_at
+
+            with self._lock:
+                stats.job_done(failed, latency)
+
+        return retval
+
+
+class SharedThreadPoolExecutor(ThreadPoolExecutorBase):
+    """Runs methods in the thread pool of the reactor, which is also used by
+    :func:`twisted.internet.threads.deferToThread` and the name resolver. Its
+    size can be set with ``reactor.suggestThreadPoolSize()``.
+
+    See :class:`ThreadPoolExecutorBase` for the arguments.
+    """
+
+    def get_pool(self):
+        return reactor.getThreadPool()
+
+
+class ThreadPoolExecutor(ThreadPoolExecutorBase):
+    """Runs methods in a dedicated thread pool, so that they can't starve
+    methods that run elsewhere. The pool is started on first use and stopped
+    when the reactor shuts down.
+
+    :param pool_size: Max. number of threads in the pool.
+    :param name: The name of the pool, used in thread names.
+
+    See :class:`ThreadPoolExecutorBase` for the other arguments.
+    """
+
+    def __init__(self, pool_size=4, max_queued=None,
+                                       offload_serialization=False, name=None):
+        super(ThreadPoolExecutor, self).__init__(max_queued=max_queued,
+                                   offload_serialization=offload_serialization)
+
+        self.pool_size = pool_size
+        self.name = name
+
+        self.pool = None
+
+    def get_pool(self):
+        if self.pool is None:
+            self.pool = ThreadPool(minthreads=0, maxthreads=self.pool_size,
+                                                                name=self.name)
+            self.pool.start()
+            reactor.addSystemEventTrigger('during', 'shutdown', self.stop)
+
+        return self.pool
+
+    def stop(self):
+        """Stops the thread pool, waiting for the running calls to finish."""
+
+        if self.pool is not None:
+            self.pool.stop()
+            self.pool = None
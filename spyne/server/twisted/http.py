@@ -84,7 +84,9 @@ from spyne.protocol.http import HttpRpc
 from spyne.server.http import HttpBase
 from spyne.server.http import HttpMethodContext
 from spyne.server.http import HttpTransportContext
+from spyne.server.http import CachedDocument
 from spyne.server.twisted._base import Producer
+from spyne.server.twisted.executor import ReactorExecutor
 from spyne.server.twisted import log_and_let_go
 
 from spyne.util.address import address_parser
@@ -151,6 +153,13 @@ def _set_response_headers(request, headers):
     return retval
 
 
+def _get_header(request, name):
+    retval = request.getHeader(name)
+    if isinstance(retval, bytes):
+        retval = retval.decode('latin1')
+    return retval
+
+
 def _reconstruct_url(request):
     # HTTP "Hosts" header only supports ascii
 
@@ -246,6 +255,8 @@ class TwistedHttpTransportContext(HttpTransportContext):
 
 
 class TwistedHttpMethodContext(HttpMethodContext):
+    __slots__ = ()
+
     HttpTransportContext = TwistedHttpTransportContext
 
 
@@ -275,16 +286,32 @@ class TwistedHttpTransport(HttpBase):
         return patt.address_b_re
 
     def __init__(self, app, chunked=False, max_content_length=2 * 1024 * 1024,
-                                                         block_length=8 * 1024):
+                                          block_length=8 * 1024, executor=None):
         super(TwistedHttpTransport, self).__init__(app, chunked=chunked,
                max_content_length=max_content_length, block_length=block_length)
 
+        if executor is None:
+            executor = ReactorExecutor()
+
+        self.executor = executor
+        """The executor of the methods that don't have one of their own. See
+        :mod:`spyne.server.twisted.executor`."""
+
         self.reactor_thread = None
         def _cb():
             self.reactor_thread = threading.current_thread()
 
         deferLater(reactor, 0, _cb)
 
+    def get_executor(self, ctx):
+        """Returns the executor that runs the method of the given context."""
+
+        descriptor = ctx.descriptor
+        if descriptor is not None and descriptor.executor is not None:
+            return descriptor.executor
+
+        return self.executor
+
     def pusher_init(self, p_ctx, gen, _cb_push_finish, pusher, interim):
         if pusher.orig_thread != self.reactor_thread:
             return deferToThread(super(TwistedHttpTransport, self).pusher_init,
@@ -431,8 +458,8 @@ class TwistedHttpTransport(HttpBase):
                 _decode_path(request.path.rsplit(b'/', 1)[-1]).decode("utf8"),
             )
 
-        logger.debug(u"%sMethod name: %r%s" % (LIGHT_GREEN,
-                                          ctx.method_request_string, END_COLOR))
+        logger.debug(u"%sMethod name: %r%s", LIGHT_GREEN,
+                                           ctx.method_request_string, END_COLOR)
 
         for k, v in params.items():
             val = ctx.in_body_doc.get(k, [])
@@ -558,13 +585,14 @@ class TwistedWebResource(Resource):
     """
 
     def __init__(self, app, chunked=False, max_content_length=2 * 1024 * 1024,
-                                           block_length=8 * 1024, prepath=None):
+                           block_length=8 * 1024, prepath=None, executor=None):
         Resource.__init__(self)
         self.app = app
 
         self.http_transport = TwistedHttpTransport(app, chunked,
-                                            max_content_length, block_length)
+                                  max_content_length, block_length, executor)
         self._wsdl = None
+        self._wsdl_doc = None
         self.prepath = prepath
 
     def getChildWithDefault(self, path, request):
@@ -628,9 +656,14 @@ class TwistedWebResource(Resource):
         # TODO: Rate limiting
         p_ctx.active = True
 
+        executor = self.http_transport.get_executor(p_ctx)
+
         if p_ctx.in_error:
             return self.handle_rpc_error(p_ctx, others, p_ctx.in_error, request)
 
+        elif not executor.in_reactor:
+            return self.handle_rpc_offloaded(executor, p_ctx, others, request)
+
         else:
             self.http_transport.get_in_object(p_ctx)
 
@@ -643,6 +676,53 @@ class TwistedWebResource(Resource):
                 return self.handle_rpc_error(p_ctx, others, p_ctx.out_error,
                                                                         request)
 
+        return self.handle_rpc_out_object(p_ctx, others, request)
+
+    def handle_rpc_offloaded(self, executor, p_ctx, others, request):
+        """Runs the user code, along with the deserialization of the incoming
+        document if the executor wants it, in the given executor."""
+
+        deserialize = executor.offload_serialization
+        if not deserialize:
+            self.http_transport.get_in_object(p_ctx)
+
+            if p_ctx.in_error:
+                return self.handle_rpc_error(p_ctx, others, p_ctx.in_error,
+                                                                        request)
+
+        args = (p_ctx, others, request)
+        executor.submit(_get_out_object, self.http_transport, p_ctx,
+                                                                deserialize) \
+            .addCallbacks(self._cb_offloaded, self._eb_offloaded,
+                                         callbackArgs=args, errbackArgs=args) \
+            .addErrback(log_and_let_go, logger)
+
+        return NOT_DONE_YET
+
+    def _cb_offloaded(self, _, p_ctx, others, request):
+        error = p_ctx.in_error or p_ctx.out_error
+        if error:
+            request.write(self.handle_rpc_error(p_ctx, others, error, request))
+            request.finish()
+            return
+
+        retval = self.handle_rpc_out_object(p_ctx, others, request)
+        if retval != NOT_DONE_YET:
+            request.write(retval)
+            request.finish()
+
+    def _eb_offloaded(self, f, p_ctx, others, request):
+        error = f.value
+        if not isinstance(error, Fault):
+            logger.error(f.getTraceback())
+            error = InternalError(error)
+
+        p_ctx.out_error = error
+
+        request.write(self.handle_rpc_error(p_ctx, others, error, request))
+        request.finish()
+
+    def handle_rpc_out_object(self, p_ctx, others, request):
         ret = p_ctx.out_object[0]
         retval = NOT_DONE_YET
         if isinstance(ret, Deferred):
@@ -695,7 +775,21 @@ class TwistedWebResource(Resource):
 
             self.http_transport.event_manager.fire_event('wsdl', ctx)
 
-            return ctx.transport.wsdl
+            doc = self._wsdl_doc
+            if doc is None or not doc.has_data(ctx.transport.wsdl):
+                doc = self._wsdl_doc = CachedDocument(ctx.transport.wsdl)
+
+            if doc.is_not_modified(_get_header(request, b'if-none-match'),
+                                 _get_header(request, b'if-modified-since')):
+                _set_response_headers(request, doc.get_headers())
+                request.setResponseCode(304)
+                return b''
+
+            encoding, retval = doc.get_encoded(
+                                     _get_header(request, b'accept-encoding'))
+            _set_response_headers(request, doc.get_headers(encoding))
+
+            return retval
 
         except Exception as e:
             ctx.transport.wsdl_error = e
@@ -710,6 +804,11 @@ def _cb_request_finished(retval, request, p_ctx):
     request.finish()
     p_ctx.close()
 
+    gc_policy = p_ctx.app.gc_policy
+    if gc_policy.wants_idle:
+        # let the reactor finish what it's doing first
+        reactor.callLater(0, gc_policy.idle)
+
 
 def _eb_request_finished(retval, request, p_ctx):
     err(request)
@@ -772,44 +871,83 @@ def _cb_deferred(ret, request, p_ctx, others, resource, cb=True):
                 .addErrback(log_and_let_go, logger)
 
     else:
-        ret = resource.http_transport.get_out_string(p_ctx)
+        transport = resource.http_transport
+        executor = transport.get_executor(p_ctx)
 
-        if not isinstance(ret, Deferred):
-            producer = Producer(p_ctx.out_string, request)
-            producer.deferred \
-                .addCallback(_cb_request_finished, request, p_ctx) \
-                .addErrback(_eb_request_finished, request, p_ctx) \
+        if executor.in_reactor or not executor.offload_serialization:
+            ret = transport.get_out_string(p_ctx)
+            _cb_out_string(ret, request, p_ctx, others, resource)
+
+        else:
+            args = (request, p_ctx, others, resource)
+            executor.submit_followup(_get_out_string, transport, p_ctx) \
+                .addCallbacks(_cb_out_string, _eb_deferred,
+                                         callbackArgs=args, errbackArgs=args) \
                 .addErrback(log_and_let_go, logger)
 
+        # _cb_out_string processes the other contexts once the response is
+        # serialized.
+        return retval
+
+    process_contexts(resource.http_transport, others, p_ctx)
+
+    return retval
+
+
+def _get_out_object(transport, p_ctx, deserialize):
+    # runs in a thread pool
+    if deserialize:
+        transport.get_in_object(p_ctx)
+        if p_ctx.in_error:
+            return
+
+    transport.get_out_object(p_ctx)
+
+
+def _get_out_string(transport, p_ctx):
+    # runs in a thread pool, so the lazily serialized chunks are consumed here
+    retval = transport.get_out_string(p_ctx)
+    if not isinstance(retval, Deferred) and p_ctx.out_string is not None:
+        p_ctx.out_string = list(p_ctx.out_string)
+
+    return retval
+
+
+def _cb_out_string(ret, request, p_ctx, others, resource):
+    if not isinstance(ret, Deferred):
+        producer = Producer(p_ctx.out_string, request)
+        producer.deferred \
+            .addCallback(_cb_request_finished, request, p_ctx) \
+            .addErrback(_eb_request_finished, request, p_ctx) \
+            .addErrback(log_and_let_go, logger)
+
+        try:
+            request.registerProducer(producer, False)
+        except Exception as e:
+            logger_server.exception(e)
             try:
-                request.registerProducer(producer, False)
+                _eb_deferred(Failure(), request, p_ctx, others, resource)
             except Exception as e:
                 logger_server.exception(e)
-                try:
-                    _eb_deferred(Failure(), request, p_ctx, others, resource)
-                except Exception as e:
-                    logger_server.exception(e)
-                    raise
+                raise
 
-        else:
-            def _cb(ret):
-                if isinstance(ret, Deferred):
-                    return ret \
-                        .addCallback(_cb) \
-                        .addErrback(_eb_request_finished, request, p_ctx) \
-                        .addErrback(log_and_let_go, logger)
-                else:
-                    return _cb_request_finished(ret, request, p_ctx)
+    else:
+        def _cb(ret):
+            if isinstance(ret, Deferred):
+                return ret \
+                    .addCallback(_cb) \
+                    .addErrback(_eb_request_finished, request, p_ctx) \
+                    .addErrback(log_and_let_go, logger)
+            else:
+                return _cb_request_finished(ret, request, p_ctx)
 
-            ret \
-                .addCallback(_cb) \
-                .addErrback(_eb_request_finished, request, p_ctx) \
-                .addErrback(log_and_let_go, logger)
+        ret \
+            .addCallback(_cb) \
+            .addErrback(_eb_request_finished, request, p_ctx) \
+            .addErrback(log_and_let_go, logger)
 
     process_contexts(resource.http_transport, others, p_ctx)
 
-    return retval
-
 
 def _eb_deferred(ret, request, p_ctx, others, resource):
     # DRY this with what's in Application.process_request
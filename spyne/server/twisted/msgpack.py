@@ -197,14 +197,20 @@ class TwistedMessagePackProtocol(Protocol):
             self.idle_timer = None
 
     def dataReceived(self, data):
-        self._buffer.feed(data)
+        buf = self._buffer
+        buf.feed(data)
         self.recv_bytes += len(data)
 
         self._reset_idle_timer()
 
-        for msg in self._buffer:
+        pos = buf.tell()
+        for msg in buf:
+            # exact length of the encoded message, shell included.
+            newpos = buf.tell()
+            msglen, pos = newpos - pos, newpos
+
             try:
-                self.process_incoming_message(msg)
+                self.process_incoming_message(msg, msglen=msglen)
             except Exception as e:
                 # If you get this error, you are in serious trouble
                 # This needs to be fixed ASAP
@@ -244,8 +250,8 @@ class TwistedMessagePackProtocol(Protocol):
         logger.debug("Aborting connection because %s", reason)
         self.transport.abortConnection()
 
-    def process_incoming_message(self, msg, oob=None):
-        p_ctx, others = self.spyne_tpt.produce_contexts(msg)
+    def process_incoming_message(self, msg, oob=None, msglen=None):
+        p_ctx, others = self.spyne_tpt.produce_contexts(msg, msglen=msglen)
         p_ctx.oob_ctx = oob
         p_ctx.transport.remote_addr = Address.from_twisted_address(
                                                        self.transport.getPeer())
@@ -374,17 +380,24 @@ class TwistedMessagePackProtocol(Protocol):
 
         # tag debug responses with the one from the relevant request
         tag = getattr(p_ctx.transport, 'tag', None)
+        inline = getattr(p_ctx.transport, 'inline', False)
+        if not inline:
+            data = msgpack.packb(data)
+
         if tag is None:
-            out_object = (error, msgpack.packb(data))
+            out_object = (error, data)
         else:
-            out_object = (error, msgpack.packb(data), tag)
+            out_object = (error, data, tag)
 
         if p_ctx.oob_ctx is not None:
             p_ctx.oob_ctx.d.callback(out_object)
             return
 
         if p_ctx.transport is not None:
-            out_string = msgpack.packb(out_object)
+            if inline:
+                out_string = self.spyne_tpt.get_packer().pack(out_object)
+            else:
+                out_string = msgpack.packb(out_object)
             p_ctx.transport.resp_length = len(out_string)
             self.enqueue_outresp_data(id(p_ctx), out_string)
 
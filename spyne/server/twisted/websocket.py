@@ -84,6 +84,8 @@ class WebSocketTransportContext(TransportContext):
 
 
 class WebSocketMethodContext(MethodContext):
+    __slots__ = ()
+
     def __init__(self, transport, client_handle):
         MethodContext.__init__(self, transport, MethodContext.SERVER)
 
@@ -27,7 +27,6 @@ logic.
 import logging
 logger = logging.getLogger(__name__)
 
-import cgi
 import threading
 
 from inspect import isgenerator
@@ -41,13 +40,15 @@ from spyne.application import get_fault_string_from_exception
 from spyne.auxproc import process_contexts
 from spyne.error import RequestTooLongError
 from spyne.protocol.http import HttpRpc
-from spyne.server.http import HttpBase, HttpMethodContext, HttpTransportContext
+from spyne.server.http import HttpBase, HttpMethodContext, \
+    HttpTransportContext, CachedDocument, parse_header
 from spyne.util.odict import odict
 from spyne.util.address import address_parser
 
 from spyne.const.ansi_color import LIGHT_GREEN
 from spyne.const.ansi_color import END_COLOR
 from spyne.const.http import HTTP_200
+from spyne.const.http import HTTP_304
 from spyne.const.http import HTTP_404
 from spyne.const.http import HTTP_500
 
@@ -68,6 +69,38 @@ except ImportError as _import_error_2:
         raise _local_import_error_2
 
 
+class _ResponseIterable(object):
+    """Wraps a WSGI response iterable to call the given callback exactly once,
+    either when the response is fully sent or when the server closes it, e.g.
+    because the client went away."""
+
+    __slots__ = ('_iterable', '_callback')
+
+    def __init__(self, iterable, callback):
+        self._iterable = iterable
+        self._callback = callback
+
+    def __iter__(self):
+        for chunk in self._iterable:
+            yield chunk
+
+        self._done()
+
+    def close(self):
+        try:
+            close = getattr(self._iterable, 'close', None)
+            if close is not None:
+                close()
+
+        finally:
+            self._done()
+
+    def _done(self):
+        callback, self._callback = self._callback, None
+        if callback is not None:
+            callback()
+
+
 def _reconstruct_url(environ, protocol=True, server_name=True, path=True,
                                                              query_string=True):
     """Rebuilds the calling url from values found in the
@@ -231,6 +264,8 @@ class WsgiMethodContext(HttpMethodContext):
     the transport attribute using the :class:`WsgiTransportContext` class.
     """
 
+    __slots__ = ()
+
     TransportContext = None
     HttpTransportContext = WsgiTransportContext
 
@@ -254,6 +289,10 @@ class WsgiApplication(HttpBase):
     Wsdl from another location, which can make testing a bit difficult. Use in
     moderation.
 
+    The wsdl is compressed only once and served with ETag and Last-Modified
+    headers, so clients that send Accept-Encoding or conditional GET headers
+    get gzipped documents or a '304 Not Modified' response.
+
     Supported events:
         * ``wsdl``
             Called right before the wsdl data is returned to the client.
@@ -286,7 +325,11 @@ class WsgiApplication(HttpBase):
 
         self._mtx_build_interface_document = threading.Lock()
 
+        self._in_flight = 0
+        self._mtx_in_flight = threading.Lock()
+
         self._wsdl = None
+        self._wsdl_doc = None
         if self.doc.wsdl11 is not None:
             self._wsdl = self.doc.wsdl11.get_interface_document()
 
@@ -306,9 +349,28 @@ class WsgiApplication(HttpBase):
             url = url.split('?')[0].split('.wsdl')[0]
             return self.handle_wsdl_request(req_env, start_response, url)
 
-        else:
+        if not self.app.gc_policy.wants_idle:
             return self.handle_rpc(req_env, start_response)
 
+        with self._mtx_in_flight:
+            self._in_flight += 1
+
+        try:
+            retval = self.handle_rpc(req_env, start_response)
+        except:
+            self.__request_done()
+            raise
+
+        return _ResponseIterable(retval, self.__request_done)
+
+    def __request_done(self):
+        with self._mtx_in_flight:
+            self._in_flight -= 1
+            idle = self._in_flight == 0
+
+        if idle:
+            self.app.gc_policy.idle()
+
     def is_wsdl_request(self, req_env):
         # Get the wsdl for the service. Assume path_info matches pattern:
         # /stuff/stuff/stuff/serviceName.wsdl or
@@ -365,11 +427,29 @@ class WsgiApplication(HttpBase):
 
         self.event_manager.fire_event('wsdl', ctx)
 
-        ctx.transport.resp_headers['Content-Length'] = \
-                                                    str(len(ctx.transport.wsdl))
-        start_response(HTTP_200, _gen_http_headers(ctx.transport.resp_headers))
+        # the compressed variants and the validators are computed only once,
+        # unless a 'wsdl' event handler changes the document.
+        doc = self._wsdl_doc
+        if doc is None or not doc.has_data(ctx.transport.wsdl):
+            doc = self._wsdl_doc = CachedDocument(ctx.transport.wsdl)
+
+        resp_headers = ctx.transport.resp_headers
 
-        retval = ctx.transport.wsdl
+        if doc.is_not_modified(req_env.get('HTTP_IF_NONE_MATCH', None),
+                                  req_env.get('HTTP_IF_MODIFIED_SINCE', None)):
+            resp_headers.update(doc.get_headers())
+            start_response(HTTP_304, _gen_http_headers(resp_headers))
+
+            ctx.close()
+
+            return []
+
+        encoding, retval = doc.get_encoded(
+                                      req_env.get('HTTP_ACCEPT_ENCODING', None))
+
+        resp_headers.update(doc.get_headers(encoding))
+        resp_headers['Content-Length'] = str(len(retval))
+        start_response(HTTP_200, _gen_http_headers(resp_headers))
 
         ctx.close()
 
@@ -453,6 +533,12 @@ class WsgiApplication(HttpBase):
         if p_ctx.transport.resp_code is None:
             p_ctx.transport.resp_code = HTTP_200
 
+        # binary values are collected as attachments during serialization
+        mtom = p_ctx.descriptor is not None and p_ctx.descriptor.mtom and \
+                             hasattr(p_ctx.outprot_ctx, 'out_attachments')
+        if mtom:
+            p_ctx.outprot_ctx.out_attachments = []
+
         try:
             self.get_out_string(p_ctx)
 
@@ -467,21 +553,10 @@ class WsgiApplication(HttpBase):
                                                p_ctx.out_header_doc is not None:
             p_ctx.transport.resp_headers.update(p_ctx.out_header_doc)
 
-        if p_ctx.descriptor and p_ctx.descriptor.mtom:
-            # when there is more than one return type, the result is
-            # encapsulated inside a list. when there's just one, the result
-            # is returned in a non-encapsulated form. the apply_mtom always
-            # expects the objects to be inside an iterable, hence the
-            # following test.
-            out_type_info = p_ctx.descriptor.out_message._type_info
-            if len(out_type_info) == 1:
-                p_ctx.out_object = [p_ctx.out_object]
-
+        if mtom:
             p_ctx.transport.resp_headers, p_ctx.out_string = apply_mtom(
                     p_ctx.transport.resp_headers, p_ctx.out_string,
-                    p_ctx.descriptor.out_message._type_info.values(),
-                    p_ctx.out_object,
-                )
+                    p_ctx.outprot_ctx.out_attachments)
 
         self.event_manager.fire_event('wsgi_return', p_ctx)
 
@@ -527,9 +602,9 @@ class WsgiApplication(HttpBase):
         charset = None
         if content_type is not None:
             # fyi, here's what the parse_header function returns:
-            # >>> import cgi; cgi.parse_header("text/xml; charset=utf-8")
+            # >>> parse_header("text/xml; charset=utf-8")
             # ('text/xml', {'charset': 'utf-8'})
-            content_type = cgi.parse_header(content_type)
+            content_type = parse_header(content_type)
             charset = content_type[1].get('charset', None)
 
         return self.__wsgi_input_to_iterable(http_env), charset
@@ -588,8 +663,8 @@ class WsgiApplication(HttpBase):
                                     prot.app.interface.get_tns(),
                                     wsgi_env['PATH_INFO'].split('/')[-1])
 
-        logger.debug("%sMethod name: %r%s" % (LIGHT_GREEN,
-                                          ctx.method_request_string, END_COLOR))
+        logger.debug("%sMethod name: %r%s", LIGHT_GREEN,
+                                           ctx.method_request_string, END_COLOR)
 
         ctx.in_header_doc = ctx.transport.headers
         ctx.in_body_doc = _parse_qs(wsgi_env['QUERY_STRING'])
@@ -29,6 +29,8 @@ from spyne.server import ServerBase
 
 
 class ZmqMethodContext(MethodContext):
+    __slots__ = ()
+
     def __init__(self, app):
         super(ZmqMethodContext, self).__init__(app, MethodContext.SERVER)
         self.transport.type = 'zmq'
@@ -126,6 +126,11 @@ class ServiceBaseBase(object):
     defined under this service is set to this value. The _aux flag in the @srpc
     decorator overrides this."""
 
+    __executor__ = None
+    """The executor of the methods defined under this service, for transports
+    that support them. The _executor flag in the @rpc decorator overrides
+    this."""
+
     @classmethod
     def get_service_class_name(cls):
         return cls.__name__
@@ -228,9 +228,9 @@ def _get_sqlalchemy_type(cls):
         if sa is None:
             return None
         if isinstance(sa, c_json):
-            return PGJson
+            return PGJson(lazy=sa.lazy)
         if isinstance(sa, c_jsonb):
-            return PGJsonB
+            return PGJsonB(lazy=sa.lazy)
         raise NotImplementedError(dict(cls=cls, store_as=sa))
 
     if issubclass(cls, ByteArray):
@@ -863,7 +863,7 @@ def _add_complex_type_as_xml(cls, props, table, subname, subcls, storage,
         col = table.c[colname]
     else:
         t = PGObjectXml(subcls, storage.root_tag, storage.no_ns,
-                                                           storage.pretty_print)
+                                       storage.pretty_print, lazy=storage.lazy)
         col = Column(colname, t, **col_kwargs)
 
     props[subname] = col
@@ -883,7 +883,8 @@ def _add_complex_type_as_json(cls, props, table, subname, subcls, storage,
 
     else:
         t = PGObjectJson(subcls, ignore_wrappers=storage.ignore_wrappers,
-                                         complex_as=storage.complex_as, dbt=dbt)
+                                         complex_as=storage.complex_as, dbt=dbt,
+                                                              lazy=storage.lazy)
         col = Column(colname, t, **col_kwargs)
 
     props[subname] = col
@@ -54,6 +54,7 @@ from spyne.model.relational import FileData
 from spyne.util import six
 from spyne.util.six import binary_type, text_type, BytesIO, StringIO
 from spyne.util.fileproxy import SeekableFileProxy
+from spyne.util.lazydoc import LazyDocument, get_object, get_raw
 
 
 class PGXml(UserDefinedType):
@@ -122,15 +123,50 @@ class PGHtml(UserDefinedType):
         return process
 
 
-class PGJson(UserDefinedType):
-    def __init__(self, encoding='UTF-8'):
+class _BatchProcessorMixin(object):
+    """Adds methods that convert whole batches of column values, e.g. ones
+    fetched with a plain DB-API cursor, with a single processor instance."""
+
+    def process_bind_values(self, values, dialect=None):
+        """Returns a list with the database representations of the given
+        values."""
+
+        process = self.bind_processor(dialect)
+        return [process(v) for v in values]
+
+    def process_result_values(self, values, dialect=None):
+        """Returns a list with the objects that the given database values
+        represent."""
+
+        process = self.result_processor(dialect, None)
+        return [process(v) for v in values]
+
+
+class PGJson(_BatchProcessorMixin, UserDefinedType):
+    """The json column type.
+
+    :param encoding: The encoding of the json document.
+    :param lazy: When ``True``, json documents are returned as
+        :class:`spyne.util.lazydoc.LazyDocument` proxies that are parsed on
+        first access. Unaccessed values are written back to the database as
+        they were read.
+    """
+
+    def __init__(self, encoding='UTF-8', lazy=False):
         self.encoding = encoding
+        self.lazy = lazy
 
     def get_col_spec(self, **_):
         return "json"
 
     def bind_processor(self, dialect):
         def process(value):
+            raw = get_raw(value)
+            if raw is not None:
+                value = raw
+            else:
+                value = get_object(value)
+
             if isinstance(value, (text_type, binary_type)) or value is None:
                 return value
             else:
@@ -141,6 +177,14 @@ class PGJson(UserDefinedType):
         return process
 
     def result_processor(self, dialect, col_type):
+        if self.lazy:
+            def process(value):
+                if isinstance(value, (text_type, binary_type)):
+                    return LazyDocument(value, json.loads)
+                else:
+                    return value
+            return process
+
         def process(value):
             if isinstance(value, (text_type, binary_type)):
                 return json.loads(value)
@@ -159,40 +203,75 @@ class PGJsonB(PGJson):
 sqlalchemy.dialects.postgresql.base.ischema_names['jsonb'] = PGJsonB
 
 
-class PGObjectXml(UserDefinedType):
+class PGObjectXml(_BatchProcessorMixin, UserDefinedType):
+    """Stores instances of the given class as xml documents.
+
+    :param lazy: When ``True``, the xml documents are returned as
+        :class:`spyne.util.lazydoc.LazyDocument` proxies that are parsed on
+        first access. Unaccessed values are written back to the database as
+        they were read.
+    """
+
     def __init__(self, cls, root_tag_name=None, no_namespace=False,
-                                                            pretty_print=False):
+                                                pretty_print=False, lazy=False):
         self.cls = cls
         self.root_tag_name = root_tag_name
         self.no_namespace = no_namespace
         self.pretty_print = pretty_print
+        self.lazy = lazy
 
     def get_col_spec(self, **_):
         return "xml"
 
     def bind_processor(self, dialect):
         def process(value):
+            raw = get_raw(value)
+            if raw is not None:
+                return raw
+
             if value is not None:
-                return etree.tostring(get_object_as_xml(value, self.cls,
-                    self.root_tag_name, self.no_namespace), encoding='utf8',
+                elt = get_object_as_xml(get_object(value), self.cls,
+                                        self.root_tag_name, self.no_namespace)
+                return etree.tostring(elt, encoding='utf8',
                           pretty_print=self.pretty_print, xml_declaration=False)
         return process
 
     def result_processor(self, dialect, col_type):
+        def load(value):
+            return get_xml_as_object(etree.fromstring(value), self.cls)
+
+        if self.lazy:
+            def process(value):
+                if value is not None:
+                    return LazyDocument(value, load)
+            return process
+
         def process(value):
             if value is not None:
-                return get_xml_as_object(etree.fromstring(value), self.cls)
+                return load(value)
         return process
 
 
-class PGObjectJson(UserDefinedType):
+class PGObjectJson(_BatchProcessorMixin, UserDefinedType):
+    """Stores instances of the given class as json documents.
+
+    :param lazy: When ``True``, the json documents are returned as
+        :class:`spyne.util.lazydoc.LazyDocument` proxies that are parsed on
+        first access. Unaccessed values are written back to the database as
+        they were read. They are also output as they were read by
+        :class:`spyne.protocol.json.JsonDocument` instances with the same
+        ``ignore_wrappers`` and ``complex_as`` arguments, without getting
+        converted to objects and back.
+    """
+
     def __init__(self, cls, ignore_wrappers=True, complex_as=dict, dbt='json',
-                                                               encoding='utf8'):
+                                                   encoding='utf8', lazy=False):
         self.cls = cls
         self.ignore_wrappers = ignore_wrappers
         self.complex_as = complex_as
         self.dbt = dbt
         self.encoding = encoding
+        self.lazy = lazy
 
         from spyne.util.dictdoc import get_dict_as_object
         from spyne.util.dictdoc import get_object_as_json
@@ -204,6 +283,15 @@ class PGObjectJson(UserDefinedType):
 
     def bind_processor(self, dialect):
         def process(value):
+            raw = get_raw(value)
+            if raw is not None:
+                if isinstance(raw, six.binary_type):
+                    return raw.decode(self.encoding)
+                if isinstance(raw, six.text_type):
+                    return raw
+                return json.dumps(raw)
+
+            value = get_object(value)
             if value is not None:
                 try:
                     return self.get_object_as_json(value, self.cls,
@@ -217,29 +305,51 @@ class PGObjectJson(UserDefinedType):
 
         return process
 
+    def get_protocol(self, protocol):
+        from spyne.util.protocol import get_protocol_instance
+
+        return get_protocol_instance(protocol,
+                   ignore_wrappers=self.ignore_wrappers,
+                   complex_as=self.complex_as)
+
     def result_processor(self, dialect, col_type):
         from spyne.util.dictdoc import JsonDocument
 
-        def process(value):
-            if value is None:
-                return None
+        prot = self.get_protocol(JsonDocument)
 
+        def load_doc(value):
             if isinstance(value, six.binary_type):
                 value = value.decode(self.encoding)
 
             if isinstance(value, six.text_type):
-                return self.get_dict_as_object(json.loads(value), self.cls,
-                        ignore_wrappers=self.ignore_wrappers,
-                        complex_as=self.complex_as,
-                        protocol=JsonDocument,
-                    )
+                value = json.loads(value)
+
+            return value
 
-            return self.get_dict_as_object(value, self.cls,
+        def load(value):
+            return self.get_dict_as_object(load_doc(value), self.cls,
                     ignore_wrappers=self.ignore_wrappers,
                     complex_as=self.complex_as,
-                    protocol=JsonDocument,
+                    protocol_inst=prot,
                 )
 
+        if self.lazy:
+            doc_key = prot.get_doc_key(self.cls)
+
+            def process(value):
+                if value is None:
+                    return None
+
+                return LazyDocument(value, load, doc_key, load_doc)
+
+            return process
+
+        def process(value):
+            if value is None:
+                return None
+
+            return load(value)
+
         return process
 
 
@@ -319,6 +429,10 @@ class PGFileJson(PGObjectJson):
         return process
 
     def result_processor(self, dialect, col_type):
+        from spyne.util.dictdoc import _UtilProtocol
+
+        prot = self.get_protocol(_UtilProtocol)
+
         def process(value):
             if value is None:
                 return None
@@ -331,7 +445,8 @@ class PGFileJson(PGObjectJson):
 
             retval = self.get_dict_as_object(value, self.cls,
                     ignore_wrappers=self.ignore_wrappers,
-                    complex_as=self.complex_as)
+                    complex_as=self.complex_as,
+                    protocol_inst=prot)
 
             retval.store = self.store
             retval.abspath = path = join(self.store, retval.path)
@@ -17,6 +17,7 @@
 # Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
 #
 
+import gzip
 import unittest
 
 from spyne.util import six
@@ -24,6 +25,7 @@ from spyne.util.six import StringIO
 
 from spyne.protocol.soap.soap11 import Soap11
 from spyne.server.wsgi import WsgiApplication
+from spyne.server.http import CachedDocument
 from spyne.application import Application
 from spyne.model.primitive import Unicode
 from spyne.decorator import rpc
@@ -87,5 +89,104 @@ class Test(unittest.TestCase):
 
         assert etree.fromstring(retval).tag == WSDL11('definitions')
 
+    def _get_wsdl(self, **kwargs):
+        req_env = {
+            'PATH_INFO': '/',
+            'QUERY_STRING': 'wsdl',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '7000',
+            'REQUEST_METHOD': 'GET',
+            'wsgi.url_scheme': 'http',
+            'wsgi.input': StringIO(),
+        }
+        req_env.update(kwargs)
+
+        status = []
+        def _start_response(code, headers):
+            status.append(code)
+            status.append(dict(headers))
+
+        retval = b''.join(self.wsgi_app(req_env, _start_response))
+        return status[0], status[1], retval
+
+    def test_wsdl_gzip(self):
+        _, headers, plain = self._get_wsdl()
+        assert 'Content-Encoding' not in headers
+        assert headers['Vary'] == 'Accept-Encoding'
+
+        code, headers, data = self._get_wsdl(
+                                        HTTP_ACCEPT_ENCODING='deflate, gzip')
+        assert code.startswith('200')
+        assert headers['Content-Encoding'] == 'gzip'
+        assert headers['Content-Length'] == str(len(data))
+        assert gzip.GzipFile(fileobj=six.BytesIO(data)).read() == plain
+
+        _, headers, data = self._get_wsdl(HTTP_ACCEPT_ENCODING='gzip;q=0')
+        assert 'Content-Encoding' not in headers
+        assert data == plain
+
+    def test_wsdl_conditional_get(self):
+        _, headers, _ = self._get_wsdl()
+        etag = headers['ETag']
+        last_modified = headers['Last-Modified']
+
+        code, headers, data = self._get_wsdl(HTTP_IF_NONE_MATCH=etag)
+        assert code.startswith('304')
+        assert headers['ETag'] == etag
+        assert data == b''
+
+        code, _, data = self._get_wsdl(HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert code.startswith('304')
+        assert data == b''
+
+        code, _, data = self._get_wsdl(HTTP_IF_NONE_MATCH='"stale"',
+                                         HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert code.startswith('200')
+        assert len(data) > 0
+
+    def test_wsdl_rendered_once(self):
+        self._get_wsdl()
+        doc = self.wsgi_app._wsdl_doc
+        self._get_wsdl(HTTP_ACCEPT_ENCODING='gzip')
+        assert self.wsgi_app._wsdl_doc is doc
+
+    def test_wsdl_copied_by_handler(self):
+        def on_wsdl(ctx):
+            ctx.transport.wsdl = bytes(bytearray(ctx.transport.wsdl))
+
+        self.wsgi_app.event_manager.add_listener('wsdl', on_wsdl)
+
+        _, headers, _ = self._get_wsdl()
+        doc = self.wsgi_app._wsdl_doc
+
+        code, _, _ = self._get_wsdl(HTTP_IF_NONE_MATCH=headers['ETag'])
+        assert code.startswith('304')
+        assert self.wsgi_app._wsdl_doc is doc
+
+
+class TestCachedDocument(unittest.TestCase):
+    def test_small(self):
+        doc = CachedDocument(b'<a/>')
+        assert doc.get_encoded('gzip') == (None, b'<a/>')
+        assert 'Vary' not in doc.get_headers()
+
+    def test_encoding_preference(self):
+        doc = CachedDocument(b'x' * 2048)
+        assert doc.get_encoded(None) == (None, doc.data)
+        assert doc.get_encoded('*')[0] in CachedDocument.ENCODINGS
+        assert doc.get_encoded('identity') == (None, doc.data)
+        assert doc.get_encoded('gzip;q=0.5, br;q=0')[0] == 'gzip'
+
+    def test_validators(self):
+        doc = CachedDocument(b'<a/>', mtime=1000000000)
+        assert doc.last_modified == 'Sun, 09 Sep 2001 01:46:40 GMT'
+        assert doc.is_not_modified(if_none_match='W/' + doc.etag)
+        assert doc.is_not_modified(if_none_match='"x", ' + doc.etag)
+        assert doc.is_not_modified(if_none_match='*')
+        assert not doc.is_not_modified()
+        assert not doc.is_not_modified(
+                         if_modified_since='Sun, 09 Sep 2001 01:46:39 GMT')
+        assert not doc.is_not_modified(if_modified_since='garbage')
+
 if __name__ == '__main__':
     unittest.main()
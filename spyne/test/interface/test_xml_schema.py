@@ -38,6 +38,7 @@ from spyne.model import Unicode
 from spyne.model import Uuid
 from spyne.model import Boolean
 from spyne.protocol.soap import Soap11, Soap12
+from spyne.protocol.xml import XmlDocument
 from spyne.service import Service
 from spyne.util.xml import get_schema_documents
 from spyne.util.xml import parse_schema_element
@@ -351,6 +352,72 @@ class TestXmlSchema(unittest.TestCase):
                                              namespaces={'xs': NS_XSD}) == [doc]
 
 
+class TestValidationSchema(unittest.TestCase):
+    def _get_app(self, prot_cls, **kwargs):
+        class SomeOtherClass(ComplexModel):
+            __namespace__ = 'other.ns'
+            i = Integer
+
+        class SomeClass(ComplexModel):
+            __namespace__ = 'some.ns'
+            o = SomeOtherClass
+
+        class SomeService(Service):
+            @rpc(SomeClass, _returns=SomeClass)
+            def some_call(ctx, c):
+                return c
+
+        return Application([SomeService], 'tns',
+                                           in_protocol=prot_cls(**kwargs),
+                                           out_protocol=prot_cls(**kwargs))
+
+    def test_shared(self):
+        app1 = self._get_app(Soap11, validator='lxml')
+        app2 = self._get_app(Soap11, validator='lxml')
+
+        schema = app1.in_protocol.validation_schema
+        assert schema is not None
+        assert schema is app2.in_protocol.validation_schema
+        assert schema is app1.out_protocol.validation_schema
+        assert schema is app2.interface.docs.xml_schema.validation_schema
+
+    def test_imports(self):
+        app = self._get_app(XmlDocument, validator='lxml')
+        schema = app.in_protocol.validation_schema
+
+        doc = """
+            <some_call xmlns="tns"><c><o xmlns="some.ns">
+                <i xmlns="other.ns">%s</i>
+            </o></c></some_call>"""
+
+        assert schema.validate(etree.fromstring(doc % '42')), \
+                                                 schema.error_log.last_error
+        assert not schema.validate(etree.fromstring(doc % 'x'))
+
+    def _call(self, **kwargs):
+        from spyne import MethodContext
+        from spyne.server import ServerBase
+
+        server = ServerBase(self._get_app(XmlDocument, **kwargs))
+        ctx = MethodContext(server, MethodContext.SERVER)
+        ctx.in_string = [b"""<some_call xmlns="tns"><c><o xmlns="some.ns">
+                <i xmlns="other.ns">x</i></o></c></some_call>"""]
+
+        ctx, = server.generate_contexts(ctx)
+        return ctx
+
+    def test_sample_rate(self):
+        from spyne.protocol.xml import SchemaValidationError
+
+        ctx = self._call(validator='lxml')
+        assert isinstance(ctx.in_error, SchemaValidationError)
+
+        ctx = self._call(validator='lxml', validation_sample_rate=0.)
+        assert ctx.in_error is None
+
+        self.assertRaises(ValueError, XmlDocument, validation_sample_rate=2)
+
+
 class TestParseOwnXmlSchema(unittest.TestCase):
     def test_simple(self):
         tns = 'some_ns'
@@ -34,6 +34,7 @@ from spyne import Application, rpc, mrpc, Service, ByteArray, Array, \
     ComplexModel, SelfReference, XmlData, XmlAttribute, Unicode, DateTime, \
     Float, Integer, String
 from spyne.const import xml
+from spyne.model.complex import ComplexModelBase
 from spyne.error import ResourceNotFoundError
 from spyne.interface import Interface
 from spyne.interface.wsdl import Wsdl11
@@ -254,6 +255,93 @@ class TestComplexModel(unittest.TestCase):
         self.assertEqual(100, len(l.level3))
 
 
+    def test_customize_interned(self):
+        assert Integer(min_occurs=1) is Integer(min_occurs=1)
+        assert Unicode(min_occurs=1, nillable=False) is \
+                                           Unicode(nillable=False, min_occurs=1)
+        assert Integer(min_occurs=1) is not Integer(min_occurs=2)
+        assert Integer(default=1) is not Integer(default=True)
+
+        # private copies
+        assert Integer.customize() is not Integer.customize()
+
+        # anonymous types get named after their parent's fields
+        assert Integer(ge=0) is not Integer(ge=0)
+        assert Unicode(64) is not Unicode(64)
+
+    def test_append_field_invalidates_dependents(self):
+        class Inner(ComplexModel):
+            a = Integer
+
+        class Outer(ComplexModel):
+            inner = Inner
+            b = Unicode
+
+        class Unrelated(ComplexModel):
+            c = Integer
+
+        sti = Outer.get_simple_type_info(Outer)
+        Unrelated.get_flat_type_info(Unrelated)
+        assert 'inner.a' in sti
+        assert 'inner.d' not in sti
+
+        Inner._append_field_impl('d', Unicode)
+
+        memo = ComplexModelBase.get_flat_type_info
+        assert Unrelated in memo.get_arguments()
+        assert Outer not in memo.get_arguments()
+
+        sti = Outer.get_simple_type_info(Outer)
+        assert 'inner.d' in sti
+
+    def test_append_field_concurrent(self):
+        import threading
+
+        classes = [ComplexModel.produce('tns', 'C%d' % i, {'a': Integer})
+                                                            for i in range(256)]
+
+        class Changed(ComplexModel):
+            a = Integer
+
+        errors = []
+        done = threading.Event()
+
+        def serve():
+            try:
+                while not done.is_set():
+                    for cls in classes:
+                        cls.get_flat_type_info(cls)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=serve) for _ in range(2)]
+        for t in threads:
+            t.start()
+
+        try:
+            for i in range(100):
+                Changed._append_field_impl('f%d' % i, Unicode)
+
+        finally:
+            done.set()
+            for t in threads:
+                t.join()
+
+        assert errors == []
+        assert 'f99' in Changed.get_flat_type_info(Changed)
+
+    def test_subclasses_refreshed(self):
+        class Base(ComplexModel):
+            a = Integer
+
+        assert list(Base.get_subclasses()) == []
+
+        class Sub(Base):
+            b = Integer
+
+        assert list(Base.get_subclasses()) == [Sub]
+
+
 class X(ComplexModel):
     __namespace__ = 'tns'
     x = Integer(nillable=True, max_occurs='unbounded')
@@ -830,6 +830,104 @@ class TestPrimitive(unittest.TestCase):
 # nM indicates the number of minutes
 # nS indicates the number of seconds
 
+class TestTemporalCodecs(unittest.TestCase):
+    def test_datetime_fast_path_matches_regex(self):
+        from spyne.protocol._inbase import _parse_datetime_iso, \
+            _parse_datetime_iso_fast
+
+        for s in (
+                    '2013-04-05T06:07:08',
+                    '2013-04-05 06:07:08',
+                    '2013-04-05T06:07:08.1',
+                    '2013-04-05T06:07:08.123',
+                    '2013-04-05T06:07:08.123456',
+                    '2013-04-05T06:07:08.999999Z',
+                    '2013-04-05T06:07:08Z',
+                    '2013-04-05T06:07:08+00:00',
+                    '2013-04-05T06:07:08+05:30',
+                    '2013-04-05T06:07:08.5-03:30',
+                ):
+            fast = _parse_datetime_iso_fast(s)
+            slow = _parse_datetime_iso(DateTime, s)
+
+            assert fast is not None, s
+            self.assertEqual(fast, slow)
+            self.assertEqual(fast.utcoffset(), slow.utcoffset())
+            assert fast.tzinfo is slow.tzinfo, s
+
+    def test_datetime_fast_path_fallback(self):
+        from spyne.protocol._inbase import _parse_datetime_iso_fast
+
+        for s in (
+                    '2013-04-05T06:07:08.1234567',  # needs rounding
+                    '2013-04-05T06:07:08+0530',
+                    '2013-04-05T06:07:08 junk',
+                    '2013-04-05',
+                    '20130405T060708',
+                ):
+            assert _parse_datetime_iso_fast(s) is None, s
+
+        # the regex parser ignores trailing garbage, as it always did
+        self.assertEqual(
+            ProtocolBase().from_unicode(DateTime, '2013-04-05T06:07:08 junk'),
+            datetime.datetime(2013, 4, 5, 6, 7, 8))
+
+        # and rounds excess fractional digits
+        self.assertEqual(
+            ProtocolBase().from_unicode(DateTime,
+                                              '2013-04-05T06:07:08.1234567Z'),
+            datetime.datetime(2013, 4, 5, 6, 7, 8, 123457, pytz.utc))
+
+    def test_datetime_negative_offset(self):
+        for s in ('2013-04-05T06:07:08-03:30', '2013-04-05T06:07:08-03:30 x'):
+            dt = ProtocolBase().from_unicode(DateTime, s)
+            self.assertEqual(dt.utcoffset(), -timedelta(hours=3, minutes=30))
+
+    def test_offset_tzinfo_cached(self):
+        dt1 = ProtocolBase().from_unicode(DateTime, '2013-04-05T06:07:08+02:00')
+        dt2 = ProtocolBase().from_unicode(DateTime, '2014-04-05T06:07:08+02:00')
+        assert dt1.tzinfo is dt2.tzinfo
+
+    def test_time_fast_path(self):
+        from spyne.protocol._inbase import _parse_time_iso_fast
+
+        for s, t in (
+                    ('06:07:08', datetime.time(6, 7, 8)),
+                    ('06:07:08.5', datetime.time(6, 7, 8, 500000)),
+                    ('06:07:08.123456', datetime.time(6, 7, 8, 123456)),
+                ):
+            self.assertEqual(ProtocolBase().from_unicode(Time, s), t)
+
+        assert _parse_time_iso_fast('06:07:08Z') is None
+        self.assertEqual(ProtocolBase().from_unicode(Time, '06:07:08Z'),
+                                                     datetime.time(6, 7, 8))
+
+    def test_date_fast_path(self):
+        from spyne.protocol._inbase import _parse_date_iso_fast
+
+        assert _parse_date_iso_fast('2013-W01-1') is None
+        self.assertEqual(XmlDocument().date_from_unicode_iso(Date,
+                                   '2013-04-05'), datetime.date(2013, 4, 5))
+
+    def test_datetime_out_plan(self):
+        t = DateTime(str_format="{0.year}")
+        prot = ProtocolBase()
+        v = datetime.datetime(2013, 4, 5, 6, 7, 8, tzinfo=pytz.utc)
+
+        self.assertEqual(prot.to_unicode(t, v), "2013")
+        assert prot._get_datetime_out_plan(t) is \
+                                                prot._get_datetime_out_plan(t)
+
+        t = DateTime(timezone=False)
+        self.assertEqual(prot.to_unicode(t, v), "2013-04-05T06:07:08")
+
+    def test_duration_fraction(self):
+        self.assertEqual(ProtocolBase().from_unicode(Duration, 'PT1.5S'),
+                                         timedelta(seconds=1, microseconds=5e5))
+        self.assertEqual(ProtocolBase().from_unicode(Duration, '-P1DT2S'),
+                                                 -timedelta(days=1, seconds=2))
+
+
 class SomeBlob(ComplexModel):
     __namespace__ = 'myns'
     howlong = Duration()
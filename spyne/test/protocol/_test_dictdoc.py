@@ -1312,6 +1312,21 @@ def TDictDocumentTest(serializer, _DictDocumentChild, dumps_kwargs=None,
                 {'some_callResponse': {'some_callResult': {'C': {'s2': 's2'}}}})
             )
 
+        def test_deserialization_table(self):
+            class C(ComplexModel):
+                s1 = Unicode(exc=True)
+                s2 = Unicode(sub_name='ss')
+                i = Integer(max_occurs='unbounded')
+
+            prot = _DictDocumentChild()
+            table = prot.get_deserialization_table(C)
+
+            assert prot.get_deserialization_table(C) is table
+            assert table.keys == ('s2', 'i')
+            assert not ('s1' in table.members)
+            assert table.members['ss'][:2] == (C._type_info['s2'], 's2')
+            assert table.members['i'][3]
+
         def test_polymorphic_deserialization(self):
             class P(ComplexModel):
                 sig = Unicode
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import unittest
+
+from spyne import Application, Service, srpc
+from spyne.error import ValidationError
+from spyne.model import ComplexModel, Unicode, Integer, Array, XmlAttribute
+from spyne.protocol import ProtocolBase
+from spyne.protocol.xml import XmlDocument
+from spyne.protocol._attrs import get_reachable_classes
+
+
+class TestClassAttrs(unittest.TestCase):
+    def test_missing_is_none(self):
+        attrs = ProtocolBase().get_cls_attrs(Unicode(max_len=5))
+
+        assert attrs.max_len == 5
+        assert attrs.some_attribute_that_does_not_exist is None
+
+    def test_read_only(self):
+        attrs = ProtocolBase().get_cls_attrs(Unicode)
+
+        with self.assertRaises(AttributeError):
+            attrs.max_len = 5
+
+    def test_prot_attrs(self):
+        prot = XmlDocument()
+        other_prot = XmlDocument()
+        cls = Unicode(prot_attrs={XmlDocument: dict(max_len=4),
+                                                     prot: dict(min_len=2)})
+
+        assert prot.get_cls_attrs(cls).max_len == 4
+        assert prot.get_cls_attrs(cls).min_len == 2
+        assert other_prot.get_cls_attrs(cls).min_len != 2
+        assert ProtocolBase().get_cls_attrs(cls).max_len != 4
+
+    def test_stats(self):
+        prot = ProtocolBase()
+        prot.get_cls_attrs(Unicode)
+        prot.get_cls_attrs(Unicode)
+
+        stats = prot.get_attrcache_stats()
+        assert stats['misses'] == 1
+        assert stats['hits'] == 1
+        assert stats['size'] == 1
+
+
+class TestWarm(unittest.TestCase):
+    def test_reachable(self):
+        class A(ComplexModel):
+            i = Integer
+
+        class B(A):
+            a = Array(A)
+            s = XmlAttribute(Unicode(5))
+
+        classes = set(get_reachable_classes([B]))
+
+        assert A in classes
+        assert A._type_info['i'] in classes
+        assert B._type_info['a'] in classes
+        assert B._type_info['s'].type in classes
+
+    def test_application(self):
+        class C(ComplexModel):
+            s = Unicode(5)
+
+        class SomeService(Service):
+            @srpc(C, _returns=C)
+            def some_call(c):
+                return c
+
+        app = Application([SomeService], 'tns', in_protocol=XmlDocument(),
+                                                     out_protocol=XmlDocument())
+
+        for prot in (app.in_protocol, app.out_protocol):
+            misses = prot.get_attrcache_stats()['misses']
+            prot.get_cls_attrs(C)
+            prot.get_cls_attrs(C._type_info['s'])
+            assert prot.get_attrcache_stats()['misses'] == misses
+
+            assert prot.warm_attrcache(app.interface.classes.values()) == 0
+            assert prot.warm_codeccache(app.interface.classes.values()) == 0
+
+
+class TestCodec(unittest.TestCase):
+    def test_resolution(self):
+        class SomeInteger(Integer):
+            pass
+
+        prot = ProtocolBase()
+        codec = prot.get_codec(SomeInteger)
+
+        assert codec is prot.get_codec(SomeInteger)
+        assert codec.ref() is SomeInteger
+        assert codec.attrs is prot.get_cls_attrs(SomeInteger)
+        assert codec.to_unicode == prot.integer_to_unicode
+        assert codec.from_unicode == prot.integer_from_bytes
+        assert prot.to_unicode(SomeInteger, 5) == '5'
+        assert prot.from_unicode(SomeInteger, '5') == 5
+
+    def test_handler_table_change(self):
+        class SomeInteger(Integer):
+            pass
+
+        prot = ProtocolBase()
+        assert prot.warm_codeccache([SomeInteger]) == 1
+        assert prot.to_unicode(SomeInteger, 5) == '5'
+
+        prot._to_unicode_handlers[SomeInteger] = \
+                                           lambda cls, value, *args: 'five'
+        assert prot.to_unicode(SomeInteger, 5) == 'five'
+
+        del prot._to_unicode_handlers[SomeInteger]
+        assert prot.to_unicode(SomeInteger, 5) == '5'
+
+    def test_missing_handler(self):
+        class NotAModel(object):
+            pass
+
+        with self.assertRaises(KeyError):
+            ProtocolBase().to_unicode(NotAModel, 5)
+
+    def test_empty_is_none(self):
+        prot = ProtocolBase()
+        cls = Integer(prot_attrs={ProtocolBase: dict(empty_is_none=True)})
+
+        assert prot.from_unicode(cls, u'') is None
+        with self.assertRaises(ValidationError):
+            ProtocolBase().from_unicode(Integer, u'')
+
+    def test_weak(self):
+        import gc
+
+        prot = ProtocolBase()
+        cls = Unicode(5)
+        prot.get_codec(cls)
+        assert len(prot._codeccache) == 1
+
+        del cls
+        gc.collect()
+        assert len(prot._codeccache) == 0
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,7 +41,7 @@ from spyne.model import ByteArray, DateTime, Uuid, String, Integer, Integer8, \
 from spyne.protocol.http import HttpRpc, HttpPattern, _parse_cookie
 from spyne.service import Service
 from spyne.server.wsgi import WsgiApplication, WsgiMethodContext
-from spyne.server.http import HttpTransportContext
+from spyne.server.http import HttpTransportContext, parse_header
 from spyne.util.test import call_wsgi_app_kwargs
 
 
@@ -81,6 +81,16 @@ class TestHttpTransportContext(unittest.TestCase):
         assert val == 'text/plain; charset="utf8"'
 
 
+class TestParseHeader(unittest.TestCase):
+    def test_parse_header(self):
+        assert parse_header('text/xml') == ('text/xml', {})
+        assert parse_header('text/xml; Charset=utf-8') == \
+                                             ('text/xml', {'charset': 'utf-8'})
+        assert parse_header('multipart/related; boundary="a;b"; start="<x>"')\
+                 == ('multipart/related', {'boundary': 'a;b', 'start': '<x>'})
+        assert parse_header('a; b="q\\"x"; c') == ('a', {'b': 'q"x'})
+
+
 class TestSimpleDictDocument(unittest.TestCase):
     def test_own_parse_qs_01(self):
         assert dict(_parse_qs('')) == {}
@@ -105,6 +115,47 @@ class TestSimpleDictDocument(unittest.TestCase):
     def test_own_parse_qs_11(self):
         assert dict(_parse_qs('p=1&q=2&p=3')) == {'p': ['1', '3'], 'q': ['2']}
 
+    def test_flat_binder(self):
+        class C(ComplexModel):
+            i = Integer
+
+        class P(ComplexModel):
+            c = Array(C)
+            s = String
+
+        prot = HttpRpc()
+        sti, _, plans = prot.get_flat_binder(P)
+        assert set(plans) == set(sti) == set(['c', 'c.i', 's'])
+
+        member, steps, _ = plans['c.i']
+        assert member.path == ('c', 'i')
+        (pkey, ncls, _, is_array), = steps
+        assert pkey == 'c' and ncls.get_orig() is C and is_array
+
+        member, steps, _ = plans['s']
+        assert steps == ()
+
+        # cached until the type info changes
+        assert prot.get_flat_binder(P) is prot.get_flat_binder(P)
+        binder = prot.get_flat_binder(P)
+        P.append_field('d', DateTime)
+        assert prot.get_flat_binder(P) is not binder
+        assert 'd' in prot.get_flat_binder(P)[2]
+
+    def test_flat_binder_unordered_keys(self):
+        class C(ComplexModel):
+            i = Integer
+            s = String
+
+        class P(ComplexModel):
+            c = Array(C)
+
+        prot = HttpRpc()
+        doc = {'c[1].s': ['b'], 'c[0].i': ['1'], 'c[1].i': ['2'],
+                                                          'c[0].s': ['a']}
+        ret = prot.simple_dict_to_object(None, doc, P)
+        assert [(c.i, c.s) for c in ret.c] == [(1, 'a'), (2, 'b')]
+
 def _test(services, qs, validator='soft', strict_arrays=False):
     app = Application(services, 'tns',
           in_protocol=HttpRpc(validator=validator, strict_arrays=strict_arrays),
@@ -760,6 +811,85 @@ class TestHttpPatterns(unittest.TestCase):
         server.get_out_object(ctx)
         assert ctx.out_error is None
 
+    def _linear_match(self, server, method, path, host):
+        for patt in server._http_patterns:
+            params = server._match_one_pattern(patt, method, path, host)
+            if params is not None:
+                return patt.endpoint.name, params
+
+        return None, {}
+
+    def test_index(self):
+        class SomeService(Service):
+            @srpc(Integer, _patterns=[HttpPattern('/a/<i>', verb='GET'),
+                                      HttpPattern('/a/<i>/b', verb='GET|PUT')])
+            def f0(i):
+                pass
+
+            @srpc(Integer, _patterns=[HttpPattern('/a/<i>'),
+                                      HttpPattern('/a/b/c', verb='POST')])
+            def f1(i):
+                pass
+
+            @srpc(String, _patterns=[HttpPattern('/a/{s}', verb='GET')])
+            def f2(s):
+                pass
+
+            @srpc(Integer, Integer, _patterns=[HttpPattern('/c/<i>.<j>')])
+            def f3(i, j):
+                pass
+
+            @srpc(_patterns=[HttpPattern('/a/b/c')])
+            def f4():
+                pass
+
+        app = Application([SomeService], 'tns', in_protocol=HttpRpc(),
+                                                        out_protocol=HttpRpc())
+        server = WsgiApplication(app)
+
+        index = server._http_route_index
+        assert len(index.linear) == 1
+
+        for method in ('GET', 'PUT', 'POST'):
+            for path in ('/a/5', '/a/5/b', '/a/b/c', '/a/x/y', '/c/1.2',
+                                                           '/c/1', 'a/b/c'):
+                ctx = WsgiMethodContext(server, {}, 'some-content-type')
+                params = server.match_pattern(ctx, method, path, 'localhost')
+                name, expected = self._linear_match(server, method,
+                                  path if path.startswith('/') else '/' + path,
+                                                                'localhost')
+                if name is None:
+                    assert ctx.method_request_string is None
+                else:
+                    assert ctx.method_request_string == name
+                assert dict(params) == dict(expected)
+
+    def test_index_optional_and_alternation(self):
+        class SomeService(Service):
+            @srpc(_patterns=[HttpPattern('/api/items/?', verb='GET')])
+            def f0():
+                pass
+
+            @srpc(_patterns=[HttpPattern('/x/a|/y/b')])
+            def f1():
+                pass
+
+            @srpc(Integer, _patterns=[HttpPattern('/x/<i>')])
+            def f2(i):
+                pass
+
+        app = Application([SomeService], 'tns', in_protocol=HttpRpc(),
+                                                        out_protocol=HttpRpc())
+        server = WsgiApplication(app)
+
+        for path, name in (('/api/items', 'f0'), ('/api/items/', 'f0'),
+                           ('/x/a', 'f1'), ('/y/b', 'f1'), ('/x/5', 'f2')):
+            ctx = WsgiMethodContext(server, {}, 'some-content-type')
+            server.match_pattern(ctx, 'GET', path, 'localhost')
+            assert ctx.method_request_string == name
+            assert self._linear_match(server, 'GET', path,
+                                                   'localhost')[0] == name
+
 
 class ParseCookieTest(unittest.TestCase):
     def test_cookie_parse(self):
@@ -23,15 +23,20 @@ try:
 except ImportError:
     import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from spyne import MethodContext
 from spyne import Application
 from spyne import rpc,srpc
 from spyne import Service
-from spyne.model import Integer, Unicode, ComplexModel
+from spyne.model import Integer, Unicode, ComplexModel, Iterable
 from spyne.protocol.json import JsonP
 from spyne.protocol.json import JsonDocument
 from spyne.protocol.json import JsonEncoder
+from spyne.protocol.json import StdlibJsonBackend
 from spyne.protocol.json import _SpyneJsonRpc1
 from spyne.server import ServerBase
 from spyne.server.null import NullServer
@@ -48,6 +53,31 @@ class TestDictDocument(TDictDocumentTest(json, JsonDocument,
     def loads(self, o):
         return super(TestDictDocument, self).loads(o.decode('utf8'))
 
+
+class _OrjsonDocument(JsonDocument):
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('backend', 'orjson')
+        super(_OrjsonDocument, self).__init__(*args, **kwargs)
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class TestOrjsonDictDocument(TDictDocumentTest(json, _OrjsonDocument,
+                                           dumps_kwargs=dict(cls=JsonEncoder))):
+    def dumps(self, o):
+        return super(TestOrjsonDictDocument, self).dumps(o).encode('utf8')
+
+    def loads(self, o):
+        return super(TestOrjsonDictDocument, self).loads(o.decode('utf8'))
+
+    @unittest.skip("orjson only supports 64-bit integers")
+    def test_integer_way_small(self):
+        pass
+
+    @unittest.skip("orjson only supports 64-bit integers")
+    def test_integer_way_big(self):
+        pass
+
+
 _dry_sjrpc1 = TDry(json, _SpyneJsonRpc1)
 
 class TestSpyneJsonRpc1(unittest.TestCase):
@@ -138,6 +168,95 @@ class TestJsonDocument(unittest.TestCase):
         ctx, = server.generate_contexts(initial_ctx, in_string_charset='utf8')
         assert ctx.in_error.faultcode == 'Client.JsonDecodeError'
 
+    def _get_out_string(self, out_protocol, gen):
+        class SomeComplexModel(ComplexModel):
+            i = Integer
+            s = Unicode
+
+        class SomeService(Service):
+            @srpc(_returns=Iterable(SomeComplexModel))
+            def yay():
+                return gen(SomeComplexModel)
+
+        app = Application([SomeService], 'tns', in_protocol=JsonDocument(),
+                                                    out_protocol=out_protocol)
+
+        server = ServerBase(app)
+        initial_ctx = MethodContext(server, MethodContext.SERVER)
+        initial_ctx.in_string = [b'{"yay": {}}']
+        ctx, = server.generate_contexts(initial_ctx, in_string_charset='utf8')
+        server.get_in_object(ctx)
+        server.get_out_object(ctx)
+        server.get_out_string(ctx)
+
+        return ctx.out_string
+
+    def test_stream_iterables(self):
+        produced = []
+
+        def gen(cls):
+            for i in range(3):
+                produced.append(i)
+                yield cls(i=i, s=str(i))
+
+        for ignore_wrappers in (True, False):
+            del produced[:]
+            prot = JsonDocument(stream_iterables=True,
+                                                ignore_wrappers=ignore_wrappers)
+            out_string = self._get_out_string(prot, gen)
+            assert produced == []
+
+            streamed = b''.join(out_string)
+            assert produced == [0, 1, 2]
+
+            expected = b''.join(self._get_out_string(
+                            JsonDocument(ignore_wrappers=ignore_wrappers), gen))
+            assert streamed == expected
+
+    def test_stream_iterables_empty(self):
+        def gen(cls):
+            return iter(())
+
+        out_string = self._get_out_string(JsonDocument(stream_iterables=True),
+                                                                            gen)
+        assert json.loads(b''.join(out_string).decode('utf8')) == []
+
+
+    def test_stream_iterables_keys(self):
+        from spyne.protocol.dictdoc.hier import StreamedArray
+
+        prot = JsonDocument(stream_iterables=True)
+        doc = {'a': StreamedArray(iter([1])), 1: 'b', None: 2, False: 3,
+                                                                       1.5: 4}
+        streamed = ''.join(prot._iter_json(doc))
+        assert json.loads(streamed) == {"a": [1], "1": "b", "null": 2,
+                                                       "false": 3, "1.5": 4}
+
+        doc = {(1, 2): StreamedArray(iter([]))}
+        self.assertRaises(TypeError, lambda: list(prot._iter_json(doc)))
+
+    def test_backend(self):
+        prot = JsonDocument(backend='json')
+        assert prot.backend.name == 'json'
+
+        prot = JsonDocument(backend=StdlibJsonBackend('json'))
+        assert prot.backend.name == 'json'
+
+        self.assertRaises(AssertionError, JsonDocument, backend='nope')
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_stream_iterables(self):
+        def gen(cls):
+            for i in range(3):
+                yield cls(i=i, s=str(i))
+
+        prot = JsonDocument(stream_iterables=True, backend='orjson')
+        streamed = b''.join(self._get_out_string(prot, gen))
+        expected = b''.join(self._get_out_string(
+                                        JsonDocument(backend='orjson'), gen))
+
+        assert streamed == expected
+
 
 class TestJsonP(unittest.TestCase):
     def test_callback_name(self):
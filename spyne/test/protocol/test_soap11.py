@@ -244,6 +244,22 @@ b'''<soap:Envelope xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
         # quick and dirty test href reconstruction
         self.assertEqual(len(payload[0]), 2)
 
+    def test_ids_without_href(self):
+        envelope_string = [
+b'''<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/">
+  <soap:Header><h id="h1">x</h></soap:Header>
+  <soap:Body><b id="b1"><c/></b></soap:Body>
+</soap:Envelope>''']
+
+        root, xmlids = _parse_xml_string(envelope_string,
+                                                    etree.XMLParser(), 'utf8')
+        assert set(xmlids) == set(['h1', 'b1'])
+
+        header, payload = _from_soap(root, xmlids)
+        self.assertEqual([h.tag for h in header], ['h'])
+        self.assertEqual(payload.tag, 'b')
+        self.assertEqual(len(payload), 1)
+
     def test_namespaces(self):
         m = ComplexModel.produce(
             namespace="some_namespace",
@@ -2,20 +2,24 @@
 
 from __future__ import unicode_literals
 
+import cgi
 import unittest
 
 from lxml import etree
 from lxml.doctestcompare import LXMLOutputChecker, PARSE_XML
 
-from spyne import Fault, Unicode, ByteArray
+from email import message_from_bytes
+
+from spyne import Fault, Unicode, ByteArray, File, ValidationError
 from spyne.application import Application
 from spyne.const import xml as ns
-from spyne.const.xml import NS_SOAP11_ENV
+from spyne.context import FakeContext
 from spyne.decorator import srpc, rpc
 from spyne.interface import Wsdl11
 from spyne.model.complex import ComplexModel
 from spyne.model.primitive import Integer, String
-from spyne.protocol.soap.mime import _join_attachment
+from spyne.protocol.soap.mime import MimeAttachment, split_multipart, \
+    apply_mtom
 from spyne.protocol.soap.soap12 import Soap12
 from spyne.protocol.xml import XmlDocument
 from spyne.server.wsgi import WsgiApplication
@@ -258,9 +262,9 @@ class TestSoap12(unittest.TestCase):
             .xpath(".//tns:documentRequestResult/text()", namespaces=nsdict) \
                                                                   == [FILE_NAME]
 
-    def test_bytes_join_attachment(self):
+    def test_xop_include(self):
         href_id = "http://tempuri.org/1/634133419330914808"
-        payload = "ANJNSLJNDYBC SFDJNIREMX:CMKSAJN"
+        payload = b"ANJNSLJNDYBC SFDJNIREMX:CMKSAJN"
         envelope = '''
 <s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
   <s:Body>
@@ -280,17 +284,182 @@ class TestSoap12(unittest.TestCase):
 </s:Envelope>
         ''' % href_id
 
-        (joinedmsg, numreplaces) = _join_attachment(NS_SOAP11_ENV,
-                                                     href_id, envelope, payload)
+        class BinaryResult(ComplexModel):
+            ErrorCode = Integer
+            ErrorMessage = String
+            Data = ByteArray
+
+        part = MimeAttachment(message_from_bytes(
+                    ('Content-ID: <%s>\r\n\r\n' % href_id).encode('ascii')))
+        part.write(payload)
+        part.finish()
+
+        prot = XmlDocument()
+        ctx = FakeContext(in_protocol=prot)
+        ctx.inprot_ctx.in_attachments = {'cid:' + href_id: part}
 
-        soaptree = etree.fromstring(joinedmsg)
+        soaptree = etree.fromstring(envelope)
 
         body = soaptree.find(ns.SOAP11_ENV("Body"))
         response = body.getchildren()[0]
         result = response.getchildren()[0]
-        r = XmlDocument().from_element(None, DownloadPartFileResult, result)
+        r = prot.from_element(ctx, BinaryResult, result)
+
+        self.assertEqual((payload,), r.Data)
+
+    def test_split_multipart(self):
+        body = MTOM_REQUEST.replace(b"\n", b"\r\n")
+        boundary = 'uuid:2e53e161-b47f-444a-b594-eb6b72e76997'
+
+        for size in (1, 7, 64, len(body)):
+            chunks = [body[i:i + size] for i in range(0, len(body), size)]
+            parts = split_multipart(chunks, boundary)
+
+            assert len(parts) == 2
+            assert parts[0].content_id == 'root.message@cxf.apache.org'
+            assert parts[0].get_data().startswith(b'<soap:Envelope')
+            assert parts[0].get_data().endswith(b'</soap:Envelope>\r\n')
+            assert parts[1].content_type == 'application/octet-stream'
+            assert parts[1].get_data() == b'sample data'
+
+    def test_split_multipart_truncated(self):
+        body = MTOM_REQUEST.replace(b"\n", b"\r\n")
+        body = body[:body.rindex(b'--uuid')]
+
+        with self.assertRaises(ValidationError):
+            split_multipart([body], 'uuid:2e53e161-b47f-444a-b594-eb6b72e76997')
+
+    def test_attachment_spool(self):
+        part = MimeAttachment(message_from_bytes(b'\r\n\r\n'), spool_size=4)
+        part.write(b'abc')
+        assert not part.spooled
+        part.write(b'def')
+        assert part.spooled
+        part.finish()
+
+        assert part.size == 6
+        assert part.get_data()[:] == b'abcdef'
+        assert part.get_handle().read() == b'abcdef'
+
+    def test_attachment_base64(self):
+        part = MimeAttachment(message_from_bytes(
+                             b'Content-Transfer-Encoding: base64\r\n\r\n'))
+        part.write(b'c2FtcGxl')
+        part.finish()
 
-        self.assertEqual(payload, r.Data)
+        assert part.get_data() == b'sample'
+
+    def test_mtom_file_spooled(self):
+        TNS = 'http://gib.gov.tr/vedop3/eFatura'
+        PAYLOAD = b"sample data " * 1024
+        data = []
+
+        class SomeService(Service):
+            @rpc(Unicode(sub_name="fileName"), File(sub_name='binaryData'),
+                 ByteArray(sub_name="hash"), _returns=Unicode)
+            def documentRequest(ctx, file_name, file_data, data_hash):
+                data.append((file_data.type, file_data.data[0][:],
+                                       file_data.handle.read(), file_data))
+                return file_name
+
+        app = Application([SomeService], tns=TNS,
+             in_protocol=Soap12(mtom_spool_size=1024), out_protocol=Soap12())
+
+        server = WsgiApplication(app, block_length=1000)
+        b''.join(server({
+            'QUERY_STRING': '',
+            'PATH_INFO': '/call',
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_TYPE': 'multipart/related; '
+                            'type="application/xop+xml"; '
+                            'boundary="uuid:2e53e161-b47f-444a-b594-eb6b72e76997"; '
+                            'start="<root.message@cxf.apache.org>"; '
+                            'start-info="application/soap+xml"',
+            'wsgi.input': BytesIO(MTOM_REQUEST
+                                  .replace(b"\n", b"\r\n")
+                                  .replace(b"sample data", PAYLOAD)),
+        }, start_response, "http://null"))
+
+        (file_type, file_bytes, handle_bytes, file_data), = data
+        assert file_type == 'application/octet-stream'
+        assert file_bytes == PAYLOAD
+        assert handle_bytes == PAYLOAD
+
+        # the spooled attachment is released along with the context
+        assert file_data.handle.closed
+        assert file_data.data[0].closed
+
+    def test_mtom_response(self):
+        TNS = 'tns'
+        PAYLOAD = b"\x00\xffsample data\r\n--" * 100
+
+        class SomeService(Service):
+            @srpc(_returns=ByteArray, _mtom=True)
+            def get_data():
+                return [PAYLOAD]
+
+        app = Application([SomeService], tns=TNS,
+                                    in_protocol=Soap12(), out_protocol=Soap12())
+
+        server = WsgiApplication(app)
+        headers = {}
+
+        def _start_response(code, hdrs):
+            headers.update(hdrs)
+
+        response = b''.join(server({
+            'QUERY_STRING': '',
+            'PATH_INFO': '/call',
+            'REQUEST_METHOD': 'POST',
+            'CONTENT_TYPE': 'application/soap+xml; charset=utf-8',
+            'wsgi.input': BytesIO(
+                b'<soap:Envelope '
+                    b'xmlns:soap="http://www.w3.org/2003/05/soap-envelope">'
+                  b'<soap:Body><get_data xmlns="tns"/></soap:Body>'
+                b'</soap:Envelope>'),
+        }, _start_response, "http://null"))
+
+        mime_type, params = cgi.parse_header(headers['Content-Type'])
+        assert mime_type == 'multipart/related'
+        assert params['start-info'] == 'application/soap+xml'
+
+        root, attachment = split_multipart([response], params['boundary'])
+        assert root.content_id == params['start'].strip('<>')
+        assert attachment.get_data() == PAYLOAD
+
+        elt = etree.fromstring(root.get_data())
+        href, = elt.xpath('//xop:Include/@href',
+                                 namespaces={'xop': ns.NS_XOP})
+        assert href == 'cid:' + attachment.content_id
+
+    def test_apply_mtom_lazy_envelope(self):
+        attachments = []
+
+        def gen_envelope():
+            yield b'<a>'
+            # the serializer collects attachments as it goes
+            attachments.append(('1.attachment@spyne', 'text/plain', [b'x']))
+            yield b'</a>'
+
+        headers, body = apply_mtom({'Content-Type': 'text/xml'},
+                                                  gen_envelope(), attachments)
+
+        mime_type, params = cgi.parse_header(headers['Content-Type'])
+        assert mime_type == 'multipart/related'
+
+        root, attachment = split_multipart(body, params['boundary'])
+        assert root.get_data() == b'<a></a>'
+        assert attachment.content_id == '1.attachment@spyne'
+        assert attachment.get_data() == b'x'
+
+    def test_apply_mtom_no_attachments(self):
+        headers = {'Content-Type': 'text/xml'}
+        envelope = [b'<a/>']
+        assert apply_mtom(headers, envelope, None) == (headers, envelope)
+
+        headers, body = apply_mtom(headers, envelope, [])
+        assert headers['Content-Type'].startswith('multipart/related;')
+        assert b'<a/>' in b''.join(body)
 
 
 if __name__ == '__main__':
@@ -43,7 +43,8 @@ from spyne.application import Application
 from spyne.decorator import srpc
 from spyne.util.six import BytesIO
 from spyne.model import Fault, Integer, Decimal, Unicode, Date, DateTime, \
-    XmlData, Array, ComplexModel, XmlAttribute, Mandatory as M
+    XmlData, Array, ComplexModel, XmlAttribute, Mandatory as M, Iterable
+from spyne.error import ValidationError
 from spyne.protocol.xml import XmlDocument, SchemaValidationError
 
 from spyne.util import six
@@ -597,6 +598,94 @@ class TestXml(unittest.TestCase):
         assert new_a._b._c == a._b._c, (a._b._c, new_a._b._c)
 
 
+class TestCompiledPlans(unittest.TestCase):
+    def _get_classes(self):
+        class B(ComplexModel):
+            __namespace__ = 'some_ns'
+            b = Unicode
+            e = Unicode(exc=True)
+
+        class C(B):
+            __namespace__ = 'some_other_ns'
+            a = Array(Integer)
+            c = Integer(max_occurs='unbounded')
+            m = M(Unicode)
+            s = Unicode(sub_name='ss', sub_ns='some_sub_ns')
+
+        return B, C
+
+    def _serialize(self, prot, cls, inst):
+        parent = etree.Element("parent")
+        prot.to_parent(None, cls, inst, parent, cls.get_namespace())
+        return etree.tostring(parent[0])
+
+    def test_same_output(self):
+        B, C = self._get_classes()
+        inst = C(b='b', e='e', a=[4, 5], c=[1, 2, 3], s='s')
+
+        expected = self._serialize(XmlDocument(), C, inst)
+        prot = XmlDocument(compile_plans=True)
+        assert self._serialize(prot, C, inst) == expected
+        # second run uses the cached plan
+        assert self._serialize(prot, C, inst) == expected
+
+    def test_plan(self):
+        B, C = self._get_classes()
+        prot = XmlDocument(compile_plans=True)
+
+        plan = prot.get_serialization_plan(C)
+        assert [p[0] for p in plan] == ['b', 'a', 'c', 'm', 's']
+        assert plan[0][2] == 'some_ns'
+        assert plan[1][2] == 'some_other_ns'
+        assert not plan[1][4]  # Array is a wrapper, not a repeated element
+        assert plan[2][4]  # is_array
+        assert plan[3][5]  # is_mandatory
+        assert plan[4][2:4] == ('some_sub_ns', 'ss')
+
+        assert prot.get_serialization_plan(C) is plan
+
+
+class TestDeserializationTable(unittest.TestCase):
+    def test_table(self):
+        class B(ComplexModel):
+            __namespace__ = 'some_ns'
+            b = Unicode
+
+        class C(B):
+            __namespace__ = 'some_other_ns'
+            c = Integer(max_occurs='unbounded')
+            s = Unicode(sub_name='ss')
+            a = XmlAttribute(Unicode)
+
+        prot = XmlDocument()
+        table = prot.get_deserialization_table(C)
+        assert prot.get_deserialization_table(C) is table
+
+        for tag in ('b', '{some_ns}b', '{some_other_ns}b'):
+            assert table.children[tag][1] == 'b'
+
+        assert table.children['{some_other_ns}c'][4]  # is_array
+        assert table.children['{some_other_ns}ss'][1] == 's'
+        assert table.attributes['a'][3] is not None
+
+    def test_roundtrip(self):
+        class C(ComplexModel):
+            __namespace__ = 'some_ns'
+            c = Integer(max_occurs='unbounded')
+            s = Unicode(sub_name='ss')
+            a = XmlAttribute(Unicode)
+
+        elt = etree.fromstring(
+            '<C xmlns="some_ns" a="x"><c>1</c><c>2</c><ss>s</ss>'
+            '<c xmlns="unknown_ns">3</c><unknown>4</unknown></C>')
+
+        o = get_xml_as_object(elt, C)
+
+        assert o.c == [1, 2, 3]
+        assert o.s == 's'
+        assert o.a == 'x'
+
+
 class TestIncremental(unittest.TestCase):
     def test_one(self):
         class SomeComplexModel(ComplexModel):
@@ -657,5 +746,152 @@ class TestIncremental(unittest.TestCase):
                         namespaces={'x': __name__}) == ['a', 'b', 'c', 'd', 'e']
 
 
+class TestParserReuse(unittest.TestCase):
+    def _get_server(self):
+        class SomeService(Service):
+            @srpc(Unicode, _returns=Unicode)
+            def some_call(s):
+                return s
+
+        app = Application([SomeService], "tns", in_protocol=XmlDocument(),
+                                                     out_protocol=XmlDocument())
+        return ServerBase(app)
+
+    def _parse(self, server, in_string):
+        ctx = MethodContext(server, MethodContext.SERVER)
+        ctx.in_string = in_string
+        server.app.in_protocol.create_in_document(ctx)
+        return ctx.in_document
+
+    def test_parser_per_thread(self):
+        import threading
+
+        prot = XmlDocument()
+        parsers = []
+        t = threading.Thread(target=lambda: parsers.append(prot.get_parser()))
+        t.start()
+        t.join()
+
+        assert prot.get_parser() is prot.get_parser()
+        assert prot.get_parser() is not parsers[0]
+
+    def test_reuse_after_error(self):
+        server = self._get_server()
+
+        self.assertRaises(Fault, self._parse, server,
+                                       [b'<some_call xmlns="tns"><s>', b'</a>'])
+        self.assertRaises(Fault, self._parse, server,
+                                              [b'<some_call xmlns="tns"><s>'])
+
+        doc = self._parse(server, [b'<some_call xmlns="tns"><s>x</s>',
+                                                              b'</some_call>'])
+        assert doc.tag == '{tns}some_call'
+        assert doc[0].text == 'x'
+
+
+class TestIncrementalIn(unittest.TestCase):
+    def _get_ctx(self, service, in_string):
+        app = Application([service], "tns",
+                                in_protocol=XmlDocument(incremental_in=True),
+                                out_protocol=XmlDocument())
+        server = ServerBase(app)
+        initial_ctx = MethodContext(server, MethodContext.SERVER)
+        initial_ctx.in_string = iter(in_string)
+
+        ctx, = server.generate_contexts(initial_ctx)
+        server.get_in_object(ctx)
+        return ctx
+
+    def test_iterable(self):
+        chunks = []
+        consumed = []
+
+        def gen():
+            yield b'<some_call xmlns="tns"><s>x</s><p>'
+            for i in range(5):
+                chunks.append(i)
+                yield ('<integer>%d</integer>' % i).encode('ascii')
+            yield b'</p></some_call>'
+
+        class SomeService(Service):
+            @srpc(Unicode, Iterable(Integer))
+            def some_call(s, p):
+                assert s == 'x'
+                for i in p:
+                    # items are parsed while they are consumed
+                    assert len(chunks) == i + 1
+                    consumed.append(i)
+
+        ctx = self._get_ctx(SomeService, gen())
+        assert len(chunks) == 0
+
+        ctx.service_class.call_wrapper(ctx)
+        assert consumed == [0, 1, 2, 3, 4]
+
+    def test_array(self):
+        class C(ComplexModel):
+            i = Integer
+            s = Unicode
+
+        class SomeService(Service):
+            @srpc(Array(C), Integer(max_occurs='unbounded'), Unicode)
+            def some_call(a, i, s):
+                pass
+
+        ctx = self._get_ctx(SomeService, [
+            b'<some_call xmlns="tns"><a><C><i>1</i><s>a</s></C>',
+            b'<C><i>2</i><s>b</s></C></a><i>3</i><i>4</i><s>s</s>',
+            b'</some_call>',
+        ])
+
+        a, i, s = ctx.in_object
+        assert [(c.i, c.s) for c in a] == [(1, 'a'), (2, 'b')]
+        assert i == [3, 4]
+        assert s == 's'
+
+    def test_iterable_sibling(self):
+        consumed = []
+
+        class SomeService(Service):
+            @srpc(Integer, Iterable(Integer))
+            def some_call(i, p):
+                for v in p:
+                    consumed.append(v)
+
+        # unknown elements are skipped, like from_element does
+        ctx = self._get_ctx(SomeService, [
+            b'<some_call xmlns="tns"><p><integer>1</integer></p>',
+            b'<x>ignored</x></some_call>',
+        ])
+        ctx.service_class.call_wrapper(ctx)
+        assert consumed == [1]
+
+        # i can't be set once p is streamed
+        ctx = self._get_ctx(SomeService, [
+            b'<some_call xmlns="tns"><p><integer>2</integer></p>',
+            b'<i>3</i></some_call>',
+        ])
+        self.assertRaises(ValidationError, ctx.service_class.call_wrapper,
+                                                                           ctx)
+        assert consumed == [1, 2]
+
+    def test_syntax_error(self):
+        class SomeService(Service):
+            @srpc(Iterable(Integer))
+            def some_call(p):
+                for _ in p:
+                    pass
+
+        ctx = self._get_ctx(SomeService, [
+            b'<some_call xmlns="tns"><p><integer>1</integer></p>',
+        ])
+
+        self.assertRaises(Fault, ctx.service_class.call_wrapper, ctx)
+
+    def test_schema_validation(self):
+        self.assertRaises(ValueError, XmlDocument, validator='lxml',
+                                                           incremental_in=True)
+
+
 if __name__ == '__main__':
     unittest.main()
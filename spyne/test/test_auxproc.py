@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+
+import os
+import unittest
+import tempfile
+
+from threading import Event, Thread
+
+from spyne.util.six import BytesIO
+
+from spyne import Application, Service, srpc
+from spyne.model import Unicode
+from spyne.auxproc import AuxMethodStats
+from spyne.auxproc.thread import ThreadAuxProc
+from spyne.auxproc.process import ProcessAuxProc
+from spyne.protocol.http import HttpRpc
+from spyne.server.wsgi import WsgiApplication
+
+
+def start_response(code, headers):
+    pass
+
+
+def _call(server, s):
+    return b''.join(server({
+        'QUERY_STRING': 's=%s' % s,
+        'PATH_INFO': '/call',
+        'REQUEST_METHOD': 'GET',
+        'SERVER_NAME': 'localhost',
+        'wsgi.input': BytesIO(),
+    }, start_response, "http://null"))
+
+
+class PrimaryService(Service):
+    @srpc(Unicode)
+    def call(s):
+        pass
+
+
+def _get_server(aux, func):
+    class AuxService(Service):
+        __aux__ = aux
+
+        @srpc(Unicode)
+        def call(s):
+            func(s)
+
+    app = Application([PrimaryService, AuxService], 'tns',
+                                  in_protocol=HttpRpc(), out_protocol=HttpRpc())
+
+    return WsgiApplication(app)
+
+
+class TestThreadAuxProcQueue(unittest.TestCase):
+    def _run(self, aux, values):
+        started = Event()
+        release = Event()
+        data = []
+
+        def func(s):
+            started.set()
+            release.wait(5)
+            data.append(s)
+
+        server = _get_server(aux, func)
+
+        _call(server, values[0])
+        assert started.wait(5)
+        for v in values[1:]:
+            _call(server, v)
+
+        release.set()
+        aux.close()
+
+        stats, = aux.stats.values()
+        return data, stats
+
+    def test_unbounded(self):
+        aux = ThreadAuxProc()
+        data, stats = self._run(aux, ['a', 'b', 'c'])
+
+        assert data == ['a', 'b', 'c']
+        assert stats.submitted == 3
+        assert stats.completed == 3
+        assert stats.max_queued == 2
+        assert stats.queued == stats.running == 0
+        assert stats.latency_max >= stats.latency_avg > 0
+
+    def test_drop(self):
+        aux = ThreadAuxProc(max_queued=1, overflow='drop')
+        data, stats = self._run(aux, ['a', 'b', 'c'])
+
+        assert data == ['a', 'b']
+        assert stats.submitted == 3
+        assert stats.completed == 2
+        assert stats.dropped == 1
+        assert stats.max_queued == 1
+
+    def test_coalesce(self):
+        aux = ThreadAuxProc(max_queued=1, overflow='coalesce')
+        data, stats = self._run(aux, ['a', 'b', 'c', 'd'])
+
+        assert data == ['a', 'd']
+        assert stats.completed == 2
+        assert stats.coalesced == 2
+        assert stats.dropped == 0
+
+    def test_block(self):
+        started = Event()
+        release = Event()
+        data = []
+
+        def func(s):
+            started.set()
+            release.wait(5)
+            data.append(s)
+
+        aux = ThreadAuxProc(max_queued=1)
+        server = _get_server(aux, func)
+
+        _call(server, 'a')
+        assert started.wait(5)
+        _call(server, 'b')
+
+        blocked = Thread(target=_call, args=(server, 'c'))
+        blocked.start()
+        blocked.join(0.2)
+        assert blocked.is_alive()
+
+        release.set()
+        blocked.join(5)
+        assert not blocked.is_alive()
+
+        aux.close()
+        assert data == ['a', 'b', 'c']
+
+    def test_failure(self):
+        def func(s):
+            raise ValueError(s)
+
+        aux = ThreadAuxProc()
+        _call(_get_server(aux, func), 'a')
+        aux.close()
+
+        stats, = aux.stats.values()
+        assert stats.failed == 1
+        assert stats.completed == 0
+
+    def test_create_job_kwargs(self):
+        aux = ThreadAuxProc()
+
+        func, args = aux.create_job('server', 'ctx', 1, x=2)
+        assert args == ('server', 'ctx', 1)
+        assert func.keywords == {'x': 2}
+
+        func, args = aux.create_job('server', 'ctx')
+        assert func == aux.process
+
+    def test_stats(self):
+        stats = AuxMethodStats()
+        assert stats.latency_avg == 0.0
+        assert stats.as_dict()['submitted'] == 0
+        assert stats.as_dict()['dropped'] == 0
+
+        stats.job_queued()
+        stats.job_started()
+        stats.job_done(False, 2.0)
+        assert stats.as_dict()['latency_avg'] == 2.0
+        assert stats.max_queued == 1
+        assert 'coalesced=0' in repr(stats)
+
+
+_out_file_name = None
+
+
+def _write_pid(s):
+    with open(_out_file_name, 'a') as f:
+        f.write("%s %d\n" % (s, os.getpid()))
+
+
+class TestProcessAuxProc(unittest.TestCase):
+    def setUp(self):
+        global _out_file_name
+
+        fd, _out_file_name = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.unlink(_out_file_name)
+
+    def test_process(self):
+        aux = ProcessAuxProc(pool_size=2)
+        server = _get_server(aux, _write_pid)
+
+        for s in ('a', 'b', 'c'):
+            _call(server, s)
+
+        aux.close()
+
+        with open(_out_file_name) as f:
+            lines = [l.split() for l in f]
+
+        assert sorted([s for s, pid in lines]) == ['a', 'b', 'c']
+        assert str(os.getpid()) not in [pid for s, pid in lines]
+
+        stats, = aux.stats.values()
+        assert stats.submitted == stats.completed == 3
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import unittest
+
+from spyne import Application, MethodContext, Service, Unicode, srpc
+from spyne.context import ProtocolContext, _LAZY
+from spyne.protocol.xml import XmlDocument
+from spyne.server import ServerBase
+
+
+class SomeService(Service):
+    @srpc(Unicode, _returns=Unicode)
+    def some_call(s):
+        return s
+
+
+def _get_server():
+    app = Application([SomeService], 'tns', in_protocol=XmlDocument(),
+                                                  out_protocol=XmlDocument())
+    return ServerBase(app)
+
+
+class TestMethodContext(unittest.TestCase):
+    def test_lazy_subcontexts(self):
+        ctx = MethodContext(_get_server(), MethodContext.SERVER)
+        assert ctx._inprot_ctx is _LAZY
+
+        assert isinstance(ctx.inprot_ctx, ProtocolContext)
+        assert ctx.inprot_ctx.parent is ctx
+        assert ctx.protocol is ctx.inprot_ctx
+        assert ctx.transport.parent is ctx
+        assert ctx.event.parent is ctx
+
+        ctx = MethodContext(_get_server(), MethodContext.CLIENT)
+        assert ctx.protocol is ctx.outprot_ctx
+
+        ctx.protocol = None
+        assert ctx.protocol is None
+
+    def test_frozen(self):
+        ctx = MethodContext(_get_server(), MethodContext.SERVER)
+        ctx.udc = 'x'
+        self.assertRaises(AttributeError, setattr, ctx, 'some_attr', 'x')
+
+        class SomeMethodContext(MethodContext):
+            def __init__(self, transport):
+                self.some_attr = None
+                super(SomeMethodContext, self).__init__(transport,
+                                                          MethodContext.SERVER)
+
+        ctx = SomeMethodContext(_get_server())
+        ctx.some_attr = 'x'
+        ctx.udc = 'x'
+        self.assertRaises(ValueError, setattr, ctx, 'other_attr', 'x')
+
+    def test_copy(self):
+        ctx = MethodContext(_get_server(), MethodContext.SERVER)
+        ctx.udc = 'x'
+        transport = ctx.transport
+
+        c = ctx.copy()
+        assert c.udc == 'x'
+        assert c.transport is transport
+        assert transport.parent is c
+
+        # sub-contexts that were not created yet are not shared
+        assert c.outprot_ctx is not ctx.outprot_ctx
+        assert c.outprot_ctx.parent is c
+        assert ctx.outprot_ctx.parent is ctx
+
+    def test_primary_context_is_reused(self):
+        server = _get_server()
+        initial_ctx = MethodContext(server, MethodContext.SERVER)
+        initial_ctx.in_string = [b'<some_call xmlns="tns"><s>x</s></some_call>']
+
+        ctx, = server.generate_contexts(initial_ctx)
+        assert ctx is initial_ctx
+        assert ctx.descriptor.name == 'some_call'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,6 +20,7 @@
 import logging
 logging.basicConfig(level=logging.DEBUG)
 
+import json
 import inspect
 import unittest
 import sqlalchemy
@@ -46,7 +47,7 @@ from spyne.model.complex import table
 
 from spyne.store.relational import get_pk_columns
 from spyne.store.relational.document import PGJsonB, PGJson, PGFileJson, \
-    PGObjectJson
+    PGObjectJson, PGObjectXml
 
 TableModel = TTableModel()
 
@@ -134,6 +135,62 @@ class TestSqlAlchemyTypeMappings(unittest.TestCase):
         assert isinstance(SomeClass2.Attributes.sqla_table.c.a.type,
                                                                    PGObjectJson)
 
+    def test_obj_json_batch(self):
+        class SomeClass(ComplexModel):
+            s = Unicode
+            d = Double
+
+        t = PGObjectJson(SomeClass, complex_as=list)
+
+        values = t.process_bind_values(
+                              [SomeClass(s='a', d=1.5), None, SomeClass(s='b')])
+        assert values[1] is None
+        assert json.loads(values[0]) == ['a', 1.5]
+
+        objs = t.process_result_values(values + [b'["c", 2.5]', ['d', None]])
+        assert objs[1] is None
+        assert [(o.s, o.d) for o in objs if o is not None] == \
+                           [('a', 1.5), ('b', None), ('c', 2.5), ('d', None)]
+
+    def test_lazy_document_columns(self):
+        from spyne.util.lazydoc import is_loaded
+
+        class SomeClass(ComplexModel):
+            __namespace__ = 'tns'
+            s = Unicode
+            d = Double
+
+        t = PGObjectJson(SomeClass, complex_as=list, lazy=True)
+        raw = u'["a", 1.5]'
+        o, = t.process_result_values([raw])
+        assert not is_loaded(o)
+
+        # unaccessed values are written back as they were read
+        assert t.process_bind_values([o]) == [raw]
+        assert (o.s, o.d) == ('a', 1.5)
+        assert is_loaded(o)
+
+        o.d = 2.5
+        assert json.loads(t.process_bind_values([o])[0]) == ['a', 2.5]
+
+        t = PGObjectXml(SomeClass, lazy=True)
+        raw, = PGObjectXml(SomeClass).process_bind_values(
+                                                    [SomeClass(s='b', d=3.5)])
+        o, = t.process_result_values([raw])
+        assert t.process_bind_values([o]) == [raw]
+        assert (o.s, o.d) == ('b', 3.5)
+
+        t = PGJson(lazy=True)
+        raw = u'{"x": [1, 2]}'
+        o, = t.process_result_values([raw])
+        assert not is_loaded(o)
+        assert t.process_bind_values([o]) == [raw]
+        assert o['x'] == [1, 2]
+        assert 'x' in o
+        assert isinstance(o, dict)
+        assert o == {'x': [1, 2]}
+        assert json.loads(t.process_bind_values([o])[0]) == {'x': [1, 2]}
+
 
 class TestSqlAlchemySchema(unittest.TestCase):
     def setUp(self):
@@ -181,6 +238,56 @@ class TestSqlAlchemySchema(unittest.TestCase):
         #flag_modified(sc1.a[0], 's')
         #assert sc1.a[0] in self.session.dirty
 
+    def test_obj_json_lazy(self):
+        from spyne.model.complex import json as c_json
+        from spyne.util.dictdoc import get_object_as_json
+        from spyne.util.lazydoc import is_loaded
+
+        fn = inspect.stack()[0][3]
+
+        class SomeClass(ComplexModel):
+            s = Unicode
+            d = Double
+
+        class SomeClass1(TableModel):
+            __tablename__ = "%s_%d" % (fn, 1)
+            _type_info = [
+                ('i', Integer32(pk=True)),
+                ('a', SomeClass.store_as(c_json(lazy=True))),
+            ]
+
+        self.metadata.create_all()
+
+        self.session.add(SomeClass1(i=5, a=SomeClass(s="s", d=42.0)))
+        self.session.commit()
+        self.session.close()
+
+        sc1 = self.session.query(SomeClass1).get(5)
+        assert not is_loaded(sc1.a)
+
+        # same document format, so the stored document is output as is
+        ret = get_object_as_json(sc1, SomeClass1, complex_as=dict)
+        assert json.loads(ret) == {'i': 5, 'a': {'s': 's', 'd': 42.0}}
+        assert not is_loaded(sc1.a)
+
+        # a different one needs the object
+        ret = get_object_as_json(sc1, SomeClass1, complex_as=list)
+        assert json.loads(ret) == [5, ['s', 42.0]]
+        assert is_loaded(sc1.a)
+
+        assert isinstance(sc1.a, SomeClass)
+        assert sc1.a.s == 's'
+
+        from sqlalchemy.orm.attributes import flag_modified
+
+        sc1.a.s = "ss"
+        flag_modified(sc1, 'a')
+        self.session.commit()
+        self.session.close()
+
+        sc1 = self.session.query(SomeClass1).get(5)
+        assert sc1.a.s == "ss"
+
     def test_schema(self):
         class SomeClass(TableModel):
             __tablename__ = 'some_class'
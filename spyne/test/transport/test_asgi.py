@@ -0,0 +1,318 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import time
+import asyncio
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from spyne import Application, Service, Fault, rpc, srpc
+from spyne.model import Integer, Unicode, Iterable
+from spyne.protocol.http import HttpRpc
+from spyne.protocol.soap import Soap11
+from spyne.server.asgi import AsgiApplication, _scope_to_environ
+from spyne.server.null import NullServer
+from spyne.server.wsgi import WsgiApplication
+
+
+class SomeService(Service):
+    @srpc(Unicode, _returns=Unicode)
+    def say_hello(name):
+        return u'Hello, %s' % name
+
+    @srpc(Unicode, Integer, _returns=Unicode)
+    async def say_hello_later(name, delay):
+        await asyncio.sleep(delay / 1000.)
+        return u'Hello, %s' % name
+
+    @srpc(_returns=Unicode)
+    async def fail_later():
+        await asyncio.sleep(0)
+        raise Fault('Client.Later', 'Failed later')
+
+    @srpc(Integer, _returns=Iterable(Integer))
+    def count(n):
+        for i in range(n):
+            yield i
+
+    @rpc(Integer)
+    def stream_lines(ctx, n):
+        ctx.out_string = (b'%d\n' % i for i in range(n))
+
+    @rpc(_returns=Unicode)
+    def get_thread_name(ctx):
+        import threading
+        return threading.current_thread().name
+
+
+def _get_app(in_protocol=None, out_protocol=None):
+    if in_protocol is None:
+        in_protocol = HttpRpc(validator='soft')
+    if out_protocol is None:
+        out_protocol = HttpRpc()
+
+    return Application([SomeService], 'tns', in_protocol=in_protocol,
+                                                    out_protocol=out_protocol)
+
+
+def _get_scope(path, query_string=b'', method='GET', headers=()):
+    return {
+        'type': 'http',
+        'asgi': {'version': '3.0'},
+        'http_version': '1.1',
+        'method': method,
+        'scheme': 'http',
+        'path': path,
+        'root_path': '',
+        'query_string': query_string,
+        'headers': list(headers),
+        'server': ('localhost', 8000),
+        'client': ('127.0.0.1', 54321),
+    }
+
+
+async def _call(asgi_app, scope, body=b''):
+    messages = [
+        {'type': 'http.request', 'body': body, 'more_body': False},
+        {'type': 'http.disconnect'},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await asgi_app(scope, receive, send)
+
+    return sent
+
+
+def _parse(sent):
+    start, body = sent[0], sent[1:]
+    assert start['type'] == 'http.response.start'
+    assert body[-1].get('more_body', False) is False
+
+    return start['status'], dict(start['headers']), \
+                                          b''.join([m['body'] for m in body])
+
+
+def _request(asgi_app, path, query_string=b'', **kwargs):
+    scope = _get_scope(path, query_string, **kwargs)
+    return _parse(asyncio.run(_call(asgi_app, scope)))
+
+
+class TestAsgiApplication(unittest.TestCase):
+    def test_sync_method(self):
+        asgi_app = AsgiApplication(_get_app())
+
+        status, headers, body = _request(asgi_app, '/say_hello',
+                                                                  b'name=world')
+
+        assert status == 200
+        assert body == b'Hello, world'
+
+    def test_async_method(self):
+        asgi_app = AsgiApplication(_get_app())
+
+        status, headers, body = _request(asgi_app, '/say_hello_later',
+                                                         b'name=world&delay=1')
+
+        assert status == 200
+        assert body == b'Hello, world'
+
+    def test_async_method_concurrency(self):
+        asgi_app = AsgiApplication(_get_app())
+        scope = _get_scope('/say_hello_later', b'name=world&delay=200')
+
+        async def run():
+            return await asyncio.gather(*[_call(asgi_app, scope)
+                                                           for _ in range(50)])
+
+        start = time.time()
+        results = asyncio.run(run())
+        elapsed = time.time() - start
+
+        # 50 sequential calls would take 10 seconds.
+        assert elapsed < 5, elapsed
+        for sent in results:
+            assert _parse(sent)[2] == b'Hello, world'
+
+    def test_async_fault(self):
+        asgi_app = AsgiApplication(_get_app())
+
+        status, headers, body = _request(asgi_app, '/fail_later')
+
+        assert status == 400
+        assert b'Failed later' in body
+
+    def test_missing_method(self):
+        asgi_app = AsgiApplication(_get_app())
+
+        status, headers, body = _request(asgi_app, '/no_such_method')
+
+        assert status == 404
+
+    def test_streaming(self):
+        asgi_app = AsgiApplication(_get_app())
+        scope = _get_scope('/stream_lines', b'n=100')
+
+        sent = asyncio.run(_call(asgi_app, scope))
+        status, headers, body = _parse(sent)
+
+        assert status == 200
+        assert b'Content-Length' not in headers
+        # one message per chunk, plus the response start and the final one
+        assert len(sent) == 102
+        assert body == b''.join([b'%d\n' % i for i in range(100)])
+
+    def test_not_chunked(self):
+        asgi_app = AsgiApplication(_get_app(out_protocol=Soap11()),
+                                                                 chunked=False)
+        scope = _get_scope('/count', b'n=100')
+
+        sent = asyncio.run(_call(asgi_app, scope))
+        status, headers, body = _parse(sent)
+
+        assert status == 200
+        assert int(headers[b'Content-Length']) == len(body)
+        assert len(sent) == 3
+
+    def test_request_too_long(self):
+        asgi_app = AsgiApplication(_get_app(), max_content_length=10)
+        scope = _get_scope('/say_hello', method='POST')
+
+        status, headers, body = _parse(asyncio.run(_call(asgi_app, scope,
+                                                              b'name=' * 10)))
+
+        assert status == 413
+
+    def test_executor(self):
+        executor = ThreadPoolExecutor(1, thread_name_prefix='spyne-test')
+        asgi_app = AsgiApplication(_get_app(), executor=executor)
+
+        try:
+            status, headers, body = _request(asgi_app, '/get_thread_name')
+            assert body.startswith(b'spyne-test')
+
+            # coroutine functions still run on the event loop
+            status, headers, body = _request(asgi_app, '/say_hello_later',
+                                                         b'name=world&delay=1')
+            assert body == b'Hello, world'
+
+        finally:
+            executor.shutdown()
+
+    def test_wsdl(self):
+        asgi_app = AsgiApplication(_get_app(in_protocol=Soap11(),
+                                                    out_protocol=Soap11()))
+
+        status, headers, body = _request(asgi_app, '/', b'wsdl')
+
+        assert status == 200
+        assert b'say_hello_later' in body
+        assert b'http://localhost:8000/' in body
+
+        etag = headers[b'ETag']
+        status, headers, body = _request(asgi_app, '/', b'wsdl',
+                                           headers=[(b'if-none-match', etag)])
+        assert status == 304
+        assert body == b''
+
+    def test_events(self):
+        asgi_app = AsgiApplication(_get_app())
+        events = []
+
+        for name in ('asgi_call', 'asgi_return', 'asgi_close'):
+            asgi_app.event_manager.add_listener(name,
+                                    lambda ctx, name=name: events.append(name))
+
+        _request(asgi_app, '/say_hello', b'name=world')
+
+        assert events == ['asgi_call', 'asgi_return', 'asgi_close']
+
+    def test_lifespan(self):
+        asgi_app = AsgiApplication(_get_app())
+        messages = [{'type': 'lifespan.startup'},
+                    {'type': 'lifespan.shutdown'}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(asgi_app({'type': 'lifespan'}, receive, send))
+
+        assert sent == [{'type': 'lifespan.startup.complete'},
+                        {'type': 'lifespan.shutdown.complete'}]
+
+    def test_environ(self):
+        scope = _get_scope(u'/ğ', b'a=b', headers=[
+            (b'content-type', b'text/xml'),
+            (b'x-some', b'a'), (b'x-some', b'b'),
+        ])
+
+        environ = _scope_to_environ(scope, b'abc')
+
+        assert environ['PATH_INFO'] == u'/ğ'.encode('utf8').decode('latin1')
+        assert environ['QUERY_STRING'] == 'a=b'
+        assert environ['CONTENT_TYPE'] == 'text/xml'
+        assert environ['CONTENT_LENGTH'] == '3'
+        assert environ['HTTP_X_SOME'] == 'a,b'
+        assert environ['SERVER_PORT'] == '8000'
+        assert environ['wsgi.input'].read() == b'abc'
+
+
+class TestAsyncMethodInSyncServer(unittest.TestCase):
+    def test_null_server(self):
+        server = NullServer(_get_app(in_protocol=Soap11(),
+                                                    out_protocol=Soap11()))
+
+        try:
+            server.service.say_hello_later(u'world', 1)
+        except Fault as e:
+            assert e.faultcode == 'Server'
+        else:
+            raise Exception("must fail")
+
+    def test_wsgi(self):
+        wsgi_app = WsgiApplication(_get_app())
+        environ = {
+            'QUERY_STRING': 'name=world&delay=1',
+            'PATH_INFO': '/say_hello_later',
+            'REQUEST_METHOD': 'GET',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '80',
+            'wsgi.url_scheme': 'http',
+        }
+
+        status = []
+        body = b''.join(wsgi_app(environ,
+                                     lambda s, h: status.append(s)))
+
+        assert status[0].startswith('500')
+        assert body.startswith(b'Server')
+
+
+if __name__ == '__main__':
+    unittest.main()
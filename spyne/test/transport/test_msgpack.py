@@ -92,3 +92,56 @@ class TestMessagePackServer(unittest.TestCase):
 
         return p_ctx[0].out_object[0].addCallback(_ccb)
 
+
+
+class TestMessagePackTransportBase(unittest.TestCase):
+    def gen_tpt(self):
+        from spyne.server.msgpack import MessagePackServerBase
+
+        class SomeService(Service):
+            @rpc(Unicode, _returns=Unicode)
+            def yay(ctx, u):
+                return u
+
+        app = Application([SomeService], 'tns',
+                                in_protocol=MessagePackDocument(),
+                                out_protocol=MessagePackDocument())
+
+        return MessagePackServerBase(app)
+
+    def roundtrip(self, tpt, msg):
+        msgstr = msgpack.packb(msg)
+        msg = msgpack.unpackb(msgstr, raw=True)
+
+        p_ctx, others = tpt.produce_contexts(msg, msglen=len(msgstr))
+        tpt.process_contexts([p_ctx] + others)
+        tpt.pack(p_ctx)
+
+        assert p_ctx.transport.request_len == len(msgstr)
+        return msgpack.unpackb(b''.join(p_ctx.out_string))
+
+    def test_v1(self):
+        tpt = self.gen_tpt()
+        val = self.roundtrip(tpt, [1, msgpack.packb({'yay': {'u': "yaaay!"}})])
+
+        # the document is packed separately
+        self.assertEqual(val[0], 0)
+        assert isinstance(val[1], bytes)
+        msgpack.unpackb(val[1])
+
+    def test_inline(self):
+        tpt = self.gen_tpt()
+        val = self.roundtrip(tpt, [2, {'yay': {'u': "yaaay!"}}])
+
+        self.assertEqual(val, [0, b"yaaay!"])
+
+    def test_inline_packer_reuse(self):
+        tpt = self.gen_tpt()
+        assert tpt.get_packer() is tpt.get_packer()
+
+    def test_inline_invalid_body(self):
+        from spyne.error import ValidationError
+
+        tpt = self.gen_tpt()
+        self.assertRaises(ValidationError, tpt.produce_contexts,
+                                                            [2, b'not a dict'])
@@ -0,0 +1,287 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import threading
+
+from twisted.trial import unittest
+from twisted.internet import reactor
+from twisted.internet.task import deferLater
+from twisted.internet.defer import inlineCallbacks, returnValue, \
+    DeferredList
+from twisted.web.client import Agent, readBody
+from twisted.web.server import Site
+
+from spyne import Application, Service, rpc
+from spyne.auxproc.sync import SyncAuxProc
+from spyne.error import ServiceUnavailableError
+from spyne.model import Unicode
+from spyne.protocol.http import HttpRpc
+from spyne.server.twisted import TwistedWebResource
+from spyne.server.twisted.executor import ReactorExecutor, \
+    ThreadPoolExecutor
+
+
+def _get_thread_name():
+    return threading.current_thread().name
+
+
+class TestExecutors(unittest.TestCase):
+    def setUp(self):
+        self.pool = ThreadPoolExecutor(pool_size=2, name='spyne-test')
+        self.port = None
+
+    @inlineCallbacks
+    def tearDown(self):
+        if self.port is not None:
+            yield self.port.stopListening()
+        self.pool.stop()
+
+    def serve(self, services, executor=None):
+        app = Application(services, 'tns', in_protocol=HttpRpc(),
+                                                        out_protocol=HttpRpc())
+        resource = TwistedWebResource(app, executor=executor)
+        self.port = reactor.listenTCP(0, Site(resource),
+                                                        interface='127.0.0.1')
+        self.app = app
+
+    @inlineCallbacks
+    def wait_for(self, condition):
+        for _ in range(500):
+            if condition():
+                return
+            yield deferLater(reactor, 0.01, lambda: None)
+
+        self.fail("Timed out")
+
+    @inlineCallbacks
+    def get(self, path):
+        url = 'http://127.0.0.1:%d/%s' % (self.port.getHost().port, path)
+        response = yield Agent(reactor).request(b'GET', url.encode('ascii'))
+        body = yield readBody(response)
+        returnValue((response.code, body))
+
+    @inlineCallbacks
+    def test_reactor_by_default(self):
+        class SomeService(Service):
+            @rpc(_returns=Unicode)
+            def thread_name(ctx):
+                return _get_thread_name()
+
+        self.serve([SomeService])
+
+        code, body = yield self.get('thread_name')
+        self.assertEqual(code, 200)
+        self.assertEqual(body, _get_thread_name().encode('utf8'))
+
+    @inlineCallbacks
+    def test_method_executor(self):
+        pool = self.pool
+
+        class SomeService(Service):
+            @rpc(_returns=Unicode, _executor=pool)
+            def thread_name(ctx):
+                return _get_thread_name()
+
+        self.serve([SomeService])
+
+        code, body = yield self.get('thread_name')
+        self.assertEqual(code, 200)
+        self.assertIn(b'spyne-test', body)
+
+        stats = pool.stats
+        self.assertEqual(stats.submitted, 1)
+        self.assertEqual(stats.completed, 1)
+        self.assertEqual(stats.failed, 0)
+        self.assertEqual(stats.queued, 0)
+        self.assertEqual(stats.running, 0)
+        self.assertEqual(stats.max_queued, 1)
+
+    @inlineCallbacks
+    def test_service_executor(self):
+        class SomeService(Service):
+            __executor__ = self.pool
+
+            @rpc(_returns=Unicode)
+            def thread_name(ctx):
+                return _get_thread_name()
+
+            @rpc(_returns=Unicode, _executor=ReactorExecutor())
+            def reactor_thread_name(ctx):
+                return _get_thread_name()
+
+        self.serve([SomeService])
+
+        code, body = yield self.get('thread_name')
+        self.assertIn(b'spyne-test', body)
+
+        code, body = yield self.get('reactor_thread_name')
+        self.assertEqual(body, _get_thread_name().encode('utf8'))
+
+    @inlineCallbacks
+    def test_transport_executor(self):
+        class SomeService(Service):
+            @rpc(_returns=Unicode)
+            def thread_name(ctx):
+                return _get_thread_name()
+
+        self.serve([SomeService], executor=self.pool)
+
+        code, body = yield self.get('thread_name')
+        self.assertEqual(code, 200)
+        self.assertIn(b'spyne-test', body)
+
+    @inlineCallbacks
+    def test_slow_method_does_not_block_reactor(self):
+        event = threading.Event()
+        pool = self.pool
+
+        class SomeService(Service):
+            @rpc(_returns=Unicode, _executor=pool)
+            def slow(ctx):
+                event.wait(10)
+                return u'slow'
+
+            @rpc(_returns=Unicode)
+            def fast(ctx):
+                return u'fast'
+
+        self.serve([SomeService])
+
+        slow = self.get('slow')
+
+        code, body = yield self.get('fast')
+        self.assertEqual(body, b'fast')
+        self.assertFalse(slow.called)
+        self.assertEqual(pool.stats.running, 1)
+
+        event.set()
+        code, body = yield slow
+        self.assertEqual(body, b'slow')
+
+    @inlineCallbacks
+    def test_max_queued(self):
+        event = threading.Event()
+        pool = ThreadPoolExecutor(pool_size=1, max_queued=1)
+        self.addCleanup(pool.stop)
+
+        class SomeService(Service):
+            @rpc(_returns=Unicode, _executor=pool)
+            def slow(ctx):
+                event.wait(10)
+                return u'slow'
+
+        self.serve([SomeService])
+
+        # the first call runs, the second one waits in the queue. the third
+        # one is refused.
+        calls = [self.get('slow')]
+        yield self.wait_for(lambda: pool.stats.running == 1)
+        calls.append(self.get('slow'))
+        yield self.wait_for(lambda: pool.stats.queued == 1)
+
+        code, body = yield self.get('slow')
+        self.assertEqual(code, 503)
+        self.assertEqual(pool.stats.rejected, 1)
+
+        event.set()
+        results = yield DeferredList(calls)
+        self.assertEqual([r[1] for r in results], [(200, b'slow')] * 2)
+
+    @inlineCallbacks
+    def test_fault(self):
+        pool = self.pool
+
+        class SomeService(Service):
+            @rpc(_returns=Unicode, _executor=pool)
+            def fail(ctx):
+                raise ValueError("boo")
+
+        self.serve([SomeService])
+
+        code, body = yield self.get('fail')
+        self.assertEqual(code, 500)
+        self.assertEqual(pool.stats.completed, 1)
+
+    @inlineCallbacks
+    def test_offload_serialization(self):
+        pool = ThreadPoolExecutor(pool_size=1, offload_serialization=True,
+                                                             name='spyne-ser')
+        self.addCleanup(pool.stop)
+
+        class SomeService(Service):
+            @rpc(Unicode, _returns=Unicode, _executor=pool)
+            def echo(ctx, s):
+                return s
+
+        self.serve([SomeService])
+
+        threads = {}
+        for name in ('before_deserialize', 'serialize'):
+            self.app.in_protocol.event_manager.add_listener(name,
+                  lambda ctx, name=name: threads.setdefault(name,
+                                                          _get_thread_name()))
+            self.app.out_protocol.event_manager.add_listener(name,
+                  lambda ctx, name=name: threads.setdefault(name,
+                                                          _get_thread_name()))
+
+        code, body = yield self.get('echo?s=hello')
+        self.assertEqual(body, b'hello')
+        self.assertIn('spyne-ser', threads['before_deserialize'])
+        self.assertIn('spyne-ser', threads['serialize'])
+
+        # serialization doesn't count as another call
+        self.assertEqual(pool.stats.submitted, 1)
+        self.assertEqual(pool.stats.completed, 1)
+
+    @inlineCallbacks
+    def test_offload_serialization_aux(self):
+        pool = ThreadPoolExecutor(pool_size=1, offload_serialization=True)
+        self.addCleanup(pool.stop)
+        out_strings = []
+
+        class SomeService(Service):
+            @rpc(Unicode, _returns=Unicode, _executor=pool)
+            def echo(ctx, s):
+                return s
+
+        class AuxService(Service):
+            __aux__ = SyncAuxProc()
+
+            @rpc(Unicode, _returns=Unicode)
+            def echo(ctx, s):
+                out_strings.append(ctx.aux.parent.out_string)
+
+        self.serve([SomeService, AuxService])
+
+        code, body = yield self.get('echo?s=hello')
+        self.assertEqual(body, b'hello')
+        self.assertEqual(out_strings, [[b'hello']])
+
+    @inlineCallbacks
+    def test_followup_not_refused(self):
+        pool = ThreadPoolExecutor(pool_size=1, max_queued=0)
+        self.addCleanup(pool.stop)
+
+        retval = yield pool.submit_followup(lambda x: x * 2, 21)
+        self.assertEqual(retval, 42)
+        self.assertEqual(pool.stats.submitted, 0)
+
+        yield self.assertFailure(pool.submit(lambda: None),
+                                                       ServiceUnavailableError)
+        self.assertEqual(pool.stats.rejected, 1)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+import gc
+import unittest
+
+from spyne.util.six import BytesIO
+
+from spyne import Application, Service, srpc
+from spyne.model import Boolean
+from spyne.protocol.xml import XmlDocument
+from spyne.protocol.http import HttpRpc
+from spyne.server.null import NullServer
+from spyne.server.wsgi import WsgiApplication
+from spyne.util.gcpolicy import GcPolicyBase, IntervalGcPolicy, \
+    IdleGcPolicy, FdGcPolicy
+
+
+class PingService(Service):
+    @srpc(_returns=Boolean)
+    def ping():
+        return True
+
+
+class _CountingMixin(object):
+    def __init__(self, *args, **kwargs):
+        super(_CountingMixin, self).__init__(*args, **kwargs)
+        self.generations = []
+
+    def collect(self, generation=None):
+        if generation is None:
+            generation = self.generation
+        self.generations.append(generation)
+        return super(_CountingMixin, self).collect(generation)
+
+
+class CountingIntervalGcPolicy(_CountingMixin, IntervalGcPolicy):
+    pass
+
+
+class CountingIdleGcPolicy(_CountingMixin, IdleGcPolicy):
+    pass
+
+
+class CountingFdGcPolicy(_CountingMixin, FdGcPolicy):
+    pass
+
+
+def _get_app(gc_policy, prot=XmlDocument):
+    return Application([PingService], 'tns', in_protocol=prot(),
+                                   out_protocol=prot(), gc_policy=gc_policy)
+
+
+class TestGcPolicy(unittest.TestCase):
+    def test_default(self):
+        app = _get_app(None)
+        assert isinstance(app.gc_policy, IntervalGcPolicy)
+        assert app.gc_policy.app is app
+
+    def test_base_never_collects(self):
+        policy = GcPolicyBase()
+        server = NullServer(_get_app(policy))
+
+        origin_collect = gc.collect
+        try:
+            gc.collect = lambda *args: 1/0
+            server.service.ping()
+        finally:
+            gc.collect = origin_collect
+
+        assert policy.stats.collections == 0
+
+    def test_interval(self):
+        policy = CountingIntervalGcPolicy(interval=3600, generation=0)
+        server = NullServer(_get_app(policy))
+
+        server.service.ping()
+        server.service.ping()
+        assert policy.generations == [0]
+
+    def test_collect(self):
+        events = []
+        policy = GcPolicyBase(generation=1)
+        app = _get_app(policy)
+        app.event_manager.add_listener('gc_collect',
+                                        lambda *args: events.append(args))
+
+        policy.collect()
+
+        assert policy.stats.collections == 1
+        assert policy.stats.time_total >= 0
+        assert policy.stats.last_run > 0
+        (p, generation, dt, collected), = events
+        assert p is policy
+        assert generation == 1
+        assert collected == policy.stats.collected
+
+    def test_idle_wsgi(self):
+        policy = CountingIdleGcPolicy(interval=0, max_interval=None)
+        server = WsgiApplication(_get_app(policy, HttpRpc))
+
+        body = server({
+            'QUERY_STRING': '',
+            'PATH_INFO': '/ping',
+            'REQUEST_METHOD': 'GET',
+            'SERVER_NAME': 'localhost',
+            'wsgi.input': BytesIO(),
+        }, lambda *args: None, "http://null")
+
+        # nothing happens until the response is sent
+        assert policy.generations == []
+        assert b''.join(body) == b'true'
+        assert policy.generations == [2]
+        assert server._in_flight == 0
+
+    def test_idle_wsgi_closed(self):
+        policy = CountingIdleGcPolicy(interval=0, max_interval=None)
+        server = WsgiApplication(_get_app(policy, HttpRpc))
+
+        for i in range(2):
+            body = server({
+                'QUERY_STRING': '',
+                'PATH_INFO': '/ping',
+                'REQUEST_METHOD': 'GET',
+                'SERVER_NAME': 'localhost',
+                'wsgi.input': BytesIO(),
+            }, lambda *args: None, "http://null")
+
+            # the client goes away before the response is sent
+            body.close()
+            body.close()
+            assert server._in_flight == 0
+
+        assert policy.generations == [2, 2]
+
+    def test_idle_max_interval(self):
+        policy = CountingIdleGcPolicy(interval=0, max_interval=0)
+        server = NullServer(_get_app(policy))
+
+        server.service.ping()
+        assert policy.generations == [2]
+
+    def test_fd(self):
+        policy = CountingFdGcPolicy(threshold=0, interval=0, check_interval=0)
+        server = NullServer(_get_app(policy))
+
+        server.service.ping()
+        assert policy.generations == [2]
+
+        policy = CountingFdGcPolicy(threshold=1 << 30, interval=0,
+                                                              check_interval=0)
+        server = NullServer(_get_app(policy))
+
+        server.service.ping()
+        if policy.count_fds() is None:
+            assert policy.generations == [2]
+        else:
+            assert policy.generations == []
+
+    def test_freeze(self):
+        if not hasattr(gc, 'freeze'):
+            return
+
+        try:
+            _get_app(GcPolicyBase(freeze=True))
+            assert gc.get_freeze_count() > 0
+        finally:
+            gc.unfreeze()
+
+
+if __name__ == '__main__':
+    unittest.main()
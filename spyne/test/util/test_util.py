@@ -2,8 +2,10 @@
 
 from __future__ import print_function
 
+import gc
 import json
 import decimal
+import weakref
 import unittest
 
 import pytz
@@ -17,11 +19,12 @@ from lxml import etree
 
 from spyne.const import MAX_STRING_FIELD_LENGTH
 
-from spyne.decorator import srpc
+from spyne.decorator import srpc, rpc
 from spyne.application import Application
 
 from spyne.model.complex import XmlAttribute, TypeInfo
 from spyne.model.complex import ComplexModel
+from spyne.model.complex import ComplexModelBase
 from spyne.model.complex import Iterable
 from spyne.model.complex import Array
 from spyne.model.primitive import Decimal
@@ -30,15 +33,20 @@ from spyne.model.primitive import Integer
 from spyne.model.primitive import Unicode
 
 from spyne.service import Service
+from spyne.protocol.soap import Soap11
 
 from spyne.util import AttrDict, AttrDictColl, get_version
 from spyne.util import memoize, memoize_ignore_none, memoize_ignore, memoize_id
+from spyne.util.memo import memoize_bounded, forget_memoized
 
 from spyne.util.protocol import deserialize_request_string
+from spyne.util.protocol import get_protocol_instance
 
 from spyne.util.dictdoc import get_dict_as_object, get_object_as_yaml, \
     get_object_as_json
 from spyne.util.dictdoc import get_object_as_dict
+from spyne.util.dictdoc import get_json_as_object
+from spyne.util.dictdoc import JsonDocument
 from spyne.util.tdict import tdict
 from spyne.util.tlist import tlist
 
@@ -46,6 +54,8 @@ from spyne.util.xml import get_object_as_xml
 from spyne.util.xml import get_xml_as_object
 from spyne.util.xml import get_schema_documents
 from spyne.util.xml import get_validation_schema
+from spyne.util.xml import get_object_as_xml_polymorphic
+from spyne.util.xml import get_xml_as_object_polymorphic
 
 
 class TestUtil(unittest.TestCase):
@@ -169,6 +179,37 @@ class TestXml(unittest.TestCase):
         # as long as it doesn't fail, it's ok.
         get_validation_schema([Punk, Foo])
 
+    def test_polymorphic(self):
+        from spyne.util.xml import _get_polymorphic_application
+
+        class B(ComplexModel):
+            __namespace__ = 'tns'
+            i = Integer
+
+        class D(B):
+            s = Unicode
+
+        elt = get_object_as_xml_polymorphic(D(i=1, s='x'), B)
+        assert elt.tag == '{tns}D'
+        assert elt.attrib['{http://www.w3.org/2001/XMLSchema-instance}type'] \
+                                                                     == 'tns:D'
+
+        o = get_xml_as_object_polymorphic(elt, B)
+        assert type(o) is D
+        assert (o.i, o.s) == (1, 'x')
+
+        # the application behind both calls is built only once
+        app = _get_polymorphic_application(B)
+        assert _get_polymorphic_application(B) is app
+        assert get_xml_as_object_polymorphic(elt, B).s == 'x'
+        assert _get_polymorphic_application(B) is app
+
+        elt = get_object_as_xml_polymorphic(D(i=1, s='x'), B,
+                                                              no_namespace=True)
+        assert elt.tag == 'D'
+        app = _get_polymorphic_application(None)
+        assert _get_polymorphic_application(None) is app
+
 
 class TestCDict(unittest.TestCase):
     def test_cdict(self):
@@ -201,6 +242,44 @@ class TestCDict(unittest.TestCase):
         else:
             raise Exception("Must fail.")
 
+    def test_cdict_mro(self):
+        from spyne.util.cdict import cdict
+
+        class A(object):
+            pass
+
+        class B(A):
+            pass
+
+        class C(object):
+            pass
+
+        class D(B, C):
+            pass
+
+        d = cdict({A: 'a', C: 'c'})
+
+        assert d[D] == 'a'
+        assert dict(d) == {A: 'a', C: 'c'}
+
+        d[B] = 'b'
+        assert d[D] == 'b'
+
+        del d[B]
+        assert d[D] == 'a'
+
+    def test_cdict_listener(self):
+        from spyne.util.cdict import cdict
+
+        changes = []
+        d = cdict({int: 'int'})
+        d.add_listener(lambda: changes.append(len(d)))
+
+        d[str] = 'str'
+        d.update({float: 'float'})
+        d.pop(str)
+        assert changes == [2, 3, 2]
+
 
 class TestTDict(unittest.TestCase):
     def test_tdict_notype(self):
@@ -433,6 +512,167 @@ class TestDictDoc(unittest.TestCase):
             print(c)
             assert o == c
 
+    def test_protocol_instance_cache(self):
+        p1 = get_protocol_instance(JsonDocument, complex_as=list)
+        p2 = get_protocol_instance(JsonDocument, complex_as=list)
+        p3 = get_protocol_instance(JsonDocument, complex_as=dict)
+        assert p1 is p2
+        assert p1 is not p3
+        assert p3.complex_as is dict
+
+        # unhashable arguments bypass the cache
+        p4 = get_protocol_instance(JsonDocument, separators=[',', ':'])
+        p5 = get_protocol_instance(JsonDocument, separators=[',', ':'])
+        assert p4 is not p5
+
+    def test_protocol_instance_reuse(self):
+        class C(ComplexModel):
+            i = Integer
+            s = Unicode
+
+        prot = get_protocol_instance(JsonDocument, ignore_wrappers=True,
+                    complex_as=list, polymorphic=False, indent=None)
+
+        assert get_object_as_json(C(i=5, s='x'), C) == b'[5, "x"]'
+        assert C in prot._attrcache
+
+        o = get_json_as_object(b'{"i": 6, "s": "y"}', C)
+        assert (o.i, o.s) == (6, 'y')
+        assert get_json_as_object(b'{"i": 7}', C).i == 7
+
+
+class TestDictDocTrace(unittest.TestCase):
+    def _get_records(self, trace):
+        import logging
+        from spyne.protocol.dictdoc import hier
+
+        class SomeClass(ComplexModel):
+            i = Integer
+            s = Unicode
+
+        records = []
+        handler = logging.Handler()
+        handler.emit = records.append
+
+        old_trace, hier.TRACE = hier.TRACE, trace
+        old_level = hier.logger.level
+        hier.logger.setLevel(logging.DEBUG)
+        hier.logger.addHandler(handler)
+        try:
+            get_object_as_dict(SomeClass(i=1, s='s'), SomeClass)
+
+        finally:
+            hier.TRACE = old_trace
+            hier.logger.setLevel(old_level)
+            hier.logger.removeHandler(handler)
+
+        return [r for r in records if 'type is' in r.msg]
+
+    def test_trace_off(self):
+        assert len(self._get_records(False)) == 0
+
+    def test_trace_on(self):
+        assert len(self._get_records(True)) == 2
+
+
+class TestLazyDocument(unittest.TestCase):
+    def test_lazy_document(self):
+        from spyne.util.lazydoc import LazyDocument, is_loaded, get_object, \
+            get_raw
+
+        class C(ComplexModel):
+            __namespace__ = "tns"
+            i = Integer
+            s = Unicode
+
+        calls = []
+        def load(raw):
+            calls.append(raw)
+            return get_json_as_object(raw, C, complex_as=dict)
+
+        raw = b'{"i": 5, "s": "x"}'
+        o = LazyDocument(raw, load)
+        assert not is_loaded(o)
+        assert get_raw(o) is raw
+        assert 'unloaded' in repr(o)
+
+        assert isinstance(o, C)
+        assert o.i == 5
+        o.s = 'y'
+        assert calls == [raw]
+        assert is_loaded(o)
+        assert get_raw(o) is None
+        assert get_object(o).s == 'y'
+
+        elt = get_object_as_xml(o, C)
+        assert elt.tag == "{tns}C"
+        assert get_xml_as_object(elt, C).s == 'y'
+
+        assert get_object(5) == 5
+        assert is_loaded(5)
+
+    def test_doc_key(self):
+        from spyne.util.lazydoc import LazyDocument
+
+        class C(ComplexModel):
+            i = Integer
+
+        calls = []
+        def load(raw):
+            calls.append(raw)
+            return C(i=int(json.loads(raw)['i']))
+
+        prot = get_protocol_instance(JsonDocument, ignore_wrappers=True,
+                                                             complex_as=dict)
+        o = LazyDocument('{"i": "6"}', load, prot.get_doc_key(C), json.loads)
+
+        # the stored document is output as is
+        assert get_object_as_json(o, C, complex_as=dict) == b'{"i": "6"}'
+        assert calls == []
+
+        assert get_object_as_json(o, C, complex_as=list) == b'[6]'
+        assert len(calls) == 1
+
+    def test_doc_key_undeclared(self):
+        from spyne.util.lazydoc import LazyDocument, is_loaded
+
+        class Inner(ComplexModel):
+            a = Integer
+            b = Unicode
+            h = Unicode(exc=True)
+
+        class C(ComplexModel):
+            i = Inner
+            l = Array(Inner)
+
+        def load(raw):
+            return get_json_as_object(raw, C, complex_as=dict)
+
+        prot = get_protocol_instance(JsonDocument, ignore_wrappers=True,
+                                                             complex_as=dict)
+        raw = json.dumps({
+            "i": {"a": 1, "b": "x", "h": "hidden", "secret": "leak"},
+            "l": [{"a": 2, "secret": "leak"}],
+            "gone": "leak",
+        })
+        o = LazyDocument(raw, load, prot.get_doc_key(C), json.loads)
+
+        ret = json.loads(get_object_as_json(o, C, complex_as=dict))
+        assert ret == {"i": {"a": 1, "b": "x"}, "l": [{"a": 2}]}
+        assert not is_loaded(o)
+
+        class D(ComplexModel):
+            i = Integer(min_occurs=1)
+            s = Unicode
+
+        o = LazyDocument('{"s": "x"}', lambda raw: D(s='x'),
+                                               prot.get_doc_key(D), json.loads)
+
+        # a missing mandatory field needs the serializer
+        ret = json.loads(get_object_as_json(o, D, complex_as=dict))
+        assert ret == {"i": None, "s": "x"}
+        assert is_loaded(o)
+
 
 class TestAttrDict(unittest.TestCase):
     def test_attr_dict(self):
@@ -596,6 +836,175 @@ class TestMemoization(unittest.TestCase):
         f({})
         assert counter[0] == 3
 
+    def test_memoize_bounded_lru(self):
+        counter = [0]
+        @memoize_bounded(maxsize=2, weak=False)
+        def f(arg):
+            counter[0] += 1
+            return arg
+
+        f(1)
+        f(2)
+        f(1)  # 1 is now the most recently used one
+        f(3)  # evicts 2
+        assert counter[0] == 3
+        assert f.get_stats() == dict(entries=2, hits=1, misses=3, evictions=1)
+
+        f(1)
+        assert counter[0] == 3
+        f(2)
+        assert counter[0] == 4
+
+    def test_memoize_bounded_ignore_none(self):
+        counter = [0]
+        @memoize_bounded(maxsize=2, base=memoize_ignore_none)
+        def f(arg):
+            counter[0] += 1
+
+        f(1)
+        f(1)
+        assert counter[0] == 2
+        assert len(f.memo) == 0
+
+    def test_memoize_weak(self):
+        class SomeClass(object):
+            pass
+
+        @memoize_bounded()
+        def f(cls, prefix='x'):
+            return prefix + cls.__name__
+
+        inst = SomeClass()
+        assert f(SomeClass) == 'xSomeClass'
+        assert f(SomeClass, prefix='y') == 'ySomeClass'
+        assert f(inst.__class__) == 'xSomeClass'
+        assert f.hits == 1
+        assert len(f.memo) == 2
+
+        ref = weakref.ref(SomeClass)
+        del SomeClass, inst
+        gc.collect()
+        assert ref() is None
+
+        # dead entries are purged when the next one is stored
+        f(int)
+        assert len(f.memo) == 1
+
+    def test_memoize_forget(self):
+        class SomeClass(object):
+            pass
+
+        @memoize_bounded()
+        def f(a, b):
+            return 0
+
+        o1, o2 = SomeClass(), SomeClass()
+        f(o1, 1)
+        f(o2, 1)
+        f(o1, 2)
+
+        forget_memoized([o1])
+        assert len(f.memo) == 1
+        f(o2, 1)
+        assert f.misses == 3
+
+    def test_memoize_discard(self):
+        @memoize
+        def f(a, b=None):
+            return a
+
+        f(1)
+        f(1, b=2)
+        f(2)
+
+        f.discard(1)
+        assert len(f.memo) == 2
+        f.discard(1, b=2)
+        assert len(f.memo) == 1
+        f.discard(3)  # no such entry
+        assert len(f.memo) == 1
+
+    def test_memoize_forget_matching(self):
+        class SomeClass(object):
+            pass
+
+        @memoize_bounded()
+        def f(a, b):
+            return 0
+
+        o1, o2 = SomeClass(), SomeClass()
+        f(o1, 1)
+        f(o2, 1)
+        f(o2, o1)
+
+        assert f.get_arguments() == set([o1, o2, 1])
+
+        f.forget_matching(lambda obj: obj is o1)
+        assert len(f.memo) == 1
+        assert f.get_arguments() == set([o2, 1])
+
+    def test_memoize_bounded_threads(self):
+        import threading
+
+        @memoize_bounded()
+        def f(a):
+            return a
+
+        for i in range(512):
+            f(i)
+
+        errors = []
+        done = threading.Event()
+
+        def hit():
+            try:
+                while not done.is_set():
+                    for i in range(512):
+                        f(i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=hit) for _ in range(2)]
+        for t in threads:
+            t.start()
+
+        try:
+            for _ in range(200):
+                f.forget_matching(lambda obj: False)
+                f.get_arguments()
+        except Exception as e:
+            errors.append(e)
+
+        finally:
+            done.set()
+            for t in threads:
+                t.join()
+
+        assert errors == []
+
+    def test_memoize_unregister_application(self):
+        from spyne.util.appreg import unregister_application
+
+        class SomeModel(ComplexModel):
+            s = Unicode
+
+        class SomeService(Service):
+            @rpc(SomeModel)
+            def some_call(ctx, x):
+                pass
+
+        app = Application([SomeService], 'tns.memo',
+                                 in_protocol=Soap11(), out_protocol=Soap11())
+
+        memo = ComplexModelBase.get_simple_type_info_with_prot
+        memo(SomeModel, app.out_protocol)
+        assert memo(SomeModel, app.out_protocol) is \
+                                         memo(SomeModel, app.out_protocol)
+        nentries = len(memo.memo)
+
+        unregister_application(app)
+        assert len(memo.memo) == nentries - 1
+
 
 if __name__ == '__main__':
     unittest.main()
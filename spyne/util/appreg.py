@@ -45,6 +45,11 @@ def unregister_application(app):
     key = (app.tns, app.name)
     del applications[key]
 
+    # don't let memoized entries keyed on this application's protocol
+    # instances outlive it.
+    from spyne.util.memo import forget_memoized
+    forget_memoized([app, app.in_protocol, app.out_protocol])
+
 
 def register_application(app):
     key = (app.tns, app.name)
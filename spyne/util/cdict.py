@@ -20,8 +20,13 @@
 """cdict (ClassDict) is a funny kind of dict that tries to return the values for
 the base classes of a key when the entry for the key is not found. It is not a
 generalized dictionary that can handle any type of key -- it relies on
-spyne.model api to look for classes. It also assumes cdict never changes after
-the first lookup.
+spyne.model api to look for classes.
+
+Base classes are searched in method resolution order and the result of every
+such search is remembered in a separate table, so the dict itself never
+changes during lookup and concurrent lookups are safe. Any modification to
+the dict discards the remembered results and notifies the callables registered
+with :meth:`cdict.add_listener`.
 
 >>> from spyne.util.cdict import cdict
 >>> class A(object):
@@ -44,11 +49,9 @@ fun
 >>> print d[B]
 fun
 >>> print d
-{<class '__main__.A'>: 'fun', <class '__main__.B'>: 'fun', <type 'object'>: 'base'}
+{<class '__main__.A'>: 'fun', <type 'object'>: 'base'}
 >>> print d[C]
 base
->>> print d
-{<class '__main__.A'>: 'fun', <class '__main__.B'>: 'fun', <class '__main__.C'>: 'base', <type 'object'>: 'base'}
 >>> print d[D]
 *** KeyError: <class __main__.D at 0x8d92c0>
 >>>
@@ -57,25 +60,69 @@ base
 import logging
 logger = logging.getLogger(__name__)
 
+from inspect import getmro
+
+
+_MISSING = object()
+
+
 class cdict(dict):
+    def __init__(self, *args, **kwargs):
+        super(cdict, self).__init__(*args, **kwargs)
+        self._resolved = {}
+        self._listeners = []
+
     def __getitem__(self, cls):
-        try:
-            return dict.__getitem__(self, cls)
-
-        except KeyError as e:
-            if not hasattr(cls, '__bases__'):
-                cls = cls.__class__
-
-            for b in reversed(cls.__bases__):
-                try:
-                    retval = self[b]
-                    # this is why a cdict instance must never be modified after
-                    # the first lookup
-                    self[cls] = retval
-                    return retval
-                except KeyError:
-                    pass
-            raise e
+        retval = dict.get(self, cls, _MISSING)
+        if retval is not _MISSING:
+            return retval
+
+        retval = self._resolved.get(cls, _MISSING)
+        if retval is not _MISSING:
+            return retval
+
+        retval = self.resolve(cls, _MISSING)
+        if retval is _MISSING:
+            raise KeyError(cls)
+
+        # a single assignment to a dict that is never iterated, so concurrent
+        # resolutions of the same key are harmless.
+        self._resolved[cls] = retval
+        return retval
+
+    def resolve(self, cls, d=None):
+        """Returns the value for ``cls`` or for its nearest base class without
+        remembering the result. This does not keep a reference to ``cls``, so
+        it's what callers that cache the result elsewhere should use."""
+
+        retval = dict.get(self, cls, _MISSING)
+        if retval is not _MISSING:
+            return retval
+
+        if hasattr(cls, '__bases__'):
+            bases = getmro(cls)[1:]
+        else:
+            # instances are looked up using the bases of their class
+            bases = getmro(cls.__class__)[1:]
+
+        for b in bases:
+            retval = dict.get(self, b, _MISSING)
+            if retval is not _MISSING:
+                return retval
+
+        return d
+
+    def add_listener(self, callback):
+        """Registers a callable that is called without arguments after every
+        modification to the dict. Callers that cache values resolved from the
+        dict use this to invalidate their caches."""
+
+        self._listeners.append(callback)
+
+    def _changed(self):
+        self._resolved = {}
+        for callback in self._listeners:
+            callback()
 
     def get(self, k, d=None):
         try:
@@ -83,3 +130,34 @@ class cdict(dict):
 
         except KeyError:
             return d
+
+    def __setitem__(self, k, v):
+        dict.__setitem__(self, k, v)
+        self._changed()
+
+    def __delitem__(self, k):
+        dict.__delitem__(self, k)
+        self._changed()
+
+    def update(self, *args, **kwargs):
+        dict.update(self, *args, **kwargs)
+        self._changed()
+
+    def setdefault(self, k, d=None):
+        retval = dict.setdefault(self, k, d)
+        self._changed()
+        return retval
+
+    def pop(self, k, *args):
+        retval = dict.pop(self, k, *args)
+        self._changed()
+        return retval
+
+    def popitem(self):
+        retval = dict.popitem(self)
+        self._changed()
+        return retval
+
+    def clear(self):
+        dict.clear(self)
+        self._changed()
@@ -18,6 +18,7 @@
 #
 
 from spyne.context import FakeContext
+from spyne.util.protocol import get_protocol_instance
 
 from spyne.protocol.dictdoc import HierDictDocument
 from spyne.protocol.dictdoc import SimpleDictDocument
@@ -77,8 +78,8 @@ class _UtilProtocol(HierDictDocument):
 def get_doc_as_object(d, cls, ignore_wrappers=True, complex_as=list,
                                     protocol=_UtilProtocol, protocol_inst=None):
     if protocol_inst is None:
-        protocol_inst = protocol(ignore_wrappers=ignore_wrappers,
-                                                          complex_as=complex_as)
+        protocol_inst = get_protocol_instance(protocol,
+                         ignore_wrappers=ignore_wrappers, complex_as=complex_as)
 
     return protocol_inst._doc_to_object(None, cls, d)
 
@@ -93,8 +94,8 @@ def get_object_as_doc(o, cls=None, ignore_wrappers=True, complex_as=dict,
         cls = o.__class__
 
     if protocol_inst is None:
-        protocol_inst = protocol(ignore_wrappers=ignore_wrappers,
-                                                          complex_as=complex_as)
+        protocol_inst = get_protocol_instance(protocol,
+                         ignore_wrappers=ignore_wrappers, complex_as=complex_as)
 
     retval = protocol_inst._object_to_doc(cls, o)
 
@@ -111,8 +112,8 @@ def get_object_as_simple_dict(o, cls=None, hier_delim='.', prefix=None):
     if cls is None:
         cls = o.__class__
 
-    return SimpleDictDocument(hier_delim=hier_delim) \
-                                   .object_to_simple_dict(cls, o, prefix=prefix)
+    prot = get_protocol_instance(SimpleDictDocument, hier_delim=hier_delim)
+    return prot.object_to_simple_dict(cls, o, prefix=prefix)
 
 
 def get_object_as_json(o, cls=None, ignore_wrappers=True, complex_as=list,
@@ -120,8 +121,9 @@ def get_object_as_json(o, cls=None, ignore_wrappers=True, complex_as=list,
     if cls is None:
         cls = o.__class__
 
-    prot = JsonDocument(ignore_wrappers=ignore_wrappers, complex_as=complex_as,
-                               polymorphic=polymorphic, indent=indent, **kwargs)
+    prot = get_protocol_instance(JsonDocument, ignore_wrappers=ignore_wrappers,
+                              complex_as=complex_as, polymorphic=polymorphic,
+                                                        indent=indent, **kwargs)
     ctx = FakeContext(out_document=[prot._object_to_doc(cls, o)])
     prot.create_out_string(ctx, encoding)
     return b''.join(ctx.out_string)
@@ -132,8 +134,9 @@ def get_object_as_json_doc(o, cls=None, ignore_wrappers=True, complex_as=list,
     if cls is None:
         cls = o.__class__
 
-    prot = JsonDocument(ignore_wrappers=ignore_wrappers, complex_as=complex_as,
-                               polymorphic=polymorphic, indent=indent, **kwargs)
+    prot = get_protocol_instance(JsonDocument, ignore_wrappers=ignore_wrappers,
+                              complex_as=complex_as, polymorphic=polymorphic,
+                                                        indent=indent, **kwargs)
 
     return prot._object_to_doc(cls, o)
 
@@ -143,8 +146,8 @@ def get_object_as_yaml(o, cls=None, ignore_wrappers=False, complex_as=dict,
     if cls is None:
         cls = o.__class__
 
-    prot = YamlDocument(ignore_wrappers=ignore_wrappers, complex_as=complex_as,
-                                                        polymorphic=polymorphic)
+    prot = get_protocol_instance(YamlDocument, ignore_wrappers=ignore_wrappers,
+                                 complex_as=complex_as, polymorphic=polymorphic)
     ctx = FakeContext(out_document=[prot._object_to_doc(cls,o)])
     prot.create_out_string(ctx, encoding)
     return b''.join(ctx.out_string)
@@ -155,8 +158,8 @@ def get_object_as_yaml_doc(o, cls=None, ignore_wrappers=False, complex_as=dict,
     if cls is None:
         cls = o.__class__
 
-    prot = YamlDocument(ignore_wrappers=ignore_wrappers, complex_as=complex_as,
-                                                        polymorphic=polymorphic)
+    prot = get_protocol_instance(YamlDocument, ignore_wrappers=ignore_wrappers,
+                                 complex_as=complex_as, polymorphic=polymorphic)
     return prot._object_to_doc(cls, o)
 
 
@@ -165,7 +168,8 @@ def get_object_as_msgpack(o, cls=None, ignore_wrappers=False, complex_as=dict,
     if cls is None:
         cls = o.__class__
 
-    prot = MessagePackDocument(ignore_wrappers=ignore_wrappers,
+    prot = get_protocol_instance(MessagePackDocument,
+                                 ignore_wrappers=ignore_wrappers,
                                  complex_as=complex_as, polymorphic=polymorphic)
     ctx = FakeContext(out_document=[prot._object_to_doc(cls,o)])
     prot.create_out_string(ctx)
@@ -177,7 +181,8 @@ def get_object_as_msgpack_doc(o, cls=None, ignore_wrappers=False,
     if cls is None:
         cls = o.__class__
 
-    prot = MessagePackDocument(ignore_wrappers=ignore_wrappers,
+    prot = get_protocol_instance(MessagePackDocument,
+                                 ignore_wrappers=ignore_wrappers,
                                  complex_as=complex_as, polymorphic=polymorphic)
 
     return prot._object_to_doc(cls, o)
@@ -188,7 +193,7 @@ def json_loads(s, cls, protocol=JsonDocument, **kwargs):
         return None
     if s == '':
         return None
-    prot = protocol(**kwargs)
+    prot = get_protocol_instance(protocol, **kwargs)
     ctx = FakeContext(in_string=[s])
     prot.create_in_document(ctx)
     return prot._doc_to_object(None, cls, ctx.in_document,
@@ -203,7 +208,8 @@ def yaml_loads(s, cls, protocol=YamlDocument, ignore_wrappers=False, **kwargs):
         return None
     if s == '' or s == b'':
         return None
-    prot = protocol(ignore_wrappers=ignore_wrappers, **kwargs)
+    prot = get_protocol_instance(protocol, ignore_wrappers=ignore_wrappers,
+                                                                       **kwargs)
     ctx = FakeContext(in_string=[s])
     prot.create_in_document(ctx)
     retval = prot._doc_to_object(None, cls, ctx.in_document,
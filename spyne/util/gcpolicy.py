@@ -0,0 +1,278 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+
+"""The ``spyne.util.gcpolicy`` module contains the policies that decide when
+Spyne runs the garbage collector explicitly.
+
+Spyne historically ran a full ``gc.collect()`` from ``MethodContext.close()``
+to have file descriptors returned in a timely manner. A full collection can
+take tens of milliseconds on large heaps, which is paid by whichever request
+happens to close at that moment. The policies here let you pick a cheaper
+trade-off. Pass one to the :class:`spyne.application.Application` constructor
+as ``gc_policy``.
+
+Every collection fires the ``gc_collect`` event of the application's event
+manager with the policy, the collected generation, the time it took in seconds
+and the number of unreachable objects found. Cumulative figures are in the
+``stats`` attribute of the policy.
+"""
+
+import logging
+logger = logging.getLogger(__name__)
+
+import gc
+import os
+
+from time import time
+
+from spyne import const
+
+
+class GcStats(object):
+    """Cumulative garbage collection figures of a policy."""
+
+    __slots__ = ('collections', 'collected', 'time_total', 'time_max',
+                                                                   'last_run')
+
+    def __init__(self):
+        self.collections = 0
+        self.collected = 0
+        self.time_total = 0.0
+        self.time_max = 0.0
+        self.last_run = 0.0
+
+    def as_dict(self):
+        return dict([(k, getattr(self, k)) for k in self.__slots__])
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, ', '.join(
+                    ['%s=%r' % (k, getattr(self, k)) for k in self.__slots__]))
+
+
+class GcPolicyBase(object):
+    """The base class for gc policies. It never runs the collector explicitly,
+    leaving it entirely to the interpreter.
+
+    :param generation: The generation to collect. Pass 0 or 1 to limit
+        explicit collections to the young generations, which are much cheaper
+        than a full collection.
+    :param freeze: When True, moves every object that exists when the
+        application is initialized to the permanent generation via
+        ``gc.freeze()``, so that later collections don't have to scan them.
+        Only works with Python 3.7 and newer.
+    """
+
+    interval = None
+
+    wants_idle = False
+    """Whether the transports should report idle moments via :meth:`idle`."""
+
+    def __init__(self, generation=2, freeze=False):
+        self.generation = generation
+        self.freeze = freeze
+        self.stats = GcStats()
+        self.app = None
+
+    def initialize(self, app):
+        """Called once by the application at the end of its initialization."""
+
+        self.app = app
+
+        if self.freeze:
+            self.freeze_heap()
+
+    def context_closed(self, ctx):
+        """Called from ``MethodContext.close()``."""
+
+    def idle(self):
+        """Called by transports when they have no requests in flight."""
+
+    def freeze_heap(self):
+        """Runs a full collection and moves all surviving objects to the
+        permanent generation. Call this again after e.g. forking worker
+        processes, if needed."""
+
+        if not hasattr(gc, 'freeze'):
+            logger.warning("gc.freeze() is not supported by this interpreter")
+            return
+
+        gc.collect()
+        gc.freeze()
+
+        logger.debug("Froze %d objects", gc.get_freeze_count())
+
+    def collect(self, generation=None):
+        """Runs the collector for the given generation and records how long it
+        took. Returns the number of unreachable objects found."""
+
+        if generation is None:
+            generation = self.generation
+
+        t = time()
+        if generation >= 2:
+            retval = gc.collect()
+        else:
+            retval = gc.collect(generation)
+        dt = time() - t
+
+        stats = self.stats
+        stats.collections += 1
+        stats.collected += retval
+        stats.time_total += dt
+        if dt > stats.time_max:
+            stats.time_max = dt
+        stats.last_run = t
+
+        logger.debug("gc.collect(%d) took around %dms.", generation,
+                                                          round(dt, 2) * 1000)
+
+        if self.app is not None:
+            self.app.event_manager.fire_event('gc_collect', self, generation,
+                                                                   dt, retval)
+
+        return retval
+
+    def _get_interval(self):
+        interval = self.interval
+        if interval is None:
+            interval = const.MIN_GC_INTERVAL
+        return interval
+
+
+class IntervalGcPolicy(GcPolicyBase):
+    """Runs the collector from ``MethodContext.close()`` when at least
+    ``interval`` seconds passed since the last collection. This is the
+    default policy.
+
+    :param interval: Minimum time in seconds between two collections. Defaults
+        to :data:`spyne.const.MIN_GC_INTERVAL`, which is read every time.
+    """
+
+    def __init__(self, interval=None, generation=2, freeze=False):
+        super(IntervalGcPolicy, self).__init__(generation=generation,
+                                                                 freeze=freeze)
+        self.interval = interval
+
+    def context_closed(self, ctx):
+        if (time() - self.stats.last_run) > self._get_interval():
+            self.collect()
+
+
+class IdleGcPolicy(GcPolicyBase):
+    """Runs the collector only between requests, when the transport reports
+    that it has no requests in flight. WsgiApplication and the Twisted http
+    transport support this.
+
+    :param interval: Minimum time in seconds between two collections. Defaults
+        to :data:`spyne.const.MIN_GC_INTERVAL`, which is read every time.
+    :param max_interval: When the server never becomes idle, a collection is
+        run from ``MethodContext.close()`` once this many seconds pass since
+        the last one. ``None`` disables this.
+    """
+
+    wants_idle = True
+
+    def __init__(self, interval=None, max_interval=60.0, generation=2,
+                                                                 freeze=False):
+        super(IdleGcPolicy, self).__init__(generation=generation,
+                                                                 freeze=freeze)
+        self.interval = interval
+        self.max_interval = max_interval
+
+    def context_closed(self, ctx):
+        if self.max_interval is not None and \
+                         (time() - self.stats.last_run) > self.max_interval:
+            self.collect()
+
+    def idle(self):
+        if (time() - self.stats.last_run) > self._get_interval():
+            self.collect()
+
+
+def _get_fd_limit():
+    try:
+        import resource
+    except ImportError:
+        return 1024
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return 1024
+
+    return soft
+
+
+def _get_fd_dir():
+    for path in ('/proc/self/fd', '/dev/fd'):
+        if os.path.isdir(path):
+            return path
+
+
+class FdGcPolicy(GcPolicyBase):
+    """Runs the collector from ``MethodContext.close()`` only when the process
+    holds more than ``threshold`` open file descriptors, which is what the
+    collections are for in the first place. When open file descriptors can't
+    be counted on this platform, it falls back to :class:`IntervalGcPolicy`'s
+    behavior.
+
+    :param threshold: The number of open file descriptors that triggers a
+        collection. Defaults to half of the soft ``RLIMIT_NOFILE`` limit.
+    :param interval: Minimum time in seconds between two collections, so that
+        a process that legitimately holds a lot of descriptors doesn't collect
+        on every request. Defaults to :data:`spyne.const.MIN_GC_INTERVAL`.
+    :param check_interval: Minimum time in seconds between two descriptor
+        counts.
+    """
+
+    def __init__(self, threshold=None, interval=None, check_interval=0.1,
+                                                  generation=2, freeze=False):
+        super(FdGcPolicy, self).__init__(generation=generation, freeze=freeze)
+
+        if threshold is None:
+            threshold = _get_fd_limit() // 2
+
+        self.threshold = threshold
+        self.interval = interval
+        self.check_interval = check_interval
+
+        self._fd_dir = _get_fd_dir()
+        self._last_check = 0.0
+
+    def count_fds(self):
+        """Returns the number of open file descriptors or None if they can't
+        be counted."""
+
+        if self._fd_dir is None:
+            return None
+
+        return len(os.listdir(self._fd_dir))
+
+    def context_closed(self, ctx):
+        t = time()
+        if (t - self.stats.last_run) <= self._get_interval():
+            return
+
+        if self._fd_dir is not None:
+            if (t - self._last_check) <= self.check_interval:
+                return
+
+            self._last_check = t
+            if self.count_fds() <= self.threshold:
+                return
+
+        self.collect()
@@ -0,0 +1,151 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+#
+
+"""The ``spyne.util.lazydoc`` module contains :class:`LazyDocument`, a proxy
+that keeps a value in its serialized form until it's first accessed."""
+
+
+_MISSING = object()
+
+
+class LazyDocument(object):
+    """A proxy for an object that is deserialized on first access. Attribute
+    access, item access, iteration, comparison and ``isinstance()`` checks are
+    all forwarded to the deserialized object.
+
+    :param raw: The serialized value.
+    :param loader: A callable that returns the object that ``raw`` represents.
+    :param doc_key: A hashable that identifies the document format of ``raw``.
+        It's compared with the return value of protocols'
+        ``get_doc_key(cls)``. Protocols that produce the same kind of document
+        use what ``doc_loader`` returns instead of serializing the object.
+    :param doc_loader: A callable that returns the document that ``raw``
+        contains.
+    """
+
+    __slots__ = ('_lazy_raw', '_lazy_loader', '_lazy_doc_key',
+                                            '_lazy_doc_loader', '_lazy_value')
+
+    def __init__(self, raw, loader, doc_key=None, doc_loader=None):
+        object.__setattr__(self, '_lazy_raw', raw)
+        object.__setattr__(self, '_lazy_loader', loader)
+        object.__setattr__(self, '_lazy_doc_key', doc_key)
+        object.__setattr__(self, '_lazy_doc_loader', doc_loader)
+        object.__setattr__(self, '_lazy_value', _MISSING)
+
+    def _lazy_load(self):
+        retval = self._lazy_value
+        if retval is _MISSING:
+            retval = self._lazy_loader(self._lazy_raw)
+            object.__setattr__(self, '_lazy_value', retval)
+        return retval
+
+    @property
+    def __class__(self):
+        return self._lazy_load().__class__
+
+    def __getattr__(self, key):
+        # only called for keys that are not in __slots__
+        return getattr(self._lazy_load(), key)
+
+    def __setattr__(self, key, value):
+        setattr(self._lazy_load(), key, value)
+
+    def __delattr__(self, key):
+        delattr(self._lazy_load(), key)
+
+    def __getitem__(self, key):
+        return self._lazy_load()[key]
+
+    def __setitem__(self, key, value):
+        self._lazy_load()[key] = value
+
+    def __delitem__(self, key):
+        del self._lazy_load()[key]
+
+    def __contains__(self, key):
+        return key in self._lazy_load()
+
+    def __iter__(self):
+        return iter(self._lazy_load())
+
+    def __len__(self):
+        return len(self._lazy_load())
+
+    def __bool__(self):
+        return bool(self._lazy_load())
+
+    __nonzero__ = __bool__
+
+    def __eq__(self, other):
+        return self._lazy_load() == get_object(other)
+
+    def __ne__(self, other):
+        return self._lazy_load() != get_object(other)
+
+    def __hash__(self):
+        return hash(self._lazy_load())
+
+    def __repr__(self):
+        retval = self._lazy_value
+        if retval is _MISSING:
+            return "<%s unloaded %r>" % (LazyDocument.__name__, self._lazy_raw)
+        return repr(retval)
+
+
+def is_loaded(inst):
+    """Returns ``False`` when the given object is a :class:`LazyDocument`
+    that was not accessed yet, ``True`` otherwise."""
+
+    return not (type(inst) is LazyDocument and inst._lazy_value is _MISSING)
+
+
+def get_object(inst):
+    """Returns the object that the given :class:`LazyDocument` stands for,
+    deserializing it if needed. Other objects are returned as they are."""
+
+    if type(inst) is LazyDocument:
+        return inst._lazy_load()
+    return inst
+
+
+def get_raw(inst):
+    """Returns the serialized value of a :class:`LazyDocument` that was not
+    accessed yet, ``None`` otherwise."""
+
+    if type(inst) is LazyDocument and inst._lazy_value is _MISSING:
+        return inst._lazy_raw
+    return None
+
+
+def has_document(inst, doc_key):
+    """Returns whether the given object is a :class:`LazyDocument` that was
+    not accessed yet and whose ``doc_key`` is equal to the given one."""
+
+    return type(inst) is LazyDocument and inst._lazy_value is _MISSING \
+                                      and inst._lazy_doc_key is not None \
+                                      and inst._lazy_doc_key == doc_key
+
+
+def get_document(inst):
+    """Returns the document that the given :class:`LazyDocument` contains,
+    without deserializing it to an object. Only call this after
+    :func:`has_document` returns ``True``."""
+
+    return inst._lazy_doc_loader(inst._lazy_raw)
@@ -20,10 +20,17 @@
 """The module for memoization stuff.
 
 When you have memory leaks in your daemon, the reason could very well be
-reckless usage of the tools here.
-
-These are NOT thread-safe. If you are relying on exactly-one-execution-per-key
-behavior in a multithreaded environment, roll your own stuff.
+reckless usage of the tools here. Use the ``maxsize`` and ``weak`` arguments
+(see :func:`memoize_bounded`) to keep caches whose keys are classes or
+protocol instances from growing without limit.
+
+The memoizers derived from :class:`memoize` can be shared between threads:
+every one of them has a reentrant lock that is held while storing results,
+reordering the entries of bounded caches on hits and walking the cache in
+methods like :meth:`memoize.forget`. Misses call the memoized function with
+that lock held, so each key is computed once, but the memoized functions
+should not wait on other threads. Hits that don't need reordering don't take
+the lock. :func:`memoize_first` has no locking at all.
 """
 
 
@@ -32,27 +39,47 @@ logger = logging.getLogger(__name__)
 
 import threading
 
+from weakref import ref as weakref_ref, WeakSet
+from collections import OrderedDict
+
 
 MEMOIZATION_STATS_LOG_INTERVAL = 60.0
 
+MEMOIZE_DEFAULT_MAX_SIZE = 4096
+"""The default number of entries kept by memoizers created by
+:func:`memoize_bounded`."""
+
+_MISSING = object()
+
 
 def _log_all():
     logger.info("%d memoizers", len(memoize.registry))
-    for memo in memoize.registry:
-        logger.info("%r: %d entries.", memo.func, len(memo.memo))
+    for memo in list(memoize.registry):
+        _log_memo(memo)
+
+
+def _log_memo(memo):
+    if isinstance(memo, memoize):
+        logger.info("%r: %d entries, %d hits, %d misses, %d evictions.",
+                       memo.func, len(memo.memo), memo.hits, memo.misses,
+                                                                memo.evictions)
+    else:
+        logger.info("%r: %d entries.", memo.func, int(hasattr(memo, 'memo')))
 
 
 def _log_func(func):
-    for memo in memoize.registry:
-        if memo.func is func.func.im_self.func:
+    func = getattr(func, '__func__', func)
+    for memo in list(memoize.registry):
+        if memo is func or memo.func is func:
             break
     else:
         logger.error("%r not found in memoization regisry", func)
         return
 
-    logger.info("%r: %d entries.", memo.func, len(memo.memo))
-    for k, v in memo.memo.items():
-        logger.info("\t%r: %r", k, v)
+    _log_memo(memo)
+    if isinstance(memo, memoize):
+        for k, v in list(memo.memo.items()):
+            logger.info("\t%r: %r", k, v)
 
 
 def start_memoization_stats_logger(func=None):
@@ -71,34 +98,250 @@ def start_memoization_stats_logger(func=None):
     t.start()
 
 
+def _weaken(obj):
+    # __weakrefoffset__ is zero for types whose instances can't be weakly
+    # referenced, like str, int or tuple. Checking it is way cheaper than
+    # catching the TypeError from weakref.ref().
+    if type(obj).__weakrefoffset__:
+        return weakref_ref(obj)
+    return obj
+
+
+def _key_items(key):
+    args, kwargs = key
+    for a in args:
+        yield a
+    for _, v in kwargs:
+        yield v
+
+
+if hasattr(OrderedDict, 'move_to_end'):
+    def _move_to_end(memo, key):
+        memo.move_to_end(key)
+
+else:  # Python 2
+    def _move_to_end(memo, key):
+        memo[key] = memo.pop(key)
+
+
+def _deref(obj):
+    if type(obj) is weakref_ref:
+        return obj()
+    return obj
+
+
 class memoize(object):
-    """A memoization decorator that keeps caching until reset."""
+    """A memoization decorator that keeps caching until reset.
+
+    :param func: The function to memoize.
+    :param maxsize: When not ``None``, the least recently used entries are
+        evicted once the cache grows beyond this many entries.
+    :param weak: When ``True``, arguments that support weak references (e.g.
+        classes or protocol instances) are not kept alive by the cache.
+        Entries that refer to garbage collected objects are dropped.
+
+    Hit, miss and eviction counts are kept in the ``hits``, ``misses`` and
+    ``evictions`` attributes and are reported by
+    :func:`start_memoization_stats_logger`.
+    """
 
-    registry = []
+    registry = WeakSet()
 
-    def __init__(self, func):
+    def __init__(self, func, maxsize=None, weak=False):
         self.func = func
-        self.memo = {}
+        self.maxsize = maxsize
+        self.weak = weak
         self.lock = threading.RLock()
-        memoize.registry.append(self)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._dead = []
+        self.memo = self._new_memo()
+
+        memoize.registry.add(self)
+
+    def _new_memo(self):
+        if self.maxsize is None:
+            return {}
+        return OrderedDict()
 
     def __call__(self, *args, **kwargs):
         key = self.get_key(args, kwargs)
-        # we hope that gil makes this comparison is race-free
-        if not key in self.memo:
-            with self.lock:
-                # make sure the situation hasn't changed after lock acq
-                if not key in self.memo:
-                    value = self.func(*args, **kwargs)
-                    self.memo[key] = value
-                    return value
-        return self.memo.get(key)
+
+        # we hope that gil makes this lookup race-free
+        memo = self.memo
+        value = memo.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+            if self.maxsize is not None:
+                self._touch(memo, key)
+            return value
+
+        with self.lock:
+            # make sure the situation hasn't changed after lock acq
+            memo = self.memo
+            value = memo.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            value = self.func(*args, **kwargs)
+            if self.should_store(value):
+                self._store(key, value)
+
+            return value
+
+    def _touch(self, memo, key):
+        """Marks the given key as the most recently used one."""
+
+        # reordering while another thread walks the memo in e.g. forget()
+        # would break its iteration, so this needs the lock too.
+        with self.lock:
+            try:
+                _move_to_end(memo, key)
+            except KeyError:
+                pass  # evicted by another thread in the meantime
+
+    def _store(self, key, value):
+        if self._dead:
+            self._purge_dead()
+
+        if self.weak:
+            # the refs in lookup keys are created without callbacks as they
+            # are thrown away right after the lookup. the stored ones need one
+            # so that we know when to purge entries.
+            args, kwargs = key
+            key = (
+                tuple([self._weaken_stored(a) for a in args]),
+                tuple([(k, self._weaken_stored(v)) for k, v in kwargs]),
+            )
+
+        memo = self.memo
+        memo[key] = value
+
+        maxsize = self.maxsize
+        if maxsize is not None:
+            while len(memo) > maxsize:
+                memo.popitem(last=False)
+                self.evictions += 1
+
+    def _weaken_stored(self, obj):
+        if type(obj) is weakref_ref:
+            return weakref_ref(obj(), self._dead.append)
+        return obj
+
+    def _purge_dead(self):
+        # called with the lock held.
+        del self._dead[:]
+
+        memo = self.memo
+        for key in [k for k in memo if any(type(a) is weakref_ref and
+                                     a() is None for a in _key_items(k))]:
+            del memo[key]
+
+    def should_store(self, value):
+        """Returns whether the given return value should be memoized."""
+        return True
 
     def get_key(self, args, kwargs):
+        if self.weak:
+            if kwargs:
+                return tuple([_weaken(a) for a in args]), \
+                             tuple([(k, _weaken(v)) for k, v in kwargs.items()])
+            # _weaken() inlined, this is the hot path.
+            return tuple([weakref_ref(a) if type(a).__weakrefoffset__ else a
+                                                             for a in args]), ()
+
         return tuple(args), tuple(kwargs.items())
 
+    def forget(self, objects):
+        """Drops every entry whose key refers to any of the given objects.
+
+        :param objects: An iterable of objects. They are compared by identity.
+        """
+
+        ids = set([id(o) for o in objects])
+        if len(ids) == 0:
+            return
+
+        self.forget_matching(lambda obj: id(obj) in ids)
+
+    def forget_matching(self, predicate):
+        """Drops every entry whose key has an argument for which the given
+        callable returns ``True``."""
+
+        with self.lock:
+            memo = self.memo
+            for key in [k for k in memo if any(predicate(_deref(a))
+                                                    for a in _key_items(k))]:
+                del memo[key]
+
+    def get_arguments(self):
+        """Returns a set of the arguments that the cached entries were called
+        with. Garbage collected arguments are skipped."""
+
+        with self.lock:
+            retval = set()
+            for k in self.memo:
+                for a in _key_items(k):
+                    a = _deref(a)
+                    if a is not None:
+                        retval.add(a)
+            return retval
+
+    def discard(self, *args, **kwargs):
+        """Drops the entry for the given arguments, if any."""
+
+        key = self.get_key(args, kwargs)
+        with self.lock:
+            self.memo.pop(key, None)
+
+    def get_stats(self):
+        """Returns a dict with entry, hit, miss and eviction counts."""
+
+        return dict(entries=len(self.memo), hits=self.hits,
+                            misses=self.misses, evictions=self.evictions)
+
     def reset(self):
-        self.memo = {}
+        self.memo = self._new_memo()
+
+
+def memoize_bounded(maxsize=MEMOIZE_DEFAULT_MAX_SIZE, weak=True,
+                                                                  base=memoize):
+    """Returns a memoization decorator that keeps at most ``maxsize`` entries
+    and doesn't keep its arguments alive. e.g.: ::
+
+        @memoize_bounded(maxsize=128, base=memoize_ignore_none)
+        def get_thing(cls):
+            ...
+
+    :param maxsize: The maximum number of entries to keep.
+    :param weak: Whether to hold arguments by weak references.
+    :param base: The memoizer class to use, ``memoize`` or one of its
+        subclasses.
+    """
+
+    def wrapper(func):
+        return base(func, maxsize=maxsize, weak=weak)
+
+    return wrapper
+
+
+def forget_memoized(objects):
+    """Drops entries whose keys refer to any of the given objects from every
+    memoizer.
+
+    This is called when an application gets unregistered, so that entries
+    keyed on its protocol instances don't outlive it.
+    """
+
+    objects = list(objects)
+    for memo in list(memoize.registry):
+        if isinstance(memo, memoize) and not isinstance(memo, memoize_id):
+            memo.forget(objects)
 
 
 class memoize_first(object):
@@ -110,7 +353,7 @@ class memoize_first(object):
     def __init__(self, func):
         self.func = func
         self.lock = threading.RLock()
-        memoize.registry.append(self)
+        memoize.registry.add(self)
 
     def __call__(self, *args, **kwargs):
         if not hasattr(self, 'memo'):
@@ -134,19 +377,8 @@ def memoize_ignore(values):
                        "memoize_ignore requires an iterable of values to ignore"
 
     class _memoize_ignored(memoize):
-        def __call__(self, *args, **kwargs):
-            key = self.get_key(args, kwargs)
-            # we hope that gil makes this comparison is race-free
-            if not key in self.memo:
-                with self.lock:
-                    # make sure the situation hasn't changed after lock acq
-                    if not key in self.memo:
-                        value = self.func(*args, **kwargs)
-                        if not value in values:
-                            self.memo[key] = value
-
-                        return value
-            return self.memo.get(key)
+        def should_store(self, value):
+            return not (value in values)
 
     return _memoize_ignored
 
@@ -156,19 +388,8 @@ class memoize_ignore_none(memoize):
     function returns `None`, the value is returned but not memoized.
     """
 
-    def __call__(self, *args, **kwargs):
-        key = self.get_key(args, kwargs)
-        # we hope that gil makes this comparison is race-free
-        if not key in self.memo:
-            with self.lock:
-                # make sure the situation hasn't changed after lock acq
-                if not key in self.memo:
-                    value = self.func(*args, **kwargs)
-                    if not (value is None):
-                        self.memo[key] = value
-
-                    return value
-        return self.memo.get(key)
+    def should_store(self, value):
+        return not (value is None)
 
 
 class memoize_id(memoize):
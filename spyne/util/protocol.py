@@ -21,6 +21,11 @@
 
 from spyne import MethodContext
 from spyne.server import ServerBase
+from spyne.util.memo import memoize_bounded
+
+
+PROTOCOL_CACHE_MAX_SIZE = 256
+"""The number of protocol instances kept by :func:`get_protocol_instance`."""
 
 
 def deserialize_request_string(string, app):
@@ -36,3 +41,26 @@ def deserialize_request_string(string, app):
     server.get_in_object(ctx)
 
     return ctx.in_object
+
+
+@memoize_bounded(maxsize=PROTOCOL_CACHE_MAX_SIZE)
+def _get_protocol_instance(protocol, **kwargs):
+    return protocol(**kwargs)
+
+
+def get_protocol_instance(protocol, **kwargs):
+    """Returns an instance of the given protocol class constructed with the
+    given arguments. Instances are cached, so calling this again with the same
+    arguments returns the same instance along with the per-class caches it has
+    built so far.
+
+    The returned instance is shared, so it must not be modified. Unhashable
+    arguments bypass the cache.
+    """
+
+    try:
+        hash(tuple(kwargs.values()))
+    except TypeError:
+        return protocol(**kwargs)
+
+    return _get_protocol_instance(protocol, **kwargs)
@@ -0,0 +1,85 @@
+
+#
+# spyne - Copyright (C) Spyne contributors.
+#
+# This library is free software; you can redistribute it and/or
+# modify it under the terms of the GNU Lesser General Public
+# License as published by the Free Software Foundation; either
+# version 2.1 of the License, or (at your option) any later version.
+#
+# This library is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+# Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public
+# License along with this library; if not, write to the Free Software
+# Foundation, Inc., 51 Franklin Street, Fifth Floor, Boston, MA  02110-1301
+
+"""The ``spyne.util.stats`` module contains the counters that the worker pools
+in Spyne keep about their queues."""
+
+
+class QueueStats(object):
+    """Queue depth and latency counters of a job queue that feeds a pool of
+    workers.
+
+    Latencies are in seconds and include the time spent waiting in the queue.
+    Subclasses add their own counters to ``__slots__``. The counters are not
+    synchronized, the owner of the instance is expected to take care of that.
+    """
+
+    __slots__ = ('queued', 'max_queued', 'running', 'submitted', 'completed',
+                                     'failed', 'latency_total', 'latency_max')
+
+    def __init__(self):
+        for k in self.get_fields():
+            setattr(self, k, 0)
+
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    @classmethod
+    def get_fields(cls):
+        """Returns the names of the counters in the order of declaration."""
+
+        retval = []
+        for c in reversed(cls.__mro__):
+            retval.extend(c.__dict__.get('__slots__', ()))
+        return retval
+
+    def job_queued(self):
+        self.queued += 1
+        if self.queued > self.max_queued:
+            self.max_queued = self.queued
+
+    def job_started(self):
+        self.queued -= 1
+        self.running += 1
+
+    def job_done(self, failed, latency):
+        self.running -= 1
+        if failed:
+            self.failed += 1
+        else:
+            self.completed += 1
+
+        self.latency_total += latency
+        if latency > self.latency_max:
+            self.latency_max = latency
+
+    @property
+    def latency_avg(self):
+        done = self.completed + self.failed
+        if done == 0:
+            return 0.0
+        return self.latency_total / done
+
+    def as_dict(self):
+        retval = dict([(k, getattr(self, k)) for k in self.get_fields()])
+        retval['latency_avg'] = self.latency_avg
+        return retval
+
+    def __repr__(self):
+        return "%s(%s)" % (self.__class__.__name__, ', '.join(
+                  ['%s=%r' % (k, getattr(self, k)) for k in self.get_fields()]))
@@ -38,6 +38,7 @@ from spyne.protocol.cloth import XmlCloth
 
 from spyne.protocol.xml import XmlDocument
 from spyne.util.appreg import unregister_application
+from spyne.util.memo import memoize_bounded
 from spyne.util.six import BytesIO
 from spyne.util.tlist import tlist
 
@@ -130,6 +131,38 @@ def get_object_as_xml(inst, cls=None, root_tag_name=None, no_namespace=False):
     return parent[0]
 
 
+@memoize_bounded(maxsize=256)
+def _get_polymorphic_application(cls):
+    """Returns an unregistered application whose protocols handle the given
+    class polymorphically. Passing ``None`` returns an application without a
+    target namespace.
+
+    The applications are cached as building one is way more expensive than
+    the (de)serialization itself.
+    """
+
+    if cls is None:
+        services = [ServiceBase]
+        tns = ""
+
+    else:
+        class _DummyService(ServiceBase):
+            @srpc(cls)
+            def f(_):
+                pass
+
+        services = [_DummyService]
+        tns = cls.get_namespace()
+
+    app = Application(services, tns=tns,
+                                  in_protocol=XmlDocument(polymorphic=True),
+                                  out_protocol=XmlDocument(polymorphic=True))
+
+    unregister_application(app)
+
+    return app
+
+
 def get_object_as_xml_polymorphic(inst, cls=None, root_tag_name=None,
                                                             no_namespace=False):
     """Returns an ElementTree representation of a
@@ -146,24 +179,14 @@ def get_object_as_xml_polymorphic(inst, cls=None, root_tag_name=None,
         cls = inst.__class__
 
     if no_namespace:
-        app = Application([ServiceBase], tns="",
-                                     out_protocol=XmlDocument(polymorphic=True))
+        app = _get_polymorphic_application(None)
     else:
-        tns = cls.get_namespace()
-        if tns is None:
+        if cls.get_namespace() is None:
             raise ValueError(
                 "Either set a namespace for %r or pass no_namespace=True"
                                                                       % (cls, ))
 
-        class _DummyService(ServiceBase):
-            @srpc(cls)
-            def f(_):
-                pass
-
-        app = Application([_DummyService], tns=tns,
-                                     out_protocol=XmlDocument(polymorphic=True))
-
-    unregister_application(app)
+        app = _get_polymorphic_application(cls)
 
     parent = etree.Element("parent", nsmap=app.interface.nsmap)
 
@@ -190,15 +213,7 @@ def get_xml_as_object_polymorphic(elt, cls):
     if tns is None:
         raise ValueError("Please set a namespace for %r" % (cls, ))
 
-    class _DummyService(ServiceBase):
-        @srpc(cls)
-        def f(_):
-            pass
-
-    app = Application([_DummyService], tns=tns,
-                                      in_protocol=XmlDocument(polymorphic=True))
-
-    unregister_application(app)
+    app = _get_polymorphic_application(cls)
 
     return app.in_protocol.from_element(FakeContext(app=app), cls, elt)
 